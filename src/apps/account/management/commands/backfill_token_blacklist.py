@@ -0,0 +1,23 @@
+from django.core.management.base import BaseCommand
+
+from apps.account.v1.tokens import backfill_token_blacklist
+
+
+class Command(BaseCommand):
+    help = (
+        "Copies unexpired refresh tokens from the BlacklistedToken table into the "
+        "Redis blacklist with their remaining lifetime. Run before serving traffic "
+        "so tokens blacklisted before the Redis blacklist stay rejected; the "
+        "command is idempotent."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            help="Number of tokens written to Redis per pipeline.",
+        )
+
+    def handle(self, *args, **options):
+        count = backfill_token_blacklist(options["batch_size"])
+        self.stdout.write(f"{count} blacklisted tokens copied to Redis.")
@@ -0,0 +1,48 @@
+import timeit
+
+from django.core.management.base import BaseCommand
+from django.template.loader import render_to_string
+from django.utils.safestring import mark_safe
+
+from apps.account.v1.services import EmailTemplate, render_email_template
+
+
+class Command(BaseCommand):
+    help = (
+        "Compares the throughput of rendering verification emails with "
+        "render_to_string against the cached static-prefix/suffix render."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--number",
+            type=int,
+            default=10000,
+            help="Number of emails rendered per template and method.",
+        )
+
+    def handle(self, *args, **options):
+        number = options["number"]
+        for template in EmailTemplate:
+            _, base_url, template_path = template.value
+            url = f"{base_url}?hashed_email={'0' * 32}&token={'0' * 32}"
+            if render_email_template(template_path, url) != render_to_string(
+                template_path, {"url": mark_safe(url)}
+            ):
+                self.stderr.write(f"{template_path}: rendered output differs")
+                continue
+
+            render_seconds = timeit.timeit(
+                lambda: render_to_string(template_path, {"url": mark_safe(url)}),
+                number=number,
+            )
+            cached_seconds = timeit.timeit(
+                lambda: render_email_template(template_path, url),
+                number=number,
+            )
+            self.stdout.write(
+                f"{template_path}: "
+                f"render_to_string {number / render_seconds:,.0f} emails/s, "
+                f"cached {number / cached_seconds:,.0f} emails/s "
+                f"({render_seconds / cached_seconds:.1f}x)"
+            )
@@ -1,17 +1,12 @@
 import datetime
 import logging
-import re
 
 import jwt
 from django.conf import settings
 from rest_framework import serializers, exceptions
 from rest_framework.generics import get_object_or_404
 from rest_framework_simplejwt.exceptions import TokenError
-from rest_framework_simplejwt.token_blacklist.models import (
-    OutstandingToken,
-    BlacklistedToken,
-)
-from rest_framework_simplejwt.tokens import RefreshToken, AccessToken
+from rest_framework_simplejwt.tokens import AccessToken
 
 from apps.account.v1.adapters import GoogleLoginAdapter
 from apps.account.v1.services import (
@@ -19,6 +14,7 @@ from apps.account.v1.services import (
     get_cached_email_verification_data,
     EmailTemplate,
 )
+from apps.account.v1.tokens import RefreshToken, revoke_access_token
 from apps.user.models import User
 from base.enums.errors import (
     E001_INVALID_EMAIL_FORMAT,
@@ -41,6 +37,7 @@ from base.enums.errors import (
     E004_VERIFICATION_INFO_NOT_FOUND,
     E004_VERIFICATION_TOKEN_NOT_MATCH,
 )
+from base.utils.validators import is_valid_email, is_valid_hex32, is_valid_password
 
 logger = logging.getLogger(__name__)
 
@@ -57,8 +54,7 @@ class RegisterSerializer(serializers.ModelSerializer):
 
     def validate_email(self, value):
         """이메일 유효성 검사"""
-        email_regex = r"^[a-zA-Z0-9_.+-]+@[a-zA-Z0-9-]+\.[a-zA-Z0-9-.]+$"
-        if not re.match(email_regex, value):
+        if not is_valid_email(value):
             raise exceptions.ValidationError(E001_INVALID_EMAIL_FORMAT)
         # 계정 존재 여부 확인
         if User.objects.filter(email=value).exists():
@@ -70,8 +66,7 @@ class RegisterSerializer(serializers.ModelSerializer):
 
     def validate_password(self, value):
         """비밀번호 유효성 검사"""
-        password_regex = r"^(?=.*[a-z])(?=.*\d)[a-zA-Z0-9_-]{6,30}$"
-        if not re.match(password_regex, value):
+        if not is_valid_password(value):
             raise exceptions.ValidationError(E001_INVALID_PASSWORD)
         return value
 
@@ -115,13 +110,13 @@ class EmailVerificationSerializer(serializers.Serializer):
     def validate_hashed_email(self, value):
         """해시된 이메일 유효성 검사"""
         # md5 유효성 검사
-        if not re.match(r"^[0-9a-f]{32}$", value):
+        if not is_valid_hex32(value):
             raise exceptions.ValidationError(E002_INVALID_HASHED_EMAIL_FORMAT)
         return value
 
     def validate_token(self, value):
         """인증 토큰 유효성 검사"""
-        if not re.match(r"^[0-9a-f]{32}$", value):
+        if not is_valid_hex32(value):
             raise exceptions.ValidationError(E002_INVALID_VERIFICATION_TOKEN)
         return value
 
@@ -256,22 +251,17 @@ class LogoutSerializer(serializers.Serializer):
     refresh_token = serializers.CharField(help_text="리프레시 토큰", write_only=True)
 
     def validate(self, attrs):
-        # 1. 액세스 토큰 블랙리스트 처리
+        # 1. 액세스 토큰 폐기 처리
         request = self.context.get("request")
         auth_header = request.META.get("HTTP_AUTHORIZATION")
         access_token_value = auth_header.split(" ")[1]
         try:
             access = AccessToken(access_token_value)
-            jti = access.payload.get("jti")
-            if jti:
-                outstanding_token = OutstandingToken.objects.filter(jti=jti).first()
-                if outstanding_token:
-                    BlacklistedToken.objects.get_or_create(token=outstanding_token)
-                    logger.info(
-                        f"Access token (jti: {jti[:8]}...) blacklisted successfully."
-                    )
-                else:
-                    logger.warning(f"Outstanding token not found for jti: {jti[:8]}...")
+            if access.payload.get("jti"):
+                revoke_access_token(access)
+                logger.info(
+                    f"Access token (jti: {access['jti'][:8]}...) revoked successfully."
+                )
             else:
                 logger.warning("Access token does not contain jti claim.")
         except TokenError as e:
@@ -304,8 +294,7 @@ class PasswordResetSerializer(serializers.Serializer):
 
     def validate_email(self, value):
         """이메일 유효성 검사"""
-        email_regex = r"^[a-zA-Z0-9_.+-]+@[a-zA-Z0-9-]+\.[a-zA-Z0-9-.]+$"
-        if not re.match(email_regex, value):
+        if not is_valid_email(value):
             raise exceptions.ValidationError(E001_INVALID_EMAIL_FORMAT)
         # 계정 존재 여부 확인
         if not User.objects.filter(email=value).exists():
@@ -335,20 +324,19 @@ class PasswordChangeSerializer(serializers.ModelSerializer):
     def validate_hashed_email(self, value):
         """해시된 이메일 유효성 검사"""
         # md5 유효성 검사
-        if not re.match(r"^[0-9a-f]{32}$", value):
+        if not is_valid_hex32(value):
             raise exceptions.ValidationError(E004_INVALID_HASHED_EMAIL_FORMAT)
         return value
 
     def validate_token(self, value):
         """인증 토큰 유효성 검사"""
-        if not re.match(r"^[0-9a-f]{32}$", value):
+        if not is_valid_hex32(value):
             raise exceptions.ValidationError(E004_INVALID_VERIFICATION_TOKEN)
         return value
 
     def validate_password(self, value):
         """비밀번호 유효성 검사"""
-        password_regex = r"^(?=.*[a-z])(?=.*\d)[a-zA-Z0-9_-]{6,30}$"
-        if not re.match(password_regex, value):
+        if not is_valid_password(value):
             raise exceptions.ValidationError(E001_INVALID_PASSWORD)
         return value
 
@@ -1,10 +1,12 @@
 import enum
+import functools
 import hashlib
+import smtplib
 import uuid
 
 from django.conf import settings
 from django.core.cache import cache
-from django.core.mail import send_mail
+from django.core.mail import EmailMultiAlternatives, get_connection
 from django.template.loader import render_to_string
 from django.utils.safestring import mark_safe
 
@@ -24,8 +26,163 @@ class EmailTemplate(enum.Enum):
     )
 
 
+class EmailSendError(Exception):
+    """이메일 발송 실패"""
+
+    def __init__(self, sent_count: int):
+        super().__init__(f"Email send failed after {sent_count} messages")
+        self.sent_count = sent_count
+
+
+# 워커 프로세스에서 재사용하는 SMTP 연결
+EMAIL_CONNECTION = None
+
+
+def get_email_connection():
+    """
+    이메일 연결 조회:
+    워커 프로세스마다 연결을 한 번만 열고 이후 발송에서 재사용
+    """
+    global EMAIL_CONNECTION
+    # [Why]
+    # Q. 재사용 전에 연결을 확인하는 이유는?
+    # A. 이미 열린 연결은 open() 이 아무 작업도 하지 않으므로
+    #    서버가 유휴 연결을 닫았으면 발송이 실패하고 작업 재시도까지 지연되기 때문
+    if EMAIL_CONNECTION is not None and not is_email_connection_alive(EMAIL_CONNECTION):
+        close_email_connection()
+    if EMAIL_CONNECTION is None:
+        EMAIL_CONNECTION = get_connection()
+    EMAIL_CONNECTION.open()
+    return EMAIL_CONNECTION
+
+
+def is_email_connection_alive(email_connection) -> bool:
+    """
+    이메일 연결 확인:
+    SMTP 연결이 열려 있으면 NOOP 명령으로 서버가 연결을 유지하는지 확인
+    (열리지 않은 연결과 SMTP 가 아닌 백엔드는 확인하지 않음)
+    """
+    smtp_connection = getattr(email_connection, "connection", None)
+    if smtp_connection is None:
+        return True
+    try:
+        status_code, _message = smtp_connection.noop()
+    except (smtplib.SMTPException, OSError):
+        return False
+    return status_code == 250
+
+
+def close_email_connection():
+    """이메일 연결 종료 (오류 발생 시 다음 발송에서 다시 연결)"""
+    global EMAIL_CONNECTION
+    if EMAIL_CONNECTION is not None:
+        try:
+            EMAIL_CONNECTION.close()
+        except Exception:
+            pass
+        EMAIL_CONNECTION = None
+
+
+# 템플릿의 URL 위치를 찾기 위한 값 (템플릿 내용과 겹치지 않는 값)
+EMAIL_TEMPLATE_URL_PLACEHOLDER = uuid.uuid4().hex
+
+
+@functools.lru_cache(maxsize=None)
+def get_email_template_parts(template_path: str) -> tuple[str, ...] | None:
+    """
+    이메일 템플릿 조각 조회:
+    URL 대신 임시 값으로 한 번만 렌더링하고 URL 위치를 기준으로 나눈 조각을 재사용
+
+    Args:
+        template_path (str): 템플릿 경로
+
+    Returns:
+        tuple: URL 앞뒤의 고정 조각 (템플릿에 URL 이 없으면 None)
+    """
+    context = {"url": EMAIL_TEMPLATE_URL_PLACEHOLDER}
+    parts = tuple(
+        render_to_string(template_path, context).split(EMAIL_TEMPLATE_URL_PLACEHOLDER)
+    )
+    return parts if len(parts) > 1 else None
+
+
+def render_email_template(template_path: str, url: str) -> str:
+    """
+    이메일 템플릿 렌더링:
+    고정 조각 사이에 URL 만 넣어 메일마다 템플릿을 다시 렌더링하지 않음
+
+    Args:
+        template_path (str): 템플릿 경로
+        url (str): 검증 URL
+
+    Returns:
+        str: 렌더링한 HTML
+    """
+    # [Why]
+    # Q. 템플릿 로더 캐시가 있는데도 조각을 따로 보관하는 이유는?
+    # A. 로더 캐시는 템플릿 파싱만 생략하고 렌더링은 메일마다 다시 하므로,
+    #    메일마다 바뀌는 URL 만 이어 붙여 대량 발송 시 렌더링 비용을 없애기 위함
+    parts = get_email_template_parts(template_path)
+    if parts is None:
+        return render_to_string(template_path, {"url": mark_safe(url)})
+    return url.join(parts)
+
+
+def build_verification_email(message: dict) -> EmailMultiAlternatives:
+    """
+    이메일 검증 메일 생성
+
+    Args:
+        message (dict): 수신자 이메일, 템플릿 종류, 검증 URL
+
+    Returns:
+        EmailMultiAlternatives: 발송할 메일
+    """
+    subject, _, template_path = EmailTemplate[message["template"]].value
+    html_message = render_email_template(template_path, message["url"])
+    email = EmailMultiAlternatives(
+        subject=subject,
+        body="",
+        from_email=settings.DEFAULT_FROM_EMAIL,
+        to=[message["email"]],
+    )
+    email.attach_alternative(html_message, "text/html")
+    return email
+
+
+def send_verification_emails(messages: list) -> int:
+    """
+    이메일 검증 메일 일괄 발송:
+    하나의 연결로 순서대로 발송하고, 실패하면 연결을 닫고 오류 발생
+
+    Args:
+        messages (list): 발송할 메일 목록
+
+    Returns:
+        int: 발송한 메일 수
+
+    Raises:
+        EmailSendError: 발송 실패 (발송한 메일 수 포함)
+    """
+    sent_count = 0
+    try:
+        connection = get_email_connection()
+        for message in messages:
+            connection.send_messages([build_verification_email(message)])
+            sent_count += 1
+    except Exception as e:
+        close_email_connection()
+        raise EmailSendError(sent_count) from e
+    return sent_count
+
+
 def send_email_verification_token(email: str, template_type: EmailTemplate) -> dict:
-    """이메일 검증 토큰 발송"""
+    """
+    이메일 검증 토큰 발송:
+    검증 토큰은 캐시에 저장하고, 메일 생성과 발송은 Celery 작업에서 처리
+    """
+    from apps.account.v1.tasks import task_send_verification_emails
+
     if not email:
         return {}
 
@@ -41,19 +198,20 @@ def send_email_verification_token(email: str, template_type: EmailTemplate) -> d
         timeout=settings.EMAIL_VERIFICATION_TIMEOUT,
     )
 
-    # 이메일 내용 생성
-    subject, base_url, template_path = template_type.value
-    verification_url = f"{base_url}?hashed_email={hashed_email}&token={token}"
-    context = {"url": mark_safe(verification_url)}
-    html_message = render_to_string(template_path, context)
-
-    # 이메일 발송
-    send_mail(
-        subject=subject,
-        message="",
-        html_message=html_message,
-        from_email=settings.DEFAULT_FROM_EMAIL,
-        recipient_list=[email],
+    # [Why]
+    # Q. 요청에서 메일을 바로 발송하지 않는 이유는?
+    # A. SMTP 응답 대기(1~3초)가 회원 가입, 비밀번호 재설정 응답 시간에 포함되지 않도록 하기 위함
+    _, base_url, _ = template_type.value
+    task_send_verification_emails.apply_async(
+        args=[
+            [
+                {
+                    "email": email,
+                    "template": template_type.name,
+                    "url": f"{base_url}?hashed_email={hashed_email}&token={token}",
+                }
+            ]
+        ]
     )
     return {"hashed_email": hashed_email, "token": token}
 
@@ -0,0 +1,38 @@
+from django.conf import settings
+from django.utils import timezone
+from rest_framework_simplejwt.token_blacklist.models import OutstandingToken
+
+from apps.account.v1.services import EmailSendError, send_verification_emails
+from conf.celery import app
+
+
+@app.task(bind=True, max_retries=settings.EMAIL_SEND_MAX_RETRIES)
+def task_send_verification_emails(self, messages: list):
+    """
+    이메일 검증 메일 발송:
+    워커에서 유지하는 SMTP 연결로 발송하고, 실패하면 발송하지 못한 메일만 다시 시도
+    """
+    try:
+        return send_verification_emails(messages)
+    except EmailSendError as e:
+        # 재시도 간격은 시도할 때마다 두 배로 늘림
+        raise self.retry(
+            args=[messages[e.sent_count :]],
+            countdown=settings.EMAIL_SEND_RETRY_DELAY * 2**self.request.retries,
+            exc=e,
+        )
+
+
+@app.task
+def task_flush_expired_tokens():
+    """
+    만료된 토큰 이력 삭제:
+    만료된 발급 이력과 블랙리스트 이력을 함께 삭제
+    (블랙리스트는 Redis 에서 만료 시 자동 삭제됨)
+    """
+    if not settings.TOKEN_BLACKLIST_AUDIT:
+        return "Token blacklist audit disabled"
+    deleted_count, _ = OutstandingToken.objects.filter(
+        expires_at__lte=timezone.now()
+    ).delete()
+    return f"{deleted_count} expired tokens deleted"
@@ -1,15 +1,37 @@
+import collections
+import datetime
 import hashlib
+import io
 import json
+import logging
+import smtplib
+import threading
+import time
 from unittest.mock import patch, MagicMock
 from urllib.parse import quote_plus
 
+import redis
+from celery.exceptions import Retry
+
 from django.conf import settings
+from django.core import mail
 from django.core.cache import cache
+from django.core.mail import get_connection
+from django.core.mail.backends import locmem, smtp
+from django.core.management import call_command
 from django.http import Http404
-from django.test import TestCase, RequestFactory
+from django.template.loader import render_to_string
+from django.test import TestCase, RequestFactory, override_settings
+from django.utils import timezone
+from django.utils.safestring import mark_safe
 from rest_framework import exceptions, status
 from rest_framework.test import APITestCase, APIClient
+from rest_framework_simplejwt.authentication import JWTAuthentication
 from rest_framework_simplejwt.exceptions import TokenError
+from rest_framework_simplejwt.token_blacklist.models import (
+    BlacklistedToken,
+    OutstandingToken,
+)
 from rest_framework_simplejwt.tokens import RefreshToken
 
 from apps.account.v1.adapters import GoogleLoginAdapter
@@ -28,7 +50,30 @@ from apps.account.v1.services import (
     send_email_verification_token,
     EmailTemplate,
 )
+from apps.account.v1 import services
+from apps.account.v1.services import (
+    close_email_connection,
+    get_email_connection,
+    get_email_template_parts,
+    render_email_template,
+)
+from apps.account.v1.tasks import (
+    task_flush_expired_tokens,
+    task_send_verification_emails,
+)
+from apps.account.v1.tokens import (
+    REVOKED_ACCESS_TOKEN_FILTER,
+    RefreshToken as BlacklistRefreshToken,
+    get_revoked_access_token_key,
+    get_token_blacklist_key,
+    revoke_access_token,
+)
 from apps.user.models import User, UserProfile, SocialUser
+from conf.authentications import VALIDATED_TOKEN_CACHE, JWTLazyUserAuthentication
+from conf.caches import LocalLRUCache
+from base.utils.bloom_filter import BloomFilter
+from base.utils.validators import is_valid_email, is_valid_hex32, is_valid_password
+from conf.filters import SensitiveFilter
 from base.enums.errors import (
     E003_EMAIL_NOT_VERIFIED,
     E003_REFRESH_TOKEN_FAILED,
@@ -374,12 +419,18 @@ class AccountServicesTest(TestCase):
         # 캐시 삭제
         cache.delete(self.cache_key)
 
-    @patch("apps.account.v1.services.send_mail")
-    def test_성공__이메일_검증_토큰_발송(self, mock_send_email):
+    @patch("apps.account.v1.tasks.task_send_verification_emails.apply_async")
+    def test_성공__이메일_검증_토큰_발송(self, mock_apply_async):
         """테스트: 이메일 검증 토큰 발송 성공"""
-        mock_send_email.return_value = {}
         result = send_email_verification_token(self.email, EmailTemplate.SIGNUP)
 
+        # 메일 발송은 작업으로 등록
+        mock_apply_async.assert_called_once()
+        (messages,) = mock_apply_async.call_args.kwargs["args"]
+        self.assertEqual(messages[0]["email"], self.email)
+        self.assertEqual(messages[0]["template"], "SIGNUP")
+        self.assertIn(f"token={result['token']}", messages[0]["url"])
+
         self.assertIn("hashed_email", result)
         self.assertIn("token", result)
         self.assertEqual(result["hashed_email"], self.hashed_email)
@@ -390,13 +441,13 @@ class AccountServicesTest(TestCase):
         self.assertEqual(cached_data["email"], self.email)
         self.assertEqual(cached_data["token"], result["token"])
 
-    @patch("apps.account.v1.services.send_mail")
-    def test_성공__빈_이메일_검증_토큰_발송(self, mock_send_email):
+    @patch("apps.account.v1.tasks.task_send_verification_emails.apply_async")
+    def test_성공__빈_이메일_검증_토큰_발송(self, mock_apply_async):
         """테스트: 빈 이메일로 검증 토큰 발송"""
-        mock_send_email.return_value = {}
         result = send_email_verification_token("", EmailTemplate.SIGNUP)
 
         self.assertEqual(result, {})
+        mock_apply_async.assert_not_called()
 
     def test_성공__캐시된_이메일_검증_데이터_조회(self):
         """테스트: 캐시된 이메일 검증 데이터 조회 성공"""
@@ -432,6 +483,7 @@ class LoginViewSerializerTest(TestCase):
     """사용자 로그인 뷰셋 테스트"""
 
     def setUp(self):
+        self.redis = patch_auth_redis(self)
         # 테스트 사용자 생성 - 인증된 사용자
         self.verified_user = User.objects.create_user(
             email="verified@example.com", password="test123"
@@ -724,6 +776,7 @@ class LoginViewSetTest(APITestCase):
     """사용자 로그인 뷰셋 테스트"""
 
     def setUp(self):
+        self.redis = patch_auth_redis(self)
         self.client = APIClient()
         self.login_url = "/v1/account/login/"
         self.refresh_url = "/v1/account/refresh/"
@@ -1802,6 +1855,7 @@ class LogoutSerializerTest(TestCase):
     """로그아웃 시리얼라이저 테스트"""
 
     def setUp(self):
+        self.redis = patch_auth_redis(self)
         # 테스트 사용자 생성
         self.user = User.objects.create_user(
             email="test@example.com", password="test123"
@@ -1864,3 +1918,626 @@ class LogoutSerializerTest(TestCase):
             # 실제 코드에서는 더 나은 오류 처리가 필요할 수 있음
             with self.assertRaises(AttributeError):
                 serializer.is_valid()
+
+
+class JWTLazyUserAuthenticationTest(TestCase):
+    """JWT 사용자 지연 인증 테스트"""
+
+    def setUp(self):
+        self.redis = patch_auth_redis(self)
+        self.user = User.objects.create_user(
+            email="test@example.com", password="test123"
+        )
+        self.access_token = RefreshToken.for_user(self.user).access_token
+        self.request = RequestFactory().get("/")
+        self.request.META["HTTP_AUTHORIZATION"] = f"Bearer {str(self.access_token)}"
+        self.authentication = JWTLazyUserAuthentication()
+        VALIDATED_TOKEN_CACHE.clear()
+
+    def test_성공__검증한_토큰_재사용(self):
+        """테스트: 같은 토큰은 서명을 다시 검증하지 않음"""
+        with patch(
+            "rest_framework_simplejwt.authentication.JWTAuthentication.get_validated_token",
+            autospec=True,
+            side_effect=JWTAuthentication.get_validated_token,
+        ) as mock_get_validated_token:
+            self.authentication.authenticate(self.request)
+            _, validated_token = self.authentication.authenticate(self.request)
+
+        mock_get_validated_token.assert_called_once()
+        self.assertEqual(str(validated_token["user_id"]), str(self.user.id))
+
+    def test_실패__변조된_토큰(self):
+        """테스트: 검증한 토큰과 다른 토큰은 다시 검증"""
+        self.authentication.authenticate(self.request)
+        self.request.META["HTTP_AUTHORIZATION"] = f"Bearer {str(self.access_token)}x"
+
+        with self.assertRaises(exceptions.AuthenticationFailed):
+            self.authentication.authenticate(self.request)
+
+    def test_성공__만료된_항목_삭제(self):
+        """테스트: 만료 시각이 지난 항목은 조회되지 않음"""
+        cache = LocalLRUCache(maxsize=2)
+        cache.set("expired", 1, time.time() - 1)
+        cache.set("a", 1, time.time() + 60)
+        cache.set("b", 2, time.time() + 60)
+        cache.set("c", 3, time.time() + 60)
+
+        self.assertIsNone(cache.get("expired"))
+        self.assertIsNone(cache.get("a"))
+        self.assertEqual(cache.get("c"), 3)
+
+
+class FakePubSub:
+    """액세스 토큰 폐기 알림 테스트용 발행/구독"""
+
+    def __init__(self, client):
+        self.client = client
+
+    def subscribe(self, **handlers):
+        for channel, handler in handlers.items():
+            self.client.handlers[channel].append(handler)
+
+    def run_in_thread(self, **kwargs):
+        return MagicMock()
+
+    def close(self):
+        pass
+
+
+class FakeRedis:
+    """토큰 블랙리스트, 액세스 토큰 폐기 테스트용 Redis"""
+
+    def __init__(self):
+        self.values = {}
+        self.sorted_sets = collections.defaultdict(dict)
+        self.handlers = collections.defaultdict(list)
+
+    def set(self, key, value, ex=None):
+        self.values[key] = (value, ex)
+
+    def exists(self, key):
+        return int(key in self.values)
+
+    def zadd(self, key, mapping):
+        self.sorted_sets[key].update(mapping)
+
+    def zremrangebyscore(self, key, min, max):
+        for member, score in list(self.sorted_sets[key].items()):
+            if score <= max:
+                del self.sorted_sets[key][member]
+
+    def zrange(self, key, start, end):
+        return [member.encode() for member in self.sorted_sets[key]]
+
+    def zscore(self, key, member):
+        return self.sorted_sets[key].get(member)
+
+    def expire(self, key, seconds):
+        pass
+
+    def publish(self, channel, message):
+        for handler in self.handlers[channel]:
+            handler({"data": message.encode()})
+
+    def pubsub(self, **kwargs):
+        return FakePubSub(self)
+
+    def pipeline(self):
+        client = self
+
+        class Pipeline:
+            def __init__(self):
+                self.commands = []
+
+            def __getattr__(self, name):
+                return lambda *args, **kwargs: self.commands.append(
+                    (name, args, kwargs)
+                )
+
+            def execute(self):
+                return [
+                    getattr(client, name)(*args, **kwargs)
+                    for name, args, kwargs in self.commands
+                ]
+
+        return Pipeline()
+
+
+def patch_auth_redis(test_case) -> FakeRedis:
+    """
+    인증에 사용하는 Redis 를 테스트용으로 교체:
+    폐기 목록도 테스트용 Redis 에서 미리 불러와 테스트 중 다시 불러오지 않고,
+    사용자 스냅샷은 구독하지 않고 데이터베이스에서 조회
+    """
+    fake_redis = FakeRedis()
+    for patcher in [
+        patch("apps.account.v1.tokens.REDIS_CLIENT", fake_redis),
+        patch("apps.user.caches.USER_SNAPSHOT_CACHE.is_subscribed", return_value=False),
+    ]:
+        patcher.start()
+        test_case.addCleanup(patcher.stop)
+    load_revoked_access_tokens()
+    # 다음 테스트에서 교체한 Redis 로 다시 불러오도록 초기화
+    test_case.addCleanup(setattr, REVOKED_ACCESS_TOKEN_FILTER, "reload_at", 0)
+    return fake_redis
+
+
+def load_revoked_access_tokens():
+    """폐기 목록을 바로 불러오고 완료될 때까지 대기"""
+    REVOKED_ACCESS_TOKEN_FILTER.bloom_filter = None
+    REVOKED_ACCESS_TOKEN_FILTER.reload_at = 0
+    REVOKED_ACCESS_TOKEN_FILTER.reload_in_background()
+    REVOKED_ACCESS_TOKEN_FILTER.reload_thread.join()
+
+
+class TokenBlacklistTest(APITestCase):
+    """토큰 블랙리스트 테스트"""
+
+    def setUp(self):
+        self.user = User.objects.create_user(
+            email="test@example.com", password="test123"
+        )
+        self.redis = patch_auth_redis(self)
+
+    def test_성공__블랙리스트_추가(self):
+        """테스트: 블랙리스트는 토큰의 남은 유효 시간 동안만 보관"""
+        refresh = BlacklistRefreshToken.for_user(self.user)
+
+        refresh.blacklist()
+
+        key = get_token_blacklist_key(refresh["jti"])
+        self.assertIn(key, self.redis.values)
+        ttl = self.redis.values[key][1]
+        lifetime = settings.SIMPLE_JWT["REFRESH_TOKEN_LIFETIME"].total_seconds()
+        self.assertTrue(lifetime - 5 <= ttl <= lifetime + 1)
+        with self.assertRaises(TokenError):
+            BlacklistRefreshToken(str(refresh))
+
+    def test_성공__리프래시_토큰_재발급_쿼리_없음(self):
+        """테스트: 만료 여유가 있는 리프레시 토큰 재발급은 데이터베이스를 조회하지 않음"""
+        refresh = BlacklistRefreshToken.for_user(self.user)
+
+        with self.assertNumQueries(0):
+            response = self.client.post(
+                "/v1/account/refresh/",
+                data={"refresh_token": str(refresh)},
+                format="json",
+            )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertIn("access_token", response.data)
+
+    def test_실패__로그아웃한_리프래시_토큰_재발급(self):
+        """테스트: 로그아웃한 리프레시 토큰으로는 재발급 불가"""
+        refresh = BlacklistRefreshToken.for_user(self.user)
+        self.client.credentials(
+            HTTP_AUTHORIZATION=f"Bearer {str(refresh.access_token)}"
+        )
+        response = self.client.post(
+            "/v1/account/logout/",
+            data={"refresh_token": str(refresh)},
+            format="json",
+        )
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+
+        # 폐기된 액세스 토큰 없이 재발급 요청
+        self.client.credentials()
+        response = self.client.post(
+            "/v1/account/refresh/",
+            data={"refresh_token": str(refresh)},
+            format="json",
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.data["refresh_token"][0]["error_code"], "E0030003")
+
+    @override_settings(TOKEN_BLACKLIST_AUDIT=False)
+    def test_성공__이력_저장_없이_블랙리스트_추가(self):
+        """테스트: 이력 저장을 사용하지 않으면 데이터베이스에 저장하지 않음"""
+        with self.assertNumQueries(0):
+            refresh = BlacklistRefreshToken.for_user(self.user)
+            refresh.blacklist()
+
+        self.assertFalse(OutstandingToken.objects.exists())
+        with self.assertRaises(TokenError):
+            BlacklistRefreshToken(str(refresh))
+
+    def test_성공__Redis_오류_시_이력_테이블_확인(self):
+        """테스트: Redis 를 사용할 수 없으면 이력 테이블에서 블랙리스트 확인"""
+        refresh = BlacklistRefreshToken.for_user(self.user)
+        refresh.blacklist()
+        self.redis.exists = MagicMock(side_effect=redis.ConnectionError)
+
+        with self.assertRaises(TokenError):
+            BlacklistRefreshToken(str(refresh))
+        self.assertIsNotNone(
+            BlacklistRefreshToken(str(BlacklistRefreshToken.for_user(self.user)))
+        )
+
+    @override_settings(TOKEN_BLACKLIST_AUDIT=False)
+    def test_실패__Redis_오류_시_이력_테이블_미사용(self):
+        """테스트: Redis 를 사용할 수 없고 이력 테이블도 사용하지 않으면 재발급 불가"""
+        refresh = BlacklistRefreshToken.for_user(self.user)
+        self.redis.exists = MagicMock(side_effect=redis.ConnectionError)
+
+        with self.assertRaises(TokenError):
+            BlacklistRefreshToken(str(refresh))
+
+    def test_성공__이력_테이블_블랙리스트_Redis_추가(self):
+        """테스트: 이력 테이블에만 있는 블랙리스트를 Redis 에 추가해 재발급 불가"""
+        refresh = BlacklistRefreshToken.for_user(self.user)
+        expired = BlacklistRefreshToken.for_user(self.user)
+        for token in [refresh, expired]:
+            # Redis 블랙리스트 이전에 추가된 블랙리스트
+            BlacklistedToken.objects.create(
+                token=OutstandingToken.objects.get(jti=token["jti"])
+            )
+        OutstandingToken.objects.filter(jti=expired["jti"]).update(
+            expires_at=timezone.now() - datetime.timedelta(seconds=1)
+        )
+        self.assertIsNotNone(BlacklistRefreshToken(str(refresh)))
+
+        out = io.StringIO()
+        call_command("backfill_token_blacklist", "--batch-size=1", stdout=out)
+
+        self.assertIn("1 blacklisted tokens", out.getvalue())
+        self.assertNotIn(get_token_blacklist_key(expired["jti"]), self.redis.values)
+        ttl = self.redis.values[get_token_blacklist_key(refresh["jti"])][1]
+        lifetime = settings.SIMPLE_JWT["REFRESH_TOKEN_LIFETIME"].total_seconds()
+        self.assertTrue(lifetime - 5 <= ttl <= lifetime + 1)
+        with self.assertRaises(TokenError):
+            BlacklistRefreshToken(str(refresh))
+
+    def test_성공__만료된_토큰_이력_삭제(self):
+        """테스트: 만료된 발급 이력과 블랙리스트 이력 삭제"""
+        expired = BlacklistRefreshToken.for_user(self.user)
+        expired.blacklist()
+        OutstandingToken.objects.filter(jti=expired["jti"]).update(
+            expires_at=timezone.now() - datetime.timedelta(seconds=1)
+        )
+        BlacklistRefreshToken.for_user(self.user)
+
+        task_flush_expired_tokens()
+
+        self.assertEqual(OutstandingToken.objects.count(), 1)
+        self.assertFalse(BlacklistedToken.objects.exists())
+
+
+class AccessTokenRevocationTest(APITestCase):
+    """액세스 토큰 폐기 테스트"""
+
+    def setUp(self):
+        self.user = User.objects.create_user(
+            email="test@example.com", password="test123"
+        )
+        UserProfile.objects.create(user=self.user, nickname="test")
+        self.refresh = BlacklistRefreshToken.for_user(self.user)
+        self.access_token = self.refresh.access_token
+        self.request = RequestFactory().get("/")
+        self.request.META["HTTP_AUTHORIZATION"] = f"Bearer {str(self.access_token)}"
+        self.authentication = JWTLazyUserAuthentication()
+        self.redis = patch_auth_redis(self)
+        VALIDATED_TOKEN_CACHE.clear()
+
+    def test_성공__블룸_필터(self):
+        """테스트: 추가한 항목은 항상 포함되고, 추가하지 않은 항목은 대부분 포함되지 않음"""
+        bloom_filter = BloomFilter(size=1 << 16, hash_count=7)
+        items = [f"item-{i}" for i in range(1000)]
+        for item in items:
+            bloom_filter.add(item)
+
+        self.assertTrue(all(item in bloom_filter for item in items))
+        false_positives = sum(f"other-{i}" in bloom_filter for i in range(1000))
+        self.assertLess(false_positives, 10)
+
+    def test_성공__폐기되지_않은_토큰은_Redis_조회_없음(self):
+        """테스트: 블룸 필터에 없는 토큰은 Redis 를 조회하지 않음"""
+        self.redis.zscore = MagicMock()
+
+        user, _ = self.authentication.authenticate(self.request)
+
+        self.assertEqual(user.id, self.user.id)
+        self.redis.zscore.assert_not_called()
+
+    def test_실패__폐기된_액세스_토큰(self):
+        """테스트: 보관 중인 토큰도 폐기되면 인증 실패"""
+        self.authentication.authenticate(self.request)
+
+        revoke_access_token(self.access_token)
+
+        with self.assertRaises(exceptions.AuthenticationFailed):
+            self.authentication.authenticate(self.request)
+
+    def test_실패__다른_프로세스에서_폐기된_액세스_토큰(self):
+        """테스트: 다른 프로세스에서 폐기한 토큰은 구독으로 전달받아 인증 실패"""
+        self.authentication.authenticate(self.request)
+
+        # 다른 프로세스의 폐기 (현재 프로세스의 블룸 필터에 직접 추가하지 않음)
+        with patch("apps.account.v1.tokens.REVOKED_ACCESS_TOKEN_FILTER", MagicMock()):
+            revoke_access_token(self.access_token)
+
+        with self.assertRaises(exceptions.AuthenticationFailed):
+            self.authentication.authenticate(self.request)
+
+    def test_성공__만료된_폐기_토큰_제외(self):
+        """테스트: 블룸 필터를 다시 만들 때 만료된 폐기 토큰은 제외"""
+        key = get_revoked_access_token_key()
+        self.redis.zadd(key, {"expired-jti": time.time() - 1})
+        self.redis.zadd(key, {self.access_token["jti"]: self.access_token["exp"]})
+
+        load_revoked_access_tokens()
+
+        self.assertTrue(
+            REVOKED_ACCESS_TOKEN_FILTER.is_revoked(self.access_token["jti"])
+        )
+        self.assertFalse(REVOKED_ACCESS_TOKEN_FILTER.is_revoked("expired-jti"))
+        self.assertNotIn("expired-jti", self.redis.sorted_sets[key])
+
+    def test_성공__폐기_목록_다시_불러오는_동안_대기_없음(self):
+        """테스트: 폐기 목록은 백그라운드에서 다시 불러오고 인증 요청은 기다리지 않음"""
+        loading = threading.Event()
+        REVOKED_ACCESS_TOKEN_FILTER.reload_at = 0
+
+        with patch.object(
+            REVOKED_ACCESS_TOKEN_FILTER, "load", side_effect=lambda: loading.wait(5)
+        ):
+            user, _ = self.authentication.authenticate(self.request)
+            reload_thread = REVOKED_ACCESS_TOKEN_FILTER.reload_thread
+            self.assertTrue(reload_thread.is_alive())
+            loading.set()
+            reload_thread.join()
+
+        self.assertEqual(user.id, self.user.id)
+
+    def test_성공__폐기_목록을_불러올_수_없으면_통과(self):
+        """테스트: 폐기 목록을 불러오지 못하면 Redis 를 기다리지 않고 통과 (fail-open)"""
+        self.redis.zremrangebyscore = MagicMock(side_effect=redis.ConnectionError())
+        self.redis.zscore = MagicMock(side_effect=redis.ConnectionError())
+
+        with self.assertLogs("apps.account.v1.tokens", level="WARNING"):
+            load_revoked_access_tokens()
+        user, _ = self.authentication.authenticate(self.request)
+
+        self.assertEqual(user.id, self.user.id)
+        self.redis.zscore.assert_not_called()
+
+    def test_실패__Redis_오류_시_블룸_필터에_포함된_토큰(self):
+        """테스트: 블룸 필터에 포함된 토큰은 Redis 로 확인할 수 없으면 폐기로 판단 (fail-closed)"""
+        revoke_access_token(self.access_token)
+        self.redis.zscore = MagicMock(side_effect=redis.ConnectionError())
+
+        with self.assertLogs("apps.account.v1.tokens", level="WARNING"):
+            with self.assertRaises(exceptions.AuthenticationFailed):
+                self.authentication.authenticate(self.request)
+
+    def test_실패__로그아웃한_액세스_토큰_사용(self):
+        """테스트: 로그아웃한 액세스 토큰으로는 인증 불가"""
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {str(self.access_token)}")
+        response = self.client.post(
+            "/v1/account/logout/",
+            data={"refresh_token": str(self.refresh)},
+            format="json",
+        )
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+
+        response = self.client.get("/v1/user/me/profile/")
+
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+
+class VerificationEmailTaskTest(TestCase):
+    """이메일 검증 메일 발송 작업 테스트"""
+
+    def setUp(self):
+        self.messages = [
+            {
+                "email": f"test{i}@example.com",
+                "template": "SIGNUP",
+                "url": f"https://example.com/confirm/?token={i}",
+            }
+            for i in range(3)
+        ]
+        close_email_connection()
+        self.addCleanup(close_email_connection)
+
+    def test_성공__메일_발송(self):
+        """테스트: 템플릿으로 메일을 만들어 발송"""
+        sent_count = task_send_verification_emails.apply(args=[self.messages]).get()
+
+        self.assertEqual(sent_count, 3)
+        self.assertEqual(len(mail.outbox), 3)
+        self.assertEqual(mail.outbox[0].to, ["test0@example.com"])
+        self.assertEqual(mail.outbox[0].subject, "회원 가입 인증")
+        self.assertIn(
+            "https://example.com/confirm/?token=0",
+            mail.outbox[0].alternatives[0][0],
+        )
+
+    def test_성공__연결_재사용(self):
+        """테스트: 작업마다 연결을 새로 만들지 않고 재사용"""
+        with patch(
+            "apps.account.v1.services.get_connection", wraps=get_connection
+        ) as mock_get_connection:
+            task_send_verification_emails.apply(args=[self.messages[:1]])
+            task_send_verification_emails.apply(args=[self.messages[1:]])
+
+        mock_get_connection.assert_called_once()
+        self.assertEqual(len(mail.outbox), 3)
+
+    def test_성공__끊어진_연결_다시_연결(self):
+        """테스트: 서버가 닫은 연결은 재사용하지 않고 다시 연결해 발송"""
+        stale_connection = smtp.EmailBackend()
+        stale_connection.connection = MagicMock()
+        stale_connection.connection.noop.side_effect = smtplib.SMTPServerDisconnected()
+        services.EMAIL_CONNECTION = stale_connection
+
+        sent_count = task_send_verification_emails.apply(args=[self.messages]).get()
+
+        self.assertEqual(sent_count, 3)
+        self.assertEqual(len(mail.outbox), 3)
+        self.assertIsNot(services.EMAIL_CONNECTION, stale_connection)
+
+    def test_성공__유지된_연결_재사용(self):
+        """테스트: 서버가 유지하는 연결은 확인 후 그대로 재사용"""
+        email_connection = smtp.EmailBackend()
+        email_connection.connection = MagicMock()
+        email_connection.connection.noop.return_value = (250, b"OK")
+        services.EMAIL_CONNECTION = email_connection
+
+        self.assertIs(get_email_connection(), email_connection)
+        email_connection.connection.noop.assert_called_once()
+
+    def test_실패__발송하지_못한_메일만_재시도(self):
+        """테스트: 발송 실패 시 연결을 닫고 발송하지 못한 메일만 다시 시도"""
+        send_messages = locmem.EmailBackend.send_messages
+        calls = []
+
+        def fail_second_message(backend, messages):
+            calls.append(messages[0].to[0])
+            if len(calls) == 2:
+                raise smtplib.SMTPServerDisconnected()
+            return send_messages(backend, messages)
+
+        with patch.object(
+            locmem.EmailBackend, "send_messages", fail_second_message
+        ), patch.object(
+            task_send_verification_emails, "retry", side_effect=Retry()
+        ) as mock_retry:
+            with self.assertRaises(Retry):
+                task_send_verification_emails.apply(args=[self.messages], throw=True)
+
+        self.assertEqual(len(mail.outbox), 1)
+        self.assertEqual(mock_retry.call_args.kwargs["args"], [self.messages[1:]])
+        self.assertEqual(mock_retry.call_args.kwargs["countdown"], 2)
+        self.assertIsNone(services.EMAIL_CONNECTION)
+
+
+class EmailTemplateRenderTest(TestCase):
+    """이메일 템플릿 렌더링 테스트"""
+
+    def setUp(self):
+        get_email_template_parts.cache_clear()
+        self.addCleanup(get_email_template_parts.cache_clear)
+        self.url = "https://example.com/confirm/?hashed_email=abc&token=def"
+
+    def test_성공__렌더링_결과_동일(self):
+        """테스트: 고정 조각으로 만든 HTML 이 템플릿 렌더링 결과와 동일"""
+        for template in EmailTemplate:
+            _, _, template_path = template.value
+            with self.subTest(template=template.name):
+                self.assertEqual(
+                    render_email_template(template_path, self.url),
+                    render_to_string(template_path, {"url": mark_safe(self.url)}),
+                )
+
+    def test_성공__템플릿_한_번만_렌더링(self):
+        """테스트: 템플릿은 처음 한 번만 렌더링하고 이후에는 URL 만 교체"""
+        with patch(
+            "apps.account.v1.services.render_to_string", wraps=render_to_string
+        ) as mock_render_to_string:
+            render_email_template("account/signup.html", self.url)
+            html_message = render_email_template(
+                "account/signup.html", "https://example.com/confirm/?token=other"
+            )
+
+        mock_render_to_string.assert_called_once()
+        self.assertIn("https://example.com/confirm/?token=other", html_message)
+        self.assertNotIn(self.url, html_message)
+
+    def test_성공__URL_이_없는_템플릿(self):
+        """테스트: 템플릿에 URL 이 없으면 메일마다 템플릿 렌더링"""
+        with patch(
+            "apps.account.v1.services.render_to_string", return_value="<p>static</p>"
+        ) as mock_render_to_string:
+            html_message = render_email_template("account/signup.html", self.url)
+
+        self.assertEqual(html_message, "<p>static</p>")
+        self.assertEqual(mock_render_to_string.call_count, 2)
+
+    def test_성공__벤치마크_명령(self):
+        """테스트: 벤치마크 명령이 템플릿별 처리량 출력"""
+        stdout = io.StringIO()
+        call_command("benchmark_email_templates", number=10, stdout=stdout)
+
+        output = stdout.getvalue()
+        self.assertIn("account/signup.html", output)
+        self.assertIn("account/reset_password.html", output)
+
+
+class ValidatorsTest(TestCase):
+    """형식 검사 함수 테스트"""
+
+    def test_성공__이메일_형식(self):
+        """테스트: 이메일 형식 검사"""
+        self.assertTrue(is_valid_email("test.user+tag@example.co.kr"))
+        self.assertFalse(is_valid_email("invalid-email"))
+        self.assertFalse(is_valid_email("test@example"))
+
+    def test_성공__비밀번호_형식(self):
+        """테스트: 영문 소문자와 숫자를 포함한 6~30자 비밀번호만 허용"""
+        self.assertTrue(is_valid_password("password123"))
+        self.assertFalse(is_valid_password("password"))
+        self.assertFalse(is_valid_password("PASSWORD123"))
+        self.assertFalse(is_valid_password("pw1"))
+        self.assertFalse(is_valid_password("password123!"))
+
+    def test_성공__32자리_16진수_형식(self):
+        """테스트: 해시된 이메일, 인증 토큰 형식 검사"""
+        self.assertTrue(is_valid_hex32("0123456789abcdef" * 2))
+        self.assertFalse(is_valid_hex32("0123456789ABCDEF" * 2))
+        self.assertFalse(is_valid_hex32("0123456789abcdef"))
+
+    def test_성공__벤치마크_명령(self):
+        """테스트: 벤치마크 명령이 항목별 처리량 출력"""
+        stdout = io.StringIO()
+        stderr = io.StringIO()
+        call_command("benchmark_validators", number=10, stdout=stdout, stderr=stderr)
+
+        self.assertIn("email", stdout.getvalue())
+        self.assertIn("log with keyword", stdout.getvalue())
+        self.assertEqual(stderr.getvalue(), "")
+
+
+class SensitiveFilterTest(TestCase):
+    """로깅 민감 정보 마스킹 필터 테스트"""
+
+    def filter_message(self, msg):
+        record = logging.LogRecord(__name__, logging.INFO, "", 0, msg, None, None)
+        self.assertTrue(SensitiveFilter().filter(record))
+        return record.msg
+
+    def test_성공__JSON_마스킹(self):
+        """테스트: JSON 형식의 민감 정보 마스킹"""
+        msg = self.filter_message(
+            '{"email": "test@example.com", "password": "secret", '
+            '"refresh_token":"token"}'
+        )
+
+        self.assertEqual(
+            msg,
+            '{"email": "test@example.com", "password": "****", '
+            '"refresh_token": "****"}',
+        )
+
+    def test_성공__딕셔너리_마스킹(self):
+        """테스트: 딕셔너리 형식의 민감 정보 마스킹"""
+        msg = self.filter_message(
+            {"email": "test@example.com", "access_token": "token"}
+        )
+
+        self.assertEqual(msg, "{'email': 'test@example.com', 'access_token': '****'}")
+
+    def test_성공__쿼리_문자열_마스킹(self):
+        """테스트: 쿼리 문자열 형식의 민감 정보 마스킹"""
+        msg = self.filter_message("/v1/?password=secret&access_token=token&page=1")
+
+        self.assertEqual(msg, "/v1/?password=****&access_token=****&page=1")
+
+    def test_성공__민감_정보_없음(self):
+        """테스트: 민감 정보가 없으면 로그를 그대로 유지"""
+        with patch.object(SensitiveFilter, "sanitize_dict") as mock_sanitize_dict:
+            msg = self.filter_message('"GET /v1/user/me/ HTTP/1.1" 200 512')
+
+        self.assertEqual(msg, '"GET /v1/user/me/ HTTP/1.1" 200 512')
+        mock_sanitize_dict.assert_not_called()
@@ -0,0 +1,286 @@
+import logging
+import threading
+import time
+
+import redis
+from django.conf import settings
+from django.utils import timezone
+from django.utils.translation import gettext_lazy as _
+from rest_framework_simplejwt import tokens
+from rest_framework_simplejwt.exceptions import TokenError
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.token_blacklist.models import BlacklistedToken
+
+from base.utils.bloom_filter import BloomFilter
+
+logger = logging.getLogger(__name__)
+
+TOKEN_BLACKLIST_KEY_PREFIX = "token:blacklist"
+ACCESS_TOKEN_REVOKED_KEY_PREFIX = "token:revoked"
+
+# 연결은 첫 명령 실행 시 생성됨
+# 인증 요청에서 사용하므로 Redis 장애 시 오래 기다리지 않도록 대기 시간 제한
+REDIS_CLIENT = redis.Redis.from_url(
+    settings.TOKEN_BLACKLIST_REDIS_URL,
+    socket_timeout=settings.TOKEN_BLACKLIST_REDIS_TIMEOUT,
+    socket_connect_timeout=settings.TOKEN_BLACKLIST_REDIS_TIMEOUT,
+)
+
+
+def get_token_blacklist_key(jti: str) -> str:
+    """토큰 블랙리스트 키 조회"""
+    django_env = settings.DJANGO_ENVIRONMENT
+    return f"{TOKEN_BLACKLIST_KEY_PREFIX}:{django_env}:{jti}"
+
+
+def blacklist_jti(jti: str, exp: int):
+    """
+    토큰 블랙리스트 추가:
+    토큰의 남은 유효 시간 동안만 보관해 만료된 토큰은 자동으로 삭제
+
+    Args:
+        jti (str): 토큰 ID
+        exp (int): 토큰 만료 시각 (Unix timestamp)
+    """
+    ttl = int(exp - time.time()) + 1
+    if ttl > 0:
+        REDIS_CLIENT.set(get_token_blacklist_key(jti), 1, ex=ttl)
+
+
+def backfill_token_blacklist(batch_size: int = None) -> int:
+    """
+    이력 테이블의 블랙리스트를 Redis 에 추가:
+    Redis 블랙리스트 이전에 블랙리스트에 추가된 토큰이 다시 유효해지지 않도록
+    만료되지 않은 토큰을 남은 유효 시간 동안 보관
+
+    Args:
+        batch_size (int): 한 번에 추가할 토큰 수
+
+    Returns:
+        int: 추가한 토큰 수
+    """
+    batch_size = batch_size or settings.TOKEN_BLACKLIST_BACKFILL_BATCH_SIZE
+    queryset = BlacklistedToken.objects.filter(
+        token__expires_at__gt=timezone.now()
+    ).order_by("id")
+    count = 0
+    last_id = 0
+    while True:
+        rows = list(
+            queryset.filter(id__gt=last_id).values_list(
+                "id", "token__jti", "token__expires_at"
+            )[:batch_size]
+        )
+        if not rows:
+            return count
+        pipeline = REDIS_CLIENT.pipeline()
+        for _id, jti, expires_at in rows:
+            ttl = int(expires_at.timestamp() - time.time()) + 1
+            if ttl > 0:
+                pipeline.set(get_token_blacklist_key(jti), 1, ex=ttl)
+                count += 1
+        pipeline.execute()
+        last_id = rows[-1][0]
+
+
+def is_jti_blacklisted(jti: str) -> bool:
+    """토큰 블랙리스트 포함 여부 확인"""
+    return bool(REDIS_CLIENT.exists(get_token_blacklist_key(jti)))
+
+
+class RefreshToken(tokens.RefreshToken):
+    """
+    리프레시 토큰:
+    블랙리스트는 Redis 에서 확인하고,
+    데이터베이스 테이블(OutstandingToken, BlacklistedToken)은 이력 저장 설정 시에만 사용
+    """
+
+    # [Why]
+    # Q. 블랙리스트를 데이터베이스가 아닌 Redis 에서 확인하는 이유는?
+    # A. 토큰 재발급마다 블랙리스트 테이블을 조회하지 않고,
+    #    만료된 토큰은 TTL 로 자동 삭제되어 저장소가 계속 커지지 않도록 하기 위함
+
+    # [Why]
+    # Q. Redis 를 사용할 수 없고 이력 테이블도 사용하지 않으면 재발급을 거부하는 이유는?
+    # A. 블랙리스트 추가(로그아웃)와 같이 확인할 수 없으면 실패로 처리해,
+    #    로그아웃한 리프레시 토큰으로 재발급되지 않도록 하기 위함 (fail-closed)
+    #    Redis 장애 동안에는 재발급이 실패하지만 발급된 액세스 토큰은 만료 전까지 사용 가능
+
+    def check_blacklist(self):
+        """블랙리스트 포함 여부 확인"""
+        jti = self.payload[api_settings.JTI_CLAIM]
+        try:
+            is_blacklisted = is_jti_blacklisted(jti)
+        except redis.RedisError as e:
+            logger.warning(f"Error checking token blacklist: {e}")
+            # Redis 를 사용할 수 없으면 이력 테이블에서 확인
+            if not settings.TOKEN_BLACKLIST_AUDIT:
+                raise TokenError(_("Token blacklist is unavailable"))
+            super().check_blacklist()
+            return
+        if is_blacklisted:
+            raise TokenError(_("Token is blacklisted"))
+
+    def blacklist(self):
+        """블랙리스트 추가"""
+        try:
+            blacklist_jti(self.payload[api_settings.JTI_CLAIM], self.payload["exp"])
+        except redis.RedisError as e:
+            logger.warning(f"Error blacklisting token: {e}")
+            # 이력 테이블도 사용하지 않으면 블랙리스트에 추가할 수 없음
+            if not settings.TOKEN_BLACKLIST_AUDIT:
+                raise
+        if settings.TOKEN_BLACKLIST_AUDIT:
+            return super().blacklist()
+
+    @classmethod
+    def for_user(cls, user):
+        """토큰 발급 (이력 저장 설정 시에만 발급 이력 저장)"""
+        if settings.TOKEN_BLACKLIST_AUDIT:
+            return super().for_user(user)
+        return super(tokens.BlacklistMixin, cls).for_user(user)
+
+
+def get_revoked_access_token_key() -> str:
+    """폐기한 액세스 토큰 목록 키 조회 (발행/구독 채널로도 사용)"""
+    django_env = settings.DJANGO_ENVIRONMENT
+    return f"{ACCESS_TOKEN_REVOKED_KEY_PREFIX}:{django_env}"
+
+
+class RevokedAccessTokenFilter:
+    """
+    폐기한 액세스 토큰 필터:
+    Redis 의 폐기 목록을 프로세스 메모리의 블룸 필터로 복사해 두고,
+    다른 프로세스에서 폐기한 토큰은 발행/구독으로 전달받아 추가
+    """
+
+    # [Why]
+    # Q. 요청마다 Redis 를 조회하지 않고 블룸 필터를 사용하는 이유는?
+    # A. 대부분의 토큰은 폐기되지 않았으므로 메모리에서 바로 통과시키고,
+    #    블룸 필터에 포함된 경우에만 Redis 에서 오탐 여부를 확인하기 위함
+    #    블룸 필터는 삭제할 수 없으므로 주기적으로 다시 만들어 만료된 토큰을 제외
+
+    # [Why]
+    # Q. Redis 장애 시 폐기 여부를 어떻게 판단하는가?
+    # A. 블룸 필터에 포함된 토큰은 대부분 폐기된 토큰이므로 폐기로 판단 (fail-closed)
+    #    폐기 목록을 한 번도 불러오지 못했으면 모든 토큰을 거부하게 되므로 통과시킴 (fail-open)
+    #    이 경우 폐기한 토큰도 최대 액세스 토큰 유효 시간 동안 사용될 수 있음
+    #    불러온 뒤 구독이 끊기면 다시 불러올 때까지 다른 프로세스의 폐기는 알 수 없음
+
+    def __init__(self):
+        self.bloom_filter = None
+        self.pubsub_thread = None
+        self.reload_thread = None
+        self.reload_at = 0
+        self.is_load_failed = False
+        self.lock = threading.Lock()
+
+    def _handle_exception(self, e, pubsub, thread):
+        """구독 오류 시 구독을 중단하고 다음 확인 시 다시 불러오기"""
+        logger.warning(f"Error subscribing revoked access tokens: {e}")
+        thread.stop()
+        pubsub.close()
+        self.reload_at = 0
+
+    def load(self):
+        """폐기 목록을 불러와 블룸 필터를 다시 만들고 폐기 알림 구독"""
+        key = get_revoked_access_token_key()
+        bloom_filter = BloomFilter(
+            size=settings.ACCESS_TOKEN_REVOCATION_FILTER_SIZE,
+            hash_count=settings.ACCESS_TOKEN_REVOCATION_FILTER_HASH_COUNT,
+        )
+        pubsub = REDIS_CLIENT.pubsub(ignore_subscribe_messages=True)
+        try:
+            # 목록을 불러오는 동안 폐기된 토큰이 누락되지 않도록 먼저 구독
+            pubsub.subscribe(
+                **{key: lambda message: bloom_filter.add(message["data"].decode())}
+            )
+            REDIS_CLIENT.zremrangebyscore(key, "-inf", time.time())
+            for jti in REDIS_CLIENT.zrange(key, 0, -1):
+                bloom_filter.add(jti.decode())
+        except redis.RedisError:
+            pubsub.close()
+            raise
+        if self.pubsub_thread:
+            self.pubsub_thread.stop()
+        self.pubsub_thread = pubsub.run_in_thread(
+            sleep_time=1,
+            daemon=True,
+            exception_handler=self._handle_exception,
+        )
+        self.bloom_filter = bloom_filter
+
+    def reload(self):
+        """폐기 목록 다시 불러오기 (실패 시 기존 블룸 필터 유지)"""
+        try:
+            self.load()
+            self.is_load_failed = False
+        except redis.RedisError as e:
+            logger.warning(f"Error loading revoked access tokens: {e}")
+            self.is_load_failed = True
+        finally:
+            self.lock.release()
+
+    def reload_in_background(self):
+        """
+        다시 불러올 시각이 지났으면 백그라운드에서 폐기 목록 다시 불러오기:
+        인증 요청은 기다리지 않고 기존 블룸 필터로 확인 (다른 요청이 불러오는 중이면 무시)
+        """
+        if self.reload_at <= time.time() and self.lock.acquire(blocking=False):
+            self.reload_at = (
+                time.time() + settings.ACCESS_TOKEN_REVOCATION_RELOAD_SECONDS
+            )
+            self.reload_thread = threading.Thread(target=self.reload, daemon=True)
+            self.reload_thread.start()
+
+    def add(self, jti: str):
+        """현재 프로세스의 블룸 필터에 추가"""
+        if self.bloom_filter is not None:
+            self.bloom_filter.add(jti)
+
+    def is_revoked(self, jti: str) -> bool:
+        """
+        액세스 토큰 폐기 여부 확인
+
+        Args:
+            jti (str): 토큰 ID
+
+        Returns:
+            bool: 폐기 여부 (폐기 목록을 불러온 적이 없고 Redis 장애 시 False)
+        """
+        self.reload_in_background()
+        bloom_filter = self.bloom_filter
+        if bloom_filter is None:
+            # 처음 불러오는 동안에는 Redis 에서 바로 확인하고,
+            # 불러오지 못했으면 요청마다 연결을 기다리지 않도록 통과
+            if self.is_load_failed:
+                return False
+        elif jti not in bloom_filter:
+            return False
+        try:
+            return REDIS_CLIENT.zscore(get_revoked_access_token_key(), jti) is not None
+        except redis.RedisError as e:
+            logger.warning(f"Error checking revoked access token: {e}")
+            return bloom_filter is not None
+
+
+REVOKED_ACCESS_TOKEN_FILTER = RevokedAccessTokenFilter()
+
+
+def revoke_access_token(token):
+    """
+    액세스 토큰 폐기:
+    폐기 목록에 만료 시각과 함께 추가하고 다른 프로세스에 알림
+
+    Args:
+        token: 액세스 토큰
+    """
+    jti = token[api_settings.JTI_CLAIM]
+    key = get_revoked_access_token_key()
+    pipeline = REDIS_CLIENT.pipeline()
+    pipeline.zadd(key, {jti: token["exp"]})
+    # 폐기 목록은 액세스 토큰 유효 시간이 지나면 모두 만료됨
+    pipeline.expire(key, int(api_settings.ACCESS_TOKEN_LIFETIME.total_seconds()) + 1)
+    pipeline.publish(key, jti)
+    pipeline.execute()
+    REVOKED_ACCESS_TOKEN_FILTER.add(jti)
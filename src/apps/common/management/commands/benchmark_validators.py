@@ -0,0 +1,99 @@
+import logging
+import re
+import timeit
+
+from django.core.management.base import BaseCommand
+
+from base.utils.validators import (
+    EMAIL_REGEX,
+    HEX32_REGEX,
+    PASSWORD_REGEX,
+    is_valid_email,
+    is_valid_hex32,
+    is_valid_password,
+)
+from conf.filters import SENSITIVE_KEYWORDS, SensitiveFilter
+
+
+def sanitize_per_keyword(record):
+    """키워드마다 정규식을 만들어 치환하는 기존 방식 (비교 기준)"""
+    for keyword in SENSITIVE_KEYWORDS:
+        record.msg = str(record.msg)
+        if keyword in record.msg:
+            regex_mapper = {
+                f'"{keyword}":[ ]*"[^"]*"': f'"{keyword}": "****"',
+                f"'{keyword}':[ ]*'[^']*'": f"'{keyword}': '****'",
+                f"{keyword}=[^&]+&?": f"{keyword}=****&",
+            }
+            for regex, replace in regex_mapper.items():
+                record.msg = re.sub(regex, replace, record.msg)
+    return True
+
+
+class Command(BaseCommand):
+    help = (
+        "Compares the throughput of inline regex validation and log masking "
+        "against the precompiled validators and SensitiveFilter."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--number",
+            type=int,
+            default=100000,
+            help="Number of calls measured per case.",
+        )
+
+    def write_result(self, name, baseline, optimized, number):
+        baseline_seconds = timeit.timeit(baseline, number=number)
+        optimized_seconds = timeit.timeit(optimized, number=number)
+        self.stdout.write(
+            f"{name}: "
+            f"inline {number / baseline_seconds:,.0f} calls/s, "
+            f"precompiled {number / optimized_seconds:,.0f} calls/s "
+            f"({baseline_seconds / optimized_seconds:.1f}x)"
+        )
+
+    def handle(self, *args, **options):
+        number = options["number"]
+        validators = [
+            ("email", EMAIL_REGEX, is_valid_email, "test.user+tag@example.com"),
+            ("password", PASSWORD_REGEX, is_valid_password, "password123"),
+            ("hex32", HEX32_REGEX, is_valid_hex32, "0123456789abcdef" * 2),
+        ]
+        for name, regex, validator, value in validators:
+            self.write_result(
+                name,
+                lambda: re.match(regex.pattern, value),
+                lambda: validator(value),
+                number,
+            )
+
+        sensitive_filter = SensitiveFilter()
+        messages = [
+            ("log without keyword", '"GET /v1/user/me/ HTTP/1.1" 200 512'),
+            (
+                "log with keyword",
+                '{"email": "test@example.com", "password": "password123"}',
+            ),
+        ]
+        record = logging.LogRecord(__name__, logging.INFO, "", 0, "", None, None)
+
+        def filter_message(log_filter, msg):
+            record.msg = msg
+            log_filter(record)
+            return record.msg
+
+        for name, msg in messages:
+            # 기존 방식과 마스킹 결과가 같은지 먼저 확인
+            if filter_message(sensitive_filter.filter, msg) != filter_message(
+                sanitize_per_keyword, msg
+            ):
+                self.stderr.write(f"{name}: masked output differs")
+                continue
+            self.write_result(
+                name,
+                lambda: filter_message(sanitize_per_keyword, msg),
+                lambda: filter_message(sensitive_filter.filter, msg),
+                number,
+            )
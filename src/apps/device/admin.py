@@ -1,7 +1,18 @@
 from django.contrib import admin
 from django.utils.html import format_html
 
-from apps.device.models import Device, PushToken
+from apps.device.models import (
+    Device,
+    PushAudience,
+    PushCampaign,
+    PushCampaignBatch,
+    PushToken,
+)
+from apps.device.utils import (
+    cancel_push_campaigns,
+    pause_push_campaigns,
+    resume_push_campaigns,
+)
 
 
 class PushTokenInline(admin.TabularInline):
@@ -101,6 +112,7 @@ class PushTokenAdmin(admin.ModelAdmin):
     def mark_as_valid(self, request, queryset):
         """유효로 표시"""
         updated = queryset.update(is_valid=True)
+        PushAudience.refresh(list(queryset.values_list("id", flat=True)))
         self.message_user(request, f"{updated}개의 토큰이 유효로 표시되었습니다.")
 
     mark_as_valid.short_description = "선택된 토큰을 유효로 표시"
@@ -108,6 +120,80 @@ class PushTokenAdmin(admin.ModelAdmin):
     def mark_as_invalid(self, request, queryset):
         """무효로 표시"""
         updated = queryset.update(is_valid=False)
+        PushAudience.refresh(list(queryset.values_list("id", flat=True)))
         self.message_user(request, f"{updated}개의 토큰이 무효로 표시되었습니다.")
 
     mark_as_invalid.short_description = "선택된 토큰을 무효로 표시"
+
+
+class PushCampaignBatchInline(admin.TabularInline):
+    """푸시 캠페인 배치 인라인"""
+
+    model = PushCampaignBatch
+    extra = 0
+    can_delete = False
+    fields = [
+        "first_push_token_id",
+        "last_push_token_id",
+        "success_count",
+        "failure_count",
+        "invalid_count",
+        "created_at",
+    ]
+    readonly_fields = fields
+
+    def has_add_permission(self, request, obj=None):
+        return False
+
+
+@admin.register(PushCampaign)
+class PushCampaignAdmin(admin.ModelAdmin):
+    """푸시 캠페인 어드민"""
+
+    list_display = [
+        "id",
+        "title",
+        "platform",
+        "status",
+        "scheduled_at",
+        "success_count",
+        "failure_count",
+        "invalid_count",
+        "completed_at",
+    ]
+    list_filter = ["status", "platform", "scheduled_at"]
+    search_fields = ["title"]
+    readonly_fields = [
+        "status",
+        "last_push_token_id",
+        "success_count",
+        "failure_count",
+        "invalid_count",
+        "started_at",
+        "completed_at",
+        "created_at",
+        "updated_at",
+    ]
+    inlines = [PushCampaignBatchInline]
+    actions = ["pause", "resume", "cancel"]
+
+    def pause(self, request, queryset):
+        """일시 정지"""
+        updated = pause_push_campaigns(queryset)
+        self.message_user(request, f"{updated}개의 캠페인이 일시 정지되었습니다.")
+
+    pause.short_description = "선택된 캠페인 일시 정지"
+
+    def resume(self, request, queryset):
+        """재개"""
+        updated = resume_push_campaigns(queryset)
+        self.message_user(request, f"{updated}개의 캠페인이 재개되었습니다.")
+
+    resume.short_description = "선택된 캠페인 재개"
+
+    def cancel(self, request, queryset):
+        """취소"""
+        updated = cancel_push_campaigns(queryset)
+        self.message_user(request, f"{updated}개의 캠페인이 취소되었습니다.")
+
+    cancel.short_description = "선택된 캠페인 취소"
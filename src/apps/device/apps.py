@@ -7,7 +7,8 @@ class DeviceConfig(AppConfig):
     def ready(self):
         import sys
 
-        if "runserver" in sys.argv or "gunicorn" in sys.argv:
+        # 푸시를 발송하는 Celery 워커에서도 초기화
+        if "runserver" in sys.argv or "gunicorn" in sys.argv or "worker" in sys.argv:
             from conf import firebase_config
 
             firebase_config.initialize_firebase()
@@ -0,0 +1,123 @@
+# Generated by Django 5.2.18 on 2026-10-19 08:34
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+def backfill_push_audience(apps, schema_editor):
+    """기존 유효한 푸시 토큰의 발송 대상 채우기"""
+    PushToken = apps.get_model("device", "PushToken")
+    PushAudience = apps.get_model("device", "PushAudience")
+    push_tokens = (
+        PushToken.objects.filter(is_valid=True)
+        .values(
+            "id",
+            "token",
+            "device__user_id",
+            "device__platform",
+            "device__user__preference__is_push_notification",
+            "device__user__preference__is_night_notification",
+        )
+        .iterator(chunk_size=2000)
+    )
+    audiences = []
+    for push_token in push_tokens:
+        audiences.append(
+            PushAudience(
+                push_token_id=push_token["id"],
+                token=push_token["token"],
+                user_id=push_token["device__user_id"],
+                platform=push_token["device__platform"],
+                is_push_notification=push_token[
+                    "device__user__preference__is_push_notification"
+                ]
+                is not False,
+                is_night_notification=bool(
+                    push_token["device__user__preference__is_night_notification"]
+                ),
+            )
+        )
+        if len(audiences) >= 2000:
+            PushAudience.objects.bulk_create(audiences)
+            audiences = []
+    PushAudience.objects.bulk_create(audiences)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("device", "0001_initial"),
+        ("user", "0001_initial"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="PushAudience",
+            fields=[
+                (
+                    "push_token",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name="audience",
+                        serialize=False,
+                        to="device.pushtoken",
+                        verbose_name="푸시 토큰",
+                    ),
+                ),
+                ("token", models.CharField(max_length=255, verbose_name="토큰")),
+                (
+                    "platform",
+                    models.CharField(
+                        choices=[(1, "Android"), (2, "iOS"), (3, "Web")],
+                        default=3,
+                        max_length=50,
+                        verbose_name="플랫폼",
+                    ),
+                ),
+                (
+                    "is_push_notification",
+                    models.BooleanField(default=True, verbose_name="푸시 알림 동의"),
+                ),
+                (
+                    "is_night_notification",
+                    models.BooleanField(default=False, verbose_name="야간 수신 동의"),
+                ),
+                (
+                    "updated_at",
+                    models.DateTimeField(auto_now=True, verbose_name="수정 일시"),
+                ),
+                (
+                    "user",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="push_audiences",
+                        to=settings.AUTH_USER_MODEL,
+                        verbose_name="사용자",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "푸시 발송 대상",
+                "verbose_name_plural": "푸시 발송 대상",
+                "db_table": "push_audience",
+                "indexes": [
+                    models.Index(fields=["token"], name="push_audien_token_ae12dd_idx"),
+                    models.Index(
+                        fields=[
+                            "is_push_notification",
+                            "is_night_notification",
+                            "push_token",
+                        ],
+                        name="push_audience_segment_idx",
+                    ),
+                ],
+            },
+        ),
+        migrations.RunPython(
+            backfill_push_audience,
+            reverse_code=migrations.RunPython.noop,
+        ),
+    ]
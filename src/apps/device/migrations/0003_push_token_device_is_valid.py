@@ -0,0 +1,19 @@
+# Generated by Django 5.2.18 on 2026-10-19 08:37
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("device", "0002_push_audience"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="pushtoken",
+            index=models.Index(
+                fields=["device", "is_valid"], name="push_token_device__6bedd2_idx"
+            ),
+        ),
+    ]
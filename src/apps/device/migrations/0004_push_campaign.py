@@ -0,0 +1,171 @@
+# Generated by Django 5.2.18 on 2026-10-19 08:40
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("device", "0003_push_token_device_is_valid"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="PushCampaign",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("title", models.CharField(max_length=100, verbose_name="알림 제목")),
+                ("body", models.TextField(verbose_name="알림 내용")),
+                (
+                    "data",
+                    models.JSONField(blank=True, default=dict, verbose_name="데이터"),
+                ),
+                (
+                    "platform",
+                    models.CharField(
+                        blank=True,
+                        choices=[(1, "Android"), (2, "iOS"), (3, "Web")],
+                        help_text="비어 있으면 전체 플랫폼에 발송",
+                        max_length=50,
+                        null=True,
+                        verbose_name="플랫폼",
+                    ),
+                ),
+                (
+                    "status",
+                    models.PositiveSmallIntegerField(
+                        choices=[
+                            (1, "예약"),
+                            (2, "발송 중"),
+                            (3, "일시 정지"),
+                            (4, "완료"),
+                            (5, "취소"),
+                        ],
+                        default=1,
+                        verbose_name="상태",
+                    ),
+                ),
+                ("scheduled_at", models.DateTimeField(verbose_name="발송 예약 일시")),
+                (
+                    "rate_limit",
+                    models.PositiveIntegerField(
+                        default=500, verbose_name="초당 발송 수"
+                    ),
+                ),
+                (
+                    "last_push_token_id",
+                    models.BigIntegerField(
+                        default=0, verbose_name="마지막 발송 푸시 토큰 ID"
+                    ),
+                ),
+                (
+                    "success_count",
+                    models.PositiveIntegerField(default=0, verbose_name="성공 수"),
+                ),
+                (
+                    "failure_count",
+                    models.PositiveIntegerField(default=0, verbose_name="실패 수"),
+                ),
+                (
+                    "invalid_count",
+                    models.PositiveIntegerField(
+                        default=0, verbose_name="무효화 토큰 수"
+                    ),
+                ),
+                (
+                    "started_at",
+                    models.DateTimeField(
+                        blank=True, null=True, verbose_name="발송 시작 일시"
+                    ),
+                ),
+                (
+                    "completed_at",
+                    models.DateTimeField(
+                        blank=True, null=True, verbose_name="발송 완료 일시"
+                    ),
+                ),
+                (
+                    "created_at",
+                    models.DateTimeField(auto_now_add=True, verbose_name="생성 일시"),
+                ),
+                (
+                    "updated_at",
+                    models.DateTimeField(auto_now=True, verbose_name="수정 일시"),
+                ),
+            ],
+            options={
+                "verbose_name": "푸시 캠페인",
+                "verbose_name_plural": "푸시 캠페인",
+                "db_table": "push_campaign",
+                "indexes": [
+                    models.Index(
+                        fields=["status", "scheduled_at"],
+                        name="push_campai_status_28874f_idx",
+                    )
+                ],
+            },
+        ),
+        migrations.CreateModel(
+            name="PushCampaignBatch",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "first_push_token_id",
+                    models.BigIntegerField(verbose_name="첫 푸시 토큰 ID"),
+                ),
+                (
+                    "last_push_token_id",
+                    models.BigIntegerField(verbose_name="마지막 푸시 토큰 ID"),
+                ),
+                (
+                    "success_count",
+                    models.PositiveIntegerField(default=0, verbose_name="성공 수"),
+                ),
+                (
+                    "failure_count",
+                    models.PositiveIntegerField(default=0, verbose_name="실패 수"),
+                ),
+                (
+                    "invalid_count",
+                    models.PositiveIntegerField(
+                        default=0, verbose_name="무효화 토큰 수"
+                    ),
+                ),
+                (
+                    "created_at",
+                    models.DateTimeField(auto_now_add=True, verbose_name="생성 일시"),
+                ),
+                (
+                    "campaign",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="batches",
+                        to="device.pushcampaign",
+                        verbose_name="캠페인",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "푸시 캠페인 배치",
+                "verbose_name_plural": "푸시 캠페인 배치",
+                "db_table": "push_campaign_batch",
+            },
+        ),
+    ]
@@ -1,4 +1,27 @@
-from django.db import models
+from django.db import connections, models, router
+from django.utils import timezone
+
+
+def upsert_returning(model, sql: str, params: list, using: str):
+    """
+    단일 구문 upsert 실행 후 저장된 행 조회:
+    RETURNING 으로 같은 구문에서 저장된 행을 받음
+    (지원하는 데이터베이스인 PostgreSQL, SQLite 3.35 이상 모두 RETURNING 지원)
+
+    Args:
+        model: upsert 할 모델
+        sql (str): INSERT ... ON CONFLICT 구문 (RETURNING 제외)
+        params (list): 구문 파라미터
+        using (str): 데이터베이스 별칭
+
+    Returns:
+        저장된 모델 인스턴스 (저장하지 않은 경우 None)
+    """
+    columns = ", ".join(field.column for field in model._meta.concrete_fields)
+    return next(
+        iter(model.objects.raw(f"{sql} RETURNING {columns}", params, using=using)),
+        None,
+    )
 
 
 class DevicePlatform(models.IntegerChoices):
@@ -40,6 +63,50 @@ class Device(models.Model):
         verbose_name="수정 일시",
     )
 
+    @classmethod
+    def upsert(cls, user_id: int, uuid, platform) -> "Device | None":
+        """
+        디바이스 등록:
+        사용자의 디바이스가 이미 있으면 플랫폼만 갱신하고 저장된 디바이스 반환
+
+        Returns:
+            Device: 등록된 디바이스 (다른 사용자가 등록한 UUID 인 경우 None)
+        """
+        # [Why]
+        # Q. 존재 여부를 조회한 뒤 생성하지 않고 ON CONFLICT 구문을 사용하는 이유는?
+        # A. 앱 실행 시 같은 디바이스 등록 요청이 동시에 들어오면
+        #    조회와 생성 사이에 UUID unique 제약 오류가 발생하기 때문
+        #    한 구문으로 처리해 경합을 없애고 조회 쿼리도 줄임
+        using = router.db_for_write(cls)
+        connection = connections[using]
+        now = timezone.now()
+        params = [
+            user_id,
+            cls._meta.get_field("uuid").get_db_prep_value(uuid, connection),
+            cls._meta.get_field("platform").get_db_prep_value(platform, connection),
+            cls._meta.get_field("created_at").get_db_prep_value(now, connection),
+        ]
+        # 플랫폼이 바뀐 경우에만 수정 일시 갱신
+        sql = f"""
+            INSERT INTO {cls._meta.db_table} (user_id, uuid, platform, created_at, updated_at)
+            VALUES (%s, %s, %s, %s, %s)
+            ON CONFLICT (uuid) DO UPDATE SET
+                platform = excluded.platform,
+                updated_at = CASE
+                    WHEN {cls._meta.db_table}.platform = excluded.platform
+                    THEN {cls._meta.db_table}.updated_at
+                    ELSE excluded.updated_at
+                END
+            WHERE {cls._meta.db_table}.user_id = excluded.user_id
+        """
+        device = upsert_returning(cls, sql, params + params[-1:], using=using)
+        # 플랫폼이 바뀌면 발송 대상의 플랫폼도 갱신
+        if device and device.updated_at == now and device.created_at != now:
+            PushAudience.objects.filter(push_token__device_id=device.id).update(
+                platform=device.platform
+            )
+        return device
+
     class Meta:
         db_table = "device"
         verbose_name = "디바이스"
@@ -78,14 +145,372 @@ class PushToken(models.Model):
         verbose_name="수정 일시",
     )
 
+    # 변경 여부 확인에 사용하는 필드
+    TRACKED_FIELDS = ["device_id", "token", "is_valid"]
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance._loaded_values = instance.get_tracked_values()
+        return instance
+
+    def get_tracked_values(self) -> dict:
+        """변경 여부 확인 필드 값 조회"""
+        return {
+            field: self.__dict__.get(field, models.DEFERRED)
+            for field in self.TRACKED_FIELDS
+        }
+
+    @classmethod
+    def upsert(cls, user_id: int, device_uuid, token: str) -> "PushToken | None":
+        """
+        푸시 토큰 등록:
+        사용자의 디바이스에 토큰을 등록하거나 무효화된 토큰을 다시 유효하게 변경하고
+        저장된 토큰 반환
+
+        Returns:
+            PushToken: 등록된 토큰
+                (사용자의 디바이스가 없거나, 사용자의 다른 디바이스에 등록된 토큰인 경우 None)
+        """
+        # [Why]
+        # Q. 디바이스 조회, 중복 확인과 토큰 등록을 한 구문으로 처리하는 이유는?
+        # A. 디바이스 조회, 다른 디바이스의 토큰 확인, 토큰 등록을 따로 실행하면
+        #    왕복 횟수가 늘고 동시 요청 시 unique 제약 오류가 발생하기 때문
+        using = router.db_for_write(cls)
+        connection = connections[using]
+        now = timezone.now()
+        device_uuid = Device._meta.get_field("uuid").get_db_prep_value(
+            device_uuid, connection
+        )
+        # [Why]
+        # Q. 이미 유효한 토큰은 수정 일시를 갱신하지 않는 이유는?
+        # A. 반환된 수정 일시로 변경 여부를 확인해,
+        #    변경이 없으면 기존 토큰 무효화와 발송 대상 갱신을 생략하기 위함
+        sql = f"""
+            INSERT INTO {cls._meta.db_table} (device_id, token, is_valid, created_at, updated_at)
+            SELECT id, %s, %s, %s, %s FROM {Device._meta.db_table}
+            WHERE uuid = %s AND user_id = %s AND NOT EXISTS (
+                SELECT 1 FROM {cls._meta.db_table} AS other_token
+                INNER JOIN {Device._meta.db_table} AS other_device
+                    ON other_device.id = other_token.device_id
+                WHERE other_token.token = %s
+                    AND other_device.user_id = %s
+                    AND other_device.uuid <> %s
+            )
+            ON CONFLICT (device_id, token) DO UPDATE SET
+                is_valid = excluded.is_valid,
+                updated_at = CASE
+                    WHEN {cls._meta.db_table}.is_valid
+                    THEN {cls._meta.db_table}.updated_at
+                    ELSE excluded.updated_at
+                END
+        """
+        push_token = upsert_returning(
+            cls,
+            sql,
+            [
+                token,
+                True,
+                cls._meta.get_field("created_at").get_db_prep_value(now, connection),
+                cls._meta.get_field("updated_at").get_db_prep_value(now, connection),
+                device_uuid,
+                user_id,
+                token,
+                user_id,
+                device_uuid,
+            ],
+            using=using,
+        )
+        if push_token and push_token.updated_at == now:
+            push_token.rotate()
+        return push_token
+
+    def rotate(self):
+        """같은 디바이스의 다른 토큰 무효화 및 발송 대상 갱신"""
+        if self.is_valid and (
+            PushToken.objects.filter(device_id=self.device_id, is_valid=True)
+            .exclude(id=self.id)
+            .update(is_valid=False)
+        ):
+            PushAudience.objects.filter(push_token__device_id=self.device_id).exclude(
+                push_token_id=self.id
+            ).delete()
+        # 발송 대상 갱신
+        PushAudience.refresh([self.id])
+
     def save(self, *args, **kwargs):
-        # 신규 등록 또는 유효한 토큰 업데이트 시 기존 토큰 무효화
-        if self.is_valid:
-            self.device.push_tokens.filter(is_valid=True).update(is_valid=False)
+        is_changed = (
+            self._state.adding
+            or getattr(self, "_loaded_values", None) != self.get_tracked_values()
+        )
         super().save(*args, **kwargs)
+        # [Why]
+        # Q. 변경된 값이 없으면 기존 토큰 무효화와 발송 대상 갱신을 생략하는 이유는?
+        # A. 앱 실행 시마다 같은 토큰을 다시 저장하는 경우가 많아,
+        #    불필요한 UPDATE 와 디바이스 조회가 발생하지 않도록 하기 위함
+        if not is_changed:
+            return
+        self._loaded_values = self.get_tracked_values()
+        # 신규 등록 또는 유효한 토큰 업데이트 시 같은 디바이스의 다른 토큰 무효화
+        self.rotate()
 
     class Meta:
         db_table = "push_token"
         verbose_name = "푸시 토큰"
         verbose_name_plural = "푸시 토큰"
         unique_together = ["device", "token"]
+        indexes = [
+            models.Index(fields=["device", "is_valid"]),
+        ]
+
+
+# [Why]
+# Q. 푸시 발송 대상 테이블을 따로 만든 이유는?
+# A. 발송 시마다 PushToken -> Device -> User -> UserPreference 를 조인하지 않고,
+#    수신 동의 여부로 대상을 바로 조회하기 위함
+#    토큰 저장, 선호 정보 수정, 토큰 무효화 시 함께 갱신함
+class PushAudience(models.Model):
+    """푸시 발송 대상"""
+
+    push_token = models.OneToOneField(
+        PushToken,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name="audience",
+        verbose_name="푸시 토큰",
+    )
+    token = models.CharField(
+        max_length=255,
+        verbose_name="토큰",
+    )
+    user = models.ForeignKey(
+        "user.User",
+        on_delete=models.CASCADE,
+        related_name="push_audiences",
+        verbose_name="사용자",
+    )
+    platform = models.CharField(
+        max_length=50,
+        choices=DevicePlatform.choices,
+        default=DevicePlatform.WEB,
+        verbose_name="플랫폼",
+    )
+    is_push_notification = models.BooleanField(
+        default=True,
+        verbose_name="푸시 알림 동의",
+    )
+    is_night_notification = models.BooleanField(
+        default=False,
+        verbose_name="야간 수신 동의",
+    )
+    updated_at = models.DateTimeField(
+        auto_now=True,
+        verbose_name="수정 일시",
+    )
+
+    @classmethod
+    def refresh(cls, push_token_ids: list):
+        """
+        푸시 토큰의 발송 대상 갱신:
+        유효한 토큰은 추가 또는 수정하고, 유효하지 않은 토큰은 삭제
+        """
+        push_tokens = list(
+            PushToken.objects.filter(id__in=push_token_ids).values(
+                "id",
+                "token",
+                "is_valid",
+                "device__user_id",
+                "device__platform",
+                "device__user__preference__is_push_notification",
+                "device__user__preference__is_night_notification",
+            )
+        )
+        cls.objects.filter(
+            push_token_id__in=[
+                push_token["id"]
+                for push_token in push_tokens
+                if not push_token["is_valid"]
+            ]
+        ).delete()
+        # 선호 정보가 없는 사용자는 기본값 사용
+        audiences = [
+            cls(
+                push_token_id=push_token["id"],
+                token=push_token["token"],
+                user_id=push_token["device__user_id"],
+                platform=push_token["device__platform"],
+                is_push_notification=push_token[
+                    "device__user__preference__is_push_notification"
+                ]
+                is not False,
+                is_night_notification=bool(
+                    push_token["device__user__preference__is_night_notification"]
+                ),
+            )
+            for push_token in push_tokens
+            if push_token["is_valid"]
+        ]
+        cls.objects.bulk_create(
+            audiences,
+            update_conflicts=True,
+            unique_fields=["push_token"],
+            update_fields=[
+                "token",
+                "user",
+                "platform",
+                "is_push_notification",
+                "is_night_notification",
+                "updated_at",
+            ],
+        )
+
+    class Meta:
+        db_table = "push_audience"
+        verbose_name = "푸시 발송 대상"
+        verbose_name_plural = "푸시 발송 대상"
+        # [Why]
+        # Q. 수신 동의 여부와 푸시 토큰 ID 복합 인덱스를 추가한 이유는?
+        # A. 동의한 대상만 푸시 토큰 ID 순으로 나눠 조회할 때 인덱스만으로 범위를 찾기 위함
+        indexes = [
+            models.Index(fields=["token"]),
+            models.Index(
+                fields=["is_push_notification", "is_night_notification", "push_token"],
+                name="push_audience_segment_idx",
+            ),
+        ]
+
+
+class PushCampaignStatus(models.IntegerChoices):
+    """푸시 캠페인 상태"""
+
+    SCHEDULED = 1, "예약"
+    RUNNING = 2, "발송 중"
+    PAUSED = 3, "일시 정지"
+    COMPLETED = 4, "완료"
+    CANCELED = 5, "취소"
+
+
+class PushCampaign(models.Model):
+    """푸시 캠페인"""
+
+    title = models.CharField(
+        max_length=100,
+        verbose_name="알림 제목",
+    )
+    body = models.TextField(
+        verbose_name="알림 내용",
+    )
+    data = models.JSONField(
+        default=dict,
+        blank=True,
+        verbose_name="데이터",
+    )
+    platform = models.CharField(
+        max_length=50,
+        choices=DevicePlatform.choices,
+        null=True,
+        blank=True,
+        verbose_name="플랫폼",
+        help_text="비어 있으면 전체 플랫폼에 발송",
+    )
+    status = models.PositiveSmallIntegerField(
+        choices=PushCampaignStatus,
+        default=PushCampaignStatus.SCHEDULED,
+        verbose_name="상태",
+    )
+    scheduled_at = models.DateTimeField(
+        verbose_name="발송 예약 일시",
+    )
+    rate_limit = models.PositiveIntegerField(
+        default=500,
+        verbose_name="초당 발송 수",
+    )
+    # [Why]
+    # Q. 마지막으로 발송한 푸시 토큰 ID를 저장하는 이유는?
+    # A. 발송 중 워커가 종료되어도 처음부터 다시 보내지 않고,
+    #    마지막으로 완료한 배치 이후부터 이어서 발송하기 위함
+    last_push_token_id = models.BigIntegerField(
+        default=0,
+        verbose_name="마지막 발송 푸시 토큰 ID",
+    )
+    success_count = models.PositiveIntegerField(
+        default=0,
+        verbose_name="성공 수",
+    )
+    failure_count = models.PositiveIntegerField(
+        default=0,
+        verbose_name="실패 수",
+    )
+    invalid_count = models.PositiveIntegerField(
+        default=0,
+        verbose_name="무효화 토큰 수",
+    )
+    started_at = models.DateTimeField(
+        null=True,
+        blank=True,
+        verbose_name="발송 시작 일시",
+    )
+    completed_at = models.DateTimeField(
+        null=True,
+        blank=True,
+        verbose_name="발송 완료 일시",
+    )
+    created_at = models.DateTimeField(
+        auto_now_add=True,
+        verbose_name="생성 일시",
+    )
+    updated_at = models.DateTimeField(
+        auto_now=True,
+        verbose_name="수정 일시",
+    )
+
+    @property
+    def message(self) -> dict:
+        """알림 내용"""
+        return {"title": self.title, "body": self.body}
+
+    class Meta:
+        db_table = "push_campaign"
+        verbose_name = "푸시 캠페인"
+        verbose_name_plural = "푸시 캠페인"
+        indexes = [
+            models.Index(fields=["status", "scheduled_at"]),
+        ]
+
+
+class PushCampaignBatch(models.Model):
+    """푸시 캠페인 배치 발송 결과"""
+
+    campaign = models.ForeignKey(
+        PushCampaign,
+        on_delete=models.CASCADE,
+        related_name="batches",
+        verbose_name="캠페인",
+    )
+    first_push_token_id = models.BigIntegerField(
+        verbose_name="첫 푸시 토큰 ID",
+    )
+    last_push_token_id = models.BigIntegerField(
+        verbose_name="마지막 푸시 토큰 ID",
+    )
+    success_count = models.PositiveIntegerField(
+        default=0,
+        verbose_name="성공 수",
+    )
+    failure_count = models.PositiveIntegerField(
+        default=0,
+        verbose_name="실패 수",
+    )
+    invalid_count = models.PositiveIntegerField(
+        default=0,
+        verbose_name="무효화 토큰 수",
+    )
+    created_at = models.DateTimeField(
+        auto_now_add=True,
+        verbose_name="생성 일시",
+    )
+
+    class Meta:
+        db_table = "push_campaign_batch"
+        verbose_name = "푸시 캠페인 배치"
+        verbose_name_plural = "푸시 캠페인 배치"
@@ -1,49 +1,603 @@
-from firebase_admin import messaging
+import collections
+import logging
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
 
-from apps.device.models import PushToken
+import redis
+from django.conf import settings
+from django.db import transaction
+from django.db.models import F, Max, Min
+from django.utils import timezone
+from firebase_admin import exceptions, messaging
 
+from apps.device.models import (
+    PushAudience,
+    PushCampaign,
+    PushCampaignBatch,
+    PushCampaignStatus,
+    PushToken,
+)
 
-def send_test_push_to_all(message: dict, data: dict = None):
-    """전체 사용자 테스트 푸시 발송"""
+logger = logging.getLogger(__name__)
 
-    token_qs = (
-        PushToken.objects.filter(is_valid=True)
-        .values_list("token", flat=True)
-        .iterator()
+# 전체 발송 결과 집계, 발송량 제한용 Redis
+REDIS_CLIENT = redis.Redis.from_url(settings.PUSH_FANOUT_REDIS_URL)
+PUSH_FANOUT_RESULT_KEY = "device:push_fanout:{fanout_id}"
+PUSH_FANOUT_INVALID_TOKENS_KEY = "device:push_fanout:{fanout_id}:invalid_tokens"
+PUSH_FANOUT_BUCKET_KEY = "device:push_fanout:{fanout_id}:bucket"
+PUSH_CAMPAIGN_BUCKET_KEY = "device:push_campaign:{campaign_id}:bucket"
+PUSH_CAMPAIGN_LOCK_KEY = "device:push_campaign:{campaign_id}:lock"
+
+# 토큰 버킷: 채워진 토큰이 충분하면 가져가고 0, 부족하면 기다려야 할 시간(초) 반환
+# 여러 워커의 시계가 달라도 같은 기준으로 채우도록 Redis 서버 시각 사용
+TOKEN_BUCKET_SCRIPT = """
+local rate = tonumber(ARGV[1])
+local amount = tonumber(ARGV[2])
+local time = redis.call("TIME")
+local now = tonumber(time[1]) + tonumber(time[2]) / 1000000
+local bucket = redis.call("HMGET", KEYS[1], "tokens", "updated_at")
+local tokens = tonumber(bucket[1]) or rate
+local updated_at = tonumber(bucket[2]) or now
+tokens = math.min(rate, tokens + math.max(0, now - updated_at) * rate)
+local wait = 0
+if tokens >= amount then
+    tokens = tokens - amount
+else
+    wait = (amount - tokens) / rate
+end
+redis.call("HSET", KEYS[1], "tokens", tokens, "updated_at", now)
+-- 1초 동안 사용하지 않으면 다시 가득 차므로 삭제되어도 같은 상태
+redis.call("EXPIRE", KEYS[1], 2)
+return tostring(wait)
+"""
+
+# 더 이상 발송할 수 없는 토큰의 오류
+DEAD_TOKEN_ERRORS = (messaging.UnregisteredError, messaging.SenderIdMismatchError)
+DEAD_TOKEN_ERROR_CODES = {
+    "messaging/invalid-registration-token",
+    "messaging/registration-token-not-registered",
+    "messaging/mismatched-credential",
+}
+
+
+def is_dead_token_error(exception: Exception) -> bool:
+    """무효화할 토큰의 발송 오류 여부 확인"""
+    if isinstance(exception, DEAD_TOKEN_ERRORS):
+        return True
+    # [Why]
+    # Q. INVALID_ARGUMENT 오류는 토큰 관련 메시지일 때만 무효화하는 이유는?
+    # A. 메시지 내용이 잘못된 경우에도 같은 오류가 발생하므로,
+    #    정상 토큰까지 모두 무효화하지 않도록 하기 위함
+    if isinstance(exception, exceptions.InvalidArgumentError):
+        return "registration token" in str(exception)
+    return getattr(exception, "code", None) in DEAD_TOKEN_ERROR_CODES
+
+
+def invalidate_push_tokens(tokens: list) -> int:
+    """
+    푸시 토큰 일괄 무효화
+
+    Args:
+        tokens (list): 무효화할 토큰 목록
+
+    Returns:
+        int: 무효화한 토큰 수
+    """
+    if not tokens:
+        return 0
+    PushAudience.objects.filter(token__in=tokens).delete()
+    return PushToken.objects.filter(token__in=tokens, is_valid=True).update(
+        is_valid=False
     )
 
-    # 전체 결과 집계를 위한 변수
-    total_success_count = 0
-    total_failure_count = 0
-    total_invalid_tokens = []
 
-    # 500개씩 담을 배치 리스트
-    batch_tokens = []
+class TokenBucket:
+    """
+    토큰 버킷:
+    초당 발송량을 제한하기 위해 여러 작업, 스레드가 Redis 에서 함께 사용하는 토큰 버킷
+    """
+
+    # [Why]
+    # Q. 프로세스 메모리가 아닌 Redis 에 버킷을 두는 이유는?
+    # A. 범위별 작업, 같은 캠페인의 작업이 여러 워커에서 동시에 실행되어도
+    #    워커 수와 관계없이 전체 발송량이 제한을 넘지 않도록 하기 위함
+
+    def __init__(self, key: str, rate: float):
+        self.key = key
+        self.rate = rate
+
+    def acquire(self, amount: float = 1):
+        """
+        토큰 획득(부족하면 채워질 때까지 대기)
+
+        Raises:
+            ValueError: 초당 발송량보다 많은 토큰 요청 (배치 크기를 초당 발송량 이하로 제한)
+        """
+        if amount > self.rate:
+            raise ValueError(f"Cannot acquire {amount} tokens at {self.rate}/s")
+        while True:
+            wait = float(
+                REDIS_CLIENT.eval(TOKEN_BUCKET_SCRIPT, 1, self.key, self.rate, amount)
+            )
+            if wait <= 0:
+                return
+            time.sleep(wait)
+
+
+def get_push_batch_size(rate: float) -> int:
+    """초당 발송량 안에서 한 번에 발송할 토큰 수 조회"""
+    return max(1, min(settings.PUSH_FANOUT_BATCH_SIZE, int(rate)))
+
+
+def is_night_time(now=None) -> bool:
+    """야간 시간 여부 확인"""
+    hour = timezone.localtime(now).hour
+    return hour >= settings.PUSH_NIGHT_START_HOUR or hour < settings.PUSH_NIGHT_END_HOUR
+
+
+def get_push_segment(platform: str = None, now=None) -> dict:
+    """
+    푸시 발송 대상 조건 조회
+
+    Args:
+        platform (str): 발송할 플랫폼 (전체 발송 시 None)
+        now (datetime): 발송 일시
+
+    Returns:
+        dict: 발송 대상 조회 조건
+    """
+    segment = {}
+    if platform:
+        segment["platform"] = platform
+    # 야간에는 야간 수신에 동의한 사용자에게만 발송
+    if is_night_time(now):
+        segment["is_night_notification"] = True
+    return segment
 
-    for token in token_qs:
-        batch_tokens.append(token)
-        # 배치가 500개가 되면 발송
-        if len(batch_tokens) == 500:
-            success, failure, invalid = send_test_push(batch_tokens, message, data)
 
-            # 결과 집계
-            total_success_count += success
-            total_failure_count += failure
-            total_invalid_tokens.extend(invalid)
+def get_push_audience(segment: dict = None):
+    """푸시 수신에 동의한 발송 대상 조회"""
+    return PushAudience.objects.filter(is_push_notification=True, **(segment or {}))
 
-            # 배치 리스트 초기화
-            batch_tokens = []
-    else:
-        # 남아있는 토큰들 발송
-        if batch_tokens:
-            success, failure, invalid = send_test_push(batch_tokens, message, data)
 
-            # 결과 집계
-            total_success_count += success
-            total_failure_count += failure
-            total_invalid_tokens.extend(invalid)
+def get_push_audience_batch(
+    segment: dict = None,
+    after_id: int = None,
+    end_id: int = None,
+    batch_size: int = None,
+) -> list[tuple[int, str]]:
+    """
+    푸시 발송 대상 배치 조회:
+    푸시 토큰 ID 순으로 이전 배치의 마지막 ID 이후만 조회
+
+    Args:
+        segment (dict): 발송 대상 조회 조건
+        after_id (int): 이전 배치의 마지막 푸시 토큰 ID
+        end_id (int): 끝 푸시 토큰 ID (미포함)
+        batch_size (int): 배치 크기
+
+    Returns:
+        list: (푸시 토큰 ID, 토큰) 목록
+    """
+    batch_size = batch_size or settings.PUSH_FANOUT_BATCH_SIZE
+    queryset = get_push_audience(segment)
+    if after_id is not None:
+        queryset = queryset.filter(push_token_id__gt=after_id)
+    if end_id is not None:
+        queryset = queryset.filter(push_token_id__lt=end_id)
+    return list(
+        queryset.order_by("push_token_id").values_list("push_token_id", "token")[
+            :batch_size
+        ]
+    )
+
+
+def iter_push_audience_tokens(
+    segment: dict = None,
+    start_id: int = None,
+    end_id: int = None,
+    batch_size: int = None,
+):
+    """
+    푸시 발송 대상 토큰 배치 조회
+
+    Args:
+        segment (dict): 발송 대상 조회 조건
+        start_id (int): 시작 푸시 토큰 ID
+        end_id (int): 끝 푸시 토큰 ID (미포함)
+        batch_size (int): 배치 크기
+
+    Yields:
+        list: 토큰 목록
+    """
+    batch_size = batch_size or settings.PUSH_FANOUT_BATCH_SIZE
+    last_id = start_id - 1 if start_id is not None else None
+    while True:
+        rows = get_push_audience_batch(segment, last_id, end_id, batch_size)
+        if not rows:
+            return
+        last_id = rows[-1][0]
+        yield [token for _, token in rows]
+        if len(rows) < batch_size:
+            return
+
+
+def get_push_token_ranges(
+    segment: dict = None, range_size: int = None
+) -> list[tuple[int, int]]:
+    """
+    발송 대상 푸시 토큰 ID 범위 분할
+
+    Args:
+        segment (dict): 발송 대상 조회 조건
+        range_size (int): 범위 하나의 ID 개수
+
+    Returns:
+        list: (시작 ID, 끝 ID) 목록 (끝 ID 미포함)
+    """
+    range_size = range_size or settings.PUSH_FANOUT_RANGE_SIZE
+    aggregate = get_push_audience(segment).aggregate(
+        min_id=Min("push_token_id"), max_id=Max("push_token_id")
+    )
+    if aggregate["min_id"] is None:
+        return []
+    return [
+        (start_id, min(start_id + range_size, aggregate["max_id"] + 1))
+        for start_id in range(aggregate["min_id"], aggregate["max_id"] + 1, range_size)
+    ]
+
+
+def start_push_fanout(message: dict, data: dict = None, platform: str = None):
+    """
+    전체 사용자 푸시 발송 시작:
+    토큰 ID 범위별 Celery 작업을 등록하고 결과를 집계할 Redis 카운터 생성
+    푸시 수신에 동의하지 않은 사용자, 야간에는 야간 수신에 동의하지 않은 사용자 제외
+
+    Args:
+        message (dict): 알림 내용
+        data (dict): 데이터
+        platform (str): 발송할 플랫폼 (전체 발송 시 None)
+
+    Returns:
+        str: 발송 ID (발송 대상이 없으면 None)
+    """
+    from apps.device.v1.tasks import task_send_push_range
+
+    segment = get_push_segment(platform)
+    ranges = get_push_token_ranges(segment)
+    if not ranges:
+        return None
+    # [Why]
+    # Q. chord 대신 Redis 카운터로 결과를 집계하는 이유는?
+    # A. chord 는 Celery 결과 백엔드가 필요하므로,
+    #    결과 백엔드 없이 범위별 작업이 각자 결과를 더하고 남은 작업 수를 줄이도록 하기 위함
+    fanout_id = uuid.uuid4().hex
+    result_key = PUSH_FANOUT_RESULT_KEY.format(fanout_id=fanout_id)
+    REDIS_CLIENT.hset(
+        result_key,
+        mapping={"pending": len(ranges), "success_count": 0, "failure_count": 0},
+    )
+    REDIS_CLIENT.expire(result_key, settings.PUSH_FANOUT_TIMEOUT)
+    # 범위별 작업은 발송 ID 의 토큰 버킷을 함께 사용해 전체 발송량 제한
+    rate = settings.PUSH_FANOUT_RATE_LIMIT
+    for start_id, end_id in ranges:
+        task_send_push_range.apply_async(
+            args=[fanout_id, start_id, end_id, message, data, rate, segment]
+        )
+    return fanout_id
+
+
+def add_push_fanout_result(fanout_id: str, result: dict) -> int:
+    """
+    범위별 푸시 발송 결과 추가:
+    결과를 먼저 더한 뒤 남은 작업 수를 줄여, 남은 작업이 없으면 집계가 끝난 상태
+
+    Args:
+        fanout_id (str): 발송 ID
+        result (dict): 범위 발송 결과
+
+    Returns:
+        int: 남은 범위 작업 수
+    """
+    result_key = PUSH_FANOUT_RESULT_KEY.format(fanout_id=fanout_id)
+    invalid_tokens_key = PUSH_FANOUT_INVALID_TOKENS_KEY.format(fanout_id=fanout_id)
+    REDIS_CLIENT.hincrby(result_key, "success_count", result["success_count"])
+    REDIS_CLIENT.hincrby(result_key, "failure_count", result["failure_count"])
+    if result["invalid_tokens"]:
+        REDIS_CLIENT.rpush(invalid_tokens_key, *result["invalid_tokens"])
+        REDIS_CLIENT.expire(invalid_tokens_key, settings.PUSH_FANOUT_TIMEOUT)
+    pending = REDIS_CLIENT.hincrby(result_key, "pending", -1)
+    if pending == 0:
+        success_count, failure_count, invalid_tokens = get_push_fanout_result(fanout_id)
+        logger.info(
+            f"Push sent: {success_count} succeeded, {failure_count} failed, "
+            f"{len(invalid_tokens)} tokens invalidated"
+        )
+    return pending
+
+
+def get_push_fanout_result(fanout_id: str):
+    """
+    전체 사용자 푸시 발송 결과 조회
+
+    Args:
+        fanout_id (str): 발송 ID
+
+    Returns:
+        tuple: 성공 수, 실패 수, 무효화한 토큰 목록 (발송 중이면 None)
+    """
+    result = REDIS_CLIENT.hgetall(PUSH_FANOUT_RESULT_KEY.format(fanout_id=fanout_id))
+    if not result or int(result[b"pending"]) > 0:
+        return None
+    invalid_tokens = REDIS_CLIENT.lrange(
+        PUSH_FANOUT_INVALID_TOKENS_KEY.format(fanout_id=fanout_id), 0, -1
+    )
+    return (
+        int(result[b"success_count"]),
+        int(result[b"failure_count"]),
+        [token.decode() for token in invalid_tokens],
+    )
+
+
+def send_test_push_to_all(
+    message: dict, data: dict = None, platform: str = None, timeout: float = None
+):
+    """
+    전체 사용자 테스트 푸시 발송:
+    토큰 ID 범위별 Celery 작업으로 나눠 동시에 발송하고 모든 작업이 끝날 때까지 대기
+
+    Returns:
+        tuple: 성공 수, 실패 수, 무효화한 토큰 목록
+
+    Raises:
+        TimeoutError: 대기 시간 안에 모든 범위의 발송이 끝나지 않음
+    """
+    fanout_id = start_push_fanout(message, data, platform)
+    if fanout_id is None:
+        return 0, 0, []
+    timeout = settings.PUSH_FANOUT_TIMEOUT if timeout is None else timeout
+    deadline = time.monotonic() + timeout
+    while True:
+        result = get_push_fanout_result(fanout_id)
+        if result is not None:
+            REDIS_CLIENT.delete(
+                PUSH_FANOUT_RESULT_KEY.format(fanout_id=fanout_id),
+                PUSH_FANOUT_INVALID_TOKENS_KEY.format(fanout_id=fanout_id),
+            )
+            return result
+        if time.monotonic() >= deadline:
+            raise TimeoutError(f"Push fan-out {fanout_id} did not finish in time")
+        time.sleep(settings.PUSH_FANOUT_POLL_INTERVAL)
+
+
+def new_push_range_result() -> dict:
+    """빈 범위 발송 결과 생성"""
+    return {
+        "success_count": 0,
+        "failure_count": 0,
+        "invalid_count": 0,
+        "invalid_tokens": [],
+    }
+
+
+def send_push_to_range(
+    start_id: int,
+    end_id: int,
+    bucket: TokenBucket,
+    message: dict,
+    data: dict = None,
+    segment: dict = None,
+    result: dict = None,
+) -> dict:
+    """
+    토큰 ID 범위 푸시 발송:
+    범위 내 발송 대상 토큰을 배치로 나눠 스레드 풀에서 동시에 발송
+
+    Args:
+        start_id (int): 시작 토큰 ID
+        end_id (int): 끝 토큰 ID (미포함)
+        bucket (TokenBucket): 발송량 제한 토큰 버킷
+        message (dict): 알림 내용
+        data (dict): 데이터
+        segment (dict): 발송 대상 조회 조건
+        result (dict): 발송 결과를 더할 dict (중간에 오류가 발생해도 발송한 결과 유지)
+
+    Returns:
+        dict: 성공 수, 실패 수, 무효화한 토큰 수, 발송할 수 없는 토큰 목록
+    """
+    if result is None:
+        result = new_push_range_result()
+
+    def send(tokens: list):
+        bucket.acquire(len(tokens))
+        try:
+            return send_test_push(tokens, message, data)
+        except Exception as e:
+            # 발송 여부를 알 수 없으므로 배치 전체를 실패로 기록하고 다음 배치 발송
+            logger.exception(f"Error sending push to range {start_id}-{end_id}: {e}")
+            return 0, len(tokens), []
+
+    def collect(future):
+        # [Why]
+        # Q. 무효화를 발송 스레드가 아닌 현재 스레드에서 하는 이유는?
+        # A. 발송 스레드마다 DB 연결이 생기지 않도록 하기 위함
+        #    배치마다 UPDATE 한 번으로 무효화해 다음 발송부터 제외
+        success, failure, invalid = future.result()
+        result["success_count"] += success
+        result["failure_count"] += failure
+        result["invalid_count"] += invalidate_push_tokens(invalid)
+        result["invalid_tokens"].extend(invalid)
+
+    max_workers = settings.PUSH_FANOUT_MAX_WORKERS
+    batches = iter_push_audience_tokens(
+        segment, start_id, end_id, get_push_batch_size(bucket.rate)
+    )
+    # 범위 전체의 토큰을 미리 조회해 두지 않도록 발송 중인 배치 수 제한
+    futures = collections.deque()
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        for tokens in batches:
+            if len(futures) >= max_workers * 2:
+                collect(futures.popleft())
+            futures.append(executor.submit(send, tokens))
+        while futures:
+            collect(futures.popleft())
+    return result
+
+
+def pause_push_campaigns(queryset) -> int:
+    """예약 또는 발송 중인 푸시 캠페인 일시 정지"""
+    return queryset.filter(
+        status__in=[PushCampaignStatus.SCHEDULED, PushCampaignStatus.RUNNING]
+    ).update(status=PushCampaignStatus.PAUSED, updated_at=timezone.now())
+
+
+def resume_push_campaigns(queryset) -> int:
+    """
+    일시 정지한 푸시 캠페인 재개:
+    발송을 시작한 캠페인은 마지막으로 발송한 토큰 이후부터 이어서 발송
+    시작 전이면 예약 상태로 되돌려 예약 일시에 발송
+    """
+    from apps.device.v1.tasks import task_send_push_campaign
+
+    now = timezone.now()
+    paused = queryset.filter(status=PushCampaignStatus.PAUSED)
+    campaign_ids = list(
+        paused.filter(started_at__isnull=False).values_list("id", flat=True)
+    )
+    count = paused.filter(started_at__isnull=True).update(
+        status=PushCampaignStatus.SCHEDULED, updated_at=now
+    )
+    count += PushCampaign.objects.filter(
+        id__in=campaign_ids, status=PushCampaignStatus.PAUSED
+    ).update(status=PushCampaignStatus.RUNNING, updated_at=now)
+    for campaign_id in campaign_ids:
+        transaction.on_commit(
+            lambda campaign_id=campaign_id: task_send_push_campaign.apply_async(
+                args=[campaign_id]
+            )
+        )
+    return count
+
+
+def cancel_push_campaigns(queryset) -> int:
+    """완료되지 않은 푸시 캠페인 취소"""
+    now = timezone.now()
+    return queryset.filter(
+        status__in=[
+            PushCampaignStatus.SCHEDULED,
+            PushCampaignStatus.RUNNING,
+            PushCampaignStatus.PAUSED,
+        ]
+    ).update(status=PushCampaignStatus.CANCELED, completed_at=now, updated_at=now)
+
+
+def send_push_campaign_batches(campaign_id: int, max_batches: int = None) -> bool:
+    """
+    푸시 캠페인 발송:
+    마지막으로 발송한 토큰 이후부터 배치 단위로 발송하고 배치마다 진행 상황 저장
+
+    Args:
+        campaign_id (int): 캠페인 ID
+        max_batches (int): 이번에 발송할 최대 배치 수
+
+    Returns:
+        bool: 발송할 배치가 남아 있는지 여부
+            (발송 오류가 발생하면 중단하고, 다음 재시작 작업에서 이어서 발송)
+            (같은 캠페인을 다른 작업이 발송 중이면 발송하지 않고 False)
+    """
+    max_batches = max_batches or settings.PUSH_CAMPAIGN_BATCHES_PER_TASK
+    # [Why]
+    # Q. 캠페인마다 Redis 잠금을 사용하는 이유는?
+    # A. 재개와 중단된 작업 재등록이 같은 캠페인의 작업을 함께 등록해도
+    #    발송 작업은 하나만 실행되어 발송량 제한을 넘지 않도록 하기 위함
+    #    잠금은 배치마다 연장하고, 종료된 작업의 잠금은 재등록 전에 만료됨
+    lock = REDIS_CLIENT.lock(
+        PUSH_CAMPAIGN_LOCK_KEY.format(campaign_id=campaign_id),
+        timeout=settings.PUSH_CAMPAIGN_LOCK_TIMEOUT,
+    )
+    if not lock.acquire(blocking=False):
+        logger.info(f"Push campaign {campaign_id} is already being sent")
+        return False
+    bucket = None
+    try:
+        for _ in range(max_batches):
+            lock.reacquire()
+            # [Why]
+            # Q. 배치를 가져갈 때만 캠페인을 잠그고 발송은 트랜잭션 밖에서 하는 이유는?
+            # A. 발송 대기와 FCM 요청 동안 일시 정지, 취소가 잠금에 막히지 않도록 하고,
+            #    이미 발송한 배치가 저장 실패로 되돌려져 다시 발송되지 않도록 하기 위함
+            #    발송 위치는 발송 전에 저장하므로 발송 중 종료되면 해당 배치는 다시 발송하지 않음
+            with transaction.atomic():
+                campaign = (
+                    PushCampaign.objects.select_for_update()
+                    .filter(id=campaign_id, status=PushCampaignStatus.RUNNING)
+                    .first()
+                )
+                if campaign is None:
+                    return False
+                if bucket is None:
+                    bucket = TokenBucket(
+                        PUSH_CAMPAIGN_BUCKET_KEY.format(campaign_id=campaign_id),
+                        campaign.rate_limit,
+                    )
+                rows = get_push_audience_batch(
+                    get_push_segment(campaign.platform),
+                    after_id=campaign.last_push_token_id,
+                    batch_size=get_push_batch_size(campaign.rate_limit),
+                )
+                if not rows:
+                    campaign.status = PushCampaignStatus.COMPLETED
+                    campaign.completed_at = timezone.now()
+                    campaign.save(
+                        update_fields=["status", "completed_at", "updated_at"]
+                    )
+                    return False
+                batch = PushCampaignBatch.objects.create(
+                    campaign=campaign,
+                    first_push_token_id=rows[0][0],
+                    last_push_token_id=rows[-1][0],
+                )
+                campaign.last_push_token_id = rows[-1][0]
+                campaign.save(update_fields=["last_push_token_id", "updated_at"])
+
+            tokens = [token for _, token in rows]
+            bucket.acquire(len(tokens))
+            send_error = None
+            try:
+                success, failure, invalid = send_test_push(
+                    tokens, campaign.message, campaign.data
+                )
+            except Exception as e:
+                # 발송 여부를 알 수 없으므로 배치 전체를 실패로 기록
+                logger.exception(f"Error sending push campaign {campaign_id}: {e}")
+                send_error = e
+                success, failure, invalid = 0, len(tokens), []
+            invalid_count = invalidate_push_tokens(invalid)
 
-    return total_success_count, total_failure_count, total_invalid_tokens
+            # 잠그지 않고 더해 발송 중 변경된 상태를 덮어쓰지 않음
+            with transaction.atomic():
+                PushCampaignBatch.objects.filter(id=batch.id).update(
+                    success_count=success,
+                    failure_count=failure,
+                    invalid_count=invalid_count,
+                )
+                PushCampaign.objects.filter(id=campaign_id).update(
+                    success_count=F("success_count") + success,
+                    failure_count=F("failure_count") + failure,
+                    invalid_count=F("invalid_count") + invalid_count,
+                    updated_at=timezone.now(),
+                )
+            if send_error is not None:
+                return False
+        return True
+    except redis.exceptions.LockError as e:
+        # 잠금을 잃었으면 잠금을 얻은 작업이 이어서 발송
+        logger.warning(f"Lost push campaign {campaign_id} lock: {e}")
+        return False
+    finally:
+        if lock.owned():
+            lock.release()
 
 
 def send_test_push(tokens: list, message: dict, data: dict = None):
@@ -69,7 +623,7 @@ def send_test_push(tokens: list, message: dict, data: dict = None):
         if resp.success:
             success_count += 1
         else:
-            if resp.exception.code == "messaging/invalid-registration-token":
+            if is_dead_token_error(resp.exception):
                 invalid_tokens.append(tokens[i])
             failure_count += 1
 
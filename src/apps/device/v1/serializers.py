@@ -1,33 +1,38 @@
+from django.conf import settings
+from django.db import transaction
 from rest_framework import serializers
+from rest_framework.exceptions import NotFound
 
-from apps.device.models import Device, PushToken
+from apps.device.models import Device, DevicePlatform, PushAudience, PushToken
 from base.enums.errors import (
     E007_DEVICE_UUID_REQUIRED,
     E007_DEVICE_ALREADY_REGISTERED,
     E007_PUSH_TOKEN_REQUIRED,
     E007_PUSH_TOKEN_ALREADY_REGISTERED,
+    E007_DEVICE_NOT_FOUND,
 )
 
 
 class DeviceSerializer(serializers.ModelSerializer):
     """
     디바이스 시리얼라이저:
-    디바이스 UUID 존재 여부 확인 및 생성
+    디바이스 등록 (이미 등록된 디바이스는 저장된 디바이스 반환)
     """
 
     def validate_uuid(self, attr):
         """UUID 유효성 검사"""
         if not attr:
             raise serializers.ValidationError(E007_DEVICE_UUID_REQUIRED)
-        elif Device.objects.filter(
-            uuid=attr,
-            user=self.context["request"].user,
-        ).exists():
-            raise serializers.ValidationError(E007_DEVICE_ALREADY_REGISTERED)
         return attr
 
     def create(self, validated_data):
-        instance = super().create(validated_data)
+        instance = Device.upsert(
+            user_id=validated_data["user"].id,
+            uuid=validated_data["uuid"],
+            platform=validated_data.get("platform", DevicePlatform.WEB),
+        )
+        if instance is None:
+            raise serializers.ValidationError({"uuid": E007_DEVICE_ALREADY_REGISTERED})
         # TODO: AWS SNS 의 구독 정보 업데이트
         return instance
 
@@ -40,12 +45,17 @@ class DeviceSerializer(serializers.ModelSerializer):
             "created_at",
             "updated_at",
         ]
+        # UUID 중복은 등록 시 ON CONFLICT 구문으로 처리
+        extra_kwargs = {
+            "uuid": {"validators": []},
+        }
 
 
 class PushTokenSerializer(serializers.ModelSerializer):
     """
     푸시 토큰 시리얼라이저:
-    사용자별 토큰 고유 여부 확인 후 등록
+    사용자의 다른 디바이스와 토큰 중복 여부 확인 후 등록
+    (같은 디바이스에 이미 등록된 토큰은 저장된 토큰 반환)
     추후 AWS SNS Token 등록하여 푸시 활용
     """
 
@@ -53,16 +63,26 @@ class PushTokenSerializer(serializers.ModelSerializer):
         """토큰 유효성 검사"""
         if not attr:
             raise serializers.ValidationError(E007_PUSH_TOKEN_REQUIRED)
-        elif PushToken.objects.filter(
-            token=attr,
-            device__user=self.context["request"].user,
-        ).exists():
-            raise serializers.ValidationError(E007_PUSH_TOKEN_ALREADY_REGISTERED)
         return attr
 
     def create(self, validated_data):
         """생성"""
-        instance = super().create(validated_data)
+        # 사용자의 다른 디바이스와 토큰 중복 여부는 등록 구문에서 함께 확인
+        instance = PushToken.upsert(
+            user_id=validated_data["user"].id,
+            device_uuid=validated_data["device_uuid"],
+            token=validated_data["token"],
+        )
+        if instance is None:
+            # 등록하지 못한 경우에만 원인 확인
+            if not Device.objects.filter(
+                user_id=validated_data["user"].id,
+                uuid=validated_data["device_uuid"],
+            ).exists():
+                raise NotFound()
+            raise serializers.ValidationError(
+                {"token": E007_PUSH_TOKEN_ALREADY_REGISTERED}
+            )
         # TODO: 푸시 토큰 생성 후 endpoint arn 생성
         return instance
 
@@ -72,3 +92,103 @@ class PushTokenSerializer(serializers.ModelSerializer):
             "id",
             "token",
         ]
+
+
+class PushTokenBulkItemSerializer(serializers.Serializer):
+    """푸시 토큰 일괄 등록 항목 시리얼라이저"""
+
+    device_uuid = serializers.UUIDField(help_text="디바이스 UUID")
+    token = serializers.CharField(max_length=255, help_text="토큰")
+
+
+class PushTokenBulkSerializer(serializers.Serializer):
+    """
+    푸시 토큰 일괄 등록 시리얼라이저:
+    앱 실행 시마다 다시 보내는 디바이스별 토큰을 한 번에 등록
+    이미 유효한 토큰은 변경하지 않음
+    """
+
+    push_tokens = PushTokenBulkItemSerializer(
+        many=True,
+        allow_empty=False,
+        max_length=settings.PUSH_TOKEN_BULK_MAX_SIZE,
+        help_text="디바이스별 푸시 토큰 목록",
+    )
+
+    def validate_push_tokens(self, attr):
+        """푸시 토큰 목록 유효성 검사"""
+        # 같은 디바이스의 토큰은 마지막 토큰만 사용
+        tokens = {item["device_uuid"]: item["token"] for item in attr}
+        devices = Device.objects.filter(
+            user=self.context["request"].user,
+            uuid__in=tokens,
+        ).only("id", "uuid")
+        if len(devices) != len(tokens):
+            raise serializers.ValidationError(E007_DEVICE_NOT_FOUND)
+        # 단건 등록과 같이 사용자의 다른 디바이스에 등록된 토큰은 등록하지 않음
+        device_uuids = {}
+        for device_uuid, token in tokens.items():
+            device_uuids.setdefault(token, set()).add(device_uuid)
+        registered_tokens = PushToken.objects.filter(
+            token__in=device_uuids,
+            device__user=self.context["request"].user,
+        ).values_list("token", "device__uuid")
+        if any(len(uuids) > 1 for uuids in device_uuids.values()) or any(
+            device_uuid not in device_uuids[token]
+            for token, device_uuid in registered_tokens
+        ):
+            raise serializers.ValidationError(E007_PUSH_TOKEN_ALREADY_REGISTERED)
+        return [
+            {
+                "device_id": device.id,
+                "device_uuid": device.uuid,
+                "token": tokens[device.uuid],
+            }
+            for device in devices
+        ]
+
+    @transaction.atomic
+    def create(self, validated_data):
+        """푸시 토큰 일괄 등록"""
+        tokens = {
+            item["device_id"]: item["token"] for item in validated_data["push_tokens"]
+        }
+        valid_tokens = set(
+            PushToken.objects.filter(
+                device_id__in=tokens,
+                token__in=tokens.values(),
+                is_valid=True,
+            ).values_list("device_id", "token")
+        )
+        # 이미 유효한 토큰이 등록된 디바이스는 제외
+        changed_tokens = {
+            device_id: token
+            for device_id, token in tokens.items()
+            if (device_id, token) not in valid_tokens
+        }
+        if changed_tokens:
+            # [Why]
+            # Q. 토큰마다 save 를 호출하지 않는 이유는?
+            # A. 기존 토큰 무효화, 토큰 등록, 발송 대상 갱신을
+            #    디바이스 수와 관계없이 일정한 쿼리 수로 처리하기 위함
+            PushToken.objects.filter(
+                device_id__in=changed_tokens, is_valid=True
+            ).update(is_valid=False)
+            PushAudience.objects.filter(
+                push_token__device_id__in=changed_tokens
+            ).delete()
+            # [Why]
+            # Q. 조회한 기존 토큰과 관계없이 ON CONFLICT 구문으로 등록하는 이유는?
+            # A. 조회 이후 같은 토큰이 단건 등록으로 먼저 저장되어도
+            #    unique 제약 오류 없이 다시 유효하게 변경하기 위함
+            push_tokens = PushToken.objects.bulk_create(
+                [
+                    PushToken(device_id=device_id, token=token)
+                    for device_id, token in changed_tokens.items()
+                ],
+                update_conflicts=True,
+                unique_fields=["device", "token"],
+                update_fields=["is_valid", "updated_at"],
+            )
+            PushAudience.refresh([push_token.id for push_token in push_tokens])
+        return validated_data
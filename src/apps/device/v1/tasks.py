@@ -0,0 +1,85 @@
+import datetime
+
+from django.conf import settings
+from django.db.models import Q
+from django.utils import timezone
+
+from apps.device.models import PushCampaign, PushCampaignStatus
+from apps.device.utils import (
+    PUSH_FANOUT_BUCKET_KEY,
+    TokenBucket,
+    add_push_fanout_result,
+    new_push_range_result,
+    send_push_campaign_batches,
+    send_push_to_range,
+)
+from conf.celery import app
+from conf.firebase_config import initialize_firebase
+
+
+@app.task
+def task_send_push_range(
+    fanout_id: str,
+    start_id: int,
+    end_id: int,
+    message: dict,
+    data: dict = None,
+    rate: float = None,
+    segment: dict = None,
+):
+    """
+    토큰 ID 범위 푸시 발송:
+    전체 발송을 나눈 범위 하나를 발송하고 결과를 Redis 카운터에 추가
+    """
+    initialize_firebase()
+    bucket = TokenBucket(
+        PUSH_FANOUT_BUCKET_KEY.format(fanout_id=fanout_id),
+        rate or settings.PUSH_FANOUT_RATE_LIMIT,
+    )
+    result = new_push_range_result()
+    # 오류가 발생해도 남은 작업 수를 줄여 전체 발송 대기가 끝나도록 결과 추가
+    try:
+        send_push_to_range(start_id, end_id, bucket, message, data, segment, result)
+    finally:
+        add_push_fanout_result(fanout_id, result)
+    return result
+
+
+@app.task
+def task_send_push_campaign(campaign_id: int):
+    """
+    푸시 캠페인 발송:
+    정해진 배치 수만큼 발송한 뒤 남은 배치가 있으면 작업을 다시 등록
+    """
+    initialize_firebase()
+    # [Why]
+    # Q. 한 작업에서 끝까지 발송하지 않고 나눠서 다시 등록하는 이유는?
+    # A. 대량 발송이 워커를 오래 점유하지 않고 다른 작업과 번갈아 실행되도록 하기 위함
+    if send_push_campaign_batches(campaign_id):
+        task_send_push_campaign.apply_async(args=[campaign_id])
+
+
+@app.task
+def task_start_push_campaigns():
+    """
+    푸시 캠페인 시작:
+    예약 일시가 지난 캠페인을 시작하고, 발송 작업이 중단된 캠페인은 다시 발송
+    """
+    now = timezone.now()
+    stale_at = now - datetime.timedelta(seconds=settings.PUSH_CAMPAIGN_STALE_SECONDS)
+    campaign_ids = list(
+        PushCampaign.objects.filter(
+            Q(status=PushCampaignStatus.SCHEDULED, scheduled_at__lte=now)
+            | Q(status=PushCampaignStatus.RUNNING, updated_at__lt=stale_at)
+        ).values_list("id", flat=True)
+    )
+    PushCampaign.objects.filter(
+        id__in=campaign_ids, status=PushCampaignStatus.SCHEDULED
+    ).update(status=PushCampaignStatus.RUNNING, started_at=now, updated_at=now)
+    # 다시 등록한 캠페인이 다음 실행에서 중복 등록되지 않도록 수정 일시 갱신
+    PushCampaign.objects.filter(
+        id__in=campaign_ids, status=PushCampaignStatus.RUNNING, updated_at__lt=stale_at
+    ).update(updated_at=now)
+    for campaign_id in campaign_ids:
+        task_send_push_campaign.apply_async(args=[campaign_id])
+    return f"{len(campaign_ids)} push campaigns started"
@@ -1,11 +1,50 @@
-from django.test import RequestFactory
+import collections
+import datetime
+import threading
+from unittest import mock
+
+from django.db import DatabaseError
+from django.test import RequestFactory, override_settings
+from django.utils import timezone
+from firebase_admin import exceptions, messaging
+from redis.exceptions import LockNotOwnedError
 from rest_framework import status
+from rest_framework.exceptions import ValidationError
 from rest_framework.test import APITestCase, APIClient
 import uuid
 
-from apps.device.models import Device, PushToken, DevicePlatform
-from apps.device.v1.serializers import DeviceSerializer, PushTokenSerializer
-from apps.user.models import User
+from apps.device.models import (
+    Device,
+    DevicePlatform,
+    PushAudience,
+    PushCampaign,
+    PushCampaignStatus,
+    PushToken,
+)
+from apps.device.v1.tasks import task_send_push_range, task_start_push_campaigns
+from apps.device.utils import (
+    TokenBucket,
+    cancel_push_campaigns,
+    pause_push_campaigns,
+    resume_push_campaigns,
+    send_push_campaign_batches,
+    get_push_segment,
+    get_push_token_ranges,
+    invalidate_push_tokens,
+    is_dead_token_error,
+    iter_push_audience_tokens,
+    get_push_fanout_result,
+    send_test_push_to_all,
+    start_push_fanout,
+)
+from apps.device.v1.serializers import (
+    DeviceSerializer,
+    PushTokenBulkSerializer,
+    PushTokenSerializer,
+)
+from apps.user.models import User, UserPreference
+from apps.user.v1.serializers import UserPreferenceSerializer
+from conf.celery import app
 
 
 class DeviceSerializerTests(APITestCase):
@@ -44,18 +83,24 @@ class DeviceSerializerTests(APITestCase):
         self.assertFalse(serializer.is_valid())
         self.assertIn("uuid", serializer.errors)
 
-    def test_실패__디바이스_등록_시_UUID_중복(self):
-        """디바이스 등록 시 UUID 중복 테스트"""
+    def test_성공__디바이스_등록_시_UUID_중복(self):
+        """이미 등록된 UUID로 다시 등록하면 저장된 디바이스를 반환하는지 테스트"""
         # 먼저 디바이스 생성
-        Device.objects.create(
+        device = Device.objects.create(
             user=self.user,
             uuid=self.valid_uuid,
         )
 
         # 같은 UUID로 다시 시도
-        serializer = DeviceSerializer(data=self.device_data)
-        self.assertFalse(serializer.is_valid())
-        self.assertIn("uuid", serializer.errors)
+        serializer = DeviceSerializer(
+            data={"uuid": self.valid_uuid, "platform": DevicePlatform.IOS},
+            context={"request": self.request},
+        )
+        self.assertTrue(serializer.is_valid())
+        upserted_device = serializer.save(user=self.user)
+        self.assertEqual(upserted_device.id, device.id)
+        self.assertEqual(upserted_device.platform, str(DevicePlatform.IOS))
+        self.assertEqual(Device.objects.count(), 1)
 
     def test_실패__디바이스_등록_시_UUID_필드가_없음(self):
         """디바이스 등록 시 UUID 필드가 없음 테스트"""
@@ -101,19 +146,56 @@ class DeviceViewTests(APITestCase):
         self.assertEqual(Device.objects.count(), 0)
         self.assertIn("uuid", response.data)
 
-    def test_실패__디바이스_등록_시_UUID_중복(self):
-        """디바이스 등록 시 UUID 중복 테스트"""
+    def test_성공__디바이스_등록_시_UUID_중복(self):
+        """이미 등록된 UUID로 다시 등록하면 저장된 디바이스를 반환하는지 테스트"""
         # 먼저 디바이스 생성
-        Device.objects.create(
+        device = Device.objects.create(
             user=self.user,
             uuid=self.valid_uuid,
         )
 
         # 같은 UUID로 다시 시도
         response = self.client.post(self.create_url, self.device_data, format="json")
-        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response.data["id"], device.id)
         self.assertEqual(Device.objects.count(), 1)
-        self.assertIn("uuid", response.data)
+
+    def test_성공__디바이스_등록_시_플랫폼_변경(self):
+        """다시 등록하며 플랫폼이 바뀌면 발송 대상의 플랫폼도 갱신되는지 테스트"""
+        device = Device.objects.create(
+            user=self.user,
+            uuid=self.valid_uuid,
+            platform=DevicePlatform.ANDROID,
+        )
+        push_token = PushToken.objects.create(device=device, token="token")
+
+        response = self.client.post(
+            self.create_url,
+            {"uuid": self.valid_uuid, "platform": DevicePlatform.IOS},
+            format="json",
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        device.refresh_from_db()
+        self.assertEqual(device.platform, str(DevicePlatform.IOS))
+        self.assertEqual(
+            PushAudience.objects.get(push_token=push_token).platform,
+            str(DevicePlatform.IOS),
+        )
+
+    def test_실패__다른_사용자가_등록한_UUID(self):
+        """다른 사용자가 등록한 UUID는 수정하지 않고 오류를 반환하는지 테스트"""
+        other_user = User.objects.create_user(
+            email="other@example.com",
+            password="password123",
+        )
+        Device.objects.create(user=other_user, uuid=self.valid_uuid)
+
+        response = self.client.post(self.create_url, self.device_data, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.data["uuid"][0]["error_code"], "E0070002")
+        self.assertEqual(Device.objects.get().user, other_user)
 
     def test_실패__디바이스_등록_시_UUID_필드가_없음(self):
         """디바이스 등록 시 UUID 필드가 없음 테스트"""
@@ -152,7 +234,7 @@ class PushTokenSerializerTests(APITestCase):
             data=self.valid_token_data, context={"request": self.request}
         )
         self.assertTrue(serializer.is_valid())
-        token = serializer.save(device=self.device)
+        token = serializer.save(user=self.user, device_uuid=self.device_uuid)
         self.assertEqual(token.device, self.device)
         self.assertEqual(token.token, self.valid_token_data["token"])
         self.assertTrue(token.is_valid)
@@ -171,9 +253,9 @@ class PushTokenSerializerTests(APITestCase):
         # 따라서 이 테스트는 이전 토큰의 상태가 변경되는지 확인
         token = "sample-push-token-123"
 
-        # 첫 번째 토큰 생성
+        # 사용자의 다른 디바이스에 토큰 생성
         PushToken.objects.create(
-            device=self.device,
+            device=Device.objects.create(user=self.user, uuid=uuid.uuid4()),
             token=token,
         )
 
@@ -184,14 +266,15 @@ class PushTokenSerializerTests(APITestCase):
         serializer = PushTokenSerializer(
             data=second_token_data, context={"request": self.request}
         )
-        self.assertFalse(serializer.is_valid())
-        self.assertIn("token", serializer.errors)
-        self.assertIn("error_code", serializer.errors["token"])
-        self.assertIn("message", serializer.errors["token"])
-        self.assertEqual(serializer.errors["token"]["error_code"], "E0070004")
-        self.assertEqual(
-            serializer.errors["token"]["message"], "이미 등록된 푸시 토큰입니다"
-        )
+        # 중복 여부는 등록 구문에서 확인
+        self.assertTrue(serializer.is_valid())
+        with self.assertRaises(ValidationError) as context:
+            serializer.save(user=self.user, device_uuid=self.device_uuid)
+        errors = context.exception.detail
+        self.assertIn("token", errors)
+        self.assertEqual(errors["token"]["error_code"], "E0070004")
+        self.assertEqual(errors["token"]["message"], "이미 등록된 푸시 토큰입니다")
+        self.assertFalse(PushToken.objects.filter(device=self.device).exists())
 
 
 class PushTokenViewTests(APITestCase):
@@ -244,28 +327,60 @@ class PushTokenViewTests(APITestCase):
         self.assertEqual(PushToken.objects.count(), 0)
         self.assertIn("token", response.data)
 
-    def test_실패__푸시_토큰_등록_시_토큰_중복(self):
-        """푸시 토큰 등록 시 토큰 중복 테스트"""
+    def test_성공__푸시_토큰_등록_시_토큰_중복(self):
+        """같은 디바이스에 같은 토큰을 다시 등록하면 저장된 토큰을 반환하는지 테스트"""
         # 먼저 토큰 생성
         token = "sample-push-token-123"
-        PushToken.objects.create(
+        push_token = PushToken.objects.create(
             device=self.device,
             token=token,
         )
 
-        # 같은 토큰으로 다시 시도
+        # 같은 토큰으로 다시 시도 (중복 확인을 포함한 등록 쿼리만 실행)
         token_data = {"token": token}
-        response = self.client.post(self.create_url, token_data, format="json")
-        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        with self.assertNumQueries(1):
+            response = self.client.post(self.create_url, token_data, format="json")
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response.data["id"], push_token.id)
         self.assertEqual(PushToken.objects.count(), 1)
-        self.assertIn("token", response.data)
-        self.assertIn("error_code", response.data["token"][0])
-        self.assertIn("message", response.data["token"][0])
-        self.assertEqual(response.data["token"][0]["error_code"], "E0070004")
+
+    def test_성공__무효화된_푸시_토큰_다시_등록(self):
+        """무효화된 토큰을 다시 등록하면 유효하게 바뀌고 다른 토큰은 무효화되는지 테스트"""
+        old_token = PushToken.objects.create(device=self.device, token="old-token")
+        current_token = PushToken.objects.create(
+            device=self.device, token="current-token"
+        )
+
+        response = self.client.post(
+            self.create_url, {"token": "old-token"}, format="json"
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        old_token.refresh_from_db()
+        current_token.refresh_from_db()
+        self.assertTrue(old_token.is_valid)
+        self.assertFalse(current_token.is_valid)
         self.assertEqual(
-            response.data["token"][0]["message"], "이미 등록된 푸시 토큰입니다"
+            list(PushAudience.objects.values_list("token", flat=True)), ["old-token"]
+        )
+
+    def test_실패__다른_사용자의_디바이스에_푸시_토큰_등록(self):
+        """다른 사용자의 디바이스에는 토큰을 등록하지 않는지 테스트"""
+        other_user = User.objects.create_user(
+            email="other@example.com",
+            password="password123",
+        )
+        other_device = Device.objects.create(user=other_user, uuid=uuid.uuid4())
+
+        response = self.client.post(
+            f"/v1/device/{other_device.uuid}/push_token/",
+            self.valid_token_data,
+            format="json",
         )
 
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+        self.assertEqual(PushToken.objects.count(), 0)
+
 
 class DeviceModelTests(APITestCase):
     """Device 모델 테스트"""
@@ -615,3 +730,776 @@ class DeviceViewSetAdditionalTests(APITestCase):
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
         self.assertEqual(Device.objects.count(), 0)
         self.assertIn("platform", response.data)
+
+
+class StubMessaging:
+    """FCM 발송 테스트용 메시징 백엔드"""
+
+    # 토큰 접두사별 발송 오류
+    ERRORS = {
+        "unregistered": messaging.UnregisteredError,
+        "mismatch": messaging.SenderIdMismatchError,
+        "invalid": exceptions.InvalidArgumentError,
+        "unavailable": exceptions.UnavailableError,
+    }
+    ERROR_MESSAGE = "The registration token is not a valid FCM registration token"
+
+    def __init__(self):
+        self.batches = []
+        self.lock = threading.Lock()
+
+    def send_each(self, messages):
+        with self.lock:
+            self.batches.append([message.token for message in messages])
+        responses = []
+        for message in messages:
+            error_class = self.ERRORS.get(message.token.split("-")[0])
+            exception = error_class(self.ERROR_MESSAGE) if error_class else None
+            responses.append(mock.Mock(success=exception is None, exception=exception))
+        return mock.Mock(responses=responses)
+
+
+class FakeRedis:
+    """전체 푸시 발송 결과 집계, 발송량 제한 테스트용 Redis"""
+
+    def __init__(self):
+        self.hashes = collections.defaultdict(dict)
+        self.lists = collections.defaultdict(list)
+        self.buckets = {}
+        self.locks = set()
+        # 토큰 버킷의 Redis 서버 시각
+        self.now = 0.0
+
+    def eval(self, script, numkeys, key, rate, amount):
+        """토큰 버킷 스크립트 대체"""
+        tokens, updated_at = self.buckets.get(key, (rate, self.now))
+        tokens = min(rate, tokens + max(0, self.now - updated_at) * rate)
+        wait = 0
+        if tokens >= amount:
+            tokens -= amount
+        else:
+            wait = (amount - tokens) / rate
+        self.buckets[key] = (tokens, self.now)
+        return str(wait).encode()
+
+    def hset(self, key, mapping):
+        self.hashes[key].update(
+            {field.encode(): str(value).encode() for field, value in mapping.items()}
+        )
+
+    def hincrby(self, key, field, amount):
+        value = int(self.hashes[key].get(field.encode(), 0)) + amount
+        self.hashes[key][field.encode()] = str(value).encode()
+        return value
+
+    def hgetall(self, key):
+        return dict(self.hashes.get(key, {}))
+
+    def rpush(self, key, *values):
+        self.lists[key].extend(value.encode() for value in values)
+        return len(self.lists[key])
+
+    def lrange(self, key, start, end):
+        return list(self.lists.get(key, []))
+
+    def expire(self, key, seconds):
+        return True
+
+    def delete(self, *keys):
+        for key in keys:
+            self.hashes.pop(key, None)
+            self.lists.pop(key, None)
+
+    def lock(self, key, timeout=None):
+        return FakeLock(self, key)
+
+
+class FakeLock:
+    """푸시 캠페인 발송 잠금 테스트용 Redis 잠금"""
+
+    def __init__(self, client, key):
+        self.client = client
+        self.key = key
+        self.is_owned = False
+
+    def acquire(self, blocking=True):
+        if self.key in self.client.locks:
+            return False
+        self.client.locks.add(self.key)
+        self.is_owned = True
+        return True
+
+    def reacquire(self):
+        if not self.is_owned or self.key not in self.client.locks:
+            raise LockNotOwnedError("Cannot reacquire a lock that's no longer owned")
+        return True
+
+    def owned(self):
+        return self.is_owned and self.key in self.client.locks
+
+    def release(self):
+        self.client.locks.discard(self.key)
+        self.is_owned = False
+
+
+@override_settings(PUSH_FANOUT_RANGE_SIZE=10, PUSH_FANOUT_BATCH_SIZE=3)
+class PushFanoutTests(APITestCase):
+    """전체 푸시 발송 테스트"""
+
+    ERROR_PREFIXES = [
+        "unregistered",
+        "mismatch",
+        "invalid",
+        "unavailable",
+        "unregistered",
+    ]
+
+    def setUp(self):
+        """테스트 데이터 설정"""
+        self.user = User.objects.create_user(
+            email="test@example.com",
+            password="password123",
+        )
+        self.tokens = []
+        for i in range(25):
+            device = Device.objects.create(user=self.user, uuid=uuid.uuid4())
+            token = f"token-{i}"
+            if i % 5 == 0:
+                token = f"{self.ERROR_PREFIXES[i // 5]}-{i}"
+            self.tokens.append(PushToken.objects.create(device=device, token=token))
+        # 무효화된 토큰은 발송하지 않아야 함
+        self.tokens[1].is_valid = False
+        self.tokens[1].save()
+
+        self.messaging = StubMessaging()
+        for target, new in [
+            ("apps.device.utils.messaging.send_each", self.messaging.send_each),
+            ("apps.device.v1.tasks.initialize_firebase", mock.Mock()),
+            ("apps.device.utils.is_night_time", mock.Mock(return_value=False)),
+        ]:
+            patcher = mock.patch(target, new)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        self.redis_client = FakeRedis()
+        patcher = mock.patch("apps.device.utils.REDIS_CLIENT", self.redis_client)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        # 결과 백엔드, task_always_eager 없이 등록한 범위별 작업을 워커처럼 실행
+        self.queued_tasks = []
+        patcher = mock.patch.object(
+            task_send_push_range, "apply_async", side_effect=self.run_task
+        )
+        self.mock_apply_async = patcher.start()
+        self.addCleanup(patcher.stop)
+        self.defer_tasks = False
+
+    def run_task(self, args):
+        """범위별 작업 실행 (지연 실행 시 대기열에 보관)"""
+        if self.defer_tasks:
+            self.queued_tasks.append(args)
+        else:
+            task_send_push_range(*args)
+
+    def test_성공__토큰_ID_범위_분할(self):
+        """유효한 토큰의 ID 범위가 빠짐없이 나뉘는지 테스트"""
+        ranges = get_push_token_ranges()
+
+        self.assertEqual(ranges[0][0], self.tokens[0].id)
+        self.assertEqual(ranges[-1][1], self.tokens[-1].id + 1)
+        self.assertEqual(len(ranges), 3)
+        for (_, end_id), (start_id, _) in zip(ranges, ranges[1:]):
+            self.assertEqual(end_id, start_id)
+
+    def test_성공__전체_발송_결과_집계(self):
+        """범위별로 나눠 발송한 결과가 하나로 집계되는지 테스트"""
+        success, failure, invalid_tokens = send_test_push_to_all(
+            {"title": "제목", "body": "내용"}
+        )
+
+        self.assertEqual(success, 19)
+        self.assertEqual(failure, 5)
+        self.assertCountEqual(
+            invalid_tokens,
+            ["unregistered-0", "mismatch-5", "invalid-10", "unregistered-20"],
+        )
+        self.assertEqual(self.mock_apply_async.call_count, 3)
+        # 발송이 끝나면 집계 결과 삭제
+        self.assertFalse(self.redis_client.hashes)
+        self.assertFalse(self.redis_client.lists)
+        sent_tokens = [token for batch in self.messaging.batches for token in batch]
+        self.assertEqual(len(sent_tokens), 24)
+        self.assertNotIn("token-1", sent_tokens)
+        self.assertTrue(all(len(batch) <= 3 for batch in self.messaging.batches))
+
+    def test_성공__발송_불가_토큰_무효화(self):
+        """발송할 수 없는 토큰은 무효화되어 다음 발송에서 제외되는지 테스트"""
+        send_test_push_to_all({"title": "제목", "body": "내용"})
+
+        invalidated_tokens = PushToken.objects.filter(is_valid=False).values_list(
+            "token", flat=True
+        )
+        self.assertCountEqual(
+            invalidated_tokens,
+            [
+                "token-1",
+                "unregistered-0",
+                "mismatch-5",
+                "invalid-10",
+                "unregistered-20",
+            ],
+        )
+
+        # 일시적인 오류가 발생한 토큰은 다시 발송
+        self.messaging.batches = []
+        _, failure, invalid_tokens = send_test_push_to_all(
+            {"title": "제목", "body": "내용"}
+        )
+        self.assertEqual(failure, 1)
+        self.assertEqual(invalid_tokens, [])
+        sent_tokens = [token for batch in self.messaging.batches for token in batch]
+        self.assertEqual(len(sent_tokens), 20)
+        self.assertIn("unavailable-15", sent_tokens)
+
+    def test_성공__메시지_오류는_무효화하지_않음(self):
+        """토큰과 관계없는 INVALID_ARGUMENT 오류는 무효화하지 않는지 테스트"""
+        self.assertFalse(
+            is_dead_token_error(exceptions.InvalidArgumentError("Invalid data payload"))
+        )
+        self.assertTrue(
+            is_dead_token_error(mock.Mock(code="messaging/invalid-registration-token"))
+        )
+
+    def test_성공__발송_대상이_없으면_발송하지_않음(self):
+        """발송 대상이 없으면 작업을 만들지 않는지 테스트"""
+        PushAudience.objects.update(is_push_notification=False)
+
+        self.assertEqual(
+            send_test_push_to_all({"title": "제목", "body": "내용"}), (0, 0, [])
+        )
+        self.assertFalse(self.messaging.batches)
+        self.mock_apply_async.assert_not_called()
+
+    def test_성공__결과_백엔드_없이_작업_완료_후_집계(self):
+        """범위별 작업이 순서와 관계없이 끝난 뒤에만 결과가 집계되는지 테스트"""
+        self.assertFalse(app.conf.task_always_eager)
+        self.defer_tasks = True
+
+        fanout_id = start_push_fanout({"title": "제목", "body": "내용"})
+
+        self.assertEqual(len(self.queued_tasks), 3)
+        for args in reversed(self.queued_tasks[1:]):
+            task_send_push_range(*args)
+            self.assertIsNone(get_push_fanout_result(fanout_id))
+
+        task_send_push_range(*self.queued_tasks[0])
+        success, failure, invalid_tokens = get_push_fanout_result(fanout_id)
+        self.assertEqual(success, 19)
+        self.assertEqual(failure, 5)
+        self.assertEqual(len(invalid_tokens), 4)
+
+    @override_settings(PUSH_FANOUT_POLL_INTERVAL=0)
+    def test_실패__대기_시간_안에_발송이_끝나지_않음(self):
+        """실행되지 않은 범위 작업이 있으면 대기 시간 후 오류가 발생하는지 테스트"""
+        self.defer_tasks = True
+
+        with self.assertRaises(TimeoutError):
+            send_test_push_to_all({"title": "제목", "body": "내용"}, timeout=0)
+
+    @mock.patch("apps.device.utils.time.sleep")
+    def test_성공__토큰_버킷_발송량_제한(self, mock_sleep):
+        """토큰이 부족하면 채워질 때까지 기다리는지 테스트"""
+        bucket = TokenBucket("bucket", rate=10)
+        bucket.acquire(10)
+        mock_sleep.side_effect = lambda seconds: setattr(
+            self.redis_client, "now", self.redis_client.now + seconds
+        )
+
+        bucket.acquire(5)
+
+        mock_sleep.assert_called_once()
+        self.assertAlmostEqual(mock_sleep.call_args[0][0], 0.5, places=1)
+
+    def test_실패__초당_발송량보다_큰_배치(self):
+        """초당 발송량보다 많은 토큰은 기다린 시간보다 많이 발송되므로 요청할 수 없는지 테스트"""
+        with self.assertRaises(ValueError):
+            TokenBucket("bucket", rate=10).acquire(11)
+
+    @mock.patch("apps.device.utils.time.sleep")
+    @override_settings(PUSH_FANOUT_RATE_LIMIT=2)
+    def test_성공__범위별_작업이_전체_발송량_공유(self, mock_sleep):
+        """범위별 작업이 발송 ID 의 토큰 버킷을 함께 사용하고 배치가 초당 발송량을 넘지 않는지 테스트"""
+        mock_sleep.side_effect = lambda seconds: setattr(
+            self.redis_client, "now", self.redis_client.now + seconds
+        )
+
+        success, failure, _ = send_test_push_to_all({"title": "제목", "body": "내용"})
+
+        self.assertEqual(success + failure, 24)
+        self.assertTrue(all(len(batch) <= 2 for batch in self.messaging.batches))
+        self.assertEqual(len(self.redis_client.buckets), 1)
+        # 3개 범위를 합쳐 초당 2개씩 발송
+        self.assertAlmostEqual(self.redis_client.now, (24 - 2) / 2)
+
+    def test_성공__발송_오류는_실패로_집계(self):
+        """배치 발송 중 오류가 발생하면 배치 전체를 실패로 집계하고 다음 배치를 발송하는지 테스트"""
+        send_each = self.messaging.send_each
+
+        def fail_batch(messages):
+            if "token-2" in [message.token for message in messages]:
+                raise exceptions.UnavailableError("FCM unavailable")
+            return send_each(messages)
+
+        with mock.patch("apps.device.utils.messaging.send_each", fail_batch):
+            success, failure, invalid_tokens = send_test_push_to_all(
+                {"title": "제목", "body": "내용"}
+            )
+
+        # unregistered-0, token-2, token-3 배치 전체가 실패
+        self.assertEqual(success, 17)
+        self.assertEqual(failure, 7)
+        self.assertNotIn("unregistered-0", invalid_tokens)
+
+    def test_실패__범위_작업_오류_시_남은_작업_수_감소(self):
+        """범위 작업이 오류로 중단되어도 결과를 추가해 전체 발송 대기가 끝나는지 테스트"""
+        self.defer_tasks = True
+        fanout_id = start_push_fanout({"title": "제목", "body": "내용"})
+
+        with mock.patch(
+            "apps.device.utils.get_push_audience_batch",
+            side_effect=DatabaseError("connection lost"),
+        ):
+            for args in self.queued_tasks:
+                with self.assertRaises(DatabaseError):
+                    task_send_push_range(*args)
+
+        self.assertEqual(get_push_fanout_result(fanout_id), (0, 0, []))
+
+
+class PushAudienceTests(APITestCase):
+    """푸시 발송 대상 테스트"""
+
+    def setUp(self):
+        """테스트 데이터 설정"""
+        self.users = [
+            User.objects.create_user(
+                email=f"test{i}@example.com",
+                password="password123",
+            )
+            for i in range(3)
+        ]
+        # 0: 야간 수신 동의, 1: 주간만 수신, 2: 푸시 수신 거부
+        for user, is_push, is_night in zip(
+            self.users, [True, True, False], [True, False, False]
+        ):
+            UserPreference.objects.create(
+                user=user,
+                is_push_notification=is_push,
+                is_night_notification=is_night,
+            )
+        self.devices = [
+            Device.objects.create(
+                user=user, uuid=uuid.uuid4(), platform=DevicePlatform.ANDROID
+            )
+            for user in self.users
+        ]
+        self.push_tokens = [
+            PushToken.objects.create(device=device, token=f"token-{i}")
+            for i, device in enumerate(self.devices)
+        ]
+
+    def get_tokens(self, segment: dict = None) -> list:
+        """발송 대상 토큰 조회"""
+        return [
+            token
+            for tokens in iter_push_audience_tokens(segment, batch_size=1)
+            for token in tokens
+        ]
+
+    def test_성공__토큰_등록_시_발송_대상_추가(self):
+        """토큰 등록 시 사용자의 선호 정보와 함께 발송 대상이 추가되는지 테스트"""
+        audience = PushAudience.objects.get(push_token=self.push_tokens[0])
+
+        self.assertEqual(audience.token, "token-0")
+        self.assertEqual(audience.user, self.users[0])
+        self.assertEqual(audience.platform, str(DevicePlatform.ANDROID))
+        self.assertTrue(audience.is_night_notification)
+
+    def test_성공__새_토큰_등록_시_기존_발송_대상_삭제(self):
+        """같은 디바이스에 새 토큰을 등록하면 기존 토큰은 발송 대상에서 빠지는지 테스트"""
+        PushToken.objects.create(device=self.devices[0], token="token-new")
+
+        self.assertNotIn("token-0", self.get_tokens())
+        self.assertIn("token-new", self.get_tokens())
+
+    def test_성공__선호_정보_수정_시_발송_대상_갱신(self):
+        """선호 정보를 수정하면 발송 대상의 수신 동의 여부가 갱신되는지 테스트"""
+        serializer = UserPreferenceSerializer(
+            instance=self.users[2].preference,
+            data={"is_push_notification": True},
+            partial=True,
+        )
+        serializer.is_valid(raise_exception=True)
+        serializer.save()
+
+        self.assertEqual(self.get_tokens(), ["token-0", "token-1", "token-2"])
+
+    def test_성공__수신_동의_여부로_대상_조회(self):
+        """푸시 수신 거부 사용자는 제외하고, 야간에는 야간 수신 동의 사용자만 조회하는지 테스트"""
+        daytime = timezone.localtime().replace(hour=12)
+        nighttime = timezone.localtime().replace(hour=22)
+
+        self.assertEqual(
+            self.get_tokens(get_push_segment(now=daytime)), ["token-0", "token-1"]
+        )
+        self.assertEqual(self.get_tokens(get_push_segment(now=nighttime)), ["token-0"])
+        self.assertEqual(
+            self.get_tokens(get_push_segment(platform=DevicePlatform.IOS, now=daytime)),
+            [],
+        )
+
+    def test_성공__무효화된_토큰_발송_대상_삭제(self):
+        """발송에 실패해 무효화된 토큰은 발송 대상에서 삭제되는지 테스트"""
+        invalidate_push_tokens(["token-0"])
+
+        self.assertFalse(
+            PushAudience.objects.filter(push_token=self.push_tokens[0]).exists()
+        )
+
+
+class PushTokenRotationTests(APITestCase):
+    """푸시 토큰 교체 테스트"""
+
+    def setUp(self):
+        """테스트 데이터 설정"""
+        self.user = User.objects.create_user(
+            email="test@example.com",
+            password="password123",
+        )
+        self.device = Device.objects.create(user=self.user, uuid=uuid.uuid4())
+        self.push_token = PushToken.objects.create(
+            device=self.device, token="first-token"
+        )
+
+    def test_성공__변경_없는_저장은_토큰_무효화_생략(self):
+        """변경된 값이 없으면 UPDATE 한 번만 실행되는지 테스트"""
+        push_token = PushToken.objects.get(id=self.push_token.id)
+
+        with self.assertNumQueries(1):
+            push_token.save()
+
+        self.assertTrue(PushAudience.objects.filter(push_token=push_token).exists())
+
+    def test_성공__다시_유효화한_토큰_외_무효화(self):
+        """무효화된 토큰을 다시 유효화하면 같은 디바이스의 다른 토큰만 무효화되는지 테스트"""
+        second_token = PushToken.objects.create(
+            device=self.device, token="second-token"
+        )
+        first_token = PushToken.objects.get(id=self.push_token.id)
+
+        first_token.is_valid = True
+        first_token.save()
+
+        second_token.refresh_from_db()
+        first_token.refresh_from_db()
+        self.assertTrue(first_token.is_valid)
+        self.assertFalse(second_token.is_valid)
+        self.assertEqual(
+            list(PushAudience.objects.values_list("token", flat=True)),
+            ["first-token"],
+        )
+
+
+class PushTokenBulkTests(APITestCase):
+    """푸시 토큰 일괄 등록 테스트"""
+
+    def setUp(self):
+        """테스트 데이터 설정"""
+        self.user = User.objects.create_user(
+            email="test@example.com",
+            password="password123",
+        )
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.user)
+        self.url = "/v1/device/push_token/bulk/"
+        self.devices = [
+            Device.objects.create(user=self.user, uuid=uuid.uuid4()) for _ in range(3)
+        ]
+        # 0: 같은 토큰 유지, 1: 새 토큰으로 교체, 2: 무효화된 토큰 다시 등록
+        PushToken.objects.create(device=self.devices[0], token="token-0")
+        PushToken.objects.create(device=self.devices[1], token="old-token-1")
+        PushToken.objects.create(device=self.devices[2], token="token-2")
+        PushToken.objects.create(device=self.devices[2], token="new-token-2")
+
+    def test_성공__일괄_등록(self):
+        """바뀐 토큰만 등록하고 디바이스별 유효한 토큰이 하나만 남는지 테스트"""
+        data = {
+            "push_tokens": [
+                {"device_uuid": str(self.devices[0].uuid), "token": "token-0"},
+                {"device_uuid": str(self.devices[1].uuid), "token": "token-1"},
+                {"device_uuid": str(self.devices[2].uuid), "token": "token-2"},
+            ]
+        }
+
+        response = self.client.post(self.url, data, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data["push_tokens"]), 3)
+        valid_tokens = PushToken.objects.filter(is_valid=True).values_list(
+            "device_id", "token"
+        )
+        self.assertCountEqual(
+            valid_tokens,
+            [
+                (self.devices[0].id, "token-0"),
+                (self.devices[1].id, "token-1"),
+                (self.devices[2].id, "token-2"),
+            ],
+        )
+        self.assertCountEqual(
+            PushAudience.objects.values_list("token", flat=True),
+            ["token-0", "token-1", "token-2"],
+        )
+
+    def test_실패__다른_사용자의_디바이스(self):
+        """내 계정으로 등록되지 않은 디바이스가 포함되면 등록하지 않는지 테스트"""
+        other_user = User.objects.create_user(
+            email="other@example.com",
+            password="password123",
+        )
+        other_device = Device.objects.create(user=other_user, uuid=uuid.uuid4())
+        data = {
+            "push_tokens": [
+                {"device_uuid": str(self.devices[1].uuid), "token": "token-1"},
+                {"device_uuid": str(other_device.uuid), "token": "token-other"},
+            ]
+        }
+
+        response = self.client.post(self.url, data, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertFalse(PushToken.objects.filter(token="token-1").exists())
+
+    def test_실패__다른_디바이스에_등록된_토큰(self):
+        """사용자의 다른 디바이스에 등록된 토큰이 포함되면 등록하지 않는지 테스트"""
+        data = {
+            "push_tokens": [
+                {"device_uuid": str(self.devices[1].uuid), "token": "token-0"},
+            ]
+        }
+
+        response = self.client.post(self.url, data, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.data["push_tokens"][0]["error_code"], "E0070004")
+        self.assertFalse(
+            PushToken.objects.filter(device=self.devices[1], token="token-0").exists()
+        )
+
+    def test_실패__여러_디바이스에_같은_토큰(self):
+        """요청한 여러 디바이스에 같은 토큰이 있으면 등록하지 않는지 테스트"""
+        data = {
+            "push_tokens": [
+                {"device_uuid": str(self.devices[0].uuid), "token": "token-new"},
+                {"device_uuid": str(self.devices[1].uuid), "token": "token-new"},
+            ]
+        }
+
+        response = self.client.post(self.url, data, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertFalse(PushToken.objects.filter(token="token-new").exists())
+
+    def test_성공__조회_이후_등록된_토큰_갱신(self):
+        """유효한 토큰 조회 이후 같은 토큰이 등록되어도 오류 없이 등록되는지 테스트"""
+        serializer = PushTokenBulkSerializer(
+            data={
+                "push_tokens": [
+                    {"device_uuid": str(self.devices[1].uuid), "token": "token-1"},
+                ]
+            },
+            context={"request": mock.Mock(user=self.user)},
+        )
+        serializer.is_valid(raise_exception=True)
+        # 검증 이후 단건 등록 요청이 같은 토큰을 먼저 저장
+        push_token = PushToken.upsert(self.user.id, self.devices[1].uuid, "token-1")
+        PushToken.objects.filter(id=push_token.id).update(is_valid=False)
+
+        serializer.save()
+
+        self.assertEqual(PushToken.objects.filter(token="token-1").count(), 1)
+        push_token.refresh_from_db()
+        self.assertTrue(push_token.is_valid)
+        self.assertTrue(PushAudience.objects.filter(push_token=push_token).exists())
+
+
+@override_settings(PUSH_FANOUT_BATCH_SIZE=3, PUSH_CAMPAIGN_BATCHES_PER_TASK=2)
+class PushCampaignTests(APITestCase):
+    """푸시 캠페인 테스트"""
+
+    def setUp(self):
+        """테스트 데이터 설정"""
+        self.user = User.objects.create_user(
+            email="test@example.com",
+            password="password123",
+        )
+        self.push_tokens = [
+            PushToken.objects.create(
+                device=Device.objects.create(user=self.user, uuid=uuid.uuid4()),
+                token=f"unregistered-{i}" if i == 3 else f"token-{i}",
+            )
+            for i in range(10)
+        ]
+        self.campaign = PushCampaign.objects.create(
+            title="제목",
+            body="내용",
+            scheduled_at=timezone.now() - datetime.timedelta(minutes=1),
+            rate_limit=1000,
+        )
+        self.messaging = StubMessaging()
+        for target, new in [
+            ("apps.device.utils.messaging.send_each", self.messaging.send_each),
+            ("apps.device.v1.tasks.initialize_firebase", mock.Mock()),
+            ("apps.device.utils.is_night_time", mock.Mock(return_value=False)),
+        ]:
+            patcher = mock.patch(target, new)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        self.redis_client = FakeRedis()
+        patcher = mock.patch("apps.device.utils.REDIS_CLIENT", self.redis_client)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        app.conf.task_always_eager = True
+        self.addCleanup(setattr, app.conf, "task_always_eager", False)
+
+    def get_sent_tokens(self) -> list:
+        """발송한 토큰 목록 조회"""
+        return [token for batch in self.messaging.batches for token in batch]
+
+    def test_성공__예약_캠페인_발송(self):
+        """예약 일시가 지난 캠페인이 끝까지 발송되고 배치별 결과가 저장되는지 테스트"""
+        task_start_push_campaigns()
+
+        self.campaign.refresh_from_db()
+        self.assertEqual(self.campaign.status, PushCampaignStatus.COMPLETED)
+        self.assertEqual(self.campaign.success_count, 9)
+        self.assertEqual(self.campaign.failure_count, 1)
+        self.assertEqual(self.campaign.invalid_count, 1)
+        self.assertEqual(self.campaign.last_push_token_id, self.push_tokens[-1].id)
+        self.assertEqual(len(self.get_sent_tokens()), 10)
+        self.assertEqual(
+            list(self.campaign.batches.values_list("success_count", flat=True)),
+            [3, 2, 3, 1],
+        )
+
+    def test_성공__중단된_위치부터_이어서_발송(self):
+        """워커 종료 후 다시 발송하면 마지막으로 저장한 배치 이후부터 발송하는지 테스트"""
+        PushCampaign.objects.filter(id=self.campaign.id).update(
+            status=PushCampaignStatus.RUNNING,
+            started_at=timezone.now(),
+            updated_at=timezone.now() - datetime.timedelta(hours=1),
+            last_push_token_id=self.push_tokens[5].id,
+        )
+
+        task_start_push_campaigns()
+
+        self.assertEqual(self.get_sent_tokens(), [f"token-{i}" for i in range(6, 10)])
+
+    def test_성공__일시_정지_후_재개(self):
+        """일시 정지한 캠페인은 발송하지 않고, 재개하면 이어서 발송하는지 테스트"""
+        campaigns = PushCampaign.objects.filter(id=self.campaign.id)
+        PushCampaign.objects.filter(id=self.campaign.id).update(
+            status=PushCampaignStatus.RUNNING, started_at=timezone.now()
+        )
+        self.assertTrue(send_push_campaign_batches(self.campaign.id, max_batches=1))
+
+        self.assertEqual(pause_push_campaigns(campaigns), 1)
+        self.assertFalse(send_push_campaign_batches(self.campaign.id))
+        self.assertEqual(len(self.get_sent_tokens()), 3)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.assertEqual(resume_push_campaigns(campaigns), 1)
+
+        self.campaign.refresh_from_db()
+        self.assertEqual(self.campaign.status, PushCampaignStatus.COMPLETED)
+        self.assertEqual(len(self.get_sent_tokens()), 10)
+
+    def test_성공__발송_중_일시_정지(self):
+        """발송 중에 일시 정지하면 발송 결과를 저장하고 상태는 유지되는지 테스트"""
+        campaigns = PushCampaign.objects.filter(id=self.campaign.id)
+        campaigns.update(status=PushCampaignStatus.RUNNING, started_at=timezone.now())
+        send_each = self.messaging.send_each
+
+        def pause_and_send(messages):
+            pause_push_campaigns(campaigns)
+            return send_each(messages)
+
+        with mock.patch("apps.device.utils.messaging.send_each", pause_and_send):
+            self.assertFalse(send_push_campaign_batches(self.campaign.id))
+
+        self.campaign.refresh_from_db()
+        self.assertEqual(self.campaign.status, PushCampaignStatus.PAUSED)
+        self.assertEqual(self.campaign.success_count, 3)
+        self.assertEqual(self.campaign.last_push_token_id, self.push_tokens[2].id)
+        self.assertEqual(len(self.get_sent_tokens()), 3)
+
+    def test_실패__발송_오류_시_발송한_배치_유지(self):
+        """발송 오류가 발생해도 발송 위치가 되돌려지지 않고 실패로 기록되는지 테스트"""
+        PushCampaign.objects.filter(id=self.campaign.id).update(
+            status=PushCampaignStatus.RUNNING, started_at=timezone.now()
+        )
+        self.assertTrue(send_push_campaign_batches(self.campaign.id, max_batches=1))
+
+        with mock.patch(
+            "apps.device.utils.messaging.send_each",
+            side_effect=exceptions.UnavailableError("FCM unavailable"),
+        ):
+            self.assertFalse(send_push_campaign_batches(self.campaign.id))
+
+        self.campaign.refresh_from_db()
+        self.assertEqual(self.campaign.status, PushCampaignStatus.RUNNING)
+        self.assertEqual(self.campaign.last_push_token_id, self.push_tokens[5].id)
+        self.assertEqual(self.campaign.success_count, 3)
+        self.assertEqual(self.campaign.failure_count, 3)
+        self.assertEqual(
+            list(self.campaign.batches.values_list("failure_count", flat=True)),
+            [0, 3],
+        )
+
+        # 재시작하면 실패한 배치 이후부터 발송
+        self.assertFalse(send_push_campaign_batches(self.campaign.id, max_batches=10))
+        self.assertEqual(
+            self.get_sent_tokens()[3:], [f"token-{i}" for i in range(6, 10)]
+        )
+
+    def test_성공__같은_캠페인_동시_발송_방지(self):
+        """발송 중인 캠페인의 작업이 다시 등록되어도 함께 발송하지 않는지 테스트"""
+        PushCampaign.objects.filter(id=self.campaign.id).update(
+            status=PushCampaignStatus.RUNNING, started_at=timezone.now()
+        )
+        send_each = self.messaging.send_each
+        duplicate_results = []
+
+        def send_with_duplicate(messages):
+            # 재개, 중단된 작업 재등록으로 같은 캠페인의 작업이 함께 실행된 상황
+            duplicate_results.append(send_push_campaign_batches(self.campaign.id))
+            return send_each(messages)
+
+        with mock.patch("apps.device.utils.messaging.send_each", send_with_duplicate):
+            self.assertFalse(
+                send_push_campaign_batches(self.campaign.id, max_batches=10)
+            )
+
+        self.assertEqual(duplicate_results, [False] * 4)
+        self.assertEqual(len(self.get_sent_tokens()), 10)
+        # 발송이 끝나면 잠금 해제
+        self.assertFalse(self.redis_client.locks)
+
+    def test_성공__취소한_캠페인_발송_중단(self):
+        """취소한 캠페인은 예약 일시가 지나도 발송하지 않는지 테스트"""
+        cancel_push_campaigns(PushCampaign.objects.filter(id=self.campaign.id))
+
+        task_start_push_campaigns()
+
+        self.campaign.refresh_from_db()
+        self.assertEqual(self.campaign.status, PushCampaignStatus.CANCELED)
+        self.assertFalse(self.messaging.batches)
@@ -1,10 +1,14 @@
 from drf_spectacular.utils import extend_schema
-from rest_framework import viewsets, mixins
-from rest_framework.generics import get_object_or_404
+from rest_framework import viewsets, mixins, status
+from rest_framework.decorators import action
 from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
 
-from apps.device.models import Device
-from apps.device.v1.serializers import DeviceSerializer, PushTokenSerializer
+from apps.device.v1.serializers import (
+    DeviceSerializer,
+    PushTokenSerializer,
+    PushTokenBulkSerializer,
+)
 
 
 class DeviceViewSet(viewsets.GenericViewSet, mixins.CreateModelMixin):
@@ -13,10 +17,18 @@ class DeviceViewSet(viewsets.GenericViewSet, mixins.CreateModelMixin):
     serializer_class = DeviceSerializer
     permission_classes = [IsAuthenticated]
     lookup_field = "uuid"
+    # UUID 형식이 아닌 경로는 디바이스를 조회하지 않고 404 반환
+    lookup_value_regex = "[0-9a-fA-F]{8}-?[0-9a-fA-F]{4}-?[0-9a-fA-F]{4}-?[0-9a-fA-F]{4}-?[0-9a-fA-F]{12}"
 
     def perform_create(self, serializer):
         serializer.save(user=self.request.user)
 
+    def get_serializer_class(self):
+        """시리얼라이저 클래스 설정"""
+        if self.action == "push_token_bulk":
+            return PushTokenBulkSerializer
+        return super().get_serializer_class()
+
     @extend_schema(
         request=DeviceSerializer,
         responses={
@@ -31,6 +43,25 @@ class DeviceViewSet(viewsets.GenericViewSet, mixins.CreateModelMixin):
     def create(self, request, *args, **kwargs):
         return super().create(request, *args, **kwargs)
 
+    @extend_schema(
+        request=PushTokenBulkSerializer,
+        responses={
+            200: PushTokenBulkSerializer,
+        },
+        tags=["device"],
+        summary="사용자 푸시 토큰 일괄 등록",
+        description="""
+        로그인한 사용자의 디바이스별 푸시 토큰을 한 번에 등록합니다.
+        이미 등록된 유효한 토큰은 변경하지 않으므로 앱 실행 시마다 호출할 수 있습니다.
+        """,
+    )
+    @action(detail=False, methods=["post"], url_path="push_token/bulk")
+    def push_token_bulk(self, request, *args, **kwargs):
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        serializer.save()
+        return Response(serializer.data, status=status.HTTP_200_OK)
+
 
 class PushTokenViewSet(viewsets.GenericViewSet, mixins.CreateModelMixin):
     """푸시 토큰"""
@@ -39,8 +70,11 @@ class PushTokenViewSet(viewsets.GenericViewSet, mixins.CreateModelMixin):
     permission_classes = [IsAuthenticated]
 
     def perform_create(self, serializer):
-        device = get_object_or_404(Device, uuid=self.kwargs["device_uuid"])
-        serializer.save(device=device)
+        # 디바이스 조회, 토큰 중복 확인은 토큰 등록 구문에서 함께 처리
+        serializer.save(
+            user=self.request.user,
+            device_uuid=self.kwargs["device_uuid"],
+        )
 
     @extend_schema(
         request=PushTokenSerializer,
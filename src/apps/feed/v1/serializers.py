@@ -14,6 +14,7 @@ from apps.feed.models import (
     FeedCommentReport,
 )
 from apps.feed.v1.fields import CurrentFeedDefault
+from apps.file.v1.utils import get_public_thumbnail_urls
 from apps.user.models import UserProfile
 from base.enums.errors import (
     E006_FEED_ALREADY_REPORTED,
@@ -31,10 +32,15 @@ class AuthorSerializer(serializers.ModelSerializer):
     """
 
     uuid = serializers.UUIDField(source="user.uuid", help_text="UUID")
+    image_thumbnails = serializers.SerializerMethodField(help_text="이미지 썸네일")
+
+    def get_image_thumbnails(self, instance) -> dict:
+        """이미지 썸네일 URL 조회"""
+        return get_public_thumbnail_urls(instance.image)
 
     class Meta:
         model = UserProfile
-        fields = ["uuid", "nickname", "image"]
+        fields = ["uuid", "nickname", "image", "image_thumbnails"]
 
 
 class FeedTagSerializer(serializers.ModelSerializer):
@@ -185,6 +191,11 @@ class FeedRetrieveSerializer(FeedListSerializer):
     """
 
     tags = FeedTagSerializer(many=True, help_text="태그 목록")
+    image_thumbnails = serializers.SerializerMethodField(help_text="이미지 썸네일")
+
+    def get_image_thumbnails(self, instance) -> dict:
+        """이미지 썸네일 URL 조회"""
+        return get_public_thumbnail_urls(instance.image)
 
     class Meta:
         model = Feed
@@ -194,6 +205,7 @@ class FeedRetrieveSerializer(FeedListSerializer):
             "title",
             "content",
             "image",
+            "image_thumbnails",
             "tags",
             "likes_count",
             "comments_count",
@@ -0,0 +1,48 @@
+# Generated by Django 5.2.18 on 2026-10-19 08:10
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("contenttypes", "0002_remove_content_type_name"),
+        ("file", "0002_initial"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="file",
+            name="part_size",
+            field=models.PositiveIntegerField(
+                blank=True, null=True, verbose_name="멀티파트 파트 크기"
+            ),
+        ),
+        migrations.AddField(
+            model_name="file",
+            name="upload_id",
+            field=models.CharField(
+                blank=True, max_length=255, null=True, verbose_name="멀티파트 업로드 ID"
+            ),
+        ),
+        migrations.AddField(
+            model_name="file",
+            name="uploaded_parts",
+            field=models.JSONField(
+                blank=True,
+                default=dict,
+                help_text="파트 번호별 ETag",
+                verbose_name="업로드 완료 파트",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="file",
+            index=models.Index(
+                condition=models.Q(("upload_id__isnull", False)),
+                fields=["updated_at"],
+                name="file_multipart_pending_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,24 @@
+# Generated by Django 5.2.18 on 2026-10-19 08:16
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("file", "0003_multipart_upload"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="file",
+            name="etag",
+            field=models.CharField(
+                blank=True,
+                help_text="업로드 검증 시 S3 에서 조회한 값",
+                max_length=255,
+                null=True,
+                verbose_name="S3 ETag",
+            ),
+        ),
+    ]
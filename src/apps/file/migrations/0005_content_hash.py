@@ -0,0 +1,42 @@
+# Generated by Django 5.2.18 on 2026-10-19 08:18
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("contenttypes", "0002_remove_content_type_name"),
+        ("file", "0004_etag"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="file",
+            name="content_hash",
+            field=models.CharField(
+                blank=True,
+                help_text="SHA-256 (16진수)",
+                max_length=64,
+                null=True,
+                verbose_name="파일 해시",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="file",
+            index=models.Index(
+                fields=["user", "content_hash", "file_size"],
+                name="file_user_id_866c89_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="file",
+            index=models.Index(
+                condition=models.Q(("content_hash__isnull", False)),
+                fields=["object_key"],
+                name="file_shared_object_key_idx",
+            ),
+        ),
+    ]
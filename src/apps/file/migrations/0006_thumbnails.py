@@ -0,0 +1,23 @@
+# Generated by Django 5.2.18 on 2026-10-19 08:21
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("file", "0005_content_hash"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="file",
+            name="thumbnails",
+            field=models.JSONField(
+                blank=True,
+                default=dict,
+                help_text="썸네일 이름(형식_크기)별 S3 객체 키",
+                verbose_name="썸네일",
+            ),
+        ),
+    ]
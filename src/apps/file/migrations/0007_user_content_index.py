@@ -0,0 +1,23 @@
+# Generated by Django 5.2.18 on 2026-10-19 08:27
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("contenttypes", "0002_remove_content_type_name"),
+        ("file", "0006_thumbnails"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="file",
+            index=models.Index(
+                fields=["user", "content_type", "object_id", "expire_at"],
+                name="file_user_content_idx",
+            ),
+        ),
+    ]
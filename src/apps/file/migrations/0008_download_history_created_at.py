@@ -0,0 +1,23 @@
+# Generated by Django 5.2.18 on 2026-10-19 08:29
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("file", "0007_user_content_index"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="filedownloadhistory",
+            name="created_at",
+            field=models.DateTimeField(
+                default=django.utils.timezone.now,
+                editable=False,
+                verbose_name="생성일시",
+            ),
+        ),
+    ]
@@ -0,0 +1,24 @@
+# Generated by Django 5.2.18 on 2026-10-19 09:29
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("contenttypes", "0002_remove_content_type_name"),
+        ("file", "0008_download_history_created_at"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="file",
+            index=models.Index(
+                condition=models.Q(("thumbnails", {}), _negated=True),
+                fields=["object_key"],
+                name="file_thumbnail_object_key_idx",
+            ),
+        ),
+    ]
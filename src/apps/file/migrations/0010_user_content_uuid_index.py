@@ -0,0 +1,27 @@
+# Generated by Django 5.2.18 on 2026-10-19 09:30
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("contenttypes", "0002_remove_content_type_name"),
+        ("file", "0009_thumbnail_object_key_index"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name="file",
+            name="file_user_content_idx",
+        ),
+        migrations.AddIndex(
+            model_name="file",
+            index=models.Index(
+                fields=["user", "content_type", "object_id", "uuid"],
+                name="file_user_content_idx",
+            ),
+        ),
+    ]
@@ -1,6 +1,9 @@
+import math
+
 from django.contrib.contenttypes.fields import GenericForeignKey
 from django.contrib.contenttypes.models import ContentType
 from django.db import models
+from django.utils import timezone
 from uuid_extensions import uuid7
 
 
@@ -53,6 +56,24 @@ class File(models.Model):
         blank=True,
     )
     # [Why]
+    # Q. 파일 내용의 해시를 저장하는 이유는?
+    # A. 같은 파일을 다시 업로드하면 기존 S3 객체를 함께 사용해 저장 공간을 줄이기 위함
+    #    같은 객체를 사용하는 파일이 모두 삭제될 때만 S3 객체를 삭제함
+    content_hash = models.CharField(
+        max_length=64,
+        null=True,
+        blank=True,
+        verbose_name="파일 해시",
+        help_text="SHA-256 (16진수)",
+    )
+    etag = models.CharField(
+        max_length=255,
+        null=True,
+        blank=True,
+        verbose_name="S3 ETag",
+        help_text="업로드 검증 시 S3 에서 조회한 값",
+    )
+    # [Why]
     # Q. ContentType, ObjectId를 사용한 이유는?
     # A. 파일은 주로 특정 객체에 연결되어 사용되며, 이 객체는 다양한 모델일 수 있음
     #    따라서, GenericForeignKey를 사용하여 다양한 모델과 연결할 수 있도록 함
@@ -82,6 +103,33 @@ class File(models.Model):
         verbose_name="만료일시",
         db_index=True,
     )
+    thumbnails = models.JSONField(
+        default=dict,
+        blank=True,
+        verbose_name="썸네일",
+        help_text="썸네일 이름(형식_크기)별 S3 객체 키",
+    )
+    # [Why]
+    # Q. 멀티파트 업로드 상태를 파일에 저장하는 이유는?
+    # A. 업로드가 중단되어도 완료된 파트부터 이어서 업로드할 수 있도록 하고,
+    #    방치된 업로드를 찾아 S3 에서 정리하기 위함
+    upload_id = models.CharField(
+        max_length=255,
+        null=True,
+        blank=True,
+        verbose_name="멀티파트 업로드 ID",
+    )
+    part_size = models.PositiveIntegerField(
+        null=True,
+        blank=True,
+        verbose_name="멀티파트 파트 크기",
+    )
+    uploaded_parts = models.JSONField(
+        default=dict,
+        blank=True,
+        verbose_name="업로드 완료 파트",
+        help_text="파트 번호별 ETag",
+    )
     created_at = models.DateTimeField(
         auto_now_add=True,
         verbose_name="생성 일시",
@@ -91,6 +139,13 @@ class File(models.Model):
         verbose_name="수정 일시",
     )
 
+    @property
+    def part_count(self) -> int:
+        """멀티파트 업로드 파트 수"""
+        if not self.part_size:
+            return 0
+        return math.ceil(self.file_size / self.part_size)
+
     class Meta:
         db_table = "file"
         verbose_name = "파일"
@@ -98,8 +153,35 @@ class File(models.Model):
         # [Why]
         # Q. ContentType, ObjectId를 복합 키로 설정한 이유는?
         # A. 항상 두 값이 함께 사용되며, 이 조합이 유일한 값을 보장하기 때문
+        # Q. 사용자, 콘텐츠, UUID 복합 인덱스를 추가한 이유는?
+        # A. 파일 목록 조회는 항상 사용자와 콘텐츠로 좁힌 뒤 UUID 순으로 페이지를 나누므로,
+        #    정렬 없이 인덱스 순서대로 한 페이지 분량만 읽기 위함
+        #    만료일시는 읽은 행에서 비교 (만료 파일은 삭제 작업에서 정리되어 적음)
+        # Q. 썸네일이 있는 파일만 객체 키 인덱스를 추가한 이유는?
+        # A. 공개 이미지 URL의 썸네일 생성 여부를 객체 키로 조회하기 위함
+        #    썸네일이 없는 파일은 조회 대상이 아니므로 인덱스 크기를 줄임
         indexes = [
             models.Index(fields=["content_type", "object_id"]),
+            models.Index(
+                fields=["user", "content_type", "object_id", "uuid"],
+                name="file_user_content_idx",
+            ),
+            models.Index(fields=["user", "content_hash", "file_size"]),
+            models.Index(
+                fields=["object_key"],
+                condition=models.Q(content_hash__isnull=False),
+                name="file_shared_object_key_idx",
+            ),
+            models.Index(
+                fields=["updated_at"],
+                condition=models.Q(upload_id__isnull=False),
+                name="file_multipart_pending_idx",
+            ),
+            models.Index(
+                fields=["object_key"],
+                condition=~models.Q(thumbnails={}),
+                name="file_thumbnail_object_key_idx",
+            ),
         ]
 
 
@@ -127,8 +209,12 @@ class FileDownloadHistory(models.Model):
         on_delete=models.CASCADE,
         related_name="download_history",
     )
+    # [Why]
+    # Q. auto_now_add 대신 default 를 사용하는 이유는?
+    # A. 이력은 버퍼에 쌓인 뒤 일괄 저장되므로, 저장 일시가 아닌 다운로드 일시를 기록하기 위함
     created_at = models.DateTimeField(
-        auto_now_add=True,
+        default=timezone.now,
+        editable=False,
         verbose_name="생성일시",
     )
 
@@ -1,3 +1,4 @@
+from django.contrib.contenttypes.models import ContentType
 from django_filters import rest_framework as filters
 
 from apps.file.models import File
@@ -8,6 +9,7 @@ class FileFilterSet(filters.FilterSet):
 
     content_type = filters.ModelChoiceFilter(
         field_name="content_type",
+        queryset=ContentType.objects.all(),
         lookup_expr="exact",
         required=True,
         label="컨텐츠 타입 (필수)",
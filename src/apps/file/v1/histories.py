@@ -0,0 +1,156 @@
+import json
+import logging
+
+import redis
+from django.conf import settings
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+
+from apps.file.models import File, FileDownloadHistory
+from apps.user.models import User
+
+logger = logging.getLogger(__name__)
+
+HISTORY_BUFFER_KEY = "file:download_history:buffer"
+HISTORY_PROCESSING_KEY = "file:download_history:processing"
+HISTORY_FLUSH_LOCK_KEY = "file:download_history:lock"
+
+# 연결은 첫 명령 실행 시 생성됨
+REDIS_CLIENT = redis.Redis.from_url(settings.FILE_DOWNLOAD_HISTORY_REDIS_URL)
+
+
+def buffer_download_histories(user_id: int, reason: str, files: list):
+    """
+    파일 다운로드 이력 버퍼에 추가:
+    이력은 Redis 리스트에 쌓아두고 Celery 작업에서 일괄 저장
+
+    Args:
+        user_id (int): 다운로드를 요청한 사용자 ID
+        reason (str): 다운로드 사유
+        files (list): 다운로드한 파일 목록
+    """
+    if not files:
+        return
+    created_at = timezone.now().isoformat()
+    payloads = [
+        json.dumps(
+            {
+                "user_id": user_id,
+                "file_id": str(file.uuid),
+                "reason": reason,
+                "created_at": created_at,
+            }
+        )
+        for file in files
+    ]
+    try:
+        # 앞에 추가하고 뒤에서 꺼내 먼저 쌓인 이력부터 저장
+        length = REDIS_CLIENT.lpush(HISTORY_BUFFER_KEY, *payloads)
+    except redis.RedisError as e:
+        # 버퍼를 사용할 수 없으면 이력이 유실되지 않도록 바로 저장
+        logger.warning(f"Error buffering download histories: {e}")
+        save_download_histories(payloads)
+        return
+    # [Why]
+    # Q. 주기적인 저장 작업 외에 버퍼 크기로도 저장을 요청하는 이유는?
+    # A. 주기 작업이 지연되거나 실행되지 않아도 버퍼가 한 번에 저장할 수 있는
+    #    크기 이상으로 쌓이지 않도록 하기 위함
+    batch_size = settings.FILE_DOWNLOAD_HISTORY_FLUSH_BATCH_SIZE
+    if length // batch_size > (length - len(payloads)) // batch_size:
+        from apps.file.v1.tasks import task_flush_download_histories
+
+        task_flush_download_histories.apply_async()
+
+
+def save_download_histories(payloads: list) -> int:
+    """
+    버퍼에 쌓인 파일 다운로드 이력 저장
+
+    Args:
+        payloads (list): JSON 으로 직렬화된 다운로드 이력 목록
+
+    Returns:
+        int: 저장한 이력 수
+    """
+    histories = [json.loads(payload) for payload in payloads]
+    # 버퍼에 있는 동안 삭제된 파일, 사용자의 이력은 저장하지 않음
+    file_ids = set(
+        File.objects.filter(
+            uuid__in={history["file_id"] for history in histories}
+        ).values_list("uuid", flat=True)
+    )
+    user_ids = set(
+        User.objects.filter(
+            id__in={history["user_id"] for history in histories}
+        ).values_list("id", flat=True)
+    )
+    created_histories = FileDownloadHistory.objects.bulk_create(
+        [
+            FileDownloadHistory(
+                user_id=history["user_id"],
+                file_id=history["file_id"],
+                reason=history["reason"],
+                created_at=parse_datetime(history["created_at"]),
+            )
+            for history in histories
+            if history["user_id"] in user_ids
+            and File._meta.pk.to_python(history["file_id"]) in file_ids
+        ],
+        batch_size=settings.FILE_DOWNLOAD_HISTORY_FLUSH_BATCH_SIZE,
+    )
+    return len(created_histories)
+
+
+def flush_download_histories(batch_size: int = None) -> int:
+    """
+    파일 다운로드 이력 버퍼 비우기:
+    버퍼의 이력을 처리 중 리스트로 옮긴 뒤 저장하고, 저장이 끝나면 처리 중 리스트 삭제
+
+    Args:
+        batch_size (int): 한 번에 저장할 이력 수
+
+    Returns:
+        int: 저장한 이력 수
+    """
+    batch_size = batch_size or settings.FILE_DOWNLOAD_HISTORY_FLUSH_BATCH_SIZE
+    # 동시에 여러 작업이 같은 처리 중 리스트를 저장하지 않도록 잠금
+    lock = REDIS_CLIENT.lock(
+        HISTORY_FLUSH_LOCK_KEY,
+        timeout=settings.FILE_DOWNLOAD_HISTORY_FLUSH_LOCK_TIMEOUT,
+    )
+    if not lock.acquire(blocking=False):
+        return 0
+    total_count = 0
+    try:
+        while True:
+            # [Why]
+            # Q. 배치마다 잠금 유지 시간을 연장하는 이유는?
+            # A. 저장이 잠금 유지 시간보다 오래 걸려 다른 작업이 잠금을 얻으면
+            #    같은 처리 중 리스트를 다시 저장하므로, 배치 하나의 저장 시간만 넘지 않도록 하기 위함
+            #    잠금을 잃었으면 처리 중 리스트는 잠금을 얻은 작업에 맡기고 중단
+            lock.reacquire()
+            # [Why]
+            # Q. 버퍼에서 바로 꺼내지 않고 처리 중 리스트로 옮기는 이유는?
+            # A. 저장 도중 워커가 종료되어도 이력이 처리 중 리스트에 남아 있어
+            #    다음 실행에서 다시 저장할 수 있도록 하기 위함 (최소 한 번 저장)
+            payloads = REDIS_CLIENT.lrange(HISTORY_PROCESSING_KEY, 0, -1)
+            recovered = bool(payloads)
+            if not recovered:
+                # LMOVE(Redis 6.2 이상) 대신 모든 버전에서 사용할 수 있는 RPOPLPUSH 사용
+                pipeline = REDIS_CLIENT.pipeline()
+                for _ in range(batch_size):
+                    pipeline.rpoplpush(HISTORY_BUFFER_KEY, HISTORY_PROCESSING_KEY)
+                payloads = [payload for payload in pipeline.execute() if payload]
+            if not payloads:
+                break
+            total_count += save_download_histories(payloads)
+            lock.reacquire()
+            REDIS_CLIENT.delete(HISTORY_PROCESSING_KEY)
+            if not recovered and len(payloads) < batch_size:
+                break
+    except redis.exceptions.LockError as e:
+        logger.warning(f"Lost download history flush lock: {e}")
+    finally:
+        if lock.owned():
+            lock.release()
+    return total_count
@@ -0,0 +1,12 @@
+from rest_framework.pagination import CursorPagination
+
+
+class FileCursorPagination(CursorPagination):
+    """파일 페이지네이션"""
+
+    # [Why]
+    # Q. 생성일시가 아닌 UUID 로 정렬하는 이유는?
+    # A. UUID(v7)는 생성 순서대로 증가하는 고유 값이라, 같은 시각에 생성된 파일도
+    #    커서가 하나의 위치를 가리키고 중복/누락 없이 다음 페이지를 조회할 수 있음
+    ordering = "-uuid"
+    page_size = 20
@@ -1,10 +1,30 @@
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Q
 from django.utils import timezone
 from rest_framework import serializers
+from uuid_extensions import uuid7
 
-from apps.file.models import File, FileStatus, FileDownloadHistory
+from apps.file.models import File, FileStatus
+from apps.file.v1.histories import buffer_download_histories
+from apps.file.v1.tasks import task_verify_uploaded_file, verify_uploaded_files
 from apps.file.v1.utils import (
     generate_upload_presigned_url,
     generate_download_presigned_url,
+    get_download_presigned_urls,
+    get_object_key,
+    get_part_size,
+    create_multipart_upload,
+    generate_upload_part_presigned_urls,
+    complete_multipart_upload,
+    abort_multipart_upload,
+)
+from base.enums.errors import (
+    E010_MULTIPART_FILE_SIZE_REQUIRED,
+    E010_MULTIPART_UPLOAD_NOT_FOUND,
+    E010_INVALID_PART_NUMBER,
+    E010_MULTIPART_PARTS_INCOMPLETE,
+    E010_MULTIPART_UPLOAD_FAILED,
 )
 
 
@@ -27,16 +47,50 @@ class FileUploadSerializer(serializers.ModelSerializer):
         help_text="S3 업로드 필드",
         allow_null=True,
     )
+    content_hash = serializers.RegexField(
+        r"^[0-9a-fA-F]{64}$",
+        required=False,
+        write_only=True,
+        help_text="파일의 SHA-256 해시 (16진수), 같은 파일이 있으면 업로드 생략",
+    )
+
+    def get_duplicated_file(self, validated_data) -> File | None:
+        """같은 내용으로 업로드된 파일 조회"""
+        # [Why]
+        # Q. 같은 사용자의 파일만 조회하는 이유는?
+        # A. 해시는 클라이언트가 보내는 값이므로, 다른 사용자의 파일 해시를 알아내
+        #    해당 파일에 접근하는 것을 방지하기 위함
+        return (
+            File.objects.filter(
+                Q(expire_at__isnull=True) | Q(expire_at__gt=timezone.now()),
+                user=validated_data["user"],
+                content_hash=validated_data["content_hash"],
+                file_size=validated_data.get("file_size", 0),
+                status=FileStatus.SUCCESS_UPLOAD,
+                object_key__isnull=False,
+            )
+            .order_by("created_at")
+            .first()
+        )
 
     def create(self, validated_data):
+        duplicated_file = None
+        if validated_data.get("content_hash"):
+            validated_data["content_hash"] = validated_data["content_hash"].lower()
+            duplicated_file = self.get_duplicated_file(validated_data)
         instance = super().create(validated_data)
+        if duplicated_file:
+            # 업로드 없이 기존 S3 객체를 함께 사용
+            instance.object_key = duplicated_file.object_key
+            instance.etag = duplicated_file.etag
+            instance.thumbnails = duplicated_file.thumbnails
+            instance.status = FileStatus.SUCCESS_UPLOAD
+            instance.save()
+            instance.fields = None
+            instance.url = None
+            return instance
         # S3 파일 경로 저장
-        content_type = ""
-        file_name = f"{instance.uuid}.{instance.extension}"
-        now = timezone.now()
-        object_key = (
-            f"files/{content_type}/{now.year}/{now.month}/{now.day}/{file_name}"
-        )
+        object_key = get_object_key(f"{instance.uuid}.{instance.extension}")
         # 프리사인드 정보 추가
         # [Why]
         # Q. S3 업로드 시 프리사인드 URL을 생성하는 이유는?
@@ -46,6 +100,7 @@ class FileUploadSerializer(serializers.ModelSerializer):
         response = generate_upload_presigned_url(
             object_key=object_key,
             file_size=instance.file_size,
+            content_hash=instance.content_hash,
         )
         instance.object_key = object_key
         instance.status = FileStatus.GENERATED
@@ -64,6 +119,7 @@ class FileUploadSerializer(serializers.ModelSerializer):
             "file_size",
             "content_type",
             "object_id",
+            "content_hash",
             "status",
             "url",
             "fields",
@@ -84,9 +140,36 @@ class FileUpdateSerializer(serializers.ModelSerializer):
     파일 업로드 후 상태 업데이트, 삭제 요청
     """
 
+    def update(self, instance, validated_data):
+        # [Why]
+        # Q. 업로드 성공 상태를 바로 저장하지 않는 이유는?
+        # A. 클라이언트가 보고한 상태와 실제 S3 객체가 달라지지 않도록
+        #    S3 에서 객체 존재 여부와 크기를 확인한 뒤 서버에서 상태를 변경하기 위함
+        if validated_data.get("status") == FileStatus.SUCCESS_UPLOAD:
+            validated_data.pop("status")
+            file_uuid = str(instance.uuid)
+            transaction.on_commit(
+                lambda: task_verify_uploaded_file.apply_async(args=[file_uuid])
+            )
+        else:
+            # ETag 는 업로드 완료 보고 시 검증에만 사용
+            validated_data.pop("etag", None)
+        return super().update(instance, validated_data)
+
+    def validate_etag(self, value):
+        """S3 응답 헤더의 따옴표 제거"""
+        return value.strip('"')
+
     class Meta:
         model = File
-        fields = ["status"]
+        fields = ["status", "etag"]
+        extra_kwargs = {
+            "etag": {
+                "write_only": True,
+                "required": False,
+                "help_text": "업로드 응답의 ETag (S3 객체와 다르면 업로드 실패 처리)",
+            },
+        }
 
 
 class FileDownloadSerializer(serializers.ModelSerializer):
@@ -138,16 +221,13 @@ class FileDownloadPresignedSerializer(serializers.ModelSerializer):
         # A. 아무나, 어떤 파일이든 다운로드할 수 없도록 하기 위함
         #    프리사인드 URL을 통해 권한이 있는 사용자만 다운로드할 수 있도록 하기 위함
         #    참고로, 모든 사람이 받아도 되는 파일은 CDN 을 통해 다운로드 가능하도록 설정
-        response = generate_download_presigned_url(
-            object_key=instance.object_key,
-        )
-        instance.fields = response.get("fields")
-        instance.url = response.get("url")
-        # 파일 다운로드 기록
-        FileDownloadHistory.objects.create(
-            reason=validated_data.get("reason"),
-            user=self.context["request"].user,
-            file=instance,
+        instance.fields = None
+        instance.url = generate_download_presigned_url(instance.object_key)
+        # 파일 다운로드 기록(버퍼에 추가 후 Celery 작업에서 일괄 저장)
+        buffer_download_histories(
+            self.context["request"].user.id,
+            validated_data.get("reason"),
+            [instance],
         )
         return instance
 
@@ -164,3 +244,346 @@ class FileDownloadPresignedSerializer(serializers.ModelSerializer):
             "file_name",
             "extension",
         ]
+
+
+class FileBatchDownloadPresignedItemSerializer(serializers.ModelSerializer):
+    """파일 다운로드 프리사인드 일괄 생성 항목 시리얼라이저"""
+
+    url = serializers.CharField(
+        read_only=True,
+        help_text="S3 다운로드 URL",
+    )
+    thumbnail_urls = serializers.DictField(
+        child=serializers.CharField(),
+        read_only=True,
+        help_text="썸네일 이름(형식_크기)별 S3 다운로드 URL",
+    )
+
+    class Meta:
+        model = File
+        fields = [
+            "uuid",
+            "file_name",
+            "extension",
+            "url",
+            "thumbnail_urls",
+        ]
+        read_only_fields = fields
+
+
+class FileBatchDownloadPresignedSerializer(serializers.Serializer):
+    """
+    파일 다운로드 프리사인드 일괄 생성 시리얼라이저:
+    여러 파일의 다운로드 프리사인드 URL을 한 번에 생성
+    """
+
+    uuids = serializers.ListField(
+        child=serializers.UUIDField(),
+        allow_empty=False,
+        max_length=settings.FILE_PRESIGNED_BATCH_MAX_SIZE,
+        write_only=True,
+        help_text="파일 ID 목록",
+    )
+    reason = serializers.CharField(
+        write_only=True,
+        help_text="다운로드 사유",
+    )
+    files = FileBatchDownloadPresignedItemSerializer(
+        many=True,
+        read_only=True,
+        help_text="프리사인드 URL이 생성된 파일 목록",
+    )
+
+    def create(self, validated_data):
+        """파일 다운로드 프리사인드 URL 일괄 생성"""
+        uuids = list(dict.fromkeys(validated_data["uuids"]))
+        files = {
+            file.uuid: file
+            for file in self.context["view"]
+            .get_queryset()
+            .filter(uuid__in=uuids, object_key__isnull=False)
+            .only("uuid", "file_name", "extension", "object_key", "thumbnails")
+        }
+        # 썸네일 URL도 함께 한 번에 생성
+        urls = get_download_presigned_urls(
+            [
+                object_key
+                for file in files.values()
+                for object_key in [file.object_key, *file.thumbnails.values()]
+            ]
+        )
+        # 요청한 순서대로 응답하며, 권한이 없거나 URL 생성에 실패한 파일은 제외
+        signed_files = []
+        for uuid in uuids:
+            file = files.get(uuid)
+            if file is None or file.object_key not in urls:
+                continue
+            file.url = urls[file.object_key]
+            file.thumbnail_urls = {
+                name: urls[object_key]
+                for name, object_key in file.thumbnails.items()
+                if object_key in urls
+            }
+            signed_files.append(file)
+        # 파일 다운로드 기록
+        # [Why]
+        # Q. 다운로드 기록을 바로 저장하지 않는 이유는?
+        # A. URL 서명만 하는 요청에 DB 쓰기가 더해지지 않도록 버퍼에 쌓아두고,
+        #    Celery 작업에서 bulk_create 로 한 번에 저장하기 위함
+        buffer_download_histories(
+            self.context["request"].user.id,
+            validated_data["reason"],
+            signed_files,
+        )
+        return {"files": signed_files}
+
+
+class FileMultipartUploadSerializer(serializers.ModelSerializer):
+    """
+    파일 멀티파트 업로드 시리얼라이저:
+    대용량 파일을 여러 파트로 나눠 업로드하기 위한 멀티파트 업로드 시작
+    """
+
+    user = serializers.HiddenField(
+        default=serializers.CurrentUserDefault(), help_text="사용자"
+    )
+    part_count = serializers.IntegerField(
+        read_only=True,
+        help_text="파트 수",
+    )
+
+    def validate(self, attrs):
+        """파일 크기 검증"""
+        if attrs.get("file_size", 0) <= 0:
+            raise serializers.ValidationError(E010_MULTIPART_FILE_SIZE_REQUIRED)
+        return attrs
+
+    def create(self, validated_data):
+        # [Why]
+        # Q. 파일을 저장하기 전에 S3 멀티파트 업로드를 시작하는 이유는?
+        # A. 업로드 ID 없이 저장된 파일이 남지 않도록 하기 위함
+        file_uuid = uuid7()
+        object_key = get_object_key(f"{file_uuid}.{validated_data['extension']}")
+        upload_id = create_multipart_upload(object_key)
+        if not upload_id:
+            raise serializers.ValidationError(E010_MULTIPART_UPLOAD_FAILED)
+        validated_data.update(
+            uuid=file_uuid,
+            object_key=object_key,
+            upload_id=upload_id,
+            part_size=get_part_size(validated_data["file_size"]),
+            status=FileStatus.GENERATED,
+        )
+        return super().create(validated_data)
+
+    class Meta:
+        model = File
+        fields = [
+            "uuid",
+            "user",
+            "file_name",
+            "extension",
+            "file_size",
+            "content_type",
+            "object_id",
+            "status",
+            "upload_id",
+            "part_size",
+            "part_count",
+        ]
+        read_only_fields = [
+            "uuid",
+            "status",
+            "upload_id",
+            "part_size",
+        ]
+        extra_kwargs = {
+            "user": {"write_only": True},
+            "content_type": {"write_only": True},
+            "object_id": {"write_only": True},
+        }
+
+
+class FileMultipartPartSerializer(serializers.Serializer):
+    """파일 멀티파트 업로드 완료 파트 시리얼라이저"""
+
+    part_number = serializers.IntegerField(
+        min_value=1,
+        help_text="파트 번호",
+    )
+    etag = serializers.CharField(
+        max_length=255,
+        help_text="파트 업로드 응답의 ETag",
+    )
+
+
+class FileMultipartSessionSerializer(serializers.ModelSerializer):
+    """파일 멀티파트 업로드 진행 시리얼라이저"""
+
+    def validate(self, attrs):
+        """진행 중인 멀티파트 업로드 및 파트 번호 검증"""
+        if not self.instance.upload_id:
+            raise serializers.ValidationError(E010_MULTIPART_UPLOAD_NOT_FOUND)
+        part_numbers = [part["part_number"] for part in attrs.get("parts", [])]
+        part_numbers += attrs.get("part_numbers", [])
+        if any(number > self.instance.part_count for number in part_numbers):
+            raise serializers.ValidationError(E010_INVALID_PART_NUMBER)
+        return attrs
+
+    def save_uploaded_parts(self, parts: list) -> dict:
+        """업로드 완료 파트 저장"""
+        # [Why]
+        # Q. 파일을 다시 조회하며 잠금을 거는 이유는?
+        # A. 여러 파트를 동시에 업로드하며 완료 파트를 보고하면
+        #    서로의 변경 내용을 덮어쓸 수 있으므로 순서대로 반영하기 위함
+        with transaction.atomic():
+            instance = File.objects.select_for_update().get(uuid=self.instance.uuid)
+            uploaded_parts = instance.uploaded_parts
+            if parts:
+                uploaded_parts.update(
+                    {str(part["part_number"]): part["etag"] for part in parts}
+                )
+                File.objects.filter(uuid=instance.uuid).update(
+                    uploaded_parts=uploaded_parts,
+                    updated_at=timezone.now(),
+                )
+        self.instance.uploaded_parts = uploaded_parts
+        return uploaded_parts
+
+
+class FileMultipartPresignedSerializer(FileMultipartSessionSerializer):
+    """
+    파일 멀티파트 업로드 파트 프리사인드 시리얼라이저:
+    업로드 완료 파트를 기록하고 다음 파트들의 업로드 URL을 한 번에 생성
+    """
+
+    part_numbers = serializers.ListField(
+        child=serializers.IntegerField(min_value=1),
+        max_length=settings.FILE_MULTIPART_PRESIGNED_BATCH_SIZE,
+        required=False,
+        write_only=True,
+        help_text="업로드 URL을 생성할 파트 번호 목록",
+    )
+    parts = FileMultipartPartSerializer(
+        many=True,
+        required=False,
+        write_only=True,
+        help_text="업로드 완료 파트 목록",
+    )
+    urls = serializers.DictField(
+        child=serializers.CharField(),
+        read_only=True,
+        help_text="파트 번호별 S3 업로드 URL",
+    )
+
+    def update(self, instance, validated_data):
+        """완료 파트 기록 및 파트 업로드 프리사인드 URL 생성"""
+        self.save_uploaded_parts(validated_data.get("parts"))
+        instance.urls = generate_upload_part_presigned_urls(
+            object_key=instance.object_key,
+            upload_id=instance.upload_id,
+            part_numbers=validated_data.get("part_numbers", []),
+        )
+        return instance
+
+    class Meta:
+        model = File
+        fields = [
+            "part_numbers",
+            "parts",
+            "upload_id",
+            "part_size",
+            "part_count",
+            "uploaded_parts",
+            "urls",
+        ]
+        read_only_fields = [
+            "upload_id",
+            "part_size",
+            "part_count",
+            "uploaded_parts",
+        ]
+
+
+class FileMultipartCompleteSerializer(FileMultipartSessionSerializer):
+    """
+    파일 멀티파트 업로드 완료 시리얼라이저:
+    모든 파트가 업로드되면 S3 에서 하나의 파일로 합침
+    """
+
+    parts = FileMultipartPartSerializer(
+        many=True,
+        required=False,
+        write_only=True,
+        help_text="업로드 완료 파트 목록 (이전에 기록하지 않은 파트)",
+    )
+
+    def update(self, instance, validated_data):
+        """멀티파트 업로드 완료"""
+        uploaded_parts = self.save_uploaded_parts(validated_data.get("parts"))
+        parts = {int(number): etag for number, etag in uploaded_parts.items()}
+        if set(parts) != set(range(1, instance.part_count + 1)):
+            raise serializers.ValidationError(E010_MULTIPART_PARTS_INCOMPLETE)
+        if not complete_multipart_upload(
+            instance.object_key, instance.upload_id, parts
+        ):
+            raise serializers.ValidationError(E010_MULTIPART_UPLOAD_FAILED)
+        instance.upload_id = None
+        instance.save(update_fields=["upload_id", "updated_at"])
+        # [Why]
+        # Q. 합친 뒤 바로 업로드 성공 상태로 변경하지 않는 이유는?
+        # A. 일반 업로드와 같이 S3 객체의 크기를 확인한 뒤 상태를 변경하기 위함
+        #    (객체 조회에 실패하면 업로드 상태 정리 작업에서 다시 확인)
+        verify_uploaded_files(
+            [
+                {
+                    "uuid": instance.uuid,
+                    "object_key": instance.object_key,
+                    "file_size": instance.file_size,
+                    "extension": instance.extension,
+                    # 멀티파트 객체의 ETag 는 파트별 ETag 로 확인
+                    "etag": None,
+                }
+            ]
+        )
+        instance.refresh_from_db(fields=["status", "file_size", "etag"])
+        return instance
+
+    class Meta:
+        model = File
+        fields = [
+            "uuid",
+            "parts",
+            "status",
+        ]
+        read_only_fields = [
+            "uuid",
+            "status",
+        ]
+
+
+class FileMultipartAbortSerializer(FileMultipartSessionSerializer):
+    """
+    파일 멀티파트 업로드 중단 시리얼라이저:
+    업로드를 중단하고 S3 에 업로드된 파트를 삭제
+    """
+
+    def update(self, instance, validated_data):
+        """멀티파트 업로드 중단"""
+        if not abort_multipart_upload(instance.object_key, instance.upload_id):
+            raise serializers.ValidationError(E010_MULTIPART_UPLOAD_FAILED)
+        instance.upload_id = None
+        instance.uploaded_parts = {}
+        instance.status = FileStatus.FAIL_UPLOAD
+        instance.save(
+            update_fields=["upload_id", "uploaded_parts", "status", "updated_at"]
+        )
+        return instance
+
+    class Meta:
+        model = File
+        fields = [
+            "uuid",
+            "status",
+        ]
+        read_only_fields = fields
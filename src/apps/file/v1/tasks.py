@@ -1,21 +1,359 @@
+import datetime
+import logging
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+
+import django
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Q
 from django.utils import timezone
 
 from apps.file.models import FileStatus, File
+from apps.file.v1.histories import flush_download_histories
+from apps.file.v1.thumbnails import generate_thumbnails
+from apps.file.v1.utils import (
+    abort_multipart_upload,
+    delete_objects,
+    get_max_upload_size,
+    get_public_thumbnail_cache_key,
+    head_objects,
+)
 from conf.celery import app
 
+logger = logging.getLogger(__name__)
+
+
+@app.task
+def task_delete_expired_files(chunk_size: int = None):
+    """
+    만료 파일 삭제:
+    만료일시 순으로 나눠 조회한 파일을 S3 에서 일괄 삭제한 뒤 상태를 한 번에 변경
+    """
+    chunk_size = chunk_size or settings.FILE_DELETE_CHUNK_SIZE
+    now = timezone.now()
+    expired_files = (
+        File.objects.exclude(status=FileStatus.DELETE)
+        .filter(expire_at__lt=now)
+        .order_by("expire_at", "uuid")
+    )
+    # [Why]
+    # Q. OFFSET 대신 (만료일시, ID) 기준으로 이어서 조회하는 이유는?
+    # A. 처리한 파일은 상태가 변경되어 조회 대상에서 빠지므로 OFFSET 을 사용하면
+    #    건너뛰는 파일이 생기고, S3 삭제에 실패한 파일이 반복 조회되는 것도 방지하기 위함
+    # Q. 작업이 중간에 중단되면?
+    # A. 청크 단위로 상태가 저장되므로 다음 실행 시 삭제되지 않은 파일부터 이어서 처리
+    cursor = None
+    deleted_count = 0
+    failed_count = 0
+    while True:
+        files = expired_files
+        if cursor:
+            expire_at, uuid = cursor
+            files = files.filter(
+                Q(expire_at__gt=expire_at) | Q(expire_at=expire_at, uuid__gt=uuid)
+            )
+        files = list(
+            files.values(
+                "uuid", "object_key", "content_hash", "thumbnails", "expire_at"
+            )[:chunk_size]
+        )
+        if not files:
+            break
+        cursor = (files[-1]["expire_at"], files[-1]["uuid"])
+
+        # 다른 파일이 함께 사용 중인 S3 객체 조회
+        # [Why]
+        # Q. 함께 사용 중인 S3 객체를 삭제하지 않는 이유는?
+        # A. 중복 업로드를 생략한 파일은 기존 S3 객체를 함께 사용하므로,
+        #    마지막으로 사용하는 파일이 삭제될 때 S3 객체를 삭제하기 위함
+        shared_keys = set(
+            File.objects.filter(
+                object_key__in={
+                    file["object_key"] for file in files if file["content_hash"]
+                },
+                content_hash__isnull=False,
+            )
+            .exclude(status=FileStatus.DELETE)
+            .exclude(uuid__in=[file["uuid"] for file in files])
+            .values_list("object_key", flat=True)
+        )
+        # S3 파일 삭제 (썸네일 포함)
+        _, failed_keys = delete_objects(
+            [
+                object_key
+                for file in files
+                if file["object_key"] and file["object_key"] not in shared_keys
+                for object_key in [file["object_key"], *file["thumbnails"].values()]
+            ]
+        )
+        # 상태 변경 (S3 삭제에 실패한 파일은 다음 실행 시 재시도)
+        deleted_uuids = [
+            file["uuid"] for file in files if file["object_key"] not in failed_keys
+        ]
+        File.objects.filter(uuid__in=deleted_uuids).update(
+            status=FileStatus.DELETE,
+            updated_at=timezone.now(),
+        )
+        deleted_count += len(deleted_uuids)
+        failed_count += len(files) - len(deleted_uuids)
+        logger.info(
+            f"Expired files progress: {deleted_count} deleted, {failed_count} failed"
+        )
+        if len(files) < chunk_size:
+            break
+    return f"{deleted_count} files deleted, {failed_count} failed"
+
+
+@app.task
+def task_abort_abandoned_multipart_uploads(batch_size: int = None):
+    """
+    방치된 멀티파트 업로드 중단:
+    일정 시간 동안 진행되지 않은 멀티파트 업로드를 중단하고 업로드된 파트를 삭제
+    """
+    batch_size = batch_size or settings.FILE_MULTIPART_ABORT_BATCH_SIZE
+    # [Why]
+    # Q. 방치된 멀티파트 업로드를 직접 정리하는 이유는?
+    # A. 완료되지 않은 파트도 S3 저장 비용이 발생하며, 파일 상태도 실패로 정리하기 위함
+    #    버킷 수명 주기 규칙(AbortIncompleteMultipartUpload)을 함께 설정하면 누락분도 정리됨
+    abandoned_at = timezone.now() - datetime.timedelta(
+        hours=settings.FILE_MULTIPART_ABANDON_HOURS
+    )
+    files = list(
+        File.objects.filter(
+            upload_id__isnull=False,
+            updated_at__lt=abandoned_at,
+        ).values("uuid", "object_key", "upload_id")[:batch_size]
+    )
+    aborted_uuids = [
+        file["uuid"]
+        for file in files
+        if abort_multipart_upload(file["object_key"], file["upload_id"])
+    ]
+    # 중단하는 사이 완료된 업로드는 제외
+    aborted_count = File.objects.filter(
+        uuid__in=aborted_uuids,
+        upload_id__isnull=False,
+    ).update(
+        upload_id=None,
+        uploaded_parts={},
+        status=FileStatus.FAIL_UPLOAD,
+        updated_at=timezone.now(),
+    )
+    return f"{aborted_count} multipart uploads aborted"
+
+
+def verify_uploaded_files(files: list[dict]) -> dict:
+    """
+    업로드 파일 검증:
+    S3 객체의 존재 여부, 크기, ETag 를 확인해 업로드 성공/실패 상태로 변경
+    객체 조회에 실패한 파일은 상태를 유지해 다음 검증 시 재시도
+
+    Args:
+        files (list[dict]): uuid, object_key, file_size, etag 를 포함한 파일 목록
+            (etag 는 업로드 완료 보고 시 받은 값, 없으면 비교하지 않음)
+
+    Returns:
+        dict: 상태별 변경된 파일 수
+    """
+    metadata = head_objects([file["object_key"] for file in files])
+    now = timezone.now()
+    verified_files = []
+    for file in files:
+        if file["object_key"] not in metadata:
+            continue
+        verified_file = File(
+            uuid=file["uuid"],
+            status=FileStatus.FAIL_UPLOAD,
+            file_size=file["file_size"],
+            updated_at=now,
+        )
+        object_metadata = metadata[file["object_key"]]
+        if (
+            object_metadata
+            and 0 < object_metadata["size"] <= get_max_upload_size(file["file_size"])
+            # 보고한 ETag 와 다르면 업로드한 파일이 아닌 다른 객체
+            and file["etag"] in [None, object_metadata["etag"]]
+        ):
+            verified_file.status = FileStatus.SUCCESS_UPLOAD
+            verified_file.file_size = object_metadata["size"]
+            verified_file.etag = object_metadata["etag"]
+        verified_files.append(verified_file)
+    # 검증하는 사이 상태가 변경된 파일은 제외하고 실제로 변경한 파일만 집계
+    with transaction.atomic():
+        generated_uuids = set(
+            File.objects.select_for_update()
+            .filter(
+                uuid__in=[verified_file.uuid for verified_file in verified_files],
+                status=FileStatus.GENERATED,
+            )
+            .values_list("uuid", flat=True)
+        )
+        verified_files = [
+            verified_file
+            for verified_file in verified_files
+            if verified_file.uuid in generated_uuids
+        ]
+        File.objects.bulk_update(
+            verified_files,
+            fields=["status", "file_size", "etag", "updated_at"],
+        )
+    result = {FileStatus.SUCCESS_UPLOAD: 0, FileStatus.FAIL_UPLOAD: 0}
+    for verified_file in verified_files:
+        result[verified_file.status] += 1
+    uploaded_uuids = {
+        verified_file.uuid
+        for verified_file in verified_files
+        if verified_file.status == FileStatus.SUCCESS_UPLOAD
+    }
+    request_thumbnails([file for file in files if file["uuid"] in uploaded_uuids])
+    return result
+
+
+@app.task
+def task_verify_uploaded_file(file_uuid: str):
+    """
+    업로드 파일 검증:
+    클라이언트가 업로드 완료를 보고하면 S3 객체를 확인해 상태 변경
+    """
+    files = list(
+        File.objects.filter(
+            uuid=file_uuid,
+            status=FileStatus.GENERATED,
+            object_key__isnull=False,
+            upload_id__isnull=True,
+        ).values("uuid", "object_key", "file_size", "extension", "etag")
+    )
+    result = verify_uploaded_files(files)
+    return (
+        f"{result[FileStatus.SUCCESS_UPLOAD]} succeeded, "
+        f"{result[FileStatus.FAIL_UPLOAD]} failed"
+    )
+
+
+@app.task
+def task_reconcile_generated_files(batch_size: int = None):
+    """
+    업로드 상태 정리:
+    업로드 URL 생성 후 일정 시간이 지난 파일의 S3 객체를 확인해 상태 변경
+    """
+    batch_size = batch_size or settings.FILE_RECONCILE_BATCH_SIZE
+    # [Why]
+    # Q. 일정 시간이 지난 파일만 확인하는 이유는?
+    # A. 업로드 중인 파일을 실패로 처리하지 않도록 업로드 URL 만료 이후에 확인하기 위함
+    created_before = timezone.now() - datetime.timedelta(
+        minutes=settings.FILE_RECONCILE_AFTER_MINUTES
+    )
+    files = (
+        File.objects.filter(
+            status=FileStatus.GENERATED,
+            object_key__isnull=False,
+            upload_id__isnull=True,
+            created_at__lt=created_before,
+        )
+        .order_by("created_at", "uuid")
+        .values("uuid", "object_key", "file_size", "extension", "etag", "created_at")
+    )
+    cursor = None
+    result = {FileStatus.SUCCESS_UPLOAD: 0, FileStatus.FAIL_UPLOAD: 0}
+    while True:
+        chunk = files
+        if cursor:
+            created_at, uuid = cursor
+            chunk = chunk.filter(
+                Q(created_at__gt=created_at) | Q(created_at=created_at, uuid__gt=uuid)
+            )
+        chunk = list(chunk[:batch_size])
+        if not chunk:
+            break
+        cursor = (chunk[-1]["created_at"], chunk[-1]["uuid"])
+        for status, count in verify_uploaded_files(chunk).items():
+            result[status] += count
+        if len(chunk) < batch_size:
+            break
+    return (
+        f"{result[FileStatus.SUCCESS_UPLOAD]} succeeded, "
+        f"{result[FileStatus.FAIL_UPLOAD]} failed"
+    )
+
+
+def request_thumbnails(files: list[dict]):
+    """
+    썸네일 생성 요청:
+    업로드에 성공한 이미지 파일의 썸네일 생성 태스크 실행
+
+    Args:
+        files (list[dict]): uuid, extension 을 포함한 파일 목록
+    """
+    file_uuids = [
+        str(file["uuid"])
+        for file in files
+        if file["extension"].lower() in settings.FILE_THUMBNAIL_EXTENSIONS
+    ]
+    if file_uuids:
+        task_generate_thumbnails.apply_async(args=[file_uuids])
+
+
+def get_thumbnail_executor(max_workers: int) -> ProcessPoolExecutor:
+    """
+    썸네일 생성 프로세스 풀 생성:
+    자식 프로세스는 spawn 으로 새로 시작되므로 모델을 불러오기 전에 Django 초기화
+    """
+    # [Why]
+    # Q. 스레드 대신 프로세스 풀을 사용하는 이유는?
+    # A. 이미지 디코딩/인코딩은 CPU 작업이므로 GIL 영향 없이 여러 코어를 사용하기 위함
+    #    S3 클라이언트를 자식 프로세스에서 새로 만들도록 fork 대신 spawn 을 사용
+    return ProcessPoolExecutor(
+        max_workers=max_workers,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=django.setup,
+    )
+
+
+@app.task
+def task_generate_thumbnails(file_uuids: list[str]):
+    """
+    이미지 썸네일 생성:
+    업로드에 성공한 이미지 파일의 썸네일을 프로세스 풀에서 생성하고 파일에 저장
+    """
+    files = list(
+        File.objects.filter(
+            uuid__in=file_uuids,
+            status=FileStatus.SUCCESS_UPLOAD,
+            object_key__isnull=False,
+            file_size__lte=settings.FILE_THUMBNAIL_MAX_SOURCE_SIZE,
+        ).values("uuid", "object_key")
+    )
+    object_keys = list(dict.fromkeys(file["object_key"] for file in files))
+    if not object_keys:
+        return "0 thumbnails generated"
+    max_workers = min(settings.FILE_THUMBNAIL_MAX_WORKERS, len(object_keys))
+    if max_workers > 1:
+        with get_thumbnail_executor(max_workers) as executor:
+            results = list(executor.map(generate_thumbnails, object_keys))
+    else:
+        results = [generate_thumbnails(object_key) for object_key in object_keys]
+
+    generated_count = 0
+    for object_key, thumbnails in zip(object_keys, results):
+        if not thumbnails:
+            continue
+        # 같은 S3 객체를 함께 사용하는 파일에도 저장
+        File.objects.filter(
+            Q(uuid__in=[file["uuid"] for file in files])
+            | Q(content_hash__isnull=False),
+            object_key=object_key,
+        ).update(thumbnails=thumbnails)
+        cache.delete(get_public_thumbnail_cache_key(object_key))
+        generated_count += 1
+    return f"{generated_count} thumbnails generated"
+
 
 @app.task
-def task_delete_expired_files():
-    """만료 파일 삭제"""
-    expired_files = File.objects.exclude(
-        status=FileStatus.DELETE,
-    ).filter(
-        expire_at__lt=timezone.now(),
-    )
-    for expired_file in expired_files:
-        # 파일 삭제
-        ...
-        # 상태 변경
-        expired_file.status = FileStatus.DELETE
-        expired_file.save(update_fields=["status"])
-    return f"{expired_files.count()} files deleted"
+def task_flush_download_histories(batch_size: int = None):
+    """
+    파일 다운로드 이력 저장:
+    버퍼에 쌓인 다운로드 이력을 bulk_create 로 일괄 저장
+    """
+    return f"{flush_download_histories(batch_size)} download histories saved"
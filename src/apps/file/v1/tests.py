@@ -0,0 +1,1099 @@
+import base64
+import collections
+import datetime
+import io
+from unittest import mock, skipUnless
+
+from django.conf import settings
+from django.contrib.contenttypes.models import ContentType
+from django.core.cache import cache
+from django.db import connection
+from django.db.models import Q
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from PIL import Image
+from django.utils import timezone
+from rest_framework import status
+from botocore.exceptions import ClientError
+from redis import RedisError
+from redis.exceptions import LockNotOwnedError
+from rest_framework.test import APITestCase, APIClient
+
+from apps.file.models import File, FileStatus, FileDownloadHistory
+from apps.file.v1.histories import (
+    HISTORY_BUFFER_KEY,
+    HISTORY_PROCESSING_KEY,
+    buffer_download_histories,
+    flush_download_histories,
+)
+from apps.file.v1.paginations import FileCursorPagination
+from apps.file.v1.tasks import (
+    get_thumbnail_executor,
+    task_abort_abandoned_multipart_uploads,
+    task_delete_expired_files,
+    task_generate_thumbnails,
+    task_reconcile_generated_files,
+    task_verify_uploaded_file,
+    verify_uploaded_files,
+)
+from apps.file.v1.utils import (
+    delete_objects,
+    get_public_thumbnail_urls,
+    get_thumbnail_name,
+    generate_upload_presigned_url,
+    get_download_presigned_urls,
+    get_presigned_expiry_window,
+)
+from apps.user.models import User
+from base.enums.errors import (
+    E010_MULTIPART_FILE_SIZE_REQUIRED,
+    E010_INVALID_PART_NUMBER,
+    E010_MULTIPART_PARTS_INCOMPLETE,
+)
+
+
+class FakeRedis:
+    """다운로드 이력 버퍼 테스트용 Redis 리스트"""
+
+    def __init__(self):
+        self.lists = collections.defaultdict(list)
+
+    def lpush(self, key, *values):
+        for value in values:
+            self.lists[key].insert(0, value.encode())
+        return len(self.lists[key])
+
+    def lrange(self, key, start, end):
+        return list(self.lists[key])
+
+    def rpoplpush(self, source, destination):
+        if not self.lists[source]:
+            return None
+        value = self.lists[source].pop()
+        self.lists[destination].insert(0, value)
+        return value
+
+    def delete(self, key):
+        self.lists.pop(key, None)
+
+    def lock(self, key, timeout=None):
+        return FakeLock()
+
+    def pipeline(self):
+        client = self
+
+        class Pipeline:
+            def __init__(self):
+                self.commands = []
+
+            def rpoplpush(self, source, destination):
+                self.commands.append((source, destination))
+
+            def execute(self):
+                return [client.rpoplpush(*command) for command in self.commands]
+
+        return Pipeline()
+
+
+class FakeLock:
+    """다운로드 이력 저장 잠금 테스트용 Redis 잠금"""
+
+    def __init__(self):
+        self.is_owned = False
+        self.reacquire_count = 0
+
+    def acquire(self, blocking=True):
+        self.is_owned = True
+        return True
+
+    def reacquire(self):
+        if not self.is_owned:
+            raise LockNotOwnedError("Cannot reacquire a lock that's no longer owned")
+        self.reacquire_count += 1
+        return True
+
+    def owned(self):
+        return self.is_owned
+
+    def release(self):
+        self.is_owned = False
+
+
+class FileBatchPresignedTestCase(APITestCase):
+    """파일 다운로드 프리사인드 일괄 생성 테스트 케이스"""
+
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        self.url = reverse("file-presigned-batch")
+        self.user = User.objects.create_user(
+            email="test@example.com", password="test123"
+        )
+        self.other_user = User.objects.create_user(
+            email="other@example.com", password="test123"
+        )
+        expire_at = timezone.now() + datetime.timedelta(days=1)
+        self.files = [
+            File.objects.create(
+                user=self.user,
+                file_name=f"image{i}",
+                extension="png",
+                object_key=f"files/image{i}.png",
+                status=FileStatus.SUCCESS_UPLOAD,
+                expire_at=expire_at,
+            )
+            for i in range(3)
+        ]
+        self.other_file = File.objects.create(
+            user=self.other_user,
+            file_name="other",
+            extension="png",
+            object_key="files/other.png",
+            status=FileStatus.SUCCESS_UPLOAD,
+            expire_at=expire_at,
+        )
+        self.client.force_authenticate(user=self.user)
+        patcher = mock.patch("apps.file.v1.histories.REDIS_CLIENT", FakeRedis())
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    @mock.patch("apps.file.v1.utils.sign_download_presigned_url")
+    def test_성공__일괄_생성(self, mock_generate):
+        """요청한 순서대로 URL이 생성되고 다운로드 기록이 저장되는지 테스트"""
+        mock_generate.side_effect = lambda key, expires_in: f"https://s3/{key}"
+        uuids = [str(file.uuid) for file in reversed(self.files)]
+
+        response = self.client.post(
+            self.url, {"uuids": uuids, "reason": "갤러리"}, format="json"
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual([file["uuid"] for file in response.data["files"]], uuids)
+        self.assertEqual(
+            response.data["files"][0]["url"], "https://s3/files/image2.png"
+        )
+        self.assertEqual(mock_generate.call_count, 3)
+        # 다운로드 기록은 버퍼에 쌓인 뒤 일괄 저장됨
+        self.assertFalse(FileDownloadHistory.objects.exists())
+        self.assertEqual(flush_download_histories(), 3)
+        self.assertEqual(
+            FileDownloadHistory.objects.filter(user=self.user, reason="갤러리").count(),
+            3,
+        )
+
+    @mock.patch("apps.file.v1.utils.sign_download_presigned_url")
+    def test_성공__캐시된_URL_재사용(self, mock_generate):
+        """이미 생성한 URL은 다시 서명하지 않는지 테스트"""
+        mock_generate.side_effect = lambda key, expires_in: f"https://s3/{key}"
+
+        get_download_presigned_urls(["files/image0.png"])
+        urls = get_download_presigned_urls(["files/image0.png", "files/image1.png"])
+
+        self.assertEqual(urls["files/image0.png"], "https://s3/files/image0.png")
+        self.assertEqual(mock_generate.call_count, 2)
+
+    @mock.patch("apps.file.v1.utils.sign_download_presigned_url")
+    def test_성공__다른_사용자_파일_제외(self, mock_generate):
+        """다른 사용자의 파일은 응답과 다운로드 기록에서 제외되는지 테스트"""
+        mock_generate.side_effect = lambda key, expires_in: f"https://s3/{key}"
+        uuids = [str(self.files[0].uuid), str(self.other_file.uuid)]
+
+        response = self.client.post(
+            self.url, {"uuids": uuids, "reason": "갤러리"}, format="json"
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data["files"]), 1)
+        flush_download_histories()
+        self.assertFalse(FileDownloadHistory.objects.filter(file=self.other_file))
+
+    def test_실패__최대_개수_초과(self):
+        """최대 개수를 초과하면 요청이 거부되는지 테스트"""
+        uuids = [str(self.files[0].uuid)] * (settings.FILE_PRESIGNED_BATCH_MAX_SIZE + 1)
+
+        response = self.client.post(
+            self.url, {"uuids": uuids, "reason": "갤러리"}, format="json"
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertFalse(FileDownloadHistory.objects.exists())
+
+
+class FileDownloadHistoryBufferTestCase(TestCase):
+    """파일 다운로드 이력 버퍼 테스트 케이스"""
+
+    def setUp(self):
+        self.user = User.objects.create_user(
+            email="test@example.com", password="test123"
+        )
+        self.files = [
+            File.objects.create(
+                user=self.user,
+                file_name=f"image{i}",
+                extension="png",
+                object_key=f"files/image{i}.png",
+                status=FileStatus.SUCCESS_UPLOAD,
+            )
+            for i in range(5)
+        ]
+        self.redis_client = FakeRedis()
+        patcher = mock.patch("apps.file.v1.histories.REDIS_CLIENT", self.redis_client)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_성공__일괄_저장(self):
+        """버퍼의 이력을 나눠서 저장하고 다운로드 일시를 유지하는지 테스트"""
+        downloaded_at = timezone.now() - datetime.timedelta(minutes=5)
+        with mock.patch("django.utils.timezone.now", return_value=downloaded_at):
+            buffer_download_histories(self.user.id, "갤러리", self.files)
+
+        self.assertEqual(flush_download_histories(batch_size=2), 5)
+
+        histories = FileDownloadHistory.objects.filter(user=self.user)
+        self.assertEqual(histories.count(), 5)
+        self.assertTrue(all(h.created_at == downloaded_at for h in histories))
+        self.assertFalse(self.redis_client.lists[HISTORY_BUFFER_KEY])
+        self.assertFalse(self.redis_client.lists[HISTORY_PROCESSING_KEY])
+
+    def test_성공__중단된_이력_재처리(self):
+        """이전 저장 중 워커가 종료되어 남은 이력을 다시 저장하는지 테스트"""
+        buffer_download_histories(self.user.id, "갤러리", self.files[:2])
+        buffer_download_histories(self.user.id, "공유", self.files[2:])
+        # 처리 중 리스트로 옮긴 뒤 저장 전에 종료된 상황
+        self.redis_client.rpoplpush(HISTORY_BUFFER_KEY, HISTORY_PROCESSING_KEY)
+        self.redis_client.rpoplpush(HISTORY_BUFFER_KEY, HISTORY_PROCESSING_KEY)
+
+        self.assertEqual(flush_download_histories(), 5)
+        self.assertEqual(FileDownloadHistory.objects.filter(reason="갤러리").count(), 2)
+        self.assertEqual(FileDownloadHistory.objects.filter(reason="공유").count(), 3)
+
+    def test_성공__배치마다_잠금_연장(self):
+        """저장 작업이 배치마다 잠금 유지 시간을 연장하는지 테스트"""
+        lock = FakeLock()
+        buffer_download_histories(self.user.id, "갤러리", self.files)
+
+        with mock.patch.object(self.redis_client, "lock", return_value=lock):
+            self.assertEqual(flush_download_histories(batch_size=2), 5)
+
+        # 3개 배치의 저장 전후
+        self.assertEqual(lock.reacquire_count, 6)
+        self.assertFalse(lock.owned())
+
+    def test_실패__저장_중_잠금_만료(self):
+        """저장 중 잠금을 잃으면 처리 중 리스트를 남겨두고 중단하는지 테스트"""
+        lock = FakeLock()
+        buffer_download_histories(self.user.id, "갤러리", self.files)
+
+        def save_and_expire(payloads):
+            # 저장이 잠금 유지 시간보다 오래 걸려 다른 작업이 잠금을 얻은 상황
+            lock.is_owned = False
+            return len(payloads)
+
+        with mock.patch.object(self.redis_client, "lock", return_value=lock):
+            with mock.patch(
+                "apps.file.v1.histories.save_download_histories", save_and_expire
+            ):
+                self.assertEqual(flush_download_histories(batch_size=2), 2)
+
+        # 처리 중 리스트는 잠금을 얻은 작업이 저장하도록 남겨둠
+        self.assertEqual(len(self.redis_client.lists[HISTORY_PROCESSING_KEY]), 2)
+        self.assertEqual(len(self.redis_client.lists[HISTORY_BUFFER_KEY]), 3)
+
+    def test_성공__삭제된_파일_제외(self):
+        """버퍼에 있는 동안 삭제된 파일의 이력은 저장하지 않는지 테스트"""
+        buffer_download_histories(self.user.id, "갤러리", self.files)
+        self.files[0].delete()
+
+        self.assertEqual(flush_download_histories(), 4)
+
+    @override_settings(FILE_DOWNLOAD_HISTORY_FLUSH_BATCH_SIZE=3)
+    @mock.patch("apps.file.v1.tasks.task_flush_download_histories.apply_async")
+    def test_성공__버퍼_크기_초과_시_저장_요청(self, mock_apply_async):
+        """버퍼가 한 번에 저장할 크기를 넘을 때마다 저장 작업을 요청하는지 테스트"""
+        buffer_download_histories(self.user.id, "갤러리", self.files[:2])
+        mock_apply_async.assert_not_called()
+
+        buffer_download_histories(self.user.id, "갤러리", self.files[2:4])
+        mock_apply_async.assert_called_once()
+
+        buffer_download_histories(self.user.id, "갤러리", self.files[4:])
+        mock_apply_async.assert_called_once()
+
+    def test_성공__버퍼_사용_불가_시_바로_저장(self):
+        """Redis 를 사용할 수 없으면 이력을 바로 저장하는지 테스트"""
+        with mock.patch.object(
+            self.redis_client, "lpush", side_effect=RedisError("down")
+        ):
+            buffer_download_histories(self.user.id, "갤러리", self.files)
+
+        self.assertEqual(FileDownloadHistory.objects.count(), 5)
+
+
+class FileListTestCase(APITestCase):
+    """파일 리스트 조회 테스트 케이스"""
+
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        self.url = reverse("file-list")
+        self.user = User.objects.create_user(
+            email="test@example.com", password="test123"
+        )
+        self.client.force_authenticate(user=self.user)
+        self.content_type = ContentType.objects.get_for_model(User)
+        expire_at = timezone.now() + datetime.timedelta(days=1)
+        self.files = [
+            File.objects.create(
+                user=self.user,
+                file_name=f"image{i}",
+                extension="png",
+                content_type=self.content_type,
+                object_id=str(self.user.id),
+                status=FileStatus.SUCCESS_UPLOAD,
+                expire_at=expire_at,
+            )
+            for i in range(25)
+        ]
+        # 만료된 파일, 다른 콘텐츠의 파일은 조회되지 않아야 함
+        File.objects.create(
+            user=self.user,
+            file_name="expired",
+            extension="png",
+            content_type=self.content_type,
+            object_id=str(self.user.id),
+            expire_at=timezone.now() - datetime.timedelta(days=1),
+        )
+        File.objects.create(
+            user=self.user,
+            file_name="other",
+            extension="png",
+            content_type=self.content_type,
+            object_id="other",
+            expire_at=expire_at,
+        )
+
+    @skipUnless(connection.vendor == "sqlite", "SQLite 실행 계획으로 확인")
+    def test_성공__인덱스_순서로_페이지_조회(self):
+        """목록 조회가 정렬 없이 사용자, 콘텐츠, UUID 인덱스 순서로 읽는지 테스트"""
+        queryset = (
+            File.objects.filter(
+                Q(expire_at__isnull=True) | Q(expire_at__gt=timezone.now()),
+                user=self.user,
+                content_type=self.content_type,
+                object_id=str(self.user.id),
+            )
+            .order_by(*FileCursorPagination.ordering.split(","))
+            .only("uuid")[: FileCursorPagination.page_size]
+        )
+
+        plan = queryset.explain()
+
+        self.assertIn("file_user_content_idx", plan)
+        self.assertNotIn("TEMP B-TREE", plan)
+
+    def test_성공__커서_페이지네이션(self):
+        """커서로 다음 페이지를 중복, 누락 없이 최신순으로 조회하는지 테스트"""
+        params = {"content_type": self.content_type.id, "object_id": self.user.id}
+
+        response = self.client.get(self.url, params)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotIn("count", response.data)
+        uuids = [item["uuid"] for item in response.data["results"]]
+
+        response = self.client.get(response.data["next"])
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertIsNone(response.data["next"])
+        uuids += [item["uuid"] for item in response.data["results"]]
+
+        expected = [str(file.uuid) for file in reversed(self.files)]
+        self.assertEqual(uuids, expected)
+
+
+class PresignedUrlCacheTestCase(TestCase):
+    """프리사인드 URL 캐시 테스트 케이스"""
+
+    def setUp(self):
+        cache.clear()
+
+    @override_settings(FILE_PRESIGNED_URL_MIN_VALIDITY=60)
+    def test_성공__만료_구간_계산(self):
+        """같은 구간에서는 같은 만료 시각으로 서명되고 최소 유효 시간이 보장되는지 테스트"""
+        # 구간 길이 240초, 960초부터 1200초까지가 4번 구간
+        bucket, expires_in, timeout = get_presigned_expiry_window(300, now=1000)
+        self.assertEqual((bucket, expires_in, timeout), (4, 260, 200))
+
+        bucket, expires_in, timeout = get_presigned_expiry_window(300, now=1199)
+        self.assertEqual((bucket, expires_in, timeout), (4, 61, 1))
+
+    @override_settings(FILE_PRESIGNED_URL_MIN_VALIDITY=300)
+    def test_성공__최소_유효_시간_이하면_캐시_미사용(self):
+        """최대 유효 시간이 최소 유효 시간 이하면 캐시하지 않는지 테스트"""
+        self.assertIsNone(get_presigned_expiry_window(300, now=1000))
+
+    @mock.patch("apps.file.v1.utils.S3_CLIENT")
+    def test_성공__업로드_URL_캐시_미사용(self, mock_s3_client):
+        """업로드 URL은 객체 키마다 한 번만 사용되므로 캐시하지 않는지 테스트"""
+        mock_s3_client.generate_presigned_post.return_value = {"url": "https://s3"}
+
+        generate_upload_presigned_url("a.png", file_size=10)
+        response = generate_upload_presigned_url("a.png", file_size=10)
+
+        self.assertEqual(response["url"], "https://s3")
+        self.assertEqual(mock_s3_client.generate_presigned_post.call_count, 2)
+        self.assertEqual(
+            mock_s3_client.generate_presigned_post.call_args.kwargs["ExpiresIn"], 300
+        )
+
+
+class DeleteExpiredFilesTestCase(TestCase):
+    """만료 파일 삭제 테스트 케이스"""
+
+    def setUp(self):
+        self.user = User.objects.create_user(
+            email="test@example.com", password="test123"
+        )
+        self.s3_client = mock.MagicMock()
+        self.s3_client.delete_objects.return_value = {}
+        patcher = mock.patch("apps.file.v1.utils.S3_CLIENT", self.s3_client)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def create_file(self, object_key, expire_at, status=FileStatus.SUCCESS_UPLOAD):
+        """테스트용 파일 생성"""
+        return File.objects.create(
+            user=self.user,
+            file_name="file",
+            extension="png",
+            object_key=object_key,
+            status=status,
+            expire_at=expire_at,
+        )
+
+    def test_성공__청크_단위_삭제(self):
+        """만료 파일만 청크 단위로 S3 에서 삭제되고 상태가 변경되는지 테스트"""
+        now = timezone.now()
+        expired_files = [
+            self.create_file(f"files/{i}.png", now - datetime.timedelta(minutes=i))
+            for i in range(1, 6)
+        ]
+        valid_file = self.create_file("files/valid.png", now + datetime.timedelta(1))
+
+        result = task_delete_expired_files(chunk_size=2)
+
+        self.assertEqual(result, "5 files deleted, 0 failed")
+        self.assertEqual(self.s3_client.delete_objects.call_count, 3)
+        for file in expired_files:
+            file.refresh_from_db()
+            self.assertEqual(file.status, FileStatus.DELETE)
+        valid_file.refresh_from_db()
+        self.assertEqual(valid_file.status, FileStatus.SUCCESS_UPLOAD)
+
+    def test_성공__삭제_실패_파일은_재시도(self):
+        """S3 삭제에 실패한 파일은 상태가 유지되어 다음 실행 시 다시 처리되는지 테스트"""
+        expire_at = timezone.now() - datetime.timedelta(minutes=1)
+        failed_file = self.create_file("files/failed.png", expire_at)
+        deleted_file = self.create_file("files/deleted.png", expire_at)
+        self.s3_client.delete_objects.return_value = {
+            "Errors": [{"Key": "files/failed.png", "Code": "AccessDenied"}]
+        }
+
+        result = task_delete_expired_files()
+
+        self.assertEqual(result, "1 files deleted, 1 failed")
+        failed_file.refresh_from_db()
+        deleted_file.refresh_from_db()
+        self.assertEqual(failed_file.status, FileStatus.SUCCESS_UPLOAD)
+        self.assertEqual(deleted_file.status, FileStatus.DELETE)
+
+        self.s3_client.delete_objects.return_value = {}
+        self.assertEqual(task_delete_expired_files(), "1 files deleted, 0 failed")
+
+    def test_성공__1000개_단위_요청(self):
+        """DeleteObjects 가 1000개 단위로 나눠 호출되는지 테스트"""
+        object_keys = [f"files/{i}.png" for i in range(2500)]
+
+        deleted_keys, failed_keys = delete_objects(object_keys, max_workers=2)
+
+        self.assertEqual(len(deleted_keys), 2500)
+        self.assertFalse(failed_keys)
+        sizes = sorted(
+            len(call.kwargs["Delete"]["Objects"])
+            for call in self.s3_client.delete_objects.call_args_list
+        )
+        self.assertEqual(sizes, [500, 1000, 1000])
+
+
+@override_settings(FILE_MULTIPART_PART_SIZE=5 * 1024 * 1024)
+class FileMultipartUploadTestCase(APITestCase):
+    """파일 멀티파트 업로드 테스트 케이스"""
+
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        self.user = User.objects.create_user(
+            email="test@example.com", password="test123"
+        )
+        self.client.force_authenticate(user=self.user)
+        self.s3_client = mock.MagicMock()
+        self.s3_client.create_multipart_upload.return_value = {"UploadId": "upload"}
+        self.s3_client.generate_presigned_url.side_effect = (
+            lambda method, Params, ExpiresIn: f"https://s3/{Params['PartNumber']}"
+        )
+        patcher = mock.patch("apps.file.v1.utils.S3_CLIENT", self.s3_client)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def create_file(self):
+        """멀티파트 업로드 중인 12MB 파일 생성 (5MB 파트 3개)"""
+        return File.objects.create(
+            user=self.user,
+            file_name="video",
+            extension="mp4",
+            file_size=12 * 1024 * 1024,
+            object_key="files/video.mp4",
+            upload_id="upload",
+            part_size=5 * 1024 * 1024,
+            status=FileStatus.GENERATED,
+        )
+
+    def test_성공__멀티파트_업로드_시작(self):
+        """멀티파트 업로드가 시작되고 파트 정보가 반환되는지 테스트"""
+        response = self.client.post(
+            reverse("file-multipart"),
+            {"file_name": "video", "extension": "mp4", "file_size": 12 * 1024 * 1024},
+            format="json",
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response.data["upload_id"], "upload")
+        self.assertEqual(response.data["part_count"], 3)
+        file = File.objects.get(uuid=response.data["uuid"])
+        self.assertTrue(file.object_key.endswith(f"{file.uuid}.mp4"))
+        self.assertEqual(file.status, FileStatus.GENERATED)
+
+    def test_실패__파일_크기_없음(self):
+        """파일 크기 없이 멀티파트 업로드를 시작할 수 없는지 테스트"""
+        response = self.client.post(
+            reverse("file-multipart"),
+            {"file_name": "video", "extension": "mp4"},
+            format="json",
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(
+            response.data["non_field"][0]["error_code"],
+            E010_MULTIPART_FILE_SIZE_REQUIRED["non_field"]["error_code"],
+        )
+        self.s3_client.create_multipart_upload.assert_not_called()
+
+    def test_성공__파트_프리사인드_및_완료_파트_기록(self):
+        """완료 파트가 기록되고 요청한 파트의 업로드 URL이 생성되는지 테스트"""
+        file = self.create_file()
+
+        response = self.client.post(
+            reverse("file-multipart-presigned", args=[file.uuid]),
+            {"part_numbers": [2, 3], "parts": [{"part_number": 1, "etag": "a"}]},
+            format="json",
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            response.data["urls"], {"2": "https://s3/2", "3": "https://s3/3"}
+        )
+        self.assertEqual(response.data["uploaded_parts"], {"1": "a"})
+        file.refresh_from_db()
+        self.assertEqual(file.uploaded_parts, {"1": "a"})
+
+    def test_실패__파트_번호_초과(self):
+        """파트 수를 초과하는 파트 번호는 거부되는지 테스트"""
+        file = self.create_file()
+
+        response = self.client.post(
+            reverse("file-multipart-presigned", args=[file.uuid]),
+            {"part_numbers": [4]},
+            format="json",
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(
+            response.data["non_field"][0]["error_code"],
+            E010_INVALID_PART_NUMBER["non_field"]["error_code"],
+        )
+
+    def test_실패__업로드되지_않은_파트(self):
+        """모든 파트가 업로드되지 않으면 완료할 수 없는지 테스트"""
+        file = self.create_file()
+
+        response = self.client.post(
+            reverse("file-multipart-complete", args=[file.uuid]),
+            {"parts": [{"part_number": 1, "etag": "a"}]},
+            format="json",
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(
+            response.data["non_field"][0]["error_code"],
+            E010_MULTIPART_PARTS_INCOMPLETE["non_field"]["error_code"],
+        )
+        self.s3_client.complete_multipart_upload.assert_not_called()
+
+    def test_성공__멀티파트_업로드_완료(self):
+        """모든 파트가 업로드되면 파일이 합쳐지고 업로드 성공 상태가 되는지 테스트"""
+        self.s3_client.head_object.return_value = {
+            "ContentLength": 12 * 1024 * 1024,
+            "ETag": '"etag-3"',
+        }
+        file = self.create_file()
+        file.uploaded_parts = {"1": "a", "2": "b"}
+        file.save()
+
+        response = self.client.post(
+            reverse("file-multipart-complete", args=[file.uuid]),
+            {"parts": [{"part_number": 3, "etag": "c"}]},
+            format="json",
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        parts = self.s3_client.complete_multipart_upload.call_args.kwargs[
+            "MultipartUpload"
+        ]["Parts"]
+        self.assertEqual([part["ETag"] for part in parts], ["a", "b", "c"])
+        self.s3_client.head_object.assert_called_once_with(
+            Bucket=settings.AWS_STORAGE_BUCKET_NAME, Key="files/video.mp4"
+        )
+        self.assertEqual(response.data["status"], FileStatus.SUCCESS_UPLOAD)
+        file.refresh_from_db()
+        self.assertEqual(file.status, FileStatus.SUCCESS_UPLOAD)
+        self.assertEqual(file.etag, "etag-3")
+        self.assertIsNone(file.upload_id)
+
+    def test_실패__합친_파일_크기_초과(self):
+        """합친 파일의 크기가 허용 크기를 넘으면 업로드 실패 상태가 되는지 테스트"""
+        self.s3_client.head_object.return_value = {
+            "ContentLength": 100 * 1024 * 1024,
+            "ETag": '"etag-3"',
+        }
+        file = self.create_file()
+        file.uploaded_parts = {"1": "a", "2": "b", "3": "c"}
+        file.save()
+
+        response = self.client.post(
+            reverse("file-multipart-complete", args=[file.uuid]), format="json"
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["status"], FileStatus.FAIL_UPLOAD)
+        file.refresh_from_db()
+        self.assertEqual(file.status, FileStatus.FAIL_UPLOAD)
+        self.assertIsNone(file.upload_id)
+
+    def test_성공__합친_파일_조회_실패_시_상태_유지(self):
+        """S3 객체를 조회할 수 없으면 상태를 유지해 정리 작업에서 다시 확인하는지 테스트"""
+        self.s3_client.head_object.side_effect = ClientError(
+            {"Error": {"Code": "500"}}, "HeadObject"
+        )
+        file = self.create_file()
+        file.uploaded_parts = {"1": "a", "2": "b", "3": "c"}
+        file.save()
+
+        response = self.client.post(
+            reverse("file-multipart-complete", args=[file.uuid]), format="json"
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        file.refresh_from_db()
+        self.assertEqual(file.status, FileStatus.GENERATED)
+        self.assertIsNone(file.upload_id)
+
+    def test_성공__멀티파트_업로드_중단(self):
+        """멀티파트 업로드를 중단하면 업로드 실패 상태가 되는지 테스트"""
+        file = self.create_file()
+
+        response = self.client.post(
+            reverse("file-multipart-abort", args=[file.uuid]), format="json"
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.s3_client.abort_multipart_upload.assert_called_once()
+        file.refresh_from_db()
+        self.assertEqual(file.status, FileStatus.FAIL_UPLOAD)
+        self.assertIsNone(file.upload_id)
+
+    def test_성공__방치된_업로드_정리(self):
+        """일정 시간 진행되지 않은 멀티파트 업로드만 중단되는지 테스트"""
+        abandoned_file = self.create_file()
+        active_file = self.create_file()
+        File.objects.filter(uuid=abandoned_file.uuid).update(
+            updated_at=timezone.now() - datetime.timedelta(days=2)
+        )
+
+        result = task_abort_abandoned_multipart_uploads()
+
+        self.assertEqual(result, "1 multipart uploads aborted")
+        abandoned_file.refresh_from_db()
+        active_file.refresh_from_db()
+        self.assertEqual(abandoned_file.status, FileStatus.FAIL_UPLOAD)
+        self.assertEqual(active_file.status, FileStatus.GENERATED)
+
+
+class FileUploadVerificationTestCase(APITestCase):
+    """파일 업로드 검증 테스트 케이스"""
+
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        self.user = User.objects.create_user(
+            email="test@example.com", password="test123"
+        )
+        self.client.force_authenticate(user=self.user)
+        self.objects = {}
+        self.s3_client = mock.MagicMock()
+        self.s3_client.head_object.side_effect = self.head_object
+        patcher = mock.patch("apps.file.v1.utils.S3_CLIENT", self.s3_client)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def head_object(self, Bucket, Key):
+        """S3 HeadObject 대체"""
+        if Key == "files/error.png":
+            raise ClientError({"Error": {"Code": "500"}}, "HeadObject")
+        if Key not in self.objects:
+            raise ClientError({"Error": {"Code": "404"}}, "HeadObject")
+        return {"ContentLength": self.objects[Key], "ETag": '"etag"'}
+
+    def create_file(self, object_key, file_size=100, minutes_ago=0):
+        """업로드 URL이 생성된 파일 생성"""
+        file = File.objects.create(
+            user=self.user,
+            file_name="image",
+            extension="png",
+            file_size=file_size,
+            object_key=object_key,
+            status=FileStatus.GENERATED,
+        )
+        File.objects.filter(uuid=file.uuid).update(
+            created_at=timezone.now() - datetime.timedelta(minutes=minutes_ago)
+        )
+        return file
+
+    @mock.patch("apps.file.v1.serializers.task_verify_uploaded_file.apply_async")
+    def test_성공__업로드_완료_보고시_검증_요청(self, mock_apply_async):
+        """업로드 성공 보고 시 상태를 바로 바꾸지 않고 검증을 요청하는지 테스트"""
+        file = self.create_file("files/image.png")
+
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.patch(
+                reverse("file-detail", args=[file.uuid]),
+                {"status": FileStatus.SUCCESS_UPLOAD},
+                format="json",
+            )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["status"], FileStatus.GENERATED)
+        mock_apply_async.assert_called_once_with(args=[str(file.uuid)])
+
+    @mock.patch("apps.file.v1.tasks.task_generate_thumbnails.apply_async")
+    def test_성공__업로드_파일_검증(self, mock_apply_async):
+        """S3 객체가 존재하면 업로드 성공으로 변경되고 썸네일 생성이 요청되는지 테스트"""
+        file = self.create_file("files/image.png")
+        self.objects["files/image.png"] = 120
+
+        result = task_verify_uploaded_file(str(file.uuid))
+
+        self.assertEqual(result, "1 succeeded, 0 failed")
+        file.refresh_from_db()
+        self.assertEqual(file.status, FileStatus.SUCCESS_UPLOAD)
+        self.assertEqual(file.file_size, 120)
+        self.assertEqual(file.etag, "etag")
+        mock_apply_async.assert_called_once_with(args=[[str(file.uuid)]])
+
+    @mock.patch("apps.file.v1.tasks.task_generate_thumbnails.apply_async")
+    def test_성공__오래된_업로드_상태_정리(self, mock_apply_async):
+        """오래된 파일만 확인하며, 조회에 실패한 파일은 상태가 유지되는지 테스트"""
+        uploaded_file = self.create_file("files/uploaded.png", minutes_ago=30)
+        missing_file = self.create_file("files/missing.png", minutes_ago=30)
+        oversized_file = self.create_file("files/oversized.png", minutes_ago=30)
+        error_file = self.create_file("files/error.png", minutes_ago=30)
+        recent_file = self.create_file("files/recent.png")
+        self.objects["files/uploaded.png"] = 100
+        self.objects["files/oversized.png"] = 100 * 1024 * 1024
+        self.objects["files/recent.png"] = 100
+
+        result = task_reconcile_generated_files(batch_size=2)
+
+        self.assertEqual(result, "1 succeeded, 2 failed")
+        expected = {
+            uploaded_file: FileStatus.SUCCESS_UPLOAD,
+            missing_file: FileStatus.FAIL_UPLOAD,
+            oversized_file: FileStatus.FAIL_UPLOAD,
+            error_file: FileStatus.GENERATED,
+            recent_file: FileStatus.GENERATED,
+        }
+        for file, file_status in expected.items():
+            file.refresh_from_db()
+            self.assertEqual(file.status, file_status)
+
+    @mock.patch("apps.file.v1.serializers.task_verify_uploaded_file.apply_async")
+    def test_성공__업로드_완료_보고시_ETag_저장(self, mock_apply_async):
+        """업로드 성공 보고 시 함께 받은 ETag 를 따옴표 없이 저장하는지 테스트"""
+        file = self.create_file("files/image.png")
+
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.patch(
+                reverse("file-detail", args=[file.uuid]),
+                {"status": FileStatus.SUCCESS_UPLOAD, "etag": '"etag"'},
+                format="json",
+            )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        file.refresh_from_db()
+        self.assertEqual(file.etag, "etag")
+
+    @mock.patch("apps.file.v1.tasks.task_generate_thumbnails.apply_async")
+    def test_실패__업로드_파일_ETag_불일치(self, mock_apply_async):
+        """보고한 ETag 와 S3 객체의 ETag 가 다르면 업로드 실패로 변경되는지 테스트"""
+        file = self.create_file("files/image.png")
+        File.objects.filter(uuid=file.uuid).update(etag="other")
+        self.objects["files/image.png"] = 100
+
+        result = task_verify_uploaded_file(str(file.uuid))
+
+        self.assertEqual(result, "0 succeeded, 1 failed")
+        file.refresh_from_db()
+        self.assertEqual(file.status, FileStatus.FAIL_UPLOAD)
+        mock_apply_async.assert_not_called()
+
+    @mock.patch("apps.file.v1.tasks.task_generate_thumbnails.apply_async")
+    def test_성공__검증중_상태_변경된_파일_제외(self, mock_apply_async):
+        """검증하는 사이 상태가 변경된 파일은 변경하지 않고 집계에서도 제외되는지 테스트"""
+        file = self.create_file("files/image.png")
+        self.objects["files/image.png"] = 100
+        files = [
+            {
+                "uuid": file.uuid,
+                "object_key": file.object_key,
+                "file_size": file.file_size,
+                "extension": file.extension,
+                "etag": None,
+            }
+        ]
+        File.objects.filter(uuid=file.uuid).update(status=FileStatus.DELETE)
+
+        result = verify_uploaded_files(files)
+
+        self.assertEqual(
+            result, {FileStatus.SUCCESS_UPLOAD: 0, FileStatus.FAIL_UPLOAD: 0}
+        )
+        file.refresh_from_db()
+        self.assertEqual(file.status, FileStatus.DELETE)
+        mock_apply_async.assert_not_called()
+
+
+class FileDeduplicationTestCase(APITestCase):
+    """파일 중복 업로드 생략 테스트 케이스"""
+
+    content_hash = "ab" * 32
+
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        self.url = reverse("file-list")
+        self.user = User.objects.create_user(
+            email="test@example.com", password="test123"
+        )
+        self.client.force_authenticate(user=self.user)
+        self.s3_client = mock.MagicMock()
+        self.s3_client.generate_presigned_post.return_value = {
+            "url": "https://s3",
+            "fields": {},
+        }
+        self.s3_client.delete_objects.return_value = {}
+        patcher = mock.patch("apps.file.v1.utils.S3_CLIENT", self.s3_client)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def create_file(self, user, expire_at=None, object_key="files/original.png"):
+        """업로드가 완료된 파일 생성"""
+        return File.objects.create(
+            user=user,
+            file_name="image",
+            extension="png",
+            file_size=100,
+            object_key=object_key,
+            content_hash=self.content_hash,
+            status=FileStatus.SUCCESS_UPLOAD,
+            expire_at=expire_at,
+        )
+
+    def upload(self):
+        """해시를 포함한 파일 업로드 요청"""
+        return self.client.post(
+            self.url,
+            {
+                "file_name": "image",
+                "extension": "png",
+                "file_size": 100,
+                "content_hash": self.content_hash.upper(),
+            },
+            format="json",
+        )
+
+    def test_성공__같은_파일_업로드_생략(self):
+        """같은 파일이 있으면 프리사인드 없이 기존 S3 객체를 사용하는지 테스트"""
+        self.create_file(self.user)
+
+        response = self.upload()
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertIsNone(response.data["url"])
+        self.assertEqual(response.data["status"], FileStatus.SUCCESS_UPLOAD)
+        file = File.objects.get(uuid=response.data["uuid"])
+        self.assertEqual(file.object_key, "files/original.png")
+        self.s3_client.generate_presigned_post.assert_not_called()
+
+    def test_성공__다른_사용자_파일은_중복_처리하지_않음(self):
+        """다른 사용자의 파일은 재사용하지 않고 해시 검증 조건으로 업로드하는지 테스트"""
+        other_user = User.objects.create_user(
+            email="other@example.com", password="test123"
+        )
+        self.create_file(other_user)
+
+        response = self.upload()
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response.data["url"], "https://s3")
+        fields = self.s3_client.generate_presigned_post.call_args.kwargs["Fields"]
+        self.assertEqual(fields["x-amz-checksum-algorithm"], "SHA256")
+        self.assertEqual(
+            fields["x-amz-checksum-sha256"],
+            base64.b64encode(bytes.fromhex(self.content_hash)).decode(),
+        )
+
+    def test_성공__마지막_파일이_만료될_때_S3_객체_삭제(self):
+        """S3 객체를 함께 사용하는 파일이 모두 만료되어야 삭제되는지 테스트"""
+        now = timezone.now()
+        self.create_file(self.user, expire_at=now - datetime.timedelta(minutes=1))
+        other_file = self.create_file(self.user, expire_at=now + datetime.timedelta(1))
+
+        task_delete_expired_files()
+        self.s3_client.delete_objects.assert_not_called()
+
+        File.objects.filter(uuid=other_file.uuid).update(
+            expire_at=now - datetime.timedelta(seconds=1)
+        )
+        task_delete_expired_files()
+        objects = self.s3_client.delete_objects.call_args.kwargs["Delete"]["Objects"]
+        self.assertEqual(objects, [{"Key": "files/original.png"}])
+
+
+@override_settings(
+    FILE_THUMBNAIL_SIZES=[64, 256],
+    FILE_THUMBNAIL_FORMATS=["webp"],
+    FILE_THUMBNAIL_MAX_WORKERS=1,
+    FILE_PUBLIC_URL="https://cdn.example.com/",
+)
+class FileThumbnailTestCase(TestCase):
+    """이미지 썸네일 테스트 케이스"""
+
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(
+            email="test@example.com", password="test123"
+        )
+        self.uploaded = {}
+        self.s3_client = mock.MagicMock()
+        self.s3_client.download_fileobj.side_effect = self.download_fileobj
+        self.s3_client.upload_fileobj.side_effect = self.upload_fileobj
+        patcher = mock.patch("apps.file.v1.utils.S3_CLIENT", self.s3_client)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def download_fileobj(self, bucket, key, fileobj):
+        """S3 다운로드 대체 (1000x500 PNG)"""
+        Image.new("RGB", (1000, 500), "red").save(fileobj, format="PNG")
+
+    def upload_fileobj(self, fileobj, bucket, key, ExtraArgs):
+        """S3 업로드 대체"""
+        self.uploaded[key] = Image.open(io.BytesIO(fileobj.read()))
+
+    def test_성공__썸네일_프로세스_풀_Django_초기화(self):
+        """spawn 으로 시작한 자식 프로세스에서 모델을 불러오는 모듈을 사용할 수 있는지 테스트"""
+        with get_thumbnail_executor(max_workers=2) as executor:
+            names = list(executor.map(get_thumbnail_name, [64, 256], ["webp", "avif"]))
+
+        self.assertEqual(names, ["webp_64", "avif_256"])
+
+    def test_성공__썸네일_생성(self):
+        """설정된 크기의 썸네일이 비율을 유지해 생성되고 파일에 저장되는지 테스트"""
+        file = File.objects.create(
+            user=self.user,
+            file_name="image",
+            extension="png",
+            file_size=100,
+            object_key="files/image.png",
+            status=FileStatus.SUCCESS_UPLOAD,
+        )
+
+        result = task_generate_thumbnails([str(file.uuid)])
+
+        self.assertEqual(result, "1 thumbnails generated")
+        file.refresh_from_db()
+        self.assertEqual(
+            file.thumbnails,
+            {
+                "webp_256": "thumbnails/files/image/256.webp",
+                "webp_64": "thumbnails/files/image/64.webp",
+            },
+        )
+        self.assertEqual(
+            self.uploaded["thumbnails/files/image/256.webp"].size, (256, 128)
+        )
+        self.assertEqual(self.uploaded["thumbnails/files/image/64.webp"].format, "WEBP")
+
+    def test_성공__공개_이미지_썸네일_URL(self):
+        """썸네일이 생성된 공개 이미지만 썸네일 URL을 만들고, 아니면 빈 값인지 테스트"""
+        File.objects.create(
+            user=self.user,
+            file_name="image",
+            extension="jpg",
+            object_key="files/image.jpg",
+            status=FileStatus.SUCCESS_UPLOAD,
+            thumbnails={"webp_64": "thumbnails/files/image/64.webp"},
+        )
+
+        urls = get_public_thumbnail_urls("https://cdn.example.com/files/image.jpg")
+
+        self.assertEqual(
+            urls,
+            {
+                "webp_64": "https://cdn.example.com/thumbnails/files/image/64.webp",
+                # 생성되지 않은 썸네일은 원본 이미지 사용
+                "webp_256": "https://cdn.example.com/files/image.jpg",
+            },
+        )
+        self.assertEqual(get_public_thumbnail_urls("https://other.com/image.jpg"), {})
+        self.assertEqual(
+            get_public_thumbnail_urls("https://cdn.example.com/files/doc.pdf"), {}
+        )
+
+    def test_성공__썸네일_생성_전에는_원본_이미지_URL(self):
+        """썸네일이 없는 이미지는 원본 URL을 사용하고, 생성 후에는 썸네일 URL을 사용하는지 테스트"""
+        image_url = "https://cdn.example.com/files/image.png"
+        file = File.objects.create(
+            user=self.user,
+            file_name="image",
+            extension="png",
+            file_size=100,
+            object_key="files/image.png",
+            status=FileStatus.SUCCESS_UPLOAD,
+        )
+
+        urls = get_public_thumbnail_urls(image_url)
+        self.assertEqual(urls, {"webp_64": image_url, "webp_256": image_url})
+
+        task_generate_thumbnails([str(file.uuid)])
+
+        urls = get_public_thumbnail_urls(image_url)
+        self.assertEqual(
+            urls["webp_64"], "https://cdn.example.com/thumbnails/files/image/64.webp"
+        )
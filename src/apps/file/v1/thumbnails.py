@@ -0,0 +1,86 @@
+import logging
+import tempfile
+
+from django.conf import settings
+from PIL import Image, ImageOps
+
+from apps.file.v1 import utils
+
+logger = logging.getLogger(__name__)
+
+THUMBNAIL_CONTENT_TYPES = {
+    "webp": "image/webp",
+    "avif": "image/avif",
+}
+
+
+def upload_thumbnail(image: Image.Image, thumbnail_key: str, image_format: str):
+    """썸네일 인코딩 후 S3 업로드"""
+    with tempfile.SpooledTemporaryFile(
+        max_size=settings.FILE_THUMBNAIL_SPOOL_SIZE
+    ) as output:
+        image.save(
+            output,
+            format=image_format.upper(),
+            quality=settings.FILE_THUMBNAIL_QUALITY,
+        )
+        output.seek(0)
+        utils.S3_CLIENT.upload_fileobj(
+            output,
+            settings.AWS_STORAGE_BUCKET_NAME,
+            thumbnail_key,
+            ExtraArgs={
+                "ContentType": THUMBNAIL_CONTENT_TYPES[image_format],
+                # 썸네일 객체 키는 원본마다 고유하므로 오래 캐시
+                "CacheControl": "max-age=31536000, immutable",
+            },
+        )
+
+
+def generate_thumbnails(object_key: str) -> dict:
+    """
+    이미지 썸네일 생성:
+    S3 원본 이미지로 설정된 크기, 형식의 썸네일을 만들어 S3에 업로드
+
+    Args:
+        object_key (str): 원본 이미지 S3 객체 키
+
+    Returns:
+        dict: 썸네일 이름별 S3 객체 키 (실패 시 빈 dict)
+    """
+    sizes = sorted(settings.FILE_THUMBNAIL_SIZES, reverse=True)
+    thumbnails = {}
+    try:
+        # [Why]
+        # Q. SpooledTemporaryFile 을 사용하는 이유는?
+        # A. 작은 이미지는 메모리에서 처리하고, 큰 이미지는 디스크에 저장해
+        #    원본 전체를 메모리에 올리지 않기 위함
+        with tempfile.SpooledTemporaryFile(
+            max_size=settings.FILE_THUMBNAIL_SPOOL_SIZE
+        ) as source:
+            utils.S3_CLIENT.download_fileobj(
+                settings.AWS_STORAGE_BUCKET_NAME, object_key, source
+            )
+            source.seek(0)
+            with Image.open(source) as original:
+                # JPEG 는 디코딩 단계에서 필요한 크기로 줄여 메모리와 CPU 사용량 감소
+                original.draft("RGB", (sizes[0], sizes[0]))
+                image = ImageOps.exif_transpose(original)
+                if image.mode not in ["RGB", "RGBA"]:
+                    image = image.convert("RGBA")
+                # 큰 크기부터 줄여가며 이전 결과를 다음 썸네일의 원본으로 사용
+                for size in sizes:
+                    image.thumbnail((size, size))
+                    for image_format in settings.FILE_THUMBNAIL_FORMATS:
+                        thumbnail_key = utils.get_thumbnail_object_key(
+                            object_key, size, image_format
+                        )
+                        upload_thumbnail(image, thumbnail_key, image_format)
+                        name = utils.get_thumbnail_name(size, image_format)
+                        thumbnails[name] = thumbnail_key
+    except Exception as e:
+        logger.error(
+            f"Error generating thumbnails for {object_key}: {e}", exc_info=True
+        )
+        return {}
+    return thumbnails
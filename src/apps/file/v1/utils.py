@@ -1,9 +1,19 @@
+import base64
 import mimetypes
 import logging
+import math
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+
 import boto3
 from botocore.config import Config
 from botocore.exceptions import ClientError
 from django.conf import settings
+from django.core.cache import cache
+from django.utils import timezone
+
+from apps.file.models import File
 
 logger = logging.getLogger(__name__)
 
@@ -14,6 +24,8 @@ try:
         region_name=getattr(settings, "AWS_S3_REGION_NAME", "ap-northeast-2"),
         config=Config(
             signature_version=getattr(settings, "AWS_S3_SIGNATURE_VERSION", "s3v4"),
+            # 여러 스레드에서 동시에 요청할 수 있도록 커넥션 풀 크기 지정
+            max_pool_connections=getattr(settings, "AWS_S3_MAX_POOL_CONNECTIONS", 10),
         ),
     )
     logger.info("Successfully initialized S3 client.")
@@ -21,18 +33,59 @@ except Exception as e:
     logger.error(f"Error initializing S3 client: {e}", exc_info=True)
 
 
+def get_presigned_expiry_window(expires_in: int, now: float = None) -> tuple:
+    """
+    Presigned URL 만료 구간 조회
+
+    Args:
+        expires_in (int): Presigned URL의 최대 유효 시간 (초)
+        now (float): 기준 시각 (Unix timestamp)
+
+    Returns:
+        tuple: (구간 번호, 서명에 사용할 유효 시간, 캐시 유지 시간)
+        None: 최대 유효 시간이 최소 유효 시간보다 짧아 캐시할 수 없는 경우
+    """
+    # [Why]
+    # Q. 만료 시각을 구간 단위로 맞추는 이유는?
+    # A. 같은 구간에서 요청된 URL은 모두 같은 만료 시각으로 서명되므로 한 번 서명한
+    #    결과를 구간이 끝날 때까지 재사용할 수 있음
+    #    구간 길이를 (최대 유효 시간 - 최소 유효 시간)으로 정해, 전달되는 URL의 남은
+    #    유효 시간은 항상 최소 유효 시간 이상, 최대 유효 시간 이하가 됨
+    now = time.time() if now is None else now
+    window = expires_in - settings.FILE_PRESIGNED_URL_MIN_VALIDITY
+    if window <= 0:
+        return None
+    bucket = int(now // window)
+    bucket_end = (bucket + 1) * window
+    expire_at = bucket_end + settings.FILE_PRESIGNED_URL_MIN_VALIDITY
+    return bucket, int(expire_at - now), max(math.ceil(bucket_end - now), 1)
+
+
+def get_presigned_cache_key(kind: str, object_key: str, expires_in: int, bucket: int):
+    """Presigned URL 캐시 키 조회"""
+    return f"file:presigned:{kind}:{expires_in}:{bucket}:{object_key}"
+
+
+def get_max_upload_size(file_size: int) -> int:
+    """업로드 가능한 최대 파일 크기 조회 (예상 파일 크기 + 10MB)"""
+    return (file_size if file_size > 0 else 100 * 1024 * 1024) + (10 * 1024 * 1024)
+
+
 def generate_upload_presigned_url(
     object_key: str,
     file_size: int = 0,  # 기본 파일 크기
     expires_in: int = 300,  # 기본 만료 시간 (초)
+    content_hash: str = None,
 ) -> dict:
     """
     S3 업로드용 Presigned POST URL 생성
+    (업로드마다 객체 키가 새로 발급되어 재사용할 수 없으므로 캐시하지 않음)
 
     Args:
         object_key (str): S3에 저장될 객체 키 (파일 경로 및 이름)
         file_size (int): 예상 파일 크기 (바이트 단위). content-length-range 조건에 사용됨.
         expires_in (int): Presigned URL의 유효 시간 (초)
+        content_hash (str): 파일의 SHA-256 해시 (16진수). 지정 시 S3 에서 내용을 검증함.
 
     Returns:
         dict: Presigned POST URL 및 필드 정보
@@ -48,13 +101,16 @@ def generate_upload_presigned_url(
         logger.warning(
             f"Could not guess Content-Type for {object_key}. Defaulting to {content_type}."
         )
-    max_upload_size = (file_size if file_size > 0 else 100 * 1024 * 1024) + (
-        10 * 1024 * 1024
-    )
+    max_upload_size = get_max_upload_size(file_size)
     fields = {"Content-Type": content_type}
-    conditions = [
-        {"Content-Type": content_type},
-        ["content-length-range", 0, max_upload_size],
+    if content_hash:
+        # 업로드한 내용의 해시가 다르면 S3 에서 업로드를 거부함
+        fields["x-amz-checksum-algorithm"] = "SHA256"
+        fields["x-amz-checksum-sha256"] = base64.b64encode(
+            bytes.fromhex(content_hash)
+        ).decode()
+    conditions = [{key: value} for key, value in fields.items()] + [
+        ["content-length-range", 0, max_upload_size]
     ]
     try:
         response = S3_CLIENT.generate_presigned_post(
@@ -80,12 +136,12 @@ def generate_upload_presigned_url(
         return {}
 
 
-def generate_download_presigned_url(
+def sign_download_presigned_url(
     object_key: str,
     expires_in: int = 300,  # 기본 만료 시간 (초)
 ) -> dict:
     """
-    S3 다운로드용 Presigned URL 생성 (공유 클라이언트 사용)
+    S3 다운로드용 Presigned URL 서명 (공유 클라이언트 사용)
 
     Args:
         object_key (str): 다운로드할 S3 객체 키
@@ -123,3 +179,426 @@ def generate_download_presigned_url(
             exc_info=True,
         )
         return {}
+
+
+def generate_download_presigned_url(
+    object_key: str,
+    expires_in: int = 300,  # 기본 만료 시간 (초)
+) -> str | None:
+    """
+    S3 다운로드용 Presigned URL 조회 (만료 구간 동안 캐시 재사용)
+
+    Args:
+        object_key (str): 다운로드할 S3 객체 키
+        expires_in (int): Presigned URL의 최대 유효 시간 (초)
+
+    Returns:
+        str: Presigned GET URL
+        None: 클라이언트가 없거나 오류 발생 시
+    """
+    return get_download_presigned_urls([object_key], expires_in).get(object_key)
+
+
+def get_download_presigned_urls(
+    object_keys: list[str],
+    expires_in: int = 300,  # 기본 만료 시간 (초)
+) -> dict[str, str]:
+    """
+    여러 S3 객체의 다운로드용 Presigned URL 일괄 조회 (만료 구간 동안 캐시 재사용)
+
+    Args:
+        object_keys (list[str]): 다운로드할 S3 객체 키 목록
+        expires_in (int): Presigned URL의 최대 유효 시간 (초)
+
+    Returns:
+        dict[str, str]: 객체 키별 Presigned GET URL (생성 실패한 객체는 제외)
+    """
+    expiry_window = get_presigned_expiry_window(expires_in)
+    if expiry_window is None:
+        urls = {
+            object_key: sign_download_presigned_url(object_key, expires_in)
+            for object_key in set(object_keys)
+        }
+        return {object_key: url for object_key, url in urls.items() if url}
+    bucket, signed_expires_in, timeout = expiry_window
+    cache_keys = {
+        object_key: get_presigned_cache_key("download", object_key, expires_in, bucket)
+        for object_key in set(object_keys)
+    }
+    cached = cache.get_many(cache_keys.values())
+    urls = {}
+    generated = {}
+    for object_key, cache_key in cache_keys.items():
+        url = cached.get(cache_key)
+        if not url:
+            url = sign_download_presigned_url(object_key, signed_expires_in)
+            if not url:
+                continue
+            generated[cache_key] = url
+        urls[object_key] = url
+    if generated:
+        cache.set_many(generated, timeout=timeout)
+    return urls
+
+
+# S3 멀티파트 업로드 제한 (최소 파트 크기, 최대 파트 수)
+S3_MULTIPART_MIN_PART_SIZE = 5 * 1024 * 1024
+S3_MULTIPART_MAX_PARTS = 10000
+
+
+def get_object_key(file_name: str) -> str:
+    """S3 파일 경로 조회"""
+    content_type = ""
+    now = timezone.now()
+    return f"files/{content_type}/{now.year}/{now.month}/{now.day}/{file_name}"
+
+
+def get_part_size(file_size: int) -> int:
+    """
+    멀티파트 업로드 파트 크기 조회
+
+    Args:
+        file_size (int): 파일 크기 (바이트 단위)
+
+    Returns:
+        int: 최대 파트 수를 넘지 않는 파트 크기
+    """
+    part_size = max(settings.FILE_MULTIPART_PART_SIZE, S3_MULTIPART_MIN_PART_SIZE)
+    return max(part_size, math.ceil(file_size / S3_MULTIPART_MAX_PARTS))
+
+
+def create_multipart_upload(object_key: str) -> str | None:
+    """
+    S3 멀티파트 업로드 시작
+
+    Args:
+        object_key (str): S3에 저장될 객체 키
+
+    Returns:
+        str: 멀티파트 업로드 ID
+        None: 클라이언트가 없거나 오류 발생 시
+    """
+    if not S3_CLIENT:
+        logger.error("S3 client is not available for creating multipart upload.")
+        return None
+    content_type, _ = mimetypes.guess_type(object_key)
+    try:
+        response = S3_CLIENT.create_multipart_upload(
+            Bucket=settings.AWS_STORAGE_BUCKET_NAME,
+            Key=object_key,
+            ContentType=content_type or "application/octet-stream",
+        )
+        return response["UploadId"]
+    except Exception as e:
+        logger.error(
+            f"Error creating multipart upload for {object_key}: {e}", exc_info=True
+        )
+        return None
+
+
+def generate_upload_part_presigned_urls(
+    object_key: str,
+    upload_id: str,
+    part_numbers: list[int],
+    expires_in: int = 3600,  # 기본 만료 시간 (초)
+) -> dict[int, str]:
+    """
+    S3 멀티파트 업로드 파트별 Presigned URL 생성
+
+    Args:
+        object_key (str): S3에 저장될 객체 키
+        upload_id (str): 멀티파트 업로드 ID
+        part_numbers (list[int]): 파트 번호 목록
+        expires_in (int): Presigned URL의 유효 시간 (초)
+
+    Returns:
+        dict[int, str]: 파트 번호별 Presigned PUT URL (생성 실패한 파트는 제외)
+    """
+    if not S3_CLIENT:
+        logger.error("S3 client is not available for generating part presigned URL.")
+        return {}
+    urls = {}
+    for part_number in part_numbers:
+        try:
+            urls[part_number] = S3_CLIENT.generate_presigned_url(
+                "upload_part",
+                Params={
+                    "Bucket": settings.AWS_STORAGE_BUCKET_NAME,
+                    "Key": object_key,
+                    "UploadId": upload_id,
+                    "PartNumber": part_number,
+                },
+                ExpiresIn=expires_in,
+            )
+        except Exception as e:
+            logger.error(
+                f"Error generating part presigned URL for {object_key}: {e}",
+                exc_info=True,
+            )
+    return urls
+
+
+def complete_multipart_upload(
+    object_key: str, upload_id: str, parts: dict[int, str]
+) -> bool:
+    """
+    S3 멀티파트 업로드 완료
+
+    Args:
+        object_key (str): S3에 저장될 객체 키
+        upload_id (str): 멀티파트 업로드 ID
+        parts (dict[int, str]): 파트 번호별 ETag
+
+    Returns:
+        bool: 완료 여부
+    """
+    if not S3_CLIENT:
+        logger.error("S3 client is not available for completing multipart upload.")
+        return False
+    try:
+        S3_CLIENT.complete_multipart_upload(
+            Bucket=settings.AWS_STORAGE_BUCKET_NAME,
+            Key=object_key,
+            UploadId=upload_id,
+            MultipartUpload={
+                "Parts": [
+                    {"PartNumber": part_number, "ETag": parts[part_number]}
+                    for part_number in sorted(parts)
+                ]
+            },
+        )
+        return True
+    except Exception as e:
+        logger.error(
+            f"Error completing multipart upload for {object_key}: {e}", exc_info=True
+        )
+        return False
+
+
+def abort_multipart_upload(object_key: str, upload_id: str) -> bool:
+    """
+    S3 멀티파트 업로드 중단 (업로드된 파트 삭제)
+
+    Args:
+        object_key (str): S3에 저장될 객체 키
+        upload_id (str): 멀티파트 업로드 ID
+
+    Returns:
+        bool: 중단 여부
+    """
+    if not S3_CLIENT:
+        logger.error("S3 client is not available for aborting multipart upload.")
+        return False
+    try:
+        S3_CLIENT.abort_multipart_upload(
+            Bucket=settings.AWS_STORAGE_BUCKET_NAME,
+            Key=object_key,
+            UploadId=upload_id,
+        )
+        return True
+    except ClientError as e:
+        # 이미 완료되었거나 중단된 업로드
+        if e.response.get("Error", {}).get("Code") == "NoSuchUpload":
+            return True
+        logger.error(
+            f"Error aborting multipart upload for {object_key}: {e}", exc_info=True
+        )
+        return False
+    except Exception as e:
+        logger.error(
+            f"Error aborting multipart upload for {object_key}: {e}", exc_info=True
+        )
+        return False
+
+
+def get_thumbnail_name(size: int, image_format: str) -> str:
+    """썸네일 이름 조회 (예: webp_256)"""
+    return f"{image_format}_{size}"
+
+
+def get_thumbnail_object_key(object_key: str, size: int, image_format: str) -> str:
+    """썸네일 S3 객체 키 조회"""
+    return f"thumbnails/{os.path.splitext(object_key)[0]}/{size}.{image_format}"
+
+
+def get_public_thumbnail_cache_key(object_key: str) -> str:
+    """공개 이미지 썸네일 캐시 키 조회"""
+    return f"file:thumbnails:{object_key}"
+
+
+def get_public_thumbnail_urls(image_url: str | None) -> dict:
+    """
+    공개 이미지 URL의 썸네일 URL 조회
+
+    Args:
+        image_url (str): 공개 파일 기본 URL 하위의 이미지 URL
+
+    Returns:
+        dict: 썸네일 이름별 URL (생성되지 않은 썸네일은 원본 이미지 URL,
+              공개 파일이 아니거나 썸네일 대상이 아니면 빈 dict)
+    """
+    # [Why]
+    # Q. 썸네일 URL을 객체 키 규칙만으로 만들지 않는 이유는?
+    # A. 썸네일 생성 대상이 아니거나 아직 생성 중인 이미지는 썸네일 객체가 없으므로,
+    #    생성 결과가 저장된 파일만 썸네일 URL을 사용하고 그 외에는 원본 이미지를 사용
+    #    목록 조회 시 항목마다 파일을 조회하지 않도록 생성 결과를 짧게 캐시
+    public_url = settings.FILE_PUBLIC_URL
+    if not public_url or not image_url or not image_url.startswith(public_url):
+        return {}
+    object_key = image_url[len(public_url) :].lstrip("/")
+    extension = os.path.splitext(object_key)[1].lstrip(".").lower()
+    if extension not in settings.FILE_THUMBNAIL_EXTENSIONS:
+        return {}
+    cache_key = get_public_thumbnail_cache_key(object_key)
+    thumbnails = cache.get(cache_key)
+    if thumbnails is None:
+        thumbnails = (
+            File.objects.filter(object_key=object_key)
+            .exclude(thumbnails={})
+            .values_list("thumbnails", flat=True)
+            .first()
+        ) or {}
+        cache.set(
+            cache_key, thumbnails, timeout=settings.FILE_THUMBNAIL_URL_CACHE_TIMEOUT
+        )
+    urls = {}
+    for size in settings.FILE_THUMBNAIL_SIZES:
+        for image_format in settings.FILE_THUMBNAIL_FORMATS:
+            name = get_thumbnail_name(size, image_format)
+            thumbnail_key = thumbnails.get(name)
+            urls[name] = (
+                f"{public_url.rstrip('/')}/{thumbnail_key}"
+                if thumbnail_key
+                else image_url
+            )
+    return urls
+
+
+def head_object(object_key: str) -> dict | None:
+    """
+    S3 객체 메타데이터 조회
+
+    Args:
+        object_key (str): 조회할 S3 객체 키
+
+    Returns:
+        dict: 객체 크기(size), ETag(etag)
+        None: 객체가 존재하지 않는 경우
+
+    Raises:
+        Exception: 클라이언트가 없거나 객체 존재 여부를 확인할 수 없는 경우
+    """
+    if not S3_CLIENT:
+        raise RuntimeError("S3 client is not available for head object.")
+    try:
+        response = S3_CLIENT.head_object(
+            Bucket=settings.AWS_STORAGE_BUCKET_NAME,
+            Key=object_key,
+        )
+    except ClientError as e:
+        if e.response.get("Error", {}).get("Code") in ["404", "NoSuchKey"]:
+            return None
+        raise
+    return {
+        "size": response["ContentLength"],
+        "etag": response["ETag"].strip('"'),
+    }
+
+
+def head_objects(object_keys: list[str], max_workers: int = None) -> dict:
+    """
+    S3 객체 메타데이터 병렬 조회
+
+    Args:
+        object_keys (list[str]): 조회할 S3 객체 키 목록
+        max_workers (int): 동시에 호출할 HeadObject 요청 수
+
+    Returns:
+        dict: 객체 키별 메타데이터 (존재하지 않으면 None, 조회에 실패한 객체는 제외)
+    """
+    object_keys = list(dict.fromkeys(object_keys))
+    if not object_keys:
+        return {}
+
+    def _head_object(object_key):
+        try:
+            return object_key, head_object(object_key), True
+        except Exception as e:
+            logger.error(f"Error heading object {object_key}: {e}", exc_info=True)
+            return object_key, None, False
+
+    max_workers = max_workers or settings.FILE_VERIFY_MAX_WORKERS
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(object_keys))) as executor:
+        return {
+            object_key: metadata
+            for object_key, metadata, ok in executor.map(_head_object, object_keys)
+            if ok
+        }
+
+
+# S3 DeleteObjects 한 번에 삭제할 수 있는 최대 객체 수
+S3_DELETE_OBJECTS_MAX_KEYS = 1000
+
+
+def delete_objects_chunk(object_keys: list[str]) -> tuple[set, set]:
+    """
+    S3 객체 일괄 삭제 (DeleteObjects 1회 호출)
+
+    Args:
+        object_keys (list[str]): 삭제할 S3 객체 키 목록 (최대 1000개)
+
+    Returns:
+        tuple[set, set]: (삭제된 객체 키, 삭제 실패한 객체 키)
+    """
+    try:
+        response = S3_CLIENT.delete_objects(
+            Bucket=settings.AWS_STORAGE_BUCKET_NAME,
+            Delete={
+                "Objects": [{"Key": object_key} for object_key in object_keys],
+                "Quiet": True,
+            },
+        )
+    except Exception as e:
+        logger.error(f"Error deleting {len(object_keys)} objects: {e}", exc_info=True)
+        return set(), set(object_keys)
+    # Quiet 모드에서는 실패한 객체만 응답에 포함됨
+    failed_keys = {error["Key"] for error in response.get("Errors", [])}
+    for error in response.get("Errors", []):
+        logger.warning(
+            f"Error deleting object {error['Key']}: {error.get('Code')} {error.get('Message')}"
+        )
+    return set(object_keys) - failed_keys, failed_keys
+
+
+def delete_objects(object_keys: list[str], max_workers: int = None) -> tuple[set, set]:
+    """
+    S3 객체 병렬 일괄 삭제
+
+    Args:
+        object_keys (list[str]): 삭제할 S3 객체 키 목록
+        max_workers (int): 동시에 호출할 DeleteObjects 요청 수
+
+    Returns:
+        tuple[set, set]: (삭제된 객체 키, 삭제 실패한 객체 키)
+    """
+    if not S3_CLIENT:
+        logger.error("S3 client is not available for deleting objects.")
+        return set(), set(object_keys)
+    object_keys = list(dict.fromkeys(object_keys))
+    chunks = [
+        object_keys[i : i + S3_DELETE_OBJECTS_MAX_KEYS]
+        for i in range(0, len(object_keys), S3_DELETE_OBJECTS_MAX_KEYS)
+    ]
+    deleted_keys, failed_keys = set(), set()
+    if not chunks:
+        return deleted_keys, failed_keys
+    # [Why]
+    # Q. 스레드 풀을 사용하는 이유는?
+    # A. DeleteObjects 호출은 대부분 네트워크 대기 시간이므로, 여러 요청을 동시에
+    #    보내 전체 삭제 시간을 줄이기 위함 (boto3 클라이언트는 스레드 안전함)
+    max_workers = max_workers or settings.FILE_DELETE_MAX_WORKERS
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(chunks))) as executor:
+        for deleted, failed in executor.map(delete_objects_chunk, chunks):
+            deleted_keys |= deleted
+            failed_keys |= failed
+    return deleted_keys, failed_keys
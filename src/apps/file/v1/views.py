@@ -1,17 +1,25 @@
+from django.db.models import Q
 from django.utils import timezone
 from drf_spectacular.utils import extend_schema
 from rest_framework import viewsets, mixins, exceptions
 from rest_framework.decorators import action
 from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
 from rest_framework.throttling import ScopedRateThrottle
 
 from apps.file.models import File, FileStatus
 from apps.file.v1.filters import FileFilterSet
+from apps.file.v1.paginations import FileCursorPagination
 from apps.file.v1.serializers import (
     FileUploadSerializer,
     FileDownloadSerializer,
     FileUpdateSerializer,
     FileDownloadPresignedSerializer,
+    FileBatchDownloadPresignedSerializer,
+    FileMultipartUploadSerializer,
+    FileMultipartPresignedSerializer,
+    FileMultipartCompleteSerializer,
+    FileMultipartAbortSerializer,
 )
 
 
@@ -27,11 +35,19 @@ class FileViewSet(
     serializer_class = FileUploadSerializer
     permission_classes = [IsAuthenticated]
     filterset_class = FileFilterSet
+    pagination_class = FileCursorPagination
     throttle_scope = "file"
 
     def get_throttles(self):
         """요청 속도 제한 설정"""
-        if self.action in ["create", "partial_update", "presigned"]:
+        if self.action in [
+            "create",
+            "partial_update",
+            "presigned",
+            "presigned_batch",
+            "multipart",
+            "multipart_presigned",
+        ]:
             self.throttle_scope = f"{self.throttle_scope}:{self.action}"
             return [ScopedRateThrottle()]
         return super().get_throttles()
@@ -43,17 +59,33 @@ class FileViewSet(
             super()
             .get_queryset()
             .filter(
+                Q(expire_at__isnull=True) | Q(expire_at__gt=now),
                 user=self.request.user,
-                expire_at__gt=now,
             )
         )
 
+    def filter_queryset(self, queryset):
+        """필터 적용(리스트 조회 시에만 콘텐츠 필터 적용)"""
+        if self.action != "list":
+            return queryset
+        return super().filter_queryset(queryset)
+
     def get_serializer_class(self):
         """시리얼라이저 클래스 설정"""
         if self.action == "partial_update":
             return FileUpdateSerializer
         elif self.action == "presigned":
             return FileDownloadPresignedSerializer
+        elif self.action == "presigned_batch":
+            return FileBatchDownloadPresignedSerializer
+        elif self.action == "multipart":
+            return FileMultipartUploadSerializer
+        elif self.action == "multipart_presigned":
+            return FileMultipartPresignedSerializer
+        elif self.action == "multipart_complete":
+            return FileMultipartCompleteSerializer
+        elif self.action == "multipart_abort":
+            return FileMultipartAbortSerializer
         elif self.action == "list":
             return FileDownloadSerializer
         return super().get_serializer_class()
@@ -123,3 +155,84 @@ class FileViewSet(
     )
     def presigned(self, request, *args, **kwargs):
         return super().update(request, *args, **kwargs)
+
+    @extend_schema(
+        request=FileBatchDownloadPresignedSerializer,
+        responses={
+            200: FileBatchDownloadPresignedSerializer,
+        },
+        tags=["file"],
+        summary="파일 다운로드, 프리사인드 일괄 생성",
+        description="""
+        여러 파일의 다운로드를 위한 프리사인드 URL을 한 번에 생성합니다
+        접근할 수 없거나 URL 생성에 실패한 파일은 응답에서 제외됩니다
+        """,
+    )
+    @action(detail=False, methods=["POST"], url_path="presigned-batch")
+    def presigned_batch(self, request, *args, **kwargs):
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        serializer.save()
+        return Response(serializer.data)
+
+    @extend_schema(
+        request=FileMultipartUploadSerializer,
+        responses={
+            201: FileMultipartUploadSerializer,
+        },
+        tags=["file"],
+        summary="파일 생성, 멀티파트 업로드 시작",
+        description="""
+        파일의 기본 정보를 저장하고 멀티파트 업로드를 시작합니다
+        응답의 파트 크기로 파일을 나눠 업로드합니다
+        """,
+    )
+    @action(detail=False, methods=["POST"])
+    def multipart(self, request, *args, **kwargs):
+        return super().create(request, *args, **kwargs)
+
+    @extend_schema(
+        request=FileMultipartPresignedSerializer,
+        responses={
+            200: FileMultipartPresignedSerializer,
+        },
+        tags=["file"],
+        summary="멀티파트 업로드 파트 프리사인드 생성",
+        description="""
+        업로드가 완료된 파트를 기록하고, 요청한 파트들의 업로드 URL을 한 번에 생성합니다
+        업로드가 중단된 경우 업로드 완료 파트를 확인해 나머지 파트부터 이어서 업로드합니다
+        """,
+    )
+    @action(detail=True, methods=["POST"], url_path="multipart/presigned")
+    def multipart_presigned(self, request, *args, **kwargs):
+        return super().update(request, *args, **kwargs)
+
+    @extend_schema(
+        request=FileMultipartCompleteSerializer,
+        responses={
+            200: FileMultipartCompleteSerializer,
+        },
+        tags=["file"],
+        summary="멀티파트 업로드 완료",
+        description="""
+        모든 파트의 업로드가 완료되면 하나의 파일로 합치고 업로드 성공 상태로 변경합니다
+        """,
+    )
+    @action(detail=True, methods=["POST"], url_path="multipart/complete")
+    def multipart_complete(self, request, *args, **kwargs):
+        return super().update(request, *args, **kwargs)
+
+    @extend_schema(
+        request=None,
+        responses={
+            200: FileMultipartAbortSerializer,
+        },
+        tags=["file"],
+        summary="멀티파트 업로드 중단",
+        description="""
+        멀티파트 업로드를 중단하고 업로드된 파트를 삭제합니다
+        """,
+    )
+    @action(detail=True, methods=["POST"], url_path="multipart/abort")
+    def multipart_abort(self, request, *args, **kwargs):
+        return super().update(request, *args, **kwargs)
@@ -2,7 +2,7 @@ import hashlib
 
 from django.contrib import admin
 
-from .models import ShortUrl, ShortUrlVisit
+from .models import ShortUrl, ShortUrlVisit, ShortUrlVisitRollup
 
 
 @admin.register(ShortUrl)
@@ -110,6 +110,7 @@ class ShortUrlVisitAdmin(admin.ModelAdmin):
         "id",
         "short_url",
         "ip_address",
+        "user_agent_family",
         "referrer",
         "created_at",
     ]
@@ -117,7 +118,7 @@ class ShortUrlVisitAdmin(admin.ModelAdmin):
     readonly_fields = [
         "short_url",
         "ip_address",
-        "user_agent",
+        "user_agent_family",
         "referrer",
         "created_at",
     ]
@@ -128,7 +129,54 @@ class ShortUrlVisitAdmin(admin.ModelAdmin):
         "referrer",
     ]
 
-    list_filter = ["created_at"]
+    list_filter = ["user_agent_family", "created_at"]
+
+    def has_add_permission(self, request):
+        """생성 권한 비활성화"""
+        return False
+
+    def has_change_permission(self, request, obj=None):
+        """수정 권한 비활성화"""
+        return False
+
+    def has_delete_permission(self, request, obj=None):
+        """삭제 권한 비활성화"""
+        return False
+
+
+@admin.register(ShortUrlVisitRollup)
+class ShortUrlVisitRollupAdmin(admin.ModelAdmin):
+    """단축 URL 방문 집계 어드민"""
+
+    list_display = [
+        "id",
+        "short_url",
+        "period",
+        "bucket_at",
+        "referrer",
+        "user_agent_family",
+        "country",
+        "visit_count",
+    ]
+
+    readonly_fields = [
+        "short_url",
+        "period",
+        "bucket_at",
+        "referrer",
+        "user_agent_family",
+        "country",
+        "visit_count",
+        "updated_at",
+    ]
+
+    search_fields = [
+        "short_url__random_key",
+        "referrer",
+    ]
+
+    list_filter = ["period", "user_agent_family", "bucket_at"]
+    raw_id_fields = ["short_url"]
 
     def has_add_permission(self, request):
         """생성 권한 비활성화"""
@@ -0,0 +1,31 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.short_url.v1.services import (
+    convert_visit_table_to_partitioned,
+    is_partitioning_enabled,
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "Converts short_url_visit into a monthly range-partitioned table. Rows are "
+        "copied in batches, each in its own transaction, and the table is locked "
+        "only to copy the remaining rows and swap the tables. Run once before "
+        "enabling scheduled partition management; the command can be re-run to "
+        "resume an interrupted copy."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            help="Number of visits copied per transaction.",
+        )
+
+    def handle(self, *args, **options):
+        if not is_partitioning_enabled():
+            raise CommandError(
+                "Partitioning requires PostgreSQL and SHORT_URL_VISIT_PARTITIONING=True."
+            )
+        copied_count = convert_visit_table_to_partitioned(options["batch_size"])
+        self.stdout.write(f"{copied_count} visits copied to the partitioned table.")
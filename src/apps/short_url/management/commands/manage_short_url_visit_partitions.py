@@ -0,0 +1,34 @@
+from django.core.management.base import BaseCommand
+
+from apps.short_url.v1.services import (
+    delete_expired_visits,
+    is_partitioning_available,
+    manage_visit_partitions,
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "Creates future monthly partitions of short_url_visit and drops or archives "
+        "partitions older than SHORT_URL_VISIT_RETENTION_MONTHS. Without "
+        "partitioning (e.g. SQLite, or before convert_short_url_visit_table has "
+        "run), expired visits are deleted in batches."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--archive",
+            action="store_true",
+            help="Detach and rename expired partitions instead of dropping them.",
+        )
+
+    def handle(self, *args, **options):
+        if not is_partitioning_available():
+            deleted_count = delete_expired_visits()
+            self.stdout.write(f"{deleted_count} expired visits deleted.")
+            return
+
+        result = manage_visit_partitions(archive=options["archive"])
+        for key in ["created", "dropped", "archived"]:
+            for name in result[key]:
+                self.stdout.write(f"{key}: {name}")
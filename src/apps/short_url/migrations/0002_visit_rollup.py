@@ -0,0 +1,135 @@
+# Generated by Django 5.2.18 on 2026-10-19 08:00
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("short_url", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ShortUrlVisitRollup",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "period",
+                    models.PositiveSmallIntegerField(
+                        choices=[(1, "시간별"), (2, "일별")], verbose_name="집계 단위"
+                    ),
+                ),
+                ("bucket_at", models.DateTimeField(verbose_name="집계 시작 일시")),
+                (
+                    "referrer",
+                    models.CharField(
+                        blank=True, default="", max_length=255, verbose_name="레퍼러"
+                    ),
+                ),
+                (
+                    "user_agent_family",
+                    models.PositiveSmallIntegerField(
+                        choices=[
+                            (1, "기타"),
+                            (2, "iOS"),
+                            (3, "Android"),
+                            (4, "Windows"),
+                            (5, "macOS"),
+                            (6, "Linux"),
+                            (7, "봇"),
+                        ],
+                        default=1,
+                        verbose_name="사용자 에이전트 계열",
+                    ),
+                ),
+                (
+                    "country",
+                    models.CharField(
+                        blank=True, default="", max_length=2, verbose_name="국가 코드"
+                    ),
+                ),
+                (
+                    "visit_count",
+                    models.PositiveIntegerField(default=0, verbose_name="방문 수"),
+                ),
+                (
+                    "updated_at",
+                    models.DateTimeField(auto_now=True, verbose_name="수정 일시"),
+                ),
+            ],
+            options={
+                "verbose_name": "단축 URL 방문 집계",
+                "verbose_name_plural": "단축 URL 방문 집계",
+                "db_table": "short_url_visit_rollup",
+            },
+        ),
+        migrations.CreateModel(
+            name="ShortUrlVisitRollupCheckpoint",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "last_visit_id",
+                    models.BigIntegerField(
+                        default=0, verbose_name="마지막 집계 방문 ID"
+                    ),
+                ),
+                (
+                    "updated_at",
+                    models.DateTimeField(auto_now=True, verbose_name="수정 일시"),
+                ),
+            ],
+            options={
+                "verbose_name": "단축 URL 방문 집계 위치",
+                "verbose_name_plural": "단축 URL 방문 집계 위치",
+                "db_table": "short_url_visit_rollup_checkpoint",
+            },
+        ),
+        migrations.AddIndex(
+            model_name="shorturlvisit",
+            index=models.Index(
+                fields=["short_url", "created_at"],
+                name="short_url_v_short_u_72a62e_idx",
+            ),
+        ),
+        migrations.AddField(
+            model_name="shorturlvisitrollup",
+            name="short_url",
+            field=models.ForeignKey(
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="visit_rollups",
+                to="short_url.shorturl",
+                verbose_name="단축 URL",
+            ),
+        ),
+        migrations.AlterUniqueTogether(
+            name="shorturlvisitrollup",
+            unique_together={
+                (
+                    "short_url",
+                    "period",
+                    "bucket_at",
+                    "referrer",
+                    "user_agent_family",
+                    "country",
+                )
+            },
+        ),
+    ]
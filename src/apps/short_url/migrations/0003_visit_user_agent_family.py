@@ -0,0 +1,83 @@
+# Generated by Django 5.2.18 on 2026-10-19 08:04
+
+import re
+
+from django.db import migrations, models
+
+# 마이그레이션 작성 시점의 판별 규칙 (앱 코드 변경에 영향받지 않도록 복사해 사용)
+USER_AGENT_FAMILY_PATTERNS = [
+    (
+        7,
+        re.compile(
+            r"bot|crawler|spider|facebookexternalhit|facebookcatalog|kakaotalk-scrap"
+            r"|whatsapp|pinterest|slack-|skypeuripreview|iframely|embedly|vkshare"
+            r"|yeti|daumoa",
+            re.I,
+        ),
+    ),
+    (2, re.compile(r"iPhone|iPad|iPod", re.I)),
+    (3, re.compile(r"Android", re.I)),
+    (4, re.compile(r"Windows", re.I)),
+    (5, re.compile(r"Macintosh|Mac OS X", re.I)),
+    (6, re.compile(r"Linux|X11", re.I)),
+]
+
+
+def get_user_agent_family(user_agent):
+    """사용자 에이전트 계열 판별"""
+    for family, pattern in USER_AGENT_FAMILY_PATTERNS:
+        if pattern.search(user_agent):
+            return family
+    return 1
+
+
+def backfill_user_agent_family(apps, schema_editor):
+    """기존 방문 기록의 사용자 에이전트 계열 채우기"""
+    ShortUrlVisit = apps.get_model("short_url", "ShortUrlVisit")
+    visits = []
+    for visit in (
+        ShortUrlVisit.objects.exclude(user_agent__isnull=True)
+        .only("id", "user_agent")
+        .iterator(chunk_size=2000)
+    ):
+        visit.user_agent_family = get_user_agent_family(visit.user_agent)
+        visits.append(visit)
+        if len(visits) >= 2000:
+            ShortUrlVisit.objects.bulk_update(visits, ["user_agent_family"])
+            visits = []
+    ShortUrlVisit.objects.bulk_update(visits, ["user_agent_family"])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("short_url", "0002_visit_rollup"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="shorturlvisit",
+            name="user_agent_family",
+            field=models.PositiveSmallIntegerField(
+                choices=[
+                    (1, "기타"),
+                    (2, "iOS"),
+                    (3, "Android"),
+                    (4, "Windows"),
+                    (5, "macOS"),
+                    (6, "Linux"),
+                    (7, "봇"),
+                ],
+                default=1,
+                verbose_name="사용자 에이전트 계열",
+            ),
+        ),
+        migrations.RunPython(
+            backfill_user_agent_family,
+            reverse_code=migrations.RunPython.noop,
+        ),
+        migrations.RemoveField(
+            model_name="shorturlvisit",
+            name="user_agent",
+        ),
+    ]
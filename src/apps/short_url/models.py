@@ -1,6 +1,25 @@
 from django.db import models
 
 
+class UserAgentFamily(models.IntegerChoices):
+    """사용자 에이전트 계열"""
+
+    OTHER = 1, "기타"
+    IOS = 2, "iOS"
+    ANDROID = 3, "Android"
+    WINDOWS = 4, "Windows"
+    MACOS = 5, "macOS"
+    LINUX = 6, "Linux"
+    BOT = 7, "봇"
+
+
+class RollupPeriod(models.IntegerChoices):
+    """방문 집계 단위"""
+
+    HOURLY = 1, "시간별"
+    DAILY = 2, "일별"
+
+
 class ShortUrl(models.Model):
     """단축 URL"""
 
@@ -68,10 +87,14 @@ class ShortUrlVisit(models.Model):
         null=True,
         blank=True,
     )
-    user_agent = models.TextField(
-        verbose_name="사용자 에이전트",
-        null=True,
-        blank=True,
+    # [Why]
+    # Q. 사용자 에이전트 원문 대신 계열만 저장하는 이유는?
+    # A. 원문은 수백 바이트로 방문 기록 크기의 대부분을 차지하지만,
+    #    통계와 리다이렉트에는 계열 정보만 사용되기 때문
+    user_agent_family = models.PositiveSmallIntegerField(
+        choices=UserAgentFamily,
+        default=UserAgentFamily.OTHER,
+        verbose_name="사용자 에이전트 계열",
     )
     ip_address = models.GenericIPAddressField(
         verbose_name="IP 주소",
@@ -87,3 +110,90 @@ class ShortUrlVisit(models.Model):
         verbose_name = "단축 URL 방문"
         verbose_name_plural = "단축 URL 방문"
         db_table = "short_url_visit"
+        # [Why]
+        # Q. 단축 URL, 생성 일시를 복합 인덱스로 설정한 이유는?
+        # A. 방문 기록은 항상 특정 단축 URL의 기간 단위로 조회되기 때문
+        indexes = [
+            models.Index(fields=["short_url", "created_at"]),
+        ]
+
+
+# [Why]
+# Q. ShortUrlVisitRollup 모델을 만든 이유는?
+# A. 방문 기록은 계속 쌓이는 원본 테이블이므로 통계 조회 시 매번 스캔할 수 없음
+#    집계 태스크가 시간별/일별 방문 수를 미리 계산해두고, 통계는 이 테이블만 조회
+class ShortUrlVisitRollup(models.Model):
+    """단축 URL 방문 집계"""
+
+    short_url = models.ForeignKey(
+        ShortUrl,
+        on_delete=models.CASCADE,
+        related_name="visit_rollups",
+        verbose_name="단축 URL",
+    )
+    period = models.PositiveSmallIntegerField(
+        choices=RollupPeriod,
+        verbose_name="집계 단위",
+    )
+    bucket_at = models.DateTimeField(
+        verbose_name="집계 시작 일시",
+    )
+    # [Why]
+    # Q. 집계 차원을 null 대신 빈 문자열/기본값으로 저장하는 이유는?
+    # A. 유니크 제약에서 NULL 은 서로 다른 값으로 취급되어 중복 행이 생길 수 있기 때문
+    referrer = models.CharField(
+        max_length=255,
+        default="",
+        blank=True,
+        verbose_name="레퍼러",
+    )
+    user_agent_family = models.PositiveSmallIntegerField(
+        choices=UserAgentFamily,
+        default=UserAgentFamily.OTHER,
+        verbose_name="사용자 에이전트 계열",
+    )
+    country = models.CharField(
+        max_length=2,
+        default="",
+        blank=True,
+        verbose_name="국가 코드",
+    )
+    visit_count = models.PositiveIntegerField(
+        default=0,
+        verbose_name="방문 수",
+    )
+    updated_at = models.DateTimeField(
+        auto_now=True,
+        verbose_name="수정 일시",
+    )
+
+    class Meta:
+        verbose_name = "단축 URL 방문 집계"
+        verbose_name_plural = "단축 URL 방문 집계"
+        db_table = "short_url_visit_rollup"
+        unique_together = [
+            "short_url",
+            "period",
+            "bucket_at",
+            "referrer",
+            "user_agent_family",
+            "country",
+        ]
+
+
+class ShortUrlVisitRollupCheckpoint(models.Model):
+    """단축 URL 방문 집계 위치"""
+
+    last_visit_id = models.BigIntegerField(
+        default=0,
+        verbose_name="마지막 집계 방문 ID",
+    )
+    updated_at = models.DateTimeField(
+        auto_now=True,
+        verbose_name="수정 일시",
+    )
+
+    class Meta:
+        verbose_name = "단축 URL 방문 집계 위치"
+        verbose_name_plural = "단축 URL 방문 집계 위치"
+        db_table = "short_url_visit_rollup_checkpoint"
@@ -0,0 +1,25 @@
+from django_filters import rest_framework as filters
+
+from apps.short_url.models import ShortUrlVisitRollup, RollupPeriod
+
+
+class ShortUrlVisitRollupFilterSet(filters.FilterSet):
+    """단축 URL 방문 집계 필터셋"""
+
+    short_url = filters.NumberFilter(
+        field_name="short_url_id",
+        lookup_expr="exact",
+        required=True,
+        label="단축 URL ID (필수)",
+    )
+    period = filters.ChoiceFilter(
+        choices=RollupPeriod.choices,
+        required=True,
+        label="집계 단위 (필수)",
+    )
+
+    class Meta:
+        model = ShortUrlVisitRollup
+        fields = {
+            "bucket_at": ["gte", "lt"],
+        }
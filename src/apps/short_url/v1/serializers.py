@@ -2,8 +2,16 @@ import hashlib
 
 from rest_framework import serializers
 
-from apps.short_url.models import ShortUrl, ShortUrlVisit
-from apps.short_url.v1.utils import generate_random_key, id_to_key
+from apps.short_url.models import (
+    ShortUrl,
+    ShortUrlVisit,
+    UserAgentFamily,
+)
+from apps.short_url.v1.utils import (
+    generate_random_key,
+    id_to_key,
+    get_user_agent_family,
+)
 from base.enums.errors import (
     E005_HASHED_VALUE_ALREADY_EXISTS,
     E005_INVALID_OG_TAG_FORMAT,
@@ -111,14 +119,16 @@ class ShortUrlRedirectSerializer(serializers.ModelSerializer):
             ip_address = request.META.get("REMOTE_ADDR")
 
         # 추가 데이터 추출
-        user_agent = request.META.get("HTTP_USER_AGENT")
+        user_agent_family = get_user_agent_family(
+            request.META.get("HTTP_USER_AGENT", "")
+        )
         referrer = request.query_params.get("referrer")
 
         # 방문 기록 생성
         ShortUrlVisit.objects.create(
             short_url=self.instance,
             referrer=referrer,
-            user_agent=user_agent,
+            user_agent_family=user_agent_family,
             ip_address=ip_address,
         )
 
@@ -134,3 +144,20 @@ class ShortUrlRedirectSerializer(serializers.ModelSerializer):
             "hashed_value",
             "og_tag",
         ]
+
+
+class ShortUrlVisitRollupSerializer(serializers.Serializer):
+    """
+    단축 URL 방문 집계 시리얼라이저:
+    집계 테이블을 기간별, 선택한 차원별로 합산한 방문 수 반환
+    """
+
+    bucket_at = serializers.DateTimeField(help_text="집계 시작 일시")
+    referrer = serializers.CharField(required=False, help_text="레퍼러")
+    user_agent_family = serializers.ChoiceField(
+        choices=UserAgentFamily.choices,
+        required=False,
+        help_text="사용자 에이전트 계열",
+    )
+    country = serializers.CharField(required=False, help_text="국가 코드")
+    visit_count = serializers.IntegerField(help_text="방문 수")
@@ -0,0 +1,340 @@
+import datetime
+import logging
+
+from django.conf import settings
+from django.db import connections, router, transaction
+from django.utils import timezone
+
+from apps.short_url.models import ShortUrlVisit
+
+logger = logging.getLogger(__name__)
+
+VISIT_TABLE = ShortUrlVisit._meta.db_table
+VISIT_PARTITION_PREFIX = f"{VISIT_TABLE}_p"
+VISIT_ARCHIVE_PREFIX = f"{VISIT_TABLE}_archive_p"
+VISIT_PARTITIONED_TABLE = f"{VISIT_TABLE}_partitioned"
+VISIT_PARTITIONED_SEQUENCE = f"{VISIT_TABLE}_partitioned_id_seq"
+
+
+def add_months(date: datetime.date, months: int) -> datetime.date:
+    """월 단위 날짜 계산(항상 1일 기준)"""
+    month_index = date.year * 12 + (date.month - 1) + months
+    return datetime.date(month_index // 12, month_index % 12 + 1, 1)
+
+
+def get_retention_cutoff(now: datetime.datetime = None) -> datetime.date:
+    """보관 기간이 지난 방문 기록의 기준일(UTC 월초) 조회"""
+    now = now or timezone.now()
+    this_month = now.astimezone(datetime.timezone.utc).date().replace(day=1)
+    return add_months(this_month, -settings.SHORT_URL_VISIT_RETENTION_MONTHS)
+
+
+def get_partition_name(month: datetime.date) -> str:
+    """월별 파티션 테이블명 조회"""
+    return f"{VISIT_PARTITION_PREFIX}{month:%Y%m}"
+
+
+def parse_partition_month(name: str) -> datetime.date | None:
+    """파티션 테이블명에서 월 조회"""
+    if not name.startswith(VISIT_PARTITION_PREFIX):
+        return None
+    try:
+        return datetime.datetime.strptime(
+            name[len(VISIT_PARTITION_PREFIX) :], "%Y%m"
+        ).date()
+    except ValueError:
+        return None
+
+
+def get_visit_connection():
+    """방문 기록이 저장된 데이터베이스 연결 조회"""
+    return connections[router.db_for_write(ShortUrlVisit)]
+
+
+def is_visit_table_partitioned(cursor) -> bool:
+    """방문 기록 테이블의 파티션 테이블 여부 확인"""
+    cursor.execute(
+        "SELECT relkind FROM pg_class WHERE oid = to_regclass(%s)",
+        [VISIT_TABLE],
+    )
+    row = cursor.fetchone()
+    return bool(row) and row[0] == "p"
+
+
+def is_partitioning_enabled(connection=None) -> bool:
+    """파티셔닝 설정 여부 확인 (PostgreSQL 에서만 사용 가능)"""
+    connection = connection or get_visit_connection()
+    return settings.SHORT_URL_VISIT_PARTITIONING and connection.vendor == "postgresql"
+
+
+def is_partitioning_available(connection=None) -> bool:
+    """파티셔닝 사용 가능 여부 확인 (파티션 테이블로 변환된 경우에만 사용)"""
+    connection = connection or get_visit_connection()
+    if not is_partitioning_enabled(connection):
+        return False
+    with connection.cursor() as cursor:
+        if is_visit_table_partitioned(cursor):
+            return True
+    logger.warning(
+        f"{VISIT_TABLE} is not partitioned yet. "
+        f"Run convert_short_url_visit_table to enable partitioning."
+    )
+    return False
+
+
+def create_visit_partition(cursor, month: datetime.date, table: str = VISIT_TABLE):
+    """월별 파티션 생성"""
+    cursor.execute(
+        f"CREATE TABLE IF NOT EXISTS {get_partition_name(month)} "
+        f"PARTITION OF {table} FOR VALUES FROM (%s) TO (%s)",
+        [f"{month.isoformat()} 00:00:00+00", f"{add_months(month, 1)} 00:00:00+00"],
+    )
+
+
+def get_premake_until(now: datetime.datetime = None) -> datetime.date:
+    """미리 생성할 마지막 파티션 월 조회"""
+    now = now or timezone.now()
+    this_month = now.astimezone(datetime.timezone.utc).date().replace(day=1)
+    return add_months(this_month, settings.SHORT_URL_VISIT_PARTITION_PREMAKE_MONTHS)
+
+
+def create_partitioned_visit_table(cursor):
+    """
+    월별 범위 파티션 테이블 생성:
+    기존 방문 기록 범위와 미리 생성할 범위의 파티션, 인덱스, 외래 키를 함께 생성
+    (이미 생성된 경우 이어서 진행할 수 있도록 생성하지 않은 항목만 생성)
+    """
+    # [Why]
+    # Q. 기본 키를 (id, created_at)으로 변경하는 이유는?
+    # A. PostgreSQL 파티션 테이블의 기본 키에는 파티션 키가 반드시 포함되어야 함
+    #    id는 시퀀스로만 발급되므로 고유성은 그대로 유지됨
+    #    (마이그레이션 상태의 기본 키는 id 이므로 이 테이블을 변경하는 마이그레이션은
+    #    실제 스키마를 확인한 뒤 작성해야 함)
+
+    # [Why]
+    # Q. 외래 키에 ON DELETE CASCADE 를 지정하는 이유는?
+    # A. 변환 중에는 Django 가 기존 테이블의 방문 기록만 삭제하므로,
+    #    단축 URL 삭제 시 이미 복사한 방문 기록도 함께 삭제되어 커밋이 실패하지 않도록 하기 위함
+    cursor.execute("SELECT to_regclass(%s) IS NOT NULL", [VISIT_PARTITIONED_TABLE])
+    if not cursor.fetchone()[0]:
+        cursor.execute(
+            f"CREATE TABLE {VISIT_PARTITIONED_TABLE} "
+            f"(LIKE {VISIT_TABLE} INCLUDING DEFAULTS) PARTITION BY RANGE (created_at)"
+        )
+        cursor.execute(
+            f"ALTER TABLE {VISIT_PARTITIONED_TABLE} ADD PRIMARY KEY (id, created_at)"
+        )
+        cursor.execute(
+            f"CREATE SEQUENCE {VISIT_PARTITIONED_SEQUENCE} "
+            f"OWNED BY {VISIT_PARTITIONED_TABLE}.id"
+        )
+        cursor.execute(
+            f"ALTER TABLE {VISIT_PARTITIONED_TABLE} "
+            f"ALTER COLUMN id SET DEFAULT nextval(%s)",
+            [VISIT_PARTITIONED_SEQUENCE],
+        )
+        cursor.execute(
+            f"ALTER TABLE {VISIT_PARTITIONED_TABLE} "
+            f"ADD CONSTRAINT {VISIT_TABLE}_short_url_id_fk "
+            f"FOREIGN KEY (short_url_id) REFERENCES short_url (id) "
+            f"ON DELETE CASCADE DEFERRABLE INITIALLY DEFERRED"
+        )
+        # 인덱스명은 기존 테이블과 겹치지 않도록 임시 이름으로 생성 후 교체 시 변경
+        for index in ShortUrlVisit._meta.indexes:
+            columns = ", ".join(
+                ShortUrlVisit._meta.get_field(field).column for field in index.fields
+            )
+            cursor.execute(
+                f"CREATE INDEX {index.name}_p ON {VISIT_PARTITIONED_TABLE} ({columns})"
+            )
+
+    # 기존 데이터 범위와 미리 생성할 범위의 파티션 생성
+    premake_until = get_premake_until()
+    cursor.execute(f"SELECT MIN(created_at) FROM {VISIT_TABLE}")
+    oldest = cursor.fetchone()[0]
+    month = premake_until
+    if oldest:
+        month = min(
+            oldest.astimezone(datetime.timezone.utc).date().replace(day=1),
+            premake_until,
+        )
+    while month <= premake_until:
+        create_visit_partition(cursor, month, table=VISIT_PARTITIONED_TABLE)
+        month = add_months(month, 1)
+
+
+def copy_visits_to_partitioned_table(cursor, batch_size: int) -> int:
+    """
+    파티션 테이블로 방문 기록 복사:
+    복사한 마지막 ID 이후의 방문 기록을 ID 순으로 한 배치만 복사
+
+    Returns:
+        int: 복사한 방문 기록 수
+    """
+    cursor.execute(
+        f"INSERT INTO {VISIT_PARTITIONED_TABLE} "
+        f"SELECT * FROM {VISIT_TABLE} "
+        f"WHERE id > (SELECT COALESCE(MAX(id), 0) FROM {VISIT_PARTITIONED_TABLE}) "
+        f"ORDER BY id LIMIT %s",
+        [batch_size],
+    )
+    return cursor.rowcount
+
+
+def swap_visit_table(cursor) -> int:
+    """
+    방문 기록 테이블 교체:
+    기존 테이블을 잠근 뒤 복사되지 않은 최근 방문 기록만 복사하고 파티션 테이블로 교체
+
+    Returns:
+        int: 잠근 뒤 복사한 방문 기록 수
+    """
+    cursor.execute(f"LOCK TABLE {VISIT_TABLE} IN ACCESS EXCLUSIVE MODE")
+    # [Why]
+    # Q. 복사한 마지막 ID 이후가 아닌 최근 ID 범위에서 복사되지 않은 방문 기록을 찾는 이유는?
+    # A. ID 는 발급 순서대로 커밋되지 않으므로, 나눠서 복사하는 동안
+    #    더 큰 ID 가 먼저 복사된 뒤 커밋된 방문 기록은 마지막 ID 기준으로는 누락됨
+    #    잠근 뒤에는 모든 방문 기록이 커밋된 상태이므로 최근 범위만 다시 비교해 복사
+    cursor.execute(f"SELECT COALESCE(MAX(id), 0) FROM {VISIT_PARTITIONED_TABLE}")
+    recheck_from_id = (
+        cursor.fetchone()[0] - settings.SHORT_URL_VISIT_CONVERT_RECHECK_SIZE
+    )
+    cursor.execute(
+        f"INSERT INTO {VISIT_PARTITIONED_TABLE} "
+        f"SELECT * FROM {VISIT_TABLE} AS visit WHERE visit.id > %s "
+        f"AND NOT EXISTS (SELECT 1 FROM {VISIT_PARTITIONED_TABLE} AS copied "
+        f"WHERE copied.id = visit.id)",
+        [recheck_from_id],
+    )
+    copied_count = cursor.rowcount
+    cursor.execute(
+        f"SELECT setval(%s, COALESCE((SELECT MAX(id) FROM {VISIT_TABLE}), 0) + 1, "
+        f"false)",
+        [VISIT_PARTITIONED_SEQUENCE],
+    )
+    cursor.execute(f"DROP TABLE {VISIT_TABLE}")
+    cursor.execute(f"ALTER TABLE {VISIT_PARTITIONED_TABLE} RENAME TO {VISIT_TABLE}")
+    cursor.execute(
+        f"ALTER SEQUENCE {VISIT_PARTITIONED_SEQUENCE} RENAME TO {VISIT_TABLE}_id_seq"
+    )
+    for index in ShortUrlVisit._meta.indexes:
+        cursor.execute(f"ALTER INDEX {index.name}_p RENAME TO {index.name}")
+    return copied_count
+
+
+def convert_visit_table_to_partitioned(batch_size: int = None) -> int:
+    """
+    방문 기록 테이블을 월별 범위 파티션 테이블로 변환 (운영자가 한 번만 실행):
+    파티션 테이블을 만들고 배치마다 별도 트랜잭션으로 복사한 뒤,
+    짧은 트랜잭션에서 남은 방문 기록만 복사하고 테이블을 교체
+
+    Args:
+        batch_size (int): 한 트랜잭션에서 복사할 방문 기록 수
+
+    Returns:
+        int: 복사한 방문 기록 수
+    """
+    # [Why]
+    # Q. 한 트랜잭션에서 복사하지 않고 나눠서 복사하는 이유는?
+    # A. 대량의 방문 기록을 복사하는 동안 기존 테이블을 잠그지 않고,
+    #    중단되어도 복사한 위치부터 다시 실행할 수 있도록 하기 위함
+    batch_size = batch_size or settings.SHORT_URL_VISIT_CONVERT_BATCH_SIZE
+    connection = get_visit_connection()
+    with transaction.atomic(using=connection.alias), connection.cursor() as cursor:
+        if is_visit_table_partitioned(cursor):
+            return 0
+        create_partitioned_visit_table(cursor)
+
+    copied_count = 0
+    while True:
+        with transaction.atomic(using=connection.alias), connection.cursor() as cursor:
+            count = copy_visits_to_partitioned_table(cursor, batch_size)
+        copied_count += count
+        if count < batch_size:
+            break
+
+    with transaction.atomic(using=connection.alias), connection.cursor() as cursor:
+        # 변환 중 월이 바뀐 경우를 위해 파티션을 다시 확인
+        create_partitioned_visit_table(cursor)
+        copied_count += swap_visit_table(cursor)
+    return copied_count
+
+
+def manage_visit_partitions(archive: bool = False) -> dict:
+    """
+    방문 기록 파티션 관리:
+    미래 파티션을 미리 생성하고, 보관 기간이 지난 파티션은 분리 후 삭제(또는 보관)
+    """
+    result = {"created": [], "dropped": [], "archived": []}
+    now = timezone.now()
+    this_month = now.astimezone(datetime.timezone.utc).date().replace(day=1)
+    premake_until = get_premake_until(now)
+    cutoff = get_retention_cutoff(now)
+    connection = get_visit_connection()
+
+    with transaction.atomic(using=connection.alias), connection.cursor() as cursor:
+        # 테이블 변환은 convert_short_url_visit_table 명령으로만 진행
+        if not is_visit_table_partitioned(cursor):
+            logger.warning(f"{VISIT_TABLE} is not partitioned, skipping.")
+            return result
+
+        # 현재 파티션 목록 조회
+        cursor.execute(
+            "SELECT c.relname FROM pg_inherits i "
+            "JOIN pg_class c ON c.oid = i.inhrelid "
+            "WHERE i.inhparent = to_regclass(%s)",
+            [VISIT_TABLE],
+        )
+        partitions = {row[0] for row in cursor.fetchall()}
+
+        # 미래 파티션 생성
+        month = this_month
+        while month <= premake_until:
+            name = get_partition_name(month)
+            if name not in partitions:
+                create_visit_partition(cursor, month)
+                result["created"].append(name)
+            month = add_months(month, 1)
+
+        # 만료 파티션 분리
+        for name in sorted(partitions):
+            month = parse_partition_month(name)
+            if month is None or add_months(month, 1) > cutoff:
+                continue
+            cursor.execute(f"ALTER TABLE {VISIT_TABLE} DETACH PARTITION {name}")
+            if archive:
+                # [Why]
+                # Q. 보관 시 테이블을 분리만 하고 이름을 바꾸는 이유는?
+                # A. 분리된 테이블은 원본 테이블의 삽입/VACUUM 대상에서 제외되며,
+                #    덤프 후 외부 저장소로 옮기기 전까지 그대로 조회할 수 있음
+                archive_name = f"{VISIT_ARCHIVE_PREFIX}{month:%Y%m}"
+                cursor.execute(f"ALTER TABLE {name} RENAME TO {archive_name}")
+                result["archived"].append(archive_name)
+            else:
+                cursor.execute(f"DROP TABLE {name}")
+                result["dropped"].append(name)
+    return result
+
+
+def delete_expired_visits(batch_size: int = None) -> int:
+    """보관 기간이 지난 방문 기록 삭제(파티셔닝 미사용 시)"""
+    batch_size = batch_size or settings.SHORT_URL_VISIT_DELETE_BATCH_SIZE
+    cutoff = get_retention_cutoff()
+    cutoff_at = datetime.datetime.combine(
+        cutoff, datetime.time.min, tzinfo=datetime.timezone.utc
+    )
+    deleted_count = 0
+    while True:
+        # [Why]
+        # Q. 한 번에 삭제하지 않고 나눠서 삭제하는 이유는?
+        # A. 대량 삭제 시 테이블 잠금과 트랜잭션 크기가 커지는 것을 방지하기 위함
+        visit_ids = list(
+            ShortUrlVisit.objects.filter(created_at__lt=cutoff_at)
+            .order_by("id")
+            .values_list("id", flat=True)[:batch_size]
+        )
+        if not visit_ids:
+            break
+        count, _ = ShortUrlVisit.objects.filter(id__in=visit_ids).delete()
+        deleted_count += count
+    return deleted_count
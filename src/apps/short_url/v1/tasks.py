@@ -0,0 +1,152 @@
+import collections
+import datetime
+
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+
+from apps.short_url.models import (
+    RollupPeriod,
+    ShortUrlVisit,
+    ShortUrlVisitRollup,
+    ShortUrlVisitRollupCheckpoint,
+)
+from apps.short_url.v1.services import (
+    delete_expired_visits,
+    is_partitioning_available,
+    manage_visit_partitions,
+)
+from apps.short_url.v1.utils import get_country_code
+from conf.celery import app
+
+
+def get_bucket_at(created_at: datetime.datetime, period: int) -> datetime.datetime:
+    """집계 단위별 시작 일시 조회"""
+    bucket_at = timezone.localtime(created_at).replace(
+        minute=0, second=0, microsecond=0
+    )
+    if period == RollupPeriod.DAILY:
+        bucket_at = bucket_at.replace(hour=0)
+    return bucket_at
+
+
+def merge_visit_rollups(counter: collections.Counter):
+    """집계 결과를 기존 집계 데이터에 합산"""
+    if not counter:
+        return
+    short_url_ids = {key[0] for key in counter}
+    bucket_ats = {key[2] for key in counter}
+    existing_rollups = {
+        (
+            rollup.short_url_id,
+            rollup.period,
+            rollup.bucket_at,
+            rollup.referrer,
+            rollup.user_agent_family,
+            rollup.country,
+        ): rollup
+        for rollup in ShortUrlVisitRollup.objects.select_for_update().filter(
+            short_url_id__in=short_url_ids,
+            bucket_at__in=bucket_ats,
+        )
+    }
+    created_rollups = []
+    updated_rollups = []
+    # bulk_update 는 auto_now 를 적용하지 않으므로 직접 설정
+    now = timezone.now()
+    for key, count in counter.items():
+        rollup = existing_rollups.get(key)
+        if rollup:
+            rollup.visit_count += count
+            rollup.updated_at = now
+            updated_rollups.append(rollup)
+            continue
+        short_url_id, period, bucket_at, referrer, user_agent_family, country = key
+        created_rollups.append(
+            ShortUrlVisitRollup(
+                short_url_id=short_url_id,
+                period=period,
+                bucket_at=bucket_at,
+                referrer=referrer,
+                user_agent_family=user_agent_family,
+                country=country,
+                visit_count=count,
+            )
+        )
+    ShortUrlVisitRollup.objects.bulk_create(created_rollups)
+    ShortUrlVisitRollup.objects.bulk_update(
+        updated_rollups, fields=["visit_count", "updated_at"]
+    )
+
+
+@app.task
+def task_rollup_short_url_visits(batch_size: int = None):
+    """
+    단축 URL 방문 집계:
+    마지막으로 집계한 방문 ID 이후의 방문 기록만 읽어 시간별/일별 집계에 합산
+    집계와 집계 위치 갱신은 하나의 트랜잭션으로 처리해 중복 집계를 방지
+    """
+    batch_size = batch_size or settings.SHORT_URL_VISIT_ROLLUP_BATCH_SIZE
+    # [Why]
+    # Q. 방금 생성된 방문 기록을 집계에서 제외하는 이유는?
+    # A. ID는 커밋 순서와 다르게 발급될 수 있어, 아직 커밋되지 않은 방문 기록을
+    #    건너뛰고 집계 위치가 앞서 나가는 것을 방지하기 위함
+    settled_at = timezone.now() - datetime.timedelta(
+        seconds=settings.SHORT_URL_VISIT_ROLLUP_DELAY
+    )
+    total_count = 0
+    while True:
+        with transaction.atomic():
+            checkpoints = ShortUrlVisitRollupCheckpoint.objects.select_for_update()
+            checkpoint, _ = checkpoints.get_or_create(id=1)
+            visits = list(
+                ShortUrlVisit.objects.filter(
+                    id__gt=checkpoint.last_visit_id,
+                    created_at__lt=settled_at,
+                )
+                .order_by("id")
+                .values(
+                    "id",
+                    "short_url_id",
+                    "referrer",
+                    "user_agent_family",
+                    "ip_address",
+                    "created_at",
+                )[:batch_size]
+            )
+            if not visits:
+                break
+
+            counter = collections.Counter()
+            for visit in visits:
+                dimensions = (
+                    (visit["referrer"] or "")[:255],
+                    visit["user_agent_family"],
+                    # 국가를 알 수 없으면 빈 값으로 집계
+                    get_country_code(visit["ip_address"]) or "",
+                )
+                for period in RollupPeriod:
+                    bucket_at = get_bucket_at(visit["created_at"], period)
+                    counter[
+                        (visit["short_url_id"], period, bucket_at, *dimensions)
+                    ] += 1
+            merge_visit_rollups(counter)
+
+            checkpoint.last_visit_id = visits[-1]["id"]
+            checkpoint.save(update_fields=["last_visit_id", "updated_at"])
+        total_count += len(visits)
+        if len(visits) < batch_size:
+            break
+    return f"{total_count} visits rolled up"
+
+
+@app.task
+def task_manage_short_url_visit_partitions():
+    """
+    단축 URL 방문 기록 보관 관리:
+    PostgreSQL 파티셔닝 사용 시 파티션 생성/삭제, 그 외에는 만료 방문 기록 삭제
+    """
+    if not is_partitioning_available():
+        return f"{delete_expired_visits()} expired visits deleted"
+    result = manage_visit_partitions()
+    return f"{len(result['created'])} created, {len(result['dropped'])} dropped"
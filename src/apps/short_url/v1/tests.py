@@ -1,13 +1,37 @@
-from unittest import mock
+from unittest import mock, skipUnless
 
-from django.test import TestCase
+from io import StringIO
+
+from django.core.management import call_command, CommandError
+from django.db import connection
+from django.test import TestCase, TransactionTestCase, override_settings
 from django.urls import reverse
+from freezegun import freeze_time
 from rest_framework import status
-from rest_framework.test import APITestCase, APIClient
-
-from apps.short_url.models import ShortUrl
+from rest_framework.test import APITestCase, APIClient, APIRequestFactory
+
+from apps.short_url.models import (
+    ShortUrl,
+    ShortUrlVisit,
+    ShortUrlVisitRollup,
+    RollupPeriod,
+    UserAgentFamily,
+)
 from apps.short_url.v1.serializers import ShortUrlSerializer
-from apps.short_url.v1.utils import id_to_key, key_to_id
+from apps.short_url.v1.services import (
+    VISIT_TABLE,
+    add_months,
+    get_partition_name,
+    is_visit_table_partitioned,
+    manage_visit_partitions,
+    parse_partition_month,
+)
+from apps.short_url.v1.tasks import (
+    task_manage_short_url_visit_partitions,
+    task_rollup_short_url_visits,
+)
+from apps.short_url.v1.utils import id_to_key, key_to_id, get_user_agent_family
+from apps.short_url.v1.views import ShortUrlRedirectView
 from apps.user.models import User
 from base.enums.errors import E005_HASHED_VALUE_ALREADY_EXISTS
 
@@ -263,3 +287,335 @@ class UtilsTestCase(TestCase):
             import re
 
             self.assertTrue(re.match(r"^[a-zA-Z0-9]+$", key))
+
+
+IPHONE_USER_AGENT = (
+    "Mozilla/5.0 (iPhone; CPU iPhone OS 17_0 like Mac OS X) "
+    "AppleWebKit/605.1.15 (KHTML, like Gecko) Version/17.0 Mobile/15E148 Safari/604.1"
+)
+ANDROID_USER_AGENT = (
+    "Mozilla/5.0 (Linux; Android 14; SM-S918N) "
+    "AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0 Mobile Safari/537.36"
+)
+
+
+class ShortUrlVisitRollupTaskTestCase(TestCase):
+    """단축 URL 방문 집계 태스크 테스트 케이스"""
+
+    def setUp(self):
+        self.short_url = ShortUrl.objects.create(
+            random_key="abcd",
+            default_fallback_url="https://example.com",
+            hashed_value="hash",
+        )
+
+    def create_visit(self, user_agent, referrer=None):
+        return ShortUrlVisit.objects.create(
+            short_url=self.short_url,
+            referrer=referrer,
+            user_agent_family=get_user_agent_family(user_agent),
+            ip_address="127.0.0.1",
+        )
+
+    def test_사용자_에이전트_계열_판별(self):
+        """사용자 에이전트 계열이 올바르게 판별되는지 테스트"""
+        self.assertEqual(get_user_agent_family(IPHONE_USER_AGENT), UserAgentFamily.IOS)
+        self.assertEqual(
+            get_user_agent_family(ANDROID_USER_AGENT), UserAgentFamily.ANDROID
+        )
+        self.assertEqual(get_user_agent_family("Googlebot/2.1"), UserAgentFamily.BOT)
+        self.assertEqual(get_user_agent_family(None), UserAgentFamily.OTHER)
+
+    def test_링크_미리보기_요청은_봇으로_판별(self):
+        """메신저, SNS 의 링크 미리보기 요청이 봇으로 판별되는지 테스트"""
+        for user_agent in [
+            "WhatsApp/2.23.20.0",
+            "Pinterest/0.2 (+https://www.pinterest.com/bot.html)",
+            "Slack-LinkExpanding 1.0 (+https://api.slack.com/robots)",
+            "Slackbot-LinkExpanding 1.0 (+https://api.slack.com/robots)",
+            "Mozilla/5.0 (compatible; Discordbot/2.0; +https://discordapp.com)",
+            "Twitterbot/1.0",
+            "TelegramBot (like TwitterBot)",
+            "kakaotalk-scrap/1.0",
+        ]:
+            with self.subTest(user_agent=user_agent):
+                self.assertEqual(get_user_agent_family(user_agent), UserAgentFamily.BOT)
+
+    def test_성공__시간별_일별_집계(self):
+        """방문 기록이 시간별/일별로 집계되는지 테스트"""
+        with freeze_time("2025-01-01 01:10:00"):
+            self.create_visit(IPHONE_USER_AGENT, referrer="kakao")
+            self.create_visit(IPHONE_USER_AGENT, referrer="kakao")
+        with freeze_time("2025-01-01 02:10:00"):
+            self.create_visit(ANDROID_USER_AGENT)
+
+        with freeze_time("2025-01-01 03:00:00"):
+            task_rollup_short_url_visits()
+
+        hourly = ShortUrlVisitRollup.objects.filter(period=RollupPeriod.HOURLY)
+        daily = ShortUrlVisitRollup.objects.filter(period=RollupPeriod.DAILY)
+        self.assertEqual(hourly.count(), 2)
+        self.assertEqual(daily.count(), 2)
+        ios_daily = daily.get(user_agent_family=UserAgentFamily.IOS)
+        self.assertEqual(ios_daily.visit_count, 2)
+        self.assertEqual(ios_daily.referrer, "kakao")
+
+    def test_성공__마지막_집계_이후_방문만_합산(self):
+        """재실행 시 중복 집계 없이 새 방문만 합산되는지 테스트"""
+        with freeze_time("2025-01-01 01:10:00"):
+            self.create_visit(IPHONE_USER_AGENT)
+        with freeze_time("2025-01-01 01:30:00"):
+            task_rollup_short_url_visits()
+            # 집계 대기 시간 이내의 방문은 다음 실행으로 미뤄짐
+            self.create_visit(IPHONE_USER_AGENT)
+            task_rollup_short_url_visits()
+        with freeze_time("2025-01-01 01:50:00"):
+            task_rollup_short_url_visits(batch_size=1)
+
+        rollup = ShortUrlVisitRollup.objects.get(period=RollupPeriod.HOURLY)
+        self.assertEqual(rollup.visit_count, 2)
+        # 기존 집계에 합산 시 수정 일시도 갱신
+        self.assertEqual(rollup.updated_at.isoformat(), "2025-01-01T01:50:00+00:00")
+
+
+class ShortUrlVisitRollupViewSetTestCase(APITestCase):
+    """단축 URL 방문 통계 뷰셋 테스트 케이스"""
+
+    def setUp(self):
+        self.client = APIClient()
+        self.url = reverse("short-url-stats-list")
+        self.admin = User.objects.create_user(
+            email="admin@test.com", password="test", is_staff=True
+        )
+        self.user = User.objects.create_user(email="test@test.com", password="test")
+        self.short_url = ShortUrl.objects.create(
+            random_key="abcd",
+            default_fallback_url="https://example.com",
+            hashed_value="hash",
+        )
+        with freeze_time("2025-01-01 01:00:00"):
+            for family, count in [
+                (UserAgentFamily.IOS, 3),
+                (UserAgentFamily.ANDROID, 2),
+            ]:
+                for country in ["KR", "US"]:
+                    ShortUrlVisitRollup.objects.create(
+                        short_url=self.short_url,
+                        period=RollupPeriod.DAILY,
+                        bucket_at="2025-01-01T00:00:00+09:00",
+                        user_agent_family=family,
+                        country=country,
+                        visit_count=count,
+                    )
+
+    def test_실패__관리자가_아닌_사용자(self):
+        """관리자가 아닌 사용자의 통계 조회가 거부되는지 테스트"""
+        self.client.force_authenticate(user=self.user)
+        response = self.client.get(
+            self.url, {"short_url": self.short_url.id, "period": RollupPeriod.DAILY}
+        )
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+    def test_성공__기간별_합산(self):
+        """차원 지정 없이 기간별 방문 수가 합산되는지 테스트"""
+        self.client.force_authenticate(user=self.admin)
+        response = self.client.get(
+            self.url, {"short_url": self.short_url.id, "period": RollupPeriod.DAILY}
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data), 1)
+        self.assertEqual(response.data[0]["visit_count"], 10)
+
+    def test_성공__차원별_합산(self):
+        """지정한 차원별로 방문 수가 합산되는지 테스트"""
+        self.client.force_authenticate(user=self.admin)
+        response = self.client.get(
+            self.url,
+            {
+                "short_url": self.short_url.id,
+                "period": RollupPeriod.DAILY,
+                "group_by": "user_agent_family",
+            },
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        counts = {row["user_agent_family"]: row["visit_count"] for row in response.data}
+        self.assertEqual(counts, {UserAgentFamily.IOS: 6, UserAgentFamily.ANDROID: 4})
+
+    def test_실패__지원하지_않는_차원(self):
+        """지원하지 않는 차원으로 조회 시 실패하는지 테스트"""
+        self.client.force_authenticate(user=self.admin)
+        response = self.client.get(
+            self.url,
+            {
+                "short_url": self.short_url.id,
+                "period": RollupPeriod.DAILY,
+                "group_by": "ip_address",
+            },
+        )
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+
+class ShortUrlVisitRetentionTestCase(TestCase):
+    """단축 URL 방문 기록 보관 테스트 케이스"""
+
+    def setUp(self):
+        self.short_url = ShortUrl.objects.create(
+            random_key="abcd",
+            default_fallback_url="https://example.com",
+            hashed_value="hash",
+        )
+
+    def test_월_단위_계산과_파티션명(self):
+        """월 단위 날짜 계산과 파티션명 변환이 올바른지 테스트"""
+        import datetime
+
+        self.assertEqual(
+            add_months(datetime.date(2025, 1, 1), -1), datetime.date(2024, 12, 1)
+        )
+        self.assertEqual(
+            add_months(datetime.date(2025, 11, 1), 3), datetime.date(2026, 2, 1)
+        )
+        name = get_partition_name(datetime.date(2025, 3, 1))
+        self.assertEqual(name, "short_url_visit_p202503")
+        self.assertEqual(parse_partition_month(name), datetime.date(2025, 3, 1))
+        self.assertIsNone(parse_partition_month("short_url_visit_partitioned"))
+
+    @override_settings(
+        SHORT_URL_VISIT_RETENTION_MONTHS=1,
+        SHORT_URL_VISIT_DELETE_BATCH_SIZE=1,
+    )
+    def test_성공__파티셔닝_미사용_시_만료_방문_기록_삭제(self):
+        """파티셔닝을 사용하지 않으면 보관 기간이 지난 방문 기록이 삭제되는지 테스트"""
+        for created_at in ["2025-01-15", "2025-02-15", "2025-03-15", "2025-04-15"]:
+            with freeze_time(created_at):
+                ShortUrlVisit.objects.create(short_url=self.short_url)
+
+        out = StringIO()
+        with freeze_time("2025-04-20"):
+            call_command("manage_short_url_visit_partitions", stdout=out)
+
+        self.assertIn("2 expired visits deleted", out.getvalue())
+        self.assertEqual(
+            sorted(visit.created_at.month for visit in ShortUrlVisit.objects.all()),
+            [3, 4],
+        )
+
+    def test_실패__파티셔닝_미사용_시_테이블_변환(self):
+        """파티셔닝을 사용할 수 없으면 테이블 변환 명령이 실패하는지 테스트"""
+        with self.assertRaises(CommandError):
+            call_command("convert_short_url_visit_table", stdout=StringIO())
+
+
+@skipUnless(connection.vendor == "postgresql", "PostgreSQL 에서만 실행")
+@override_settings(
+    SHORT_URL_VISIT_PARTITIONING=True, SHORT_URL_VISIT_RETENTION_MONTHS=1
+)
+class ShortUrlVisitPartitionTestCase(TransactionTestCase):
+    """단축 URL 방문 기록 파티셔닝 테스트 케이스 (PostgreSQL)"""
+
+    def setUp(self):
+        self.short_url = ShortUrl.objects.create(
+            random_key="abcd",
+            default_fallback_url="https://example.com",
+            hashed_value="hash",
+        )
+
+    def tearDown(self):
+        """파티션 테이블과 분리된 파티션을 삭제하고 일반 테이블로 복원"""
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT relname FROM pg_class WHERE relkind IN ('r', 'p') "
+                "AND relname ~ %s",
+                [rf"^{VISIT_TABLE}_(p\d{{6}}|archive_p\d{{6}}|partitioned)$"],
+            )
+            for (name,) in cursor.fetchall():
+                cursor.execute(f"DROP TABLE IF EXISTS {name} CASCADE")
+            if not is_visit_table_partitioned(cursor):
+                return
+            cursor.execute(f"DROP TABLE {VISIT_TABLE} CASCADE")
+        with connection.schema_editor() as schema_editor:
+            schema_editor.create_model(ShortUrlVisit)
+
+    def test_성공__배치_단위_변환_후_파티션_관리(self):
+        """명령으로 배치 단위 변환 후 예약 작업이 파티션만 생성/삭제하는지 테스트"""
+        with freeze_time("2025-03-15"):
+            ShortUrlVisit.objects.create(short_url=self.short_url)
+        with freeze_time("2025-04-15"):
+            ShortUrlVisit.objects.create(short_url=self.short_url)
+            last_visit = ShortUrlVisit.objects.create(short_url=self.short_url)
+
+        with freeze_time("2025-04-20"):
+            # 변환 전에는 예약 작업이 테이블을 변환하지 않고 만료 방문 기록만 삭제
+            result = task_manage_short_url_visit_partitions()
+            with connection.cursor() as cursor:
+                self.assertFalse(is_visit_table_partitioned(cursor))
+            self.assertEqual(result, "0 expired visits deleted")
+
+            out = StringIO()
+            call_command("convert_short_url_visit_table", batch_size=1, stdout=out)
+            self.assertIn("3 visits copied", out.getvalue())
+            with connection.cursor() as cursor:
+                self.assertTrue(is_visit_table_partitioned(cursor))
+            new_visit = ShortUrlVisit.objects.create(short_url=self.short_url)
+            self.assertGreater(new_visit.id, last_visit.id)
+
+        with freeze_time("2025-05-02"):
+            result = manage_visit_partitions()
+
+        self.assertEqual(result["dropped"], ["short_url_visit_p202503"])
+        self.assertEqual(result["created"], ["short_url_visit_p202508"])
+        self.assertEqual(ShortUrlVisit.objects.count(), 3)
+
+
+class ShortUrlRedirectViewTestCase(APITestCase):
+    """단축 URL 리다이렉트 뷰 테스트 케이스"""
+
+    def setUp(self):
+        self.factory = APIRequestFactory()
+        self.view = ShortUrlRedirectView.as_view()
+        self.short_url = ShortUrl.objects.create(
+            random_key="abcd",
+            ios_fallback_url="https://example.com/ios",
+            android_deep_link="app://test",
+            android_fallback_url="https://example.com/android",
+            default_fallback_url="https://example.com",
+            hashed_value="hash",
+        )
+        self.short_key = f"ab{id_to_key(self.short_url.id)}cd"
+
+    def redirect(self, user_agent):
+        request = self.factory.get(f"/{self.short_key}/", HTTP_USER_AGENT=user_agent)
+        return self.view(request, short_key=self.short_key)
+
+    def test_성공__iOS_딥링크_없으면_폴백_URL로_302(self):
+        """iOS 딥링크가 없으면 iOS 폴백 URL로 바로 리다이렉트되는지 테스트"""
+        response = self.redirect(IPHONE_USER_AGENT)
+        self.assertEqual(response.status_code, status.HTTP_302_FOUND)
+        self.assertEqual(response["Location"], "https://example.com/ios")
+
+    def test_성공__Android_딥링크_있으면_페이지_렌더링(self):
+        """Android 딥링크가 있으면 딥링크 실행을 위해 페이지가 렌더링되는지 테스트"""
+        response = self.redirect(ANDROID_USER_AGENT)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertIn(b"app://test", response.content)
+
+    def test_성공__데스크톱은_기본_폴백_URL로_302(self):
+        """데스크톱 사용자는 기본 폴백 URL로 바로 리다이렉트되는지 테스트"""
+        response = self.redirect(
+            "Mozilla/5.0 (Windows NT 10.0; Win64; x64) Chrome/120.0 Safari/537.36"
+        )
+        self.assertEqual(response.status_code, status.HTTP_302_FOUND)
+        self.assertEqual(response["Location"], "https://example.com")
+
+    def test_성공__봇은_OG_태그를_위해_페이지_렌더링(self):
+        """봇은 OG 태그를 읽을 수 있도록 페이지가 렌더링되는지 테스트"""
+        for user_agent in ["facebookexternalhit/1.1", "WhatsApp/2.23.20.0"]:
+            with self.subTest(user_agent=user_agent):
+                response = self.redirect(user_agent)
+                self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_성공__방문_기록에_사용자_에이전트_계열_저장(self):
+        """방문 기록에 사용자 에이전트 원문 대신 계열이 저장되는지 테스트"""
+        self.redirect(IPHONE_USER_AGENT)
+        visit = ShortUrlVisit.objects.get(short_url=self.short_url)
+        self.assertEqual(visit.user_agent_family, UserAgentFamily.IOS)
@@ -1,8 +1,11 @@
 from rest_framework.routers import SimpleRouter
 
-from apps.short_url.v1.views import ShortUrlViewSet
+from apps.short_url.v1.views import ShortUrlViewSet, ShortUrlVisitRollupViewSet
 
 router = SimpleRouter()
 router.register("short-url", ShortUrlViewSet, basename="short-url")
+router.register(
+    "short-url-stats", ShortUrlVisitRollupViewSet, basename="short-url-stats"
+)
 
 urlpatterns = router.urls
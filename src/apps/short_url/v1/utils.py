@@ -1,9 +1,45 @@
+import functools
 import random
+import re
 import string
 
+from apps.short_url.models import UserAgentFamily
+
 CHARS = "abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789"
 BASE = 62
 
+# OG 태그를 읽는 크롤러, 링크 미리보기 요청 (Slackbot, Discordbot, Twitterbot 등은 bot 으로 판별)
+BOT_USER_AGENT_KEYWORDS = [
+    "bot",
+    "crawler",
+    "spider",
+    "facebookexternalhit",
+    "facebookcatalog",
+    "kakaotalk-scrap",
+    "whatsapp",
+    "pinterest",
+    "slack-",
+    "skypeuripreview",
+    "iframely",
+    "embedly",
+    "vkshare",
+    "yeti",
+    "daumoa",
+]
+
+# 사용자 에이전트 계열 판별 정규식(순서대로 검사)
+USER_AGENT_FAMILY_PATTERNS = [
+    (
+        UserAgentFamily.BOT,
+        re.compile("|".join(map(re.escape, BOT_USER_AGENT_KEYWORDS)), re.I),
+    ),
+    (UserAgentFamily.IOS, re.compile(r"iPhone|iPad|iPod", re.I)),
+    (UserAgentFamily.ANDROID, re.compile(r"Android", re.I)),
+    (UserAgentFamily.WINDOWS, re.compile(r"Windows", re.I)),
+    (UserAgentFamily.MACOS, re.compile(r"Macintosh|Mac OS X", re.I)),
+    (UserAgentFamily.LINUX, re.compile(r"Linux|X11", re.I)),
+]
+
 
 def generate_random_key():
     """랜덤 키 생성"""
@@ -33,3 +69,44 @@ def key_to_id(key: str):
             return None
         result = result * BASE + (digit + 1)
     return result
+
+
+# [Why]
+# Q. 사용자 에이전트 판별 결과를 LRU 캐시로 저장하는 이유는?
+# A. 방문자의 대부분은 소수의 동일한 사용자 에이전트 문자열을 사용하므로
+#    매 요청마다 정규식을 검사하지 않고 이전 판별 결과를 재사용하기 위함
+@functools.lru_cache(maxsize=4096)
+def get_user_agent_family(user_agent: str) -> int:
+    """사용자 에이전트 계열 판별"""
+    if not user_agent:
+        return UserAgentFamily.OTHER
+    for family, pattern in USER_AGENT_FAMILY_PATTERNS:
+        if pattern.search(user_agent):
+            return family
+    return UserAgentFamily.OTHER
+
+
+def get_redirect_url(short_url, user_agent_family: int) -> str | None:
+    """
+    플랫폼별 리다이렉트 URL 조회:
+    딥링크 실행이 필요하거나 OG 태그를 읽어야 하는 봇은 페이지 렌더링이 필요하므로 None 반환
+    """
+    if user_agent_family == UserAgentFamily.BOT:
+        return None
+    if user_agent_family == UserAgentFamily.IOS:
+        if short_url.ios_deep_link:
+            return None
+        return short_url.ios_fallback_url or short_url.default_fallback_url
+    if user_agent_family == UserAgentFamily.ANDROID:
+        if short_url.android_deep_link:
+            return None
+        return short_url.android_fallback_url or short_url.default_fallback_url
+    return short_url.default_fallback_url
+
+
+def get_country_code(ip_address: str) -> str | None:
+    """
+    IP 주소로 국가 코드 조회:
+    GeoIP 데이터베이스를 사용하지 않으므로 국가를 알 수 없음 (항상 None)
+    """
+    return None
@@ -1,11 +1,23 @@
+from django.db.models import Sum
+from django.http import HttpResponseRedirect
 from django.shortcuts import render
-from drf_spectacular.utils import extend_schema
-from rest_framework import viewsets, mixins, generics, permissions
+from drf_spectacular.utils import extend_schema, OpenApiParameter
+from rest_framework import viewsets, mixins, generics, permissions, exceptions
 from rest_framework.generics import get_object_or_404
 
-from apps.short_url.models import ShortUrl
-from apps.short_url.v1.serializers import ShortUrlSerializer, ShortUrlRedirectSerializer
-from apps.short_url.v1.utils import key_to_id
+from apps.short_url.models import ShortUrl, ShortUrlVisitRollup
+from apps.short_url.v1.filters import ShortUrlVisitRollupFilterSet
+from apps.short_url.v1.serializers import (
+    ShortUrlSerializer,
+    ShortUrlRedirectSerializer,
+    ShortUrlVisitRollupSerializer,
+)
+from apps.short_url.v1.utils import (
+    key_to_id,
+    get_redirect_url,
+    get_user_agent_family,
+)
+from base.enums.errors import E005_INVALID_ROLLUP_GROUP_BY
 
 
 class ShortUrlViewSet(
@@ -48,6 +60,7 @@ class ShortUrlRedirectView(generics.RetrieveAPIView):
         summary="단축URL 리다이렉트",
         description="""
         단축 URL을 리다이렉트합니다.
+        딥링크 실행이 필요 없는 경우 플랫폼별 URL로 바로 302 리다이렉트합니다.
         """,
     )
     def retrieve(self, request, *args, **kwargs):
@@ -55,4 +68,63 @@ class ShortUrlRedirectView(generics.RetrieveAPIView):
         instance = get_object_or_404(ShortUrl, id=short_url_id)
         serializer = self.get_serializer(instance)
         serializer.save()
+        # [Why]
+        # Q. 플랫폼을 서버에서 판별해 바로 리다이렉트하는 이유는?
+        # A. 딥링크 실행이 필요 없는 경우 페이지 렌더링과 클라이언트 스크립트 실행 없이
+        #    한 번의 응답으로 이동할 수 있기 때문
+        redirect_url = get_redirect_url(
+            instance,
+            get_user_agent_family(request.META.get("HTTP_USER_AGENT", "")),
+        )
+        if redirect_url:
+            return HttpResponseRedirect(redirect_url)
         return render(request, "short_url/redirect.html", serializer.data)
+
+
+class ShortUrlVisitRollupViewSet(viewsets.GenericViewSet, mixins.ListModelMixin):
+    """단축 URL 방문 통계 뷰셋"""
+
+    queryset = ShortUrlVisitRollup.objects.all()
+    serializer_class = ShortUrlVisitRollupSerializer
+    permission_classes = [permissions.IsAdminUser]
+    filterset_class = ShortUrlVisitRollupFilterSet
+    group_by_fields = ["referrer", "user_agent_family", "country"]
+
+    def filter_queryset(self, queryset):
+        """집계 차원별 방문 수 합산"""
+        queryset = super().filter_queryset(queryset)
+        group_by = self.request.query_params.get("group_by")
+        if group_by and group_by not in self.group_by_fields:
+            raise exceptions.ValidationError({"group_by": E005_INVALID_ROLLUP_GROUP_BY})
+        # [Why]
+        # Q. 집계 테이블을 다시 합산하는 이유는?
+        # A. 집계 테이블은 모든 차원 조합별로 저장되므로,
+        #    요청한 차원을 제외한 나머지 차원은 합산해서 반환해야 하기 때문
+        fields = ["bucket_at", group_by] if group_by else ["bucket_at"]
+        return (
+            queryset.values(*fields)
+            .annotate(visit_count=Sum("visit_count"))
+            .order_by("-bucket_at", *fields[1:])
+        )
+
+    @extend_schema(
+        parameters=[
+            OpenApiParameter(
+                name="group_by",
+                description="집계 차원 (referrer, user_agent_family, country)",
+                required=False,
+                type=str,
+            ),
+        ],
+        responses={
+            200: ShortUrlVisitRollupSerializer(many=True),
+        },
+        tags=["short-url"],
+        summary="단축URL 방문 통계 조회",
+        description="""
+        단축 URL의 시간별/일별 방문 통계를 조회합니다.
+        원본 방문 기록이 아닌 집계 테이블만 조회합니다.
+        """,
+    )
+    def list(self, request, *args, **kwargs):
+        return super().list(request, *args, **kwargs)
@@ -0,0 +1,235 @@
+import datetime
+import json
+import logging
+import threading
+import time
+import uuid
+
+import redis
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import models, router
+from django.utils.dateparse import parse_datetime
+
+from apps.user.models import User
+from conf.caches import LocalLRUCache
+
+logger = logging.getLogger(__name__)
+
+USER_SNAPSHOT_KEY_PREFIX = "user_snapshot"
+
+# [Why]
+# Q. 인증에 필요한 필드만이 아닌 모든 필드를 보관하는 이유는?
+# A. 스냅샷에 없는 필드는 지연 필드가 되어 사용할 때마다 조용히 조회하므로
+#    권한 확인에서 사용하는 관리자 여부(is_superuser) 등도 조회 없이 사용하기 위함
+USER_SNAPSHOT_FIELDS = [field.attname for field in User._meta.concrete_fields]
+USER_SNAPSHOT_DATETIME_FIELDS = [
+    field.attname
+    for field in User._meta.concrete_fields
+    if isinstance(field, models.DateTimeField)
+]
+
+# 연결은 첫 명령 실행 시 생성됨
+# 인증 요청에서 사용하므로 Redis 장애 시 오래 기다리지 않도록 대기 시간 제한
+REDIS_CLIENT = redis.Redis.from_url(
+    settings.USER_SNAPSHOT_REDIS_URL,
+    socket_timeout=settings.USER_SNAPSHOT_REDIS_TIMEOUT,
+    socket_connect_timeout=settings.USER_SNAPSHOT_REDIS_TIMEOUT,
+)
+
+
+def get_user_snapshot_cache_key(user_id) -> str:
+    """사용자 스냅샷 캐시 키 조회"""
+    django_env = settings.DJANGO_ENVIRONMENT
+    return f"{USER_SNAPSHOT_KEY_PREFIX}:{django_env}:{user_id}"
+
+
+def get_user_snapshot_channel() -> str:
+    """사용자 스냅샷 삭제 알림 채널 조회"""
+    django_env = settings.DJANGO_ENVIRONMENT
+    return f"{USER_SNAPSHOT_KEY_PREFIX}:{django_env}:invalidate"
+
+
+def dump_user_snapshot(snapshot: dict) -> str:
+    """사용자 스냅샷 직렬화"""
+    # DjangoJSONEncoder 는 시각의 마이크로초를 버리므로 직접 변환
+    snapshot = {
+        field: value.isoformat() if isinstance(value, datetime.datetime) else value
+        for field, value in snapshot.items()
+    }
+    return json.dumps(snapshot, cls=DjangoJSONEncoder)
+
+
+def load_user_snapshot(value: bytes) -> dict | None:
+    """
+    사용자 스냅샷 역직렬화:
+    보관하는 필드가 변경되기 전에 저장된 스냅샷은 사용하지 않음 (None 반환)
+    """
+    snapshot = json.loads(value)
+    if set(snapshot) != set(USER_SNAPSHOT_FIELDS):
+        return None
+    snapshot["uuid"] = uuid.UUID(snapshot["uuid"])
+    for field in USER_SNAPSHOT_DATETIME_FIELDS:
+        if snapshot[field] is not None:
+            snapshot[field] = parse_datetime(snapshot[field])
+    return snapshot
+
+
+class UserSnapshotCache:
+    """
+    사용자 스냅샷 캐시:
+    Redis 에 프로세스 간 공유하고 프로세스 메모리에도 짧게 보관,
+    사용자가 변경되면 발행/구독으로 모든 프로세스의 프로세스 메모리에서 삭제
+    """
+
+    # [Why]
+    # Q. 사용자 스냅샷을 프로세스 메모리와 Redis 에 나눠 보관하는 이유는?
+    # A. 대부분의 인증 요청은 프로세스 메모리에서 처리하고,
+    #    프로세스가 많아도 데이터베이스 조회는 Redis 만료 시마다 한 번만 발생하도록 하기 위함
+    #    활성화 여부, 관리자 여부가 포함되므로 변경 시 다른 프로세스에도 바로 삭제를 알림
+    #    구독이 끊긴 것을 알기 전에 놓친 알림이 있을 수 있으므로 프로세스 메모리는 짧게 보관
+
+    def __init__(self, maxsize: int):
+        self.local_cache = LocalLRUCache(maxsize=maxsize)
+        self.pubsub_thread = None
+        self.subscribe_at = 0
+        self.lock = threading.Lock()
+
+    def _handle_exception(self, e, pubsub, thread):
+        """구독 오류 시 구독을 중단하고 다음 조회 시 다시 구독"""
+        logger.warning(f"Error subscribing user snapshot invalidation: {e}")
+        thread.stop()
+        pubsub.close()
+        self.pubsub_thread = None
+        self.subscribe_at = 0
+        # 구독이 끊긴 동안의 삭제 알림은 받을 수 없으므로 보관한 스냅샷 모두 삭제
+        self.local_cache.clear()
+
+    def _handle_message(self, message):
+        """다른 프로세스에서 삭제한 스냅샷을 프로세스 메모리에서 삭제"""
+        self.local_cache.delete(message["data"].decode())
+
+    def subscribe(self):
+        """다른 프로세스의 스냅샷 삭제 알림 구독"""
+        pubsub = REDIS_CLIENT.pubsub(ignore_subscribe_messages=True)
+        try:
+            pubsub.subscribe(**{get_user_snapshot_channel(): self._handle_message})
+        except redis.RedisError:
+            pubsub.close()
+            raise
+        # 구독 전에 보관한 스냅샷은 삭제 알림을 받지 못했을 수 있으므로 삭제
+        self.local_cache.clear()
+        self.pubsub_thread = pubsub.run_in_thread(
+            sleep_time=1,
+            daemon=True,
+            exception_handler=self._handle_exception,
+        )
+
+    def is_subscribed(self) -> bool:
+        """
+        삭제 알림 구독 여부 확인:
+        구독하지 않았으면 다시 구독 (다른 요청이 구독 중이면 기다리지 않음)
+        """
+        if self.pubsub_thread is None and self.subscribe_at <= time.time():
+            if self.lock.acquire(blocking=False):
+                try:
+                    self.subscribe_at = (
+                        time.time() + settings.USER_SNAPSHOT_SUBSCRIBE_RETRY_SECONDS
+                    )
+                    self.subscribe()
+                except redis.RedisError as e:
+                    logger.warning(f"Error subscribing user snapshot invalidation: {e}")
+                finally:
+                    self.lock.release()
+        return self.pubsub_thread is not None
+
+    @staticmethod
+    def get_from_database(user_id) -> dict | None:
+        """데이터베이스에서 사용자 스냅샷 조회"""
+        return User.objects.filter(id=user_id).values(*USER_SNAPSHOT_FIELDS).first()
+
+    def get(self, user_id) -> dict | None:
+        """
+        사용자 스냅샷 조회:
+        프로세스 메모리, Redis, 데이터베이스 순으로 조회
+
+        Args:
+            user_id: 사용자 ID
+
+        Returns:
+            dict: 사용자 스냅샷 (사용자가 없는 경우 None)
+        """
+        # 토큰의 사용자 ID 는 문자열로 저장되므로 문자열로 통일
+        user_id = str(user_id)
+        # [Why]
+        # Q. 삭제 알림을 구독하지 못하면 캐시를 사용하지 않는 이유는?
+        # A. 다른 프로세스의 비활성화, 권한 변경을 알 수 없으므로
+        #    인증에 오래된 스냅샷을 사용하지 않도록 데이터베이스에서 바로 조회
+        #    Redis 장애 시 요청마다 연결을 기다리지 않는 효과도 있음
+        if not self.is_subscribed():
+            return self.get_from_database(user_id)
+        snapshot = self.local_cache.get(user_id)
+        if snapshot is not None:
+            return snapshot
+        cache_key = get_user_snapshot_cache_key(user_id)
+        try:
+            value = REDIS_CLIENT.get(cache_key)
+        except redis.RedisError as e:
+            logger.warning(f"Error getting user snapshot: {e}")
+            # Redis 를 사용할 수 없으면 데이터베이스에서 조회하고 보관하지 않음
+            return self.get_from_database(user_id)
+        snapshot = load_user_snapshot(value) if value is not None else None
+        if snapshot is None:
+            snapshot = self.get_from_database(user_id)
+            if snapshot is None:
+                return None
+            try:
+                REDIS_CLIENT.set(
+                    cache_key,
+                    dump_user_snapshot(snapshot),
+                    ex=settings.USER_SNAPSHOT_TIMEOUT,
+                )
+            except redis.RedisError as e:
+                logger.warning(f"Error setting user snapshot: {e}")
+        self.local_cache.set(
+            user_id, snapshot, time.time() + settings.USER_SNAPSHOT_LOCAL_TIMEOUT
+        )
+        return snapshot
+
+    def invalidate(self, user_id):
+        """사용자 스냅샷 삭제 및 다른 프로세스에 삭제 알림"""
+        user_id = str(user_id)
+        self.local_cache.delete(user_id)
+        try:
+            pipeline = REDIS_CLIENT.pipeline()
+            pipeline.delete(get_user_snapshot_cache_key(user_id))
+            pipeline.publish(get_user_snapshot_channel(), user_id)
+            pipeline.execute()
+        except redis.RedisError as e:
+            logger.error(f"Error invalidating user snapshot: {e}")
+
+    def clear(self):
+        """현재 프로세스의 프로세스 메모리 전체 삭제"""
+        self.local_cache.clear()
+
+
+USER_SNAPSHOT_CACHE = UserSnapshotCache(maxsize=settings.USER_SNAPSHOT_LOCAL_CACHE_SIZE)
+
+
+def get_user_snapshot(user_id) -> dict | None:
+    """사용자 스냅샷 조회"""
+    return USER_SNAPSHOT_CACHE.get(user_id)
+
+
+def get_user_from_snapshot(snapshot: dict) -> User:
+    """스냅샷으로 사용자 생성 (모든 필드를 포함하므로 조회 없이 사용)"""
+    return User.from_db(
+        router.db_for_write(User),
+        USER_SNAPSHOT_FIELDS,
+        [snapshot[field] for field in USER_SNAPSHOT_FIELDS],
+    )
+
+
+def invalidate_user_snapshot(user_id):
+    """사용자 스냅샷 삭제"""
+    USER_SNAPSHOT_CACHE.invalidate(user_id)
@@ -1,6 +1,11 @@
+import functools
+
 from django.contrib.auth.signals import user_logged_in
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
 from django.dispatch import receiver
 
+from apps.user.caches import invalidate_user_snapshot
 from apps.user.models import User
 
 
@@ -9,3 +14,12 @@ def post_login(sender, request, user, **kwargs):
     """로그인 시 처리"""
 
     pass
+
+
+@receiver([post_save, post_delete], sender=User)
+def post_user_change(sender, instance, **kwargs):
+    """사용자 저장, 삭제 시 사용자 스냅샷 삭제"""
+    # [Why]
+    # Q. 커밋 후에 스냅샷을 삭제하는 이유는?
+    # A. 커밋 전에 삭제하면 다른 프로세스가 변경 전 사용자로 스냅샷을 다시 저장할 수 있기 때문
+    transaction.on_commit(functools.partial(invalidate_user_snapshot, instance.id))
@@ -3,6 +3,8 @@ import re
 from better_profanity import profanity
 from rest_framework import serializers
 
+from apps.device.models import PushAudience
+from apps.file.v1.utils import get_public_thumbnail_urls
 from apps.user.models import UserProfile, UserPreference
 from base.enums.errors import (
     E008_NICKNAME_CONTAINS_FORBIDDEN_WORD,
@@ -21,6 +23,8 @@ class UserProfileSerializer(serializers.ModelSerializer):
     프로필 등록
     """
 
+    image_thumbnails = serializers.SerializerMethodField(help_text="이미지 썸네일")
+
     NICKNAME_ALLOWED_CHARS_REGEX = re.compile(
         r"^[a-zA-Z0-9가-힣\-_.+=^!\s"  # 기본 문자 + 허용 특수문자 + 공백
         r"\U0001F300-\U0001F5FF"  # Miscellaneous Symbols and Pictographs
@@ -80,12 +84,17 @@ class UserProfileSerializer(serializers.ModelSerializer):
 
         return value  # 모든 검사를 통과하면 원래 값 반환
 
+    def get_image_thumbnails(self, instance) -> dict:
+        """이미지 썸네일 URL 조회"""
+        return get_public_thumbnail_urls(instance.image)
+
     class Meta:
         model = UserProfile
         fields = [
             "id",
             "nickname",
             "image",
+            "image_thumbnails",
         ]
 
 
@@ -98,6 +107,11 @@ class UserPreferenceSerializer(serializers.ModelSerializer):
 
     def save(self, **kwargs):
         instance = super().save(**kwargs)
+        # 푸시 발송 대상의 수신 동의 여부 갱신
+        PushAudience.objects.filter(user_id=instance.user_id).update(
+            is_push_notification=instance.is_push_notification,
+            is_night_notification=instance.is_night_notification,
+        )
         # TODO: AWS SNS 의 구독 정보 업데이트
         return instance
 
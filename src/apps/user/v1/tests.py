@@ -1,7 +1,25 @@
+import collections
+import json
+from unittest import mock
+
+import redis
+from django.db import connection
 from django.test import RequestFactory
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
 from rest_framework import status
 from rest_framework.test import APITestCase, APIClient
-
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from apps.user.caches import (
+    USER_SNAPSHOT_CACHE,
+    UserSnapshotCache,
+    get_user_from_snapshot,
+    get_user_snapshot,
+    get_user_snapshot_cache_key,
+    get_user_snapshot_channel,
+)
 from apps.user.models import User, UserPreference
 from apps.user.models import UserProfile
 from apps.user.v1.serializers import UserPreferenceSerializer
@@ -471,3 +489,235 @@ class UserPreferenceViewTests(APITestCase):
         self.assertEqual(updated_preference.is_night_notification, True)
         self.assertEqual(updated_preference.is_push_notification, True)
         self.assertEqual(updated_preference.is_email_notification, True)
+
+
+class FakePubSub:
+    """사용자 스냅샷 삭제 알림 테스트용 발행/구독"""
+
+    def __init__(self, client):
+        self.client = client
+
+    def subscribe(self, **handlers):
+        for channel, handler in handlers.items():
+            self.client.handlers[channel].append(handler)
+
+    def run_in_thread(self, **kwargs):
+        return mock.MagicMock()
+
+    def close(self):
+        pass
+
+
+class FakeRedis:
+    """사용자 스냅샷 테스트용 Redis"""
+
+    def __init__(self):
+        self.values = {}
+        self.handlers = collections.defaultdict(list)
+
+    def get(self, key):
+        return self.values.get(key)
+
+    def set(self, key, value, ex=None):
+        self.values[key] = value.encode()
+
+    def delete(self, key):
+        self.values.pop(key, None)
+
+    def publish(self, channel, message):
+        for handler in self.handlers[channel]:
+            handler({"data": message.encode()})
+
+    def pubsub(self, **kwargs):
+        return FakePubSub(self)
+
+    def pipeline(self):
+        client = self
+
+        class Pipeline:
+            def __init__(self):
+                self.commands = []
+
+            def __getattr__(self, name):
+                return lambda *args: self.commands.append((name, args))
+
+            def execute(self):
+                return [getattr(client, name)(*args) for name, args in self.commands]
+
+        return Pipeline()
+
+
+class UserSnapshotTests(APITestCase):
+    """사용자 스냅샷 테스트"""
+
+    def setUp(self):
+        """테스트 데이터 설정"""
+        self.user = User.objects.create_user(
+            email="test@example.com",
+            password="password123",
+        )
+        UserPreference.objects.create(user=self.user)
+        self.access_token = RefreshToken.for_user(self.user).access_token
+        self.client = APIClient()
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {self.access_token}")
+        self.redis = FakeRedis()
+        patcher = mock.patch("apps.user.caches.REDIS_CLIENT", self.redis)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        # 구독 상태는 프로세스마다 유지되므로 테스트마다 다시 구독
+        for attr, value in [("pubsub_thread", None), ("subscribe_at", 0)]:
+            patcher = mock.patch.object(USER_SNAPSHOT_CACHE, attr, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        USER_SNAPSHOT_CACHE.clear()
+        self.addCleanup(USER_SNAPSHOT_CACHE.clear)
+
+    def test_성공__사용자_스냅샷_조회(self):
+        """프로세스 메모리, 캐시 서버 순으로 스냅샷을 조회하는지 테스트"""
+        with self.assertNumQueries(1):
+            snapshot = get_user_snapshot(self.user.id)
+        self.assertEqual(snapshot["email"], self.user.email)
+        self.assertEqual(snapshot["uuid"], self.user.uuid)
+
+        # 프로세스 메모리
+        with self.assertNumQueries(0):
+            self.assertEqual(get_user_snapshot(self.user.id), snapshot)
+
+        # Redis
+        USER_SNAPSHOT_CACHE.clear()
+        with self.assertNumQueries(0):
+            self.assertEqual(get_user_snapshot(str(self.user.id)), snapshot)
+
+    def test_실패__존재하지_않는_사용자_스냅샷_조회(self):
+        """존재하지 않는 사용자는 스냅샷이 없는지 테스트"""
+        self.assertIsNone(get_user_snapshot(self.user.id + 1))
+
+    def test_성공__스냅샷으로_생성한_사용자(self):
+        """스냅샷으로 생성한 사용자는 조회 없이 사용할 수 있는지 테스트"""
+        user = get_user_from_snapshot(get_user_snapshot(self.user.id))
+
+        with self.assertNumQueries(1):
+            self.assertEqual(user.pk, self.user.pk)
+            self.assertEqual(user.email, self.user.email)
+            self.assertEqual(
+                UserPreference.objects.get(user=user).user_id, self.user.id
+            )
+        # 권한 확인 등에서 사용하는 필드도 조회 없이 사용
+        with self.assertNumQueries(0):
+            self.assertEqual(user.date_joined, self.user.date_joined)
+            self.assertFalse(user.is_superuser)
+            self.assertTrue(user.check_password("password123"))
+        self.assertEqual(user.get_deferred_fields(), set())
+
+    def test_성공__Redis_스냅샷으로_생성한_사용자(self):
+        """Redis 에서 조회한 스냅샷도 시각 필드를 포함해 그대로 복원되는지 테스트"""
+        self.user.last_login = timezone.now()
+        self.user.save()
+        get_user_snapshot(self.user.id)
+        USER_SNAPSHOT_CACHE.clear()
+
+        with self.assertNumQueries(0):
+            user = get_user_from_snapshot(get_user_snapshot(self.user.id))
+            self.assertEqual(user.last_login, self.user.last_login)
+            self.assertEqual(user.date_joined, self.user.date_joined)
+        self.assertEqual(user.get_deferred_fields(), set())
+
+    def test_성공__필드가_다른_스냅샷_무시(self):
+        """보관하는 필드가 변경되기 전에 저장된 스냅샷은 다시 조회하는지 테스트"""
+        self.redis.set(
+            get_user_snapshot_cache_key(self.user.id),
+            json.dumps({"id": self.user.id, "uuid": str(self.user.uuid)}),
+        )
+
+        with self.assertNumQueries(1):
+            snapshot = get_user_snapshot(self.user.id)
+
+        self.assertEqual(snapshot["email"], self.user.email)
+
+    def test_성공__사용자_저장_시_스냅샷_삭제(self):
+        """사용자를 저장하면 스냅샷이 삭제되는지 테스트"""
+        get_user_snapshot(self.user.id)
+
+        self.user.email = "changed@example.com"
+        with self.captureOnCommitCallbacks(execute=True):
+            self.user.save()
+
+        self.assertEqual(
+            get_user_snapshot(self.user.id)["email"], "changed@example.com"
+        )
+
+    def test_성공__인증_시_사용자_테이블_조회_없음(self):
+        """스냅샷이 있으면 인증 요청에서 사용자 테이블을 조회하지 않는지 테스트"""
+        url = reverse("user-preference")
+        self.client.get(url)
+
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertFalse(
+            any('FROM "user"' in query["sql"] for query in context.captured_queries)
+        )
+
+    def test_실패__비활성화된_사용자_인증(self):
+        """비활성화된 사용자는 스냅샷이 삭제되어 바로 인증에 실패하는지 테스트"""
+        url = reverse("user-preference")
+        self.assertEqual(self.client.get(url).status_code, status.HTTP_200_OK)
+
+        self.user.is_active = False
+        with self.captureOnCommitCallbacks(execute=True):
+            self.user.save()
+
+        self.assertEqual(self.client.get(url).status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_성공__다른_프로세스의_스냅샷_삭제(self):
+        """다른 프로세스에서 사용자를 변경하면 프로세스 메모리의 스냅샷도 삭제되는지 테스트"""
+        get_user_snapshot(self.user.id)
+        self.assertIsNotNone(USER_SNAPSHOT_CACHE.local_cache.get(str(self.user.id)))
+
+        # 다른 프로세스에서 삭제 알림 발행
+        self.redis.publish(get_user_snapshot_channel(), str(self.user.id))
+
+        self.assertIsNone(USER_SNAPSHOT_CACHE.local_cache.get(str(self.user.id)))
+
+    def test_성공__비활성화한_사용자_다른_프로세스_반영(self):
+        """한 프로세스에서 비활성화한 사용자가 다른 프로세스의 캐시에도 바로 반영되는지 테스트"""
+        other_cache = UserSnapshotCache(maxsize=10)
+        self.assertTrue(get_user_snapshot(self.user.id)["is_active"])
+        self.assertTrue(other_cache.get(self.user.id)["is_active"])
+        with self.assertNumQueries(0):
+            other_cache.get(self.user.id)
+
+        self.user.is_active = False
+        with self.captureOnCommitCallbacks(execute=True):
+            self.user.save()
+
+        with self.assertNumQueries(1):
+            self.assertFalse(other_cache.get(self.user.id)["is_active"])
+        self.assertFalse(get_user_snapshot(self.user.id)["is_active"])
+
+    def test_성공__구독_오류_시_프로세스_메모리_삭제(self):
+        """삭제 알림 구독이 끊기면 보관한 스냅샷을 모두 삭제하고 다시 구독하는지 테스트"""
+        get_user_snapshot(self.user.id)
+
+        USER_SNAPSHOT_CACHE._handle_exception(
+            redis.ConnectionError(), mock.Mock(), mock.Mock()
+        )
+
+        self.assertIsNone(USER_SNAPSHOT_CACHE.local_cache.get(str(self.user.id)))
+        get_user_snapshot(self.user.id)
+        self.assertIsNotNone(USER_SNAPSHOT_CACHE.pubsub_thread)
+
+    def test_성공__Redis_장애_시_데이터베이스_조회(self):
+        """Redis 를 사용할 수 없으면 캐시 없이 데이터베이스에서 조회하는지 테스트"""
+        failing_redis = mock.Mock()
+        failing_redis.pubsub.return_value.subscribe.side_effect = redis.ConnectionError
+        with mock.patch("apps.user.caches.REDIS_CLIENT", failing_redis):
+            for _ in range(2):
+                with self.assertNumQueries(1):
+                    snapshot = get_user_snapshot(self.user.id)
+                self.assertEqual(snapshot["email"], self.user.email)
+
+        # 재시도 간격 동안은 다시 구독하지 않음
+        failing_redis.pubsub.assert_called_once()
+        failing_redis.get.assert_not_called()
@@ -140,6 +140,11 @@ E005_INVALID_OG_TAG_FORMAT = {
     "message": "OG 태그는 JSON 형식이어야 합니다",
     "error_code": "E0050002",
 }
+# 지원하지 않는 방문 통계 집계 차원
+E005_INVALID_ROLLUP_GROUP_BY = {
+    "message": "지원하지 않는 집계 차원입니다",
+    "error_code": "E0050003",
+}
 
 # -- Feed
 # 이미 신고된 피드
@@ -193,6 +198,11 @@ E007_PUSH_TOKEN_ALREADY_REGISTERED = {
     "message": "이미 등록된 푸시 토큰입니다",
     "error_code": "E0070004",
 }
+# 내 계정으로 등록되지 않은 디바이스
+E007_DEVICE_NOT_FOUND = {
+    "message": "내 계정으로 등록되지 않은 디바이스입니다",
+    "error_code": "E0070005",
+}
 
 # -- 프로필
 # 닉네임 길이가 맞지 않음
@@ -247,3 +257,40 @@ E009_AGREEMENT_REQUIRED_ALL = {
     "message": "모든 활성화된 약관에 대해 동의 또는 미동의가 필요합니다",
     "error_code": "E0090004",
 }
+
+# -- 파일
+# 멀티파트 업로드 시 파일 크기 필요
+E010_MULTIPART_FILE_SIZE_REQUIRED = {
+    "non_field": {
+        "message": "멀티파트 업로드 시 파일 크기가 필요합니다",
+        "error_code": "E0100001",
+    }
+}
+# 진행 중인 멀티파트 업로드 없음
+E010_MULTIPART_UPLOAD_NOT_FOUND = {
+    "non_field": {
+        "message": "진행 중인 멀티파트 업로드가 없습니다",
+        "error_code": "E0100002",
+    }
+}
+# 파트 번호가 올바르지 않음
+E010_INVALID_PART_NUMBER = {
+    "non_field": {
+        "message": "파트 번호가 올바르지 않습니다",
+        "error_code": "E0100003",
+    }
+}
+# 업로드되지 않은 파트가 있음
+E010_MULTIPART_PARTS_INCOMPLETE = {
+    "non_field": {
+        "message": "업로드되지 않은 파트가 있습니다",
+        "error_code": "E0100004",
+    }
+}
+# 멀티파트 업로드 처리 실패
+E010_MULTIPART_UPLOAD_FAILED = {
+    "non_field": {
+        "message": "멀티파트 업로드 처리에 실패했습니다",
+        "error_code": "E0100005",
+    }
+}
@@ -0,0 +1,46 @@
+import hashlib
+
+
+class BloomFilter:
+    """
+    블룸 필터.
+    포함되지 않은 항목은 항상 없다고 판단하며, 포함 여부는 오탐이 있을 수 있습니다.
+    """
+
+    def __init__(self, size: int, hash_count: int):
+        """
+        초기화 메서드.
+
+        Args:
+            size (int): 비트 수.
+            hash_count (int): 항목마다 설정할 비트 수.
+        """
+        self.size = size
+        self.hash_count = hash_count
+        self.bits = bytearray((size + 7) // 8)
+
+    def _get_positions(self, item: str) -> list[int]:
+        """
+        항목의 비트 위치를 계산합니다.
+        해시 하나를 둘로 나눠 조합하는 이중 해싱을 사용합니다.
+        """
+        digest = hashlib.blake2b(item.encode("utf-8"), digest_size=16).digest()
+        first = int.from_bytes(digest[:8], "little")
+        second = int.from_bytes(digest[8:], "little") | 1
+        return [(first + i * second) % self.size for i in range(self.hash_count)]
+
+    def add(self, item: str):
+        """
+        항목을 추가합니다.
+
+        Args:
+            item (str): 추가할 항목.
+        """
+        for position in self._get_positions(item):
+            self.bits[position >> 3] |= 1 << (position & 7)
+
+    def __contains__(self, item: str) -> bool:
+        return all(
+            self.bits[position >> 3] & (1 << (position & 7))
+            for position in self._get_positions(item)
+        )
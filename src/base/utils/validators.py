@@ -0,0 +1,47 @@
+import re
+
+# 정규식은 프론트와 맞춰야 함
+EMAIL_REGEX = re.compile(r"^[a-zA-Z0-9_.+-]+@[a-zA-Z0-9-]+\.[a-zA-Z0-9-.]+$")
+# 영문 소문자와 숫자를 포함한 6~30자 (영문, 숫자, _, - 만 허용)
+PASSWORD_REGEX = re.compile(r"^(?=.*[a-z])(?=.*\d)[a-zA-Z0-9_-]{6,30}$")
+# md5 해시, uuid4 hex 토큰
+HEX32_REGEX = re.compile(r"^[0-9a-f]{32}$")
+
+
+def is_valid_email(value: str) -> bool:
+    """
+    이메일 형식을 검사합니다.
+
+    Args:
+        value (str): 이메일.
+
+    Returns:
+        bool: 형식 일치 여부.
+    """
+    return EMAIL_REGEX.match(value) is not None
+
+
+def is_valid_password(value: str) -> bool:
+    """
+    비밀번호 형식을 검사합니다.
+
+    Args:
+        value (str): 비밀번호.
+
+    Returns:
+        bool: 형식 일치 여부.
+    """
+    return PASSWORD_REGEX.match(value) is not None
+
+
+def is_valid_hex32(value: str) -> bool:
+    """
+    32자리 16진수 문자열(해시된 이메일, 인증 토큰) 형식을 검사합니다.
+
+    Args:
+        value (str): 검사할 문자열.
+
+    Returns:
+        bool: 형식 일치 여부.
+    """
+    return HEX32_REGEX.match(value) is not None
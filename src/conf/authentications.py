@@ -1,3 +1,6 @@
+import hashlib
+
+from django.conf import settings
 from django.utils.functional import SimpleLazyObject
 from django.utils.translation import gettext_lazy as _
 from rest_framework_simplejwt import exceptions
@@ -7,6 +10,16 @@ from rest_framework_simplejwt.settings import api_settings
 from drf_spectacular.extensions import OpenApiAuthenticationExtension
 from drf_spectacular.plumbing import build_bearer_security_scheme_object
 
+from apps.account.v1.tokens import REVOKED_ACCESS_TOKEN_FILTER
+from apps.user.caches import get_user_from_snapshot, get_user_snapshot
+from conf.caches import LocalLRUCache
+
+# [Why]
+# Q. 검증한 토큰을 프로세스 메모리에 보관하는 이유는?
+# A. 같은 액세스 토큰으로 반복되는 요청마다 서명을 검증하지 않기 위함
+#    토큰 자체의 만료 시각까지만 보관
+VALIDATED_TOKEN_CACHE = LocalLRUCache(maxsize=settings.JWT_TOKEN_CACHE_SIZE)
+
 
 class SimpleLazyUser(SimpleLazyObject):
     @property
@@ -26,19 +39,32 @@ class JWTLazyUserAuthentication(JWTAuthentication):
     - 데이터베이스에 저장된 사용자 정보는 실제 데이터가 사용되는 곳에서 지연 로딩
     """
 
+    def get_validated_token(self, raw_token):
+        """검증한 토큰은 만료 시각까지 서명 검증 없이 재사용"""
+        key = hashlib.sha256(raw_token).digest()
+        validated_token = VALIDATED_TOKEN_CACHE.get(key)
+        if validated_token is None:
+            validated_token = super().get_validated_token(raw_token)
+            VALIDATED_TOKEN_CACHE.set(key, validated_token, validated_token["exp"])
+        # 보관 중인 토큰도 로그아웃으로 폐기되었을 수 있으므로 매번 확인
+        if REVOKED_ACCESS_TOKEN_FILTER.is_revoked(
+            validated_token[api_settings.JTI_CLAIM]
+        ):
+            raise exceptions.InvalidToken(_("Token is revoked"))
+        return validated_token
+
     def get_active_user(self, user_id):
-        """지연 로딩: 사용자 조회 및 활성화 여부 확인"""
-        try:
-            user = self.user_model.objects.get(**{api_settings.USER_ID_FIELD: user_id})
-        except self.user_model.DoesNotExist:
+        """지연 로딩: 사용자 스냅샷 조회 및 활성화 여부 확인"""
+        snapshot = get_user_snapshot(user_id)
+        if snapshot is None:
             raise exceptions.AuthenticationFailed(
                 _("User not found"), code="user_not_found"
             )
-        if api_settings.CHECK_USER_IS_ACTIVE and not user.is_active:
+        if api_settings.CHECK_USER_IS_ACTIVE and not snapshot["is_active"]:
             raise exceptions.AuthenticationFailed(
                 _("User is inactive"), code="user_inactive"
             )
-        return user
+        return get_user_from_snapshot(snapshot)
 
     def get_user(self, validated_token):
         """토큰을 이용한 사용자 조회"""
@@ -1,5 +1,7 @@
+import collections
 import datetime
 import threading
+import time
 
 from django.core.cache.backends.redis import RedisCache as DjangoRedisCache
 from django.utils import timezone
@@ -75,3 +77,48 @@ class RedisCache(DjangoRedisCache):
             # 동기
             value = self._set_value(*args)
         return value
+
+
+class LocalLRUCache:
+    """
+    프로세스 메모리 LRU 캐시:
+    항목마다 만료 시각(Unix timestamp)을 지정하고, 최대 개수를 넘으면 오래 사용하지 않은 항목부터 삭제
+    """
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self._data = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key, default=None):
+        """만료되지 않은 항목 조회"""
+        with self._lock:
+            item = self._data.get(key)
+            if item is None:
+                return default
+            value, expires_at = item
+            if expires_at <= time.time():
+                del self._data[key]
+                return default
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key, value, expires_at: float):
+        """항목 저장"""
+        if expires_at <= time.time():
+            return
+        with self._lock:
+            self._data[key] = (value, expires_at)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def delete(self, key):
+        """항목 삭제"""
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self):
+        """전체 삭제"""
+        with self._lock:
+            self._data.clear()
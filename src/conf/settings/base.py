@@ -31,6 +31,7 @@ load_dotenv()
 AWS_ACCESS_KEY_ID = os.environ.get("AWS_ACCESS_KEY_ID")
 AWS_SECRET_ACCESS_KEY = os.environ.get("AWS_SECRET_ACCESS_KEY")
 AWS_REGION_NAME = os.environ.get("AWS_REGION_NAME")
+AWS_STORAGE_BUCKET_NAME = os.environ.get("AWS_STORAGE_BUCKET_NAME")
 
 # AWS 파라미터 스토어 조회(1회 실행)
 if DJANGO_ENVIRONMENT not in [
@@ -185,6 +186,8 @@ EMAIL_HOST_USER = os.environ.get("EMAIL_HOST_USER")  # 이메일 호스트 유
 EMAIL_HOST_PASSWORD = os.environ.get("EMAIL_HOST_PASSWORD")  # 이메일 호스트 패스워드
 
 DEFAULT_FROM_EMAIL = os.environ.get("DEFAULT_FROM_EMAIL")  # 기본 발송 이메일 주소
+EMAIL_SEND_MAX_RETRIES = 5  # 이메일 발송 실패 시 최대 재시도 횟수
+EMAIL_SEND_RETRY_DELAY = 2  # 첫 재시도 대기 시간(초, 재시도마다 두 배)
 
 # 언어 및 시간 설정
 LANGUAGE_CODE = "ko"  # 언어 코드
@@ -251,8 +254,11 @@ REST_FRAMEWORK = {
         "comment:like": "2/second",
         "comment:report": "2/second",
         "file:create": "1/second",
-        "file:update": "1/second",
+        "file:partial_update": "1/second",
         "file:presigned": "1/second",
+        "file:presigned_batch": "1/second",
+        "file:multipart": "1/second",
+        "file:multipart_presigned": "5/second",
     },
 }
 
@@ -298,6 +304,12 @@ SIMPLE_JWT = {
     "SLIDING_TOKEN_LIFETIME": timedelta(minutes=5),
     "SLIDING_TOKEN_REFRESH_LIFETIME": timedelta(days=1),
 }
+JWT_TOKEN_CACHE_SIZE = 10000  # 검증한 액세스 토큰을 프로세스 메모리에 보관할 최대 개수
+USER_SNAPSHOT_TIMEOUT = 60 * 5  # 사용자 스냅샷 Redis 보관 시간(초)
+USER_SNAPSHOT_LOCAL_CACHE_SIZE = (
+    10000  # 사용자 스냅샷을 프로세스 메모리에 보관할 최대 개수
+)
+USER_SNAPSHOT_LOCAL_TIMEOUT = 10  # 사용자 스냅샷 프로세스 메모리 보관 시간(초)
 
 # SPECTACULAR
 SPECTACULAR_SETTINGS = {
@@ -344,6 +356,8 @@ if SENTRY_DSN and os.environ.get("LOADED_SETTINGS"):
     )
 
 # LOGGING
+# 로그 파일 디렉터리는 저장소에 포함하지 않으므로 없으면 생성
+os.makedirs(os.path.join(BASE_DIR, "logs"), exist_ok=True)
 LOGGING = {
     "version": 1,
     "disable_existing_loggers": False,
@@ -420,10 +434,139 @@ GOOGLE_CLIENT_SECRETS_CONFIG = {
 
 # Celery
 CELERY_BROKER_URL = os.environ.get("CELERY_BROKER_URL", "redis://redis:6379")
+CELERY_BEAT_SCHEDULE = {
+    "rollup-short-url-visits": {
+        "task": "apps.short_url.v1.tasks.task_rollup_short_url_visits",
+        "schedule": timedelta(minutes=5),
+    },
+    "manage-short-url-visit-partitions": {
+        "task": "apps.short_url.v1.tasks.task_manage_short_url_visit_partitions",
+        "schedule": timedelta(days=1),
+    },
+    "abort-abandoned-multipart-uploads": {
+        "task": "apps.file.v1.tasks.task_abort_abandoned_multipart_uploads",
+        "schedule": timedelta(hours=1),
+    },
+    "reconcile-generated-files": {
+        "task": "apps.file.v1.tasks.task_reconcile_generated_files",
+        "schedule": timedelta(minutes=10),
+    },
+    "flush-file-download-histories": {
+        "task": "apps.file.v1.tasks.task_flush_download_histories",
+        "schedule": timedelta(seconds=10),
+    },
+    "start-push-campaigns": {
+        "task": "apps.device.v1.tasks.task_start_push_campaigns",
+        "schedule": timedelta(minutes=1),
+    },
+    "flush-expired-tokens": {
+        "task": "apps.account.v1.tasks.task_flush_expired_tokens",
+        "schedule": timedelta(days=1),
+    },
+}
 
 # 한 번 실행이 필요한 로직 예외용
 os.environ.setdefault("LOADED_SETTINGS", "True")
 
+# 단축 URL 방문 집계
+SHORT_URL_VISIT_ROLLUP_BATCH_SIZE = 5000  # 한 번에 집계할 방문 기록 수
+SHORT_URL_VISIT_ROLLUP_DELAY = 60  # 커밋 대기를 위해 집계에서 제외할 최근 방문 기록(초)
+
+# 단축 URL 방문 기록 보관(PostgreSQL 에서만 월별 파티셔닝, 그 외에는 배치 삭제)
+SHORT_URL_VISIT_PARTITIONING = os.environ.get("SHORT_URL_VISIT_PARTITIONING") == "True"
+SHORT_URL_VISIT_RETENTION_MONTHS = int(
+    os.environ.get("SHORT_URL_VISIT_RETENTION_MONTHS") or 12
+)  # 보관 기간(월)
+SHORT_URL_VISIT_PARTITION_PREMAKE_MONTHS = 3  # 미리 생성할 파티션(월)
+SHORT_URL_VISIT_DELETE_BATCH_SIZE = 5000  # 한 번에 삭제할 방문 기록 수
+SHORT_URL_VISIT_CONVERT_BATCH_SIZE = 50000  # 파티션 변환 시 한 번에 복사할 방문 기록 수
+SHORT_URL_VISIT_CONVERT_RECHECK_SIZE = (
+    100000  # 테이블 교체 시 누락 여부를 다시 확인할 최근 방문 기록 ID 수
+)
+
+# 파일 프리사인드
+FILE_PRESIGNED_BATCH_MAX_SIZE = 100  # 한 번에 생성할 수 있는 프리사인드 URL 수
+FILE_PRESIGNED_URL_MIN_VALIDITY = 60  # 캐시한 프리사인드 URL의 최소 유효 시간(초)
+
+# 만료 파일 삭제
+FILE_DELETE_CHUNK_SIZE = 5000  # 한 번에 처리할 만료 파일 수
+FILE_DELETE_MAX_WORKERS = 4  # 동시에 호출할 S3 삭제 요청 수
+
+# 파일 멀티파트 업로드
+FILE_MULTIPART_PART_SIZE = 8 * 1024 * 1024  # 파트 크기(바이트, 최소 5MB)
+FILE_MULTIPART_PRESIGNED_BATCH_SIZE = 100  # 한 번에 생성할 수 있는 파트 업로드 URL 수
+FILE_MULTIPART_ABANDON_HOURS = 24  # 진행되지 않으면 중단할 멀티파트 업로드(시간)
+FILE_MULTIPART_ABORT_BATCH_SIZE = 1000  # 한 번에 중단할 멀티파트 업로드 수
+
+# 파일 업로드 검증
+AWS_S3_MAX_POOL_CONNECTIONS = 32  # S3 클라이언트 커넥션 풀 크기
+FILE_VERIFY_MAX_WORKERS = 16  # 동시에 호출할 S3 객체 조회 요청 수
+FILE_RECONCILE_AFTER_MINUTES = 10  # 업로드 URL 생성 후 상태를 확인할 시간(분)
+FILE_RECONCILE_BATCH_SIZE = 1000  # 한 번에 확인할 파일 수
+
+# 이미지 썸네일
+FILE_PUBLIC_URL = os.environ.get("FILE_PUBLIC_URL", "")  # 공개 파일 기본 URL(CDN)
+FILE_THUMBNAIL_EXTENSIONS = ["jpg", "jpeg", "png", "webp", "gif", "bmp"]
+FILE_THUMBNAIL_SIZES = [64, 256, 1024]  # 썸네일 최대 가로/세로 크기(px)
+FILE_THUMBNAIL_FORMATS = ["webp", "avif"]
+FILE_THUMBNAIL_QUALITY = 80
+FILE_THUMBNAIL_MAX_SOURCE_SIZE = 50 * 1024 * 1024  # 썸네일을 생성할 최대 원본 크기
+FILE_THUMBNAIL_SPOOL_SIZE = 10 * 1024 * 1024  # 초과 시 임시 파일에 저장할 크기
+FILE_THUMBNAIL_MAX_WORKERS = 2  # 썸네일 생성 프로세스 수
+FILE_THUMBNAIL_URL_CACHE_TIMEOUT = 60  # 공개 이미지 썸네일 생성 결과 캐시 시간(초)
+
+# 파일 다운로드 이력 버퍼
+FILE_DOWNLOAD_HISTORY_REDIS_URL = os.environ.get(
+    "FILE_DOWNLOAD_HISTORY_REDIS_URL", CELERY_BROKER_URL
+)
+FILE_DOWNLOAD_HISTORY_FLUSH_BATCH_SIZE = 1000  # 한 번에 저장할 다운로드 이력 수
+FILE_DOWNLOAD_HISTORY_FLUSH_LOCK_TIMEOUT = 60  # 이력 저장 작업 잠금 유지 시간(초)
+
+# 토큰 블랙리스트
+TOKEN_BLACKLIST_REDIS_URL = os.environ.get(
+    "TOKEN_BLACKLIST_REDIS_URL", CELERY_BROKER_URL
+)  # 토큰 블랙리스트 Redis
+TOKEN_BLACKLIST_AUDIT = (
+    os.environ.get("TOKEN_BLACKLIST_AUDIT", "True") == "True"
+)  # 토큰 발급, 블랙리스트 이력 데이터베이스 저장 여부
+TOKEN_BLACKLIST_REDIS_TIMEOUT = 0.5  # 인증 요청의 Redis 연결, 응답 대기 시간(초)
+TOKEN_BLACKLIST_BACKFILL_BATCH_SIZE = 1000  # 이력 테이블에서 한 번에 옮길 블랙리스트 수
+
+# 사용자 스냅샷
+USER_SNAPSHOT_REDIS_URL = os.environ.get(
+    "USER_SNAPSHOT_REDIS_URL", CELERY_BROKER_URL
+)  # 사용자 스냅샷 공유, 삭제 알림 Redis
+USER_SNAPSHOT_REDIS_TIMEOUT = 0.5  # 사용자 스냅샷 Redis 연결, 응답 대기 시간(초)
+USER_SNAPSHOT_SUBSCRIBE_RETRY_SECONDS = 10  # 삭제 알림 구독 실패 시 재시도 간격(초)
+
+# 액세스 토큰 폐기
+ACCESS_TOKEN_REVOCATION_FILTER_SIZE = 1 << 20  # 폐기 토큰 블룸 필터 비트 수(128KB)
+ACCESS_TOKEN_REVOCATION_FILTER_HASH_COUNT = 7  # 토큰마다 설정할 블룸 필터 비트 수
+ACCESS_TOKEN_REVOCATION_RELOAD_SECONDS = 60  # 블룸 필터를 다시 만드는 주기(초)
+
+# 푸시 토큰 일괄 등록
+PUSH_TOKEN_BULK_MAX_SIZE = 100  # 한 번에 등록할 수 있는 푸시 토큰 수
+
+# 전체 푸시 발송
+PUSH_FANOUT_RANGE_SIZE = 100000  # 작업 하나가 발송할 토큰 ID 범위
+PUSH_FANOUT_BATCH_SIZE = 500  # 한 번에 발송할 토큰 수(FCM send_each 최대 500)
+PUSH_FANOUT_MAX_WORKERS = 8  # 작업 하나에서 동시에 호출할 발송 요청 수
+PUSH_FANOUT_RATE_LIMIT = int(
+    os.environ.get("PUSH_FANOUT_RATE_LIMIT") or 10000
+)  # 전체 초당 최대 발송 수(FCM 기본 할당량 분당 60만)
+PUSH_FANOUT_REDIS_URL = os.environ.get(
+    "PUSH_FANOUT_REDIS_URL", CELERY_BROKER_URL
+)  # 범위별 발송 결과 집계 Redis
+PUSH_FANOUT_TIMEOUT = 3600  # 전체 발송 완료 대기 시간(초)
+PUSH_FANOUT_POLL_INTERVAL = 1  # 전체 발송 완료 확인 주기(초)
+PUSH_NIGHT_START_HOUR = 21  # 야간 수신 동의가 필요한 시작 시각
+PUSH_NIGHT_END_HOUR = 8  # 야간 수신 동의가 필요한 종료 시각
+
+# 푸시 캠페인
+PUSH_CAMPAIGN_BATCHES_PER_TASK = 20  # 작업 하나가 발송할 배치 수
+PUSH_CAMPAIGN_STALE_SECONDS = 300  # 진행이 없으면 발송 작업을 다시 등록할 시간(초)
+PUSH_CAMPAIGN_LOCK_TIMEOUT = 60  # 캠페인 발송 잠금 유지 시간(초, 재등록 시간보다 짧게)
+
 # 출석 체크 정책
 ATTENDANCE_CHECK_REWARD_POINTS = list(
     map(